@@ -101,6 +101,17 @@ def main():
     sim.start_async_render_and_step_physics(physics_step_time)
     obs = sim.get_sensor_observations_async_finish()  # noqa: F841
 
+    # sim.step_pipelined renders frame t in the background while the agent
+    # acts and physics runs for frame t+1.  Observations are delivered one
+    # call late, together with the index of the frame they belong to.  None
+    # is returned by the first call.
+    for _ in range(4):
+        frame = sim.step_pipelined("move_forward")
+        if frame is not None:
+            frame_index, obs = frame
+    # Collect the frame that is still in flight
+    last_frame = sim.flush_pipeline()  # noqa: F841
+
     # Call close with destroy=True here because this example is over :)
     sim.close(destroy=True)
 
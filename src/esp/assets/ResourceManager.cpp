@@ -176,6 +176,16 @@ bool ResourceManager::getCreateRenderer() const {
   return metadataMediator_->getCreateRenderer();
 }
 
+std::string ResourceManager::getCollisionShapeCacheDirectory() const {
+  return metadataMediator_->getSimulatorConfiguration()
+      .collisionShapeCacheDirectory;
+}
+
+std::size_t ResourceManager::getCollisionShapeCacheMaxSize() const {
+  return metadataMediator_->getSimulatorConfiguration()
+      .collisionShapeCacheMaxSize;
+}
+
 void ResourceManager::initDefaultPrimAttributes() {
   if (!getCreateRenderer()) {
     return;
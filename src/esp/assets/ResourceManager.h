@@ -105,6 +105,18 @@ class ResourceManager {
    */
   bool getCreateRenderer() const;
 
+  /**
+   * @brief The directory of the on-disk cache of static collision shapes,
+   * empty if disabled.
+   */
+  std::string getCollisionShapeCacheDirectory() const;
+
+  /**
+   * @brief The maximum total size in bytes of the on-disk cache of static
+   * collision shapes.
+   */
+  std::size_t getCollisionShapeCacheMaxSize() const;
+
   /** @brief Stores references to a set of drawable elements */
   using DrawableGroup = gfx::DrawableGroup;
   /** @brief Convenience typedef for Importer class */
@@ -915,6 +915,16 @@ void initAttributesBindings(py::module& m) {
                     &PhysicsManagerAttributes::setMaxSubsteps,
                     R"(Maximum simulation steps between each rendering step.
                     (Not currently implemented).)")
+      .def_property(
+          "num_substeps", &PhysicsManagerAttributes::getNumSubsteps,
+          &PhysicsManagerAttributes::setNumSubsteps,
+          R"(The number of fixed timesteps the simulation advances by per agent action
+          when stepping with substeps. See Simulator.step_substeps.)")
+      .def_property(
+          "render_interval", &PhysicsManagerAttributes::getRenderInterval,
+          &PhysicsManagerAttributes::setRenderInterval,
+          R"(The number of simulation steps between two renderings of the observations
+          when stepping with substeps. See Simulator.step_substeps.)")
       .def_property(
           "gravity", &PhysicsManagerAttributes::getGravity,
           &PhysicsManagerAttributes::setGravity,
@@ -118,6 +118,9 @@ void initGfxBindings(py::module& m) {
       .def("start_draw_jobs", &Renderer::startDrawJobs,
            R"(See tutorials/async_rendering.py)")
 #endif
+      .def(
+          "wait_scene_graph", &Renderer::waitSceneGraph,
+          R"(Blocks until the background render thread has released the scene graph. Call before changing the scene graph while draw jobs are running. This is a noop if the main-thread already owns the scene graph.)")
       .def(
           "acquire_gl_context", &Renderer::acquireGlContext,
           R"(See tutorials/async_rendering.py. This is a noop if the main-thread already has the context.)")
@@ -3,6 +3,9 @@
 // LICENSE file in the root directory of this source tree.
 
 #include "esp/bindings/Bindings.h"
+
+#include <pybind11/eigen.h>
+
 #include "esp/bindings/EnumOperators.h"
 #include "esp/physics/PhysicsManager.h"
 
@@ -150,6 +153,74 @@ void initPhysicsBindings(py::module& m) {
       .def_readonly("ray", &RaycastResults::ray)
       .def("has_hits", &RaycastResults::hasHits);
 
+  // ==== struct object BatchRaycastResults ====
+  py::class_<BatchRaycastResults, BatchRaycastResults::ptr>(
+      m, "BatchRaycastResults")
+      .def(py::init(&BatchRaycastResults::create<>))
+      .def_readonly(
+          "distances", &BatchRaycastResults::distances,
+          R"(Distance along each ray from its origin to its first hit, in units of ray length. inf for rays which hit nothing.)")
+      .def_readonly(
+          "object_ids", &BatchRaycastResults::objectIds,
+          R"(The id of the object first hit by each ray, -1 for rays which hit nothing.)")
+      .def_readonly(
+          "normals", &BatchRaycastResults::normals,
+          R"(The (N, 3) collision object normals at the first hits, zero for rays which hit nothing.)");
+
+  // ==== struct object RigidObjectStates ====
+  py::class_<RigidObjectStates, RigidObjectStates::ptr>(m, "RigidObjectStates")
+      .def(py::init(&RigidObjectStates::create<>))
+      .def_readonly("translations", &RigidObjectStates::translations,
+                    R"((N, 3) translations of the objects.)")
+      .def_readonly(
+          "rotations", &RigidObjectStates::rotations,
+          R"((N, 4) rotations of the objects, as (x, y, z, w) quaternion coefficients.)")
+      .def_readonly("linear_velocities", &RigidObjectStates::linearVelocities,
+                    R"((N, 3) linear velocities of the objects.)")
+      .def_readonly("angular_velocities", &RigidObjectStates::angularVelocities,
+                    R"((N, 3) angular velocities of the objects.)")
+      .def_readonly("motion_types", &RigidObjectStates::motionTypes,
+                    R"(MotionType value of each object.)");
+
+  // ==== struct object PhysicsSnapshot ====
+  py::class_<PhysicsSnapshot, PhysicsSnapshot::ptr>(m, "PhysicsSnapshot")
+      .def(py::init(&PhysicsSnapshot::create<>))
+      .def_readonly("world_time", &PhysicsSnapshot::worldTime,
+                    R"(The world time of the snapshot.)")
+      .def_property_readonly(
+          "rigid_object_ids",
+          [](const PhysicsSnapshot& self) {
+            std::vector<int> ids;
+            ids.reserve(self.rigidObjects.size());
+            for (const auto& object : self.rigidObjects) {
+              ids.push_back(object.first);
+            }
+            return ids;
+          },
+          R"(The IDs of the rigid objects of the snapshot.)")
+      .def_property_readonly(
+          "articulated_object_ids",
+          [](const PhysicsSnapshot& self) {
+            std::vector<int> ids;
+            ids.reserve(self.articulatedObjects.size());
+            for (const auto& object : self.articulatedObjects) {
+              ids.push_back(object.first);
+            }
+            return ids;
+          },
+          R"(The IDs of the articulated objects of the snapshot.)")
+      .def_property_readonly(
+          "rigid_constraint_ids",
+          [](const PhysicsSnapshot& self) {
+            std::vector<int> ids;
+            ids.reserve(self.rigidConstraints.size());
+            for (const auto& constraint : self.rigidConstraints) {
+              ids.push_back(constraint.first);
+            }
+            return ids;
+          },
+          R"(The IDs of the rigid constraints of the snapshot.)");
+
   // ==== struct object ContactPointData ====
   py::class_<ContactPointData, ContactPointData::ptr>(m, "ContactPointData")
       .def(py::init(&ContactPointData::create<>))
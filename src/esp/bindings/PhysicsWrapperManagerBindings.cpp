@@ -4,6 +4,8 @@
 
 #include "esp/bindings/Bindings.h"
 
+#include <pybind11/eigen.h>
+
 #include "esp/physics/bullet/objectWrappers/ManagedBulletArticulatedObject.h"
 #include "esp/physics/bullet/objectWrappers/ManagedBulletRigidObject.h"
 #include "esp/physics/objectManagers/ArticulatedObjectManager.h"
@@ -256,7 +258,22 @@ void initPhysicsWrapperManagerBindings(pybind11::module& m) {
           &RigidObjectManager::removePhysObjectByHandle, "handle"_a,
           "delete_object_node"_a = true, "delete_visual_node"_a = true,
           R"(This removes the RigidObject referenced by the passed handle from the library, while allowing "
-          "for the optional retention of the object's scene node and/or the visual node)");
+          "for the optional retention of the object's scene node and/or the visual node)")
+      .def(
+          "get_states", &RigidObjectManager::getStates, "object_ids"_a,
+          R"(Get the translations, rotations (as (x, y, z, w) quaternion coefficients), linear and angular velocities and motion types of the RigidObjects with the passed IDs as arrays with a row per object, in a single call.)")
+      .def(
+          "set_states", &RigidObjectManager::setStates, "object_ids"_a,
+          "translations"_a = Eigen::RowMatrixX3f{},
+          "rotations"_a = Eigen::RowMatrixX4f{},
+          "linear_velocities"_a = Eigen::RowMatrixX3f{},
+          "angular_velocities"_a = Eigen::RowMatrixX3f{},
+          "motion_types"_a = Eigen::VectorXi{},
+          R"(Set the states of the RigidObjects with the passed IDs from arrays with a row per object, in a single call. Rotations are (x, y, z, w) quaternion coefficients and motion types are MotionType values. States passed as empty arrays are left unchanged. Poses are set first, then motion types, then velocities, so that objects made STATIC are still moved.)")
+      .def(
+          "apply_forces", &RigidObjectManager::applyForces, "object_ids"_a,
+          "forces"_a, "relative_positions"_a = Eigen::RowMatrixX3f{},
+          R"(Apply the (N, 3) forces to the RigidObjects with the passed IDs in a single call, at the (N, 3) positions relative to their centers of mass if passed.)");
 
   // initialize bindings for articulated objects
 
@@ -10,6 +10,7 @@
 #include <Magnum/PythonBindings.h>
 #include <Magnum/SceneGraph/PythonBindings.h>
 
+#include "esp/nav/PathFinder.h"
 #include "esp/scene/Mp3dSemanticScene.h"
 #include "esp/scene/ObjectControls.h"
 #include "esp/scene/SceneGraph.h"
@@ -262,12 +263,47 @@ void initSceneBindings(py::module& m) {
            "points"_a);
 
   // ==== ObjectControls ====
+  py::enum_<DefaultControl>(m, "DefaultControl")
+      .value("MOVE_FORWARD", DefaultControl::MoveForward)
+      .value("MOVE_BACKWARD", DefaultControl::MoveBackward)
+      .value("MOVE_RIGHT", DefaultControl::MoveRight)
+      .value("MOVE_LEFT", DefaultControl::MoveLeft)
+      .value("MOVE_UP", DefaultControl::MoveUp)
+      .value("MOVE_DOWN", DefaultControl::MoveDown)
+      .value("LOOK_LEFT", DefaultControl::LookLeft)
+      .value("LOOK_RIGHT", DefaultControl::LookRight)
+      .value("LOOK_UP", DefaultControl::LookUp)
+      .value("LOOK_DOWN", DefaultControl::LookDown);
+
   py::class_<ObjectControls, ObjectControls::ptr>(m, "ObjectControls")
       .def(py::init(&ObjectControls::create<>))
       .def("action", &ObjectControls::action, R"(
         Take action using this :py:class:`ObjectControls`.
       )",
-           "object"_a, "name"_a, "amount"_a, "apply_filter"_a = true);
+           "object"_a, "name"_a, "amount"_a, "apply_filter"_a = true)
+      .def_static(
+          "apply_default_controls",
+          [](const std::vector<SceneNode*>& objects,
+             const std::vector<DefaultControl>& controls,
+             const Eigen::VectorXf& amounts, const Eigen::VectorXf& constraints,
+             const Eigen::Matrix<bool, Eigen::Dynamic, 1>& applyFilter,
+             nav::PathFinder* pathfinder, bool allowSliding, int numThreads) {
+            ObjectControls::BatchMoveFilterFunc filterFunc;
+            if (pathfinder != nullptr && pathfinder->isLoaded()) {
+              filterFunc = [=](const Eigen::RowMatrixX3f& starts,
+                               const Eigen::RowMatrixX3f& ends) {
+                return pathfinder->tryStepBatch(starts, ends, allowSliding,
+                                                numThreads);
+              };
+            }
+            return ObjectControls::applyDefaultControls(
+                objects, controls, amounts, constraints, applyFilter,
+                filterFunc);
+          },
+          "objects"_a, "controls"_a, "amounts"_a, "constraints"_a,
+          "apply_filter"_a, "pathfinder"_a = nullptr, "allow_sliding"_a = true,
+          "num_threads"_a = 1,
+          R"(Applies a default control to each object in a single native call, moves of the objects with apply_filter set are then filtered by try_step or try_step_no_sliding on the pathfinder, if it is loaded. constraints holds the largest look angle in degrees of each object, NAN for none. Returns whether each move was shortened by the filter, i.e. collided.)");
 }
 
 }  // namespace scene
@@ -14,6 +14,7 @@
 #include "esp/assets/MeshData.h"
 #include "esp/core/Esp.h"
 #include "esp/nav/GreedyFollower.h"
+#include "esp/nav/NavMeshCache.h"
 #include "esp/nav/PathFinder.h"
 #include "esp/scene/ObjectControls.h"
 
@@ -72,6 +73,14 @@ void initShortestPathBindings(py::module& m) {
           &MultiGoalShortestPath::closestEndPointIndex,
           R"(The index of the closest end point corresponding to end of the shortest path. Will be -1 if no path exists.)");
 
+  py::class_<GeodesicDistanceField, GeodesicDistanceField::ptr>(
+      m, "GeodesicDistanceField",
+      R"(Geodesic distances from the navigation mesh to the closest of a fixed set of goals. Built once on its first query, after which queries are cheap lookups. Used in conjunction with PathFinder.geodesic_distance_to_goals().)")
+      .def(py::init(&GeodesicDistanceField::create<>))
+      .def_property("goals", &GeodesicDistanceField::getGoals,
+                    &GeodesicDistanceField::setGoals,
+                    R"(The list of goal points.)");
+
   py::class_<NavMeshSettings, NavMeshSettings::ptr>(
       m, "NavMeshSettings",
       R"(Configuration structure for NavMesh generation with recast. Passed to PathFinder::build to construct the NavMesh. Serialized with saved .navmesh files for later equivalency checks upon re-load.)")
@@ -128,6 +137,9 @@ void initShortestPathBindings(py::module& m) {
       .def_readwrite(
           "include_static_objects", &NavMeshSettings::includeStaticObjects,
           R"(Whether or not to include STATIC RigidObjects as NavMesh constraints. Note: Used in Simulator recomputeNavMesh pre-process. Default False.)")
+      .def_readwrite(
+          "tile_size", &NavMeshSettings::tileSize,
+          R"(Width and depth of the navmesh tiles in cells, 0 builds the navmesh as a single tile. The tiles of a tiled navmesh overlapping changed parts of the scene can be rebuilt with Simulator.update_navmesh. Default 0.)")
       .def("set_defaults", &NavMeshSettings::setDefaults)
       .def("read_from_json", &NavMeshSettings::readFromJSON,
            R"(Overwrite these settings with values from a JSON file.)")
@@ -138,10 +150,83 @@ void initShortestPathBindings(py::module& m) {
           R"(Checks for equivalency of (or < eps 1e-5 distance between) each parameter.)")
       .def(py::self != py::self);
 
+  py::class_<EpisodeSamplingSettings, EpisodeSamplingSettings::ptr>(
+      m, "EpisodeSamplingSettings",
+      R"(Constraints on the start/goal pairs sampled by PathFinder.sample_episodes().)")
+      .def(py::init(&EpisodeSamplingSettings::create<>))
+      .def_readwrite(
+          "min_geodesic_distance",
+          &EpisodeSamplingSettings::minGeodesicDistance,
+          R"(Minimum geodesic distance between the start and the goal. Default 1.)")
+      .def_readwrite(
+          "max_geodesic_distance",
+          &EpisodeSamplingSettings::maxGeodesicDistance,
+          R"(Maximum geodesic distance between the start and the goal. Default 30.)")
+      .def_readwrite(
+          "min_geodesic_to_euclidean_ratio",
+          &EpisodeSamplingSettings::minGeodesicToEuclideanRatio,
+          R"(Minimum ratio of the geodesic to the euclidean distance between the start and the goal. Values above 1 reject straight line episodes. Default 1.)")
+      .def_readwrite(
+          "min_height", &EpisodeSamplingSettings::minHeight,
+          R"(Minimum height of the start and the goal, e.g. the bottom of a floor. Default -inf.)")
+      .def_readwrite(
+          "max_height", &EpisodeSamplingSettings::maxHeight,
+          R"(Maximum height of the start and the goal, e.g. the top of a floor. Default inf.)")
+      .def_readwrite(
+          "max_height_difference",
+          &EpisodeSamplingSettings::maxHeightDifference,
+          R"(Maximum height difference between the start and the goal. Default inf.)")
+      .def_readwrite(
+          "island_index", &EpisodeSamplingSettings::islandIndex,
+          R"(The island to sample on. Default -1 samples the full navmesh, with the start and the goal on the same island.)")
+      .def_readwrite(
+          "max_tries", &EpisodeSamplingSettings::maxTries,
+          R"(How many start/goal pairs to try for each episode before giving up on it. Default 1000.)");
+
+  py::class_<SampledEpisodes, SampledEpisodes::ptr>(
+      m, "SampledEpisodes",
+      R"(Start/goal pairs sampled by PathFinder.sample_episodes(), one episode per row.)")
+      .def_readonly("starts", &SampledEpisodes::starts,
+                    R"((N, 3) start of each episode.)")
+      .def_readonly("goals", &SampledEpisodes::goals,
+                    R"((N, 3) goal of each episode.)")
+      .def_readonly(
+          "geodesic_distances", &SampledEpisodes::geodesicDistances,
+          R"((N,) geodesic distance from the start to the goal of each episode.)")
+      .def_readonly("islands", &SampledEpisodes::islands,
+                    R"((N,) island of each episode.)")
+      .def("__len__",
+           [](const SampledEpisodes& self) { return self.starts.rows(); });
+
+  py::class_<NavMeshCache, NavMeshCache::ptr>(
+      m, "NavMeshCache",
+      R"(Content-addressed on-disk cache of built navmeshes, keyed by a hash of the geometry and NavMeshSettings they were built from. The least recently used navmeshes are removed once the cache exceeds its maximum size. Several processes can share a directory.)")
+      .def(py::init(&NavMeshCache::create<const std::string&, std::size_t>),
+           "directory"_a, "max_size"_a = NavMeshCache::DefaultMaxSize)
+      .def_property_readonly("directory", &NavMeshCache::getDirectory)
+      .def_property(
+          "max_size", &NavMeshCache::getMaxSize, &NavMeshCache::setMaxSize,
+          R"(The maximum total size of the cached navmeshes in bytes.)")
+      .def_property_readonly(
+          "size", &NavMeshCache::getSize,
+          R"(The total size of the cached navmeshes in bytes.)")
+      .def(
+          "evict", &NavMeshCache::evict,
+          R"(Removes the least recently used navmeshes until the cache fits in its maximum size.)")
+      .def("clear", &NavMeshCache::clear, R"(Removes all cached navmeshes.)");
+
   py::class_<PathFinder, PathFinder::ptr>(
       m, "PathFinder",
       R"(Loads and/or builds a navigation mesh and then allows point sampling, path finding, collision, and island queries on that navmesh. See PathFinder C++ API docs for more details.)")
       .def(py::init(&PathFinder::create<>))
+      .def_property(
+          "navmesh_cache", &PathFinder::getNavMeshCache,
+          &PathFinder::setNavMeshCache,
+          R"(The NavMeshCache consulted by build before building a navmesh, and filled with the navmeshes it builds. None disables caching.)")
+      .def_property(
+          "num_build_threads", &PathFinder::getNumBuildThreads,
+          &PathFinder::setNumBuildThreads,
+          R"(The number of threads building the tiles of navmeshes with NavMeshSettings.tile_size > 0, all hardware threads if less than 1. The navmesh is the same whatever the number of threads. Default 0.)")
       .def(
           "get_bounds", &PathFinder::bounds,
           R"(Get the axis aligned bounding box containing the navigation mesh.)")
@@ -157,6 +242,12 @@ void initShortestPathBindings(py::module& m) {
           R"(Returns the topdown view of the PathFinder's navmesh with island indices at each point or -1 for non-navigable cells for a given vertical slice with eps slack.)",
           "meters_per_pixel"_a, "height"_a, "eps"_a = 0.5)
       // detailed docs in docs/docs.rst
+      .def("get_topdown_view_crop", &PathFinder::getTopDownViewCrop,
+           "meters_per_pixel"_a, "height"_a, "center"_a, "radius"_a,
+           "eps"_a = 0.5)
+      .def("get_topdown_island_view_crop",
+           &PathFinder::getTopDownIslandViewCrop, "meters_per_pixel"_a,
+           "height"_a, "center"_a, "radius"_a, "eps"_a = 0.5)
       .def("get_random_navigable_point", &PathFinder::getRandomNavigablePoint,
            "max_tries"_a = 10, "island_index"_a = ID_UNDEFINED)
       .def(
@@ -250,6 +341,66 @@ void initShortestPathBindings(py::module& m) {
       .def("is_navigable", &PathFinder::isNavigable,
            R"(Checks to see if the agent can stand at the specified point.)",
            "pt"_a, "max_y_delta"_a = 0.5)
+      .def(
+          "geodesic_distance_batch", &PathFinder::geodesicDistanceBatch,
+          "starts"_a, "ends"_a, "num_threads"_a = 1,
+          R"(Returns the geodesic distance between each row of the (N, 3) starts and ends arrays, inf where no path exists. The queries run natively, optionally on num_threads threads (num_threads < 1 uses all hardware threads).)")
+      .def(
+          "snap_point_batch", &PathFinder::snapPointBatch, "points"_a,
+          "island_index"_a = ID_UNDEFINED, "num_threads"_a = 1,
+          R"(Snaps each row of an (N, 3) array of points to the navigation mesh. Rows that could not be snapped are NAN.)")
+      .def(
+          "try_step_batch",
+          [](PathFinder& self, const Eigen::RowMatrixX3f& starts,
+             const Eigen::RowMatrixX3f& ends, int numThreads) {
+            return self.tryStepBatch(starts, ends, /*allowSliding=*/true,
+                                     numThreads);
+          },
+          "starts"_a, "ends"_a, "num_threads"_a = 1,
+          R"(Batch version of try_step over (N, 3) arrays of starts and ends.)")
+      .def(
+          "try_step_no_sliding_batch",
+          [](PathFinder& self, const Eigen::RowMatrixX3f& starts,
+             const Eigen::RowMatrixX3f& ends, int numThreads) {
+            return self.tryStepBatch(starts, ends, /*allowSliding=*/false,
+                                     numThreads);
+          },
+          "starts"_a, "ends"_a, "num_threads"_a = 1,
+          R"(Batch version of try_step_no_sliding over (N, 3) arrays of starts and ends.)")
+      .def(
+          "is_navigable_batch", &PathFinder::isNavigableBatch, "points"_a,
+          "max_y_delta"_a = 0.5, "num_threads"_a = 1,
+          R"(Checks for each row of an (N, 3) array of points whether the agent can stand there.)")
+      .def(
+          "distance_to_closest_obstacle_batch",
+          &PathFinder::distanceToClosestObstacleBatch, "points"_a,
+          "max_search_radius"_a = 2.0, "num_threads"_a = 1,
+          R"(Returns the distance to the closest obstacle for each row of an (N, 3) array of points.)")
+      .def(
+          "sample_episodes", &PathFinder::sampleEpisodes, "num_episodes"_a,
+          "settings"_a = EpisodeSamplingSettings{}, "seed"_a = 0,
+          "num_threads"_a = 1,
+          R"(Samples start/goal pairs satisfying the EpisodeSamplingSettings natively, optionally on num_threads threads (num_threads < 1 uses all hardware threads). Every episode has its own random stream derived from seed, so the result does not depend on num_threads. Episodes which run out of tries are left out.)")
+      .def(
+          "get_geodesic_distance_field", &PathFinder::getGeodesicDistanceField,
+          "goals"_a,
+          R"(Returns the GeodesicDistanceField for a set of goals from a least-recently-used cache keyed by the goal set, creating it if needed.)")
+      .def(
+          "geodesic_distance_to_goals", &PathFinder::geodesicDistanceToGoals,
+          "field"_a, "point"_a,
+          R"(Approximate geodesic distance from a point to the closest goal of a GeodesicDistanceField, inf if no goal is reachable. Builds the field on first use and whenever the navmesh changed.)")
+      .def(
+          "geodesic_distance_to_goals_batch",
+          &PathFinder::geodesicDistanceToGoalsBatch, "field"_a, "points"_a,
+          "num_threads"_a = 1,
+          R"(Batch version of geodesic_distance_to_goals over an (N, 3) array of points.)")
+      .def_property(
+          "distance_field_cache_size", &PathFinder::getDistanceFieldCacheSize,
+          &PathFinder::setDistanceFieldCacheSize,
+          R"(The number of GeodesicDistanceField kept by get_geodesic_distance_field.)")
+      .def_property(
+          "topdown_view_cache_size",
+          &PathFinder::getTopDownViewCacheSize, &PathFinder::setTopDownViewCacheSize, R"(The number of views kept by get_topdown_view and get_topdown_island_view each, keyed by (meters_per_pixel, height, eps). The cache is cleared when the navmesh changes, 0 disables it.)")
       .def_property_readonly("nav_mesh_settings",
                              &PathFinder::getNavMeshSettings,
                              R"(The settings for the current NavMesh.)");
@@ -273,6 +424,11 @@ void initShortestPathBindings(py::module& m) {
                     GreedyGeodesicFollowerImpl::MoveFn&,
                     GreedyGeodesicFollowerImpl::MoveFn&, double, double, double,
                     bool, int>))
+      .def(py::init(&GreedyGeodesicFollowerImpl::create<
+                    PathFinder::ptr&, double, double, double, bool, bool, int>),
+           "pathfinder"_a, "goal_dist"_a, "forward_amount"_a, "turn_amount"_a,
+           "allow_sliding"_a, "fix_thrashing"_a = true,
+           "thrashing_threshold"_a = 16)
       .def("next_action_along",
            py::overload_cast<const Mn::Quaternion&, const Mn::Vector3&,
                              const Mn::Vector3&>(
@@ -292,6 +448,32 @@ void initShortestPathBindings(py::module& m) {
                &GreedyGeodesicFollowerImpl::findPath),
            py::return_value_policy::move)
       .def("reset", &GreedyGeodesicFollowerImpl::reset);
+
+  py::class_<BatchGreedyGeodesicFollowerImpl,
+             BatchGreedyGeodesicFollowerImpl::ptr>(
+      m, "BatchGreedyGeodesicFollowerImpl")
+      .def(py::init(
+               &BatchGreedyGeodesicFollowerImpl::create<PathFinder::ptr&, int,
+                                                        double, double, double,
+                                                        bool, bool, int>),
+           "pathfinder"_a, "num_agents"_a, "goal_dist"_a, "forward_amount"_a,
+           "turn_amount"_a, "allow_sliding"_a = true, "fix_thrashing"_a = true,
+           "thrashing_threshold"_a = 16)
+      .def_property_readonly("num_agents",
+                             &BatchGreedyGeodesicFollowerImpl::getNumAgents)
+      .def(
+          "next_actions_along",
+          &BatchGreedyGeodesicFollowerImpl::nextActionsAlong, "rotations"_a,
+          "positions"_a, "goals"_a,
+          R"(Next action code of each agent, from (N, 4) [x, y, z, w] rotations and (N, 3) positions and goals)")
+      .def("find_paths", &BatchGreedyGeodesicFollowerImpl::findPaths,
+           "rotations"_a, "positions"_a, "goals"_a,
+           R"(Action codes to the goal of each row, empty if there is no path)")
+      .def("reset",
+           py::overload_cast<>(&BatchGreedyGeodesicFollowerImpl::reset))
+      .def("reset",
+           py::overload_cast<int>(&BatchGreedyGeodesicFollowerImpl::reset),
+           "agent_index"_a);
 }
 
 }  // namespace nav
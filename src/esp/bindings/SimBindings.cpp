@@ -4,6 +4,8 @@
 
 #include "esp/bindings/Bindings.h"
 
+#include <pybind11/eigen.h>
+
 #include <Magnum/ImageView.h>
 #include <Magnum/Magnum.h>
 #include <Magnum/SceneGraph/SceneGraph.h>
@@ -75,6 +77,10 @@ void initSimBindings(py::module& m) {
           "enable_gfx_replay_save",
           &SimulatorConfiguration::enableGfxReplaySave,
           R"(Enable replay recording. See sim.gfx_replay.save_keyframe.)")
+      .def_readwrite(
+          "gfx_replay_skip_sleeping_objects",
+          &SimulatorConfiguration::gfxReplaySkipSleepingObjects,
+          R"(Whether replay keyframes skip updating the instances which didn't move since the previous keyframe, such as those of sleeping physics objects, instead of checking every instance of the scene. Defaults to False)")
       .def_readwrite("physics_config_file",
                      &SimulatorConfiguration::physicsConfigFile,
                      R"(Path to the physics parameter config file.)")
@@ -99,6 +105,22 @@ void initSimBindings(py::module& m) {
       .def_readwrite(
           "navmesh_settings", &SimulatorConfiguration::navMeshSettings,
           R"(Optionally provide a pre-configured NavMeshSettings. If provided, the NavMesh will be recomputed with the provided settings if: A. no NavMesh was loaded, or B. the loaded NavMesh's settings differ from the configured settings. If not provided, no NavMesh recompute will be done automatically.)")
+      .def_readwrite(
+          "navmesh_cache_directory",
+          &SimulatorConfiguration::navMeshCacheDirectory,
+          R"(Optionally provide a directory to cache built NavMeshes in. A NavMesh recompute then loads the NavMesh from the cache when the same scene geometry and NavMeshSettings were built before, by any process sharing the directory. Empty disables the cache.)")
+      .def_readwrite(
+          "navmesh_cache_max_size",
+          &SimulatorConfiguration::navMeshCacheMaxSize,
+          R"(The maximum total size in bytes of the NavMesh cache. The least recently used NavMeshes are removed from the cache beyond it. Default 1 GiB.)")
+      .def_readwrite(
+          "collision_shape_cache_directory",
+          &SimulatorConfiguration::collisionShapeCacheDirectory,
+          R"(Optionally provide a directory to cache the collision shapes of stages in. Loading a stage then memory-maps its collision BVHs from the cache when the same collision meshes were loaded before, by any process sharing the directory, instead of building them. Empty disables the cache.)")
+      .def_readwrite(
+          "collision_shape_cache_max_size",
+          &SimulatorConfiguration::collisionShapeCacheMaxSize,
+          R"(The maximum total size in bytes of the collision shape cache. The least recently used shapes are removed from the cache beyond it. Default 1 GiB.)")
       .def_readwrite(
           "enable_hbao", &SimulatorConfiguration::enableHBAO,
           R"(Whether or not to enable horizon-based ambient occlusion, which provides soft shadows in corners and crevices.)")
@@ -106,7 +128,9 @@ void initSimBindings(py::module& m) {
       .def(py::self != py::self);
 
   // ==== Simulator ====
-  py::class_<Simulator, Simulator::ptr>(m, "Simulator")
+  py::class_<Simulator, Simulator::ptr> simulator(m, "Simulator");
+
+  simulator
       // modify constructor to pass MetadataMediator
       .def(py::init<const SimulatorConfiguration&,
                     esp::metadata::MetadataMediator::ptr>())
@@ -263,6 +287,10 @@ void initSimBindings(py::module& m) {
       .def(
           "cast_ray", &Simulator::castRay, "ray"_a, "max_distance"_a = 100.0,
           R"(Cast a ray into the collidable scene and return hit results. Physics must be enabled. max_distance in units of ray length.)")
+      .def(
+          "cast_rays", &Simulator::castRays, "origins"_a, "directions"_a,
+          "max_distance"_a = 100.0, "num_threads"_a = 1,
+          R"(Cast each row of the (N, 3) origins and directions arrays as a ray into the collidable scene and return the first hit of each ray as BatchRaycastResults. Physics must be enabled. max_distance in units of ray length. The rays are cast natively, optionally on num_threads threads (num_threads < 1 uses all hardware threads).)")
       .def("set_object_bb_draw", &Simulator::setObjectBBDraw, "draw_bb"_a,
            "object_id"_a,
            R"(Enable or disable bounding box visualization for an object.)")
@@ -270,6 +298,10 @@ void initSimBindings(py::module& m) {
           "recompute_navmesh", &Simulator::recomputeNavMesh, "pathfinder"_a,
           "navmesh_settings"_a,
           R"(Recompute the NavMesh for a given PathFinder instance using configured NavMeshSettings.)")
+      .def(
+          "update_navmesh", &Simulator::updateNavMesh, "pathfinder"_a,
+          "regions"_a,
+          R"(Rebuild the tiles of a tiled NavMesh (NavMeshSettings.tile_size > 0) overlapping the world space bounding boxes of changed regions, e.g. of STATIC objects before and after they moved. Recomputes the whole NavMesh if it isn't tiled.)")
 
       .def(
           "add_trajectory_object",
@@ -361,6 +393,38 @@ void initSimBindings(py::module& m) {
            pybind11::return_value_policy::reference,
            R"(Get visualization helper for rendering lines.)");
 
+  /* --- Physics snapshots --- */
+  simulator
+      .def(
+          "save_physics_snapshot", &Simulator::savePhysicsSnapshot,
+          R"(Save the poses, velocities, motion types and activation states of all rigid and articulated objects, the joint states and motors of articulated objects, the rigid constraints and the world time in memory.)")
+      .def(
+          "restore_physics_snapshot", &Simulator::restorePhysicsSnapshot,
+          "snapshot"_a,
+          R"(Restore a PhysicsSnapshot from save_physics_snapshot, reusing the existing objects instead of removing and re-adding them. Objects removed since the snapshot are skipped and objects added since are left untouched. Constraints removed since the snapshot are created again and their new IDs replace the old ones in the snapshot. Returns whether all the objects of the snapshot still existed.)");
+
+  /* --- Activity of physics objects --- */
+  simulator
+      .def(
+          "get_active_object_ids", &Simulator::getActiveObjectIds,
+          R"(The ids of the rigid and articulated objects which are awake, in increasing order. Sleeping objects aren't moved by the physics simulation until something wakes them up.)")
+      .def(
+          "get_dirty_object_ids", &Simulator::getDirtyObjectIds,
+          R"(The ids of the rigid and articulated objects whose transforms the last step_world may have changed, in increasing order: the objects awake at the end of the step, or the objects moved by their velocity control without dynamics. Objects moved through the API between steps aren't included.)");
+
+  /* --- Sub-stepped physics --- */
+  simulator
+      .def(
+          "step_world_substeps", &Simulator::stepWorldSubsteps,
+          "num_substeps"_a = -1,
+          R"(Step the physics simulation by num_substeps fixed timesteps, or by the num_substeps of the PhysicsManagerAttributes if negative. The scene graph is only synchronized after the last substep. Returns the new world time.)")
+      .def(
+          "get_physics_num_substeps", &Simulator::getPhysicsNumSubsteps,
+          R"(Get the number of fixed timesteps step_world_substeps advances by.)")
+      .def(
+          "get_physics_render_interval", &Simulator::getPhysicsRenderInterval,
+          R"(Get the number of physics steps between two renderings of the observations in step_substeps.)");
+
   // ==== ReplayRendererConfiguration ====
   py::class_<ReplayRendererConfiguration, ReplayRendererConfiguration::ptr>(
       m, "ReplayRendererConfiguration")
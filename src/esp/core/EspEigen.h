@@ -30,6 +30,11 @@ typedef Matrix<uint32_t, 4, 1> Vector4ui;
 typedef Matrix<uint64_t, 4, 1> Vector4ul;
 
 typedef Matrix<float, Dynamic, Dynamic, RowMajor> RowMatrixXf;
+//! Stack of 3D points, one per row. Maps to an (N, 3) numpy array.
+typedef Matrix<float, Dynamic, 3, RowMajor> RowMatrixX3f;
+//! Stack of 4D vectors, e.g. quaternion coefficients (x, y, z, w), one per
+//! row. Maps to an (N, 4) numpy array.
+typedef Matrix<float, Dynamic, 4, RowMajor> RowMatrixX4f;
 
 //! Eigen JSON string format specification
 static const IOFormat kJsonFormat(StreamPrecision,
@@ -0,0 +1,165 @@
+// Copyright (c) Meta Platforms, Inc. and its affiliates.
+// This source code is licensed under the MIT license found in the
+// LICENSE file in the root directory of this source tree.
+
+#include "FileCache.h"
+
+#include <sys/stat.h>
+#include <unistd.h>
+#include <utime.h>
+
+#include <algorithm>
+#include <cstdio>
+#include <functional>
+#include <thread>
+#include <tuple>
+#include <utility>
+#include <vector>
+
+#include <Corrade/Containers/Optional.h>
+#include <Corrade/Containers/String.h>
+#include <Corrade/Containers/StringStl.h>
+#include <Corrade/Utility/FormatStl.h>
+#include <Corrade/Utility/Path.h>
+
+#include "esp/core/Logging.h"
+
+namespace Cr = Corrade;
+
+namespace esp {
+namespace core {
+
+namespace {
+
+//! (size, last modification time) of a file, nullopt if it doesn't exist
+Cr::Containers::Optional<std::pair<std::size_t, time_t>> fileStat(
+    const std::string& path) {
+  struct stat info {};
+  if (stat(path.c_str(), &info) != 0) {
+    return Cr::Containers::NullOpt;
+  }
+  return std::make_pair(static_cast<std::size_t>(info.st_size), info.st_mtime);
+}
+
+bool hasExtension(const std::string& filename, const std::string& extension) {
+  return filename.size() > extension.size() &&
+         filename.compare(filename.size() - extension.size(), extension.size(),
+                          extension) == 0;
+}
+
+//! (last modification time, size, path) of every file of the cache
+std::vector<std::tuple<time_t, std::size_t, std::string>> listFiles(
+    const std::string& directory,
+    const std::string& extension) {
+  std::vector<std::tuple<time_t, std::size_t, std::string>> files;
+  const auto filenames = Cr::Utility::Path::list(
+      directory, Cr::Utility::Path::ListFlag::SkipDirectories |
+                     Cr::Utility::Path::ListFlag::SkipDotAndDotDot);
+  if (!filenames) {
+    return files;
+  }
+  for (const Cr::Containers::String& filename : *filenames) {
+    if (!hasExtension(filename, extension)) {
+      continue;
+    }
+    std::string path = Cr::Utility::Path::join(directory, filename);
+    // may have been removed by another process in the meantime
+    if (const auto info = fileStat(path)) {
+      files.emplace_back(info->second, info->first, std::move(path));
+    }
+  }
+  return files;
+}
+
+}  // namespace
+
+constexpr std::size_t FileCache::DefaultMaxSize;
+
+std::string FileCache::Hasher::key() const {
+  return Cr::Utility::formatString("{:.16x}", hash_);
+}
+
+FileCache::FileCache(const std::string& directory,
+                     std::string extension,
+                     std::string description,
+                     const std::size_t maxSize)
+    : directory_{directory},
+      extension_{std::move(extension)},
+      description_{std::move(description)},
+      maxSize_{maxSize} {
+  if (!Cr::Utility::Path::make(directory_)) {
+    ESP_WARNING() << "Could not create the" << description_ << "cache directory"
+                  << directory_;
+  }
+}
+
+std::string FileCache::getPath(const std::string& key) const {
+  return Cr::Utility::Path::join(directory_, key + extension_);
+}
+
+std::string FileCache::getTemporaryPath(const std::string& key) const {
+  return Cr::Utility::formatString(
+      "{}.{}.{}.tmp", Cr::Utility::Path::join(directory_, key), getpid(),
+      std::hash<std::thread::id>{}(std::this_thread::get_id()));
+}
+
+bool FileCache::commit(const std::string& temporaryPath,
+                       const std::string& key) const {
+  // rename is atomic, so other processes never see a partial file
+  if (std::rename(temporaryPath.c_str(), getPath(key).c_str()) != 0) {
+    ESP_WARNING() << "Could not add" << temporaryPath << "to the"
+                  << description_ << "cache";
+    std::remove(temporaryPath.c_str());
+    return false;
+  }
+  evict();
+  return true;
+}
+
+void FileCache::touch(const std::string& key) const {
+  utime(getPath(key).c_str(), nullptr);
+}
+
+void FileCache::remove(const std::string& key) const {
+  std::remove(getPath(key).c_str());
+}
+
+std::size_t FileCache::getSize() const {
+  std::size_t size = 0;
+  for (const auto& file : listFiles(directory_, extension_)) {
+    size += std::get<1>(file);
+  }
+  return size;
+}
+
+void FileCache::evict() const {
+  auto files = listFiles(directory_, extension_);
+  std::size_t size = 0;
+  for (const auto& file : files) {
+    size += std::get<1>(file);
+  }
+  if (size <= maxSize_) {
+    return;
+  }
+
+  // least recently used first
+  std::sort(files.begin(), files.end());
+  for (const auto& file : files) {
+    if (size <= maxSize_) {
+      break;
+    }
+    ESP_DEBUG() << "Evicting" << std::get<2>(file) << "from the" << description_
+                << "cache";
+    std::remove(std::get<2>(file).c_str());
+    size -= std::get<1>(file);
+  }
+}
+
+void FileCache::clear() const {
+  for (const auto& file : listFiles(directory_, extension_)) {
+    std::remove(std::get<2>(file).c_str());
+  }
+}
+
+}  // namespace core
+}  // namespace esp
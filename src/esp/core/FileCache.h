@@ -0,0 +1,143 @@
+// Copyright (c) Meta Platforms, Inc. and its affiliates.
+// This source code is licensed under the MIT license found in the
+// LICENSE file in the root directory of this source tree.
+
+#ifndef ESP_CORE_FILECACHE_H_
+#define ESP_CORE_FILECACHE_H_
+
+/** @file
+ * @brief Class @ref esp::core::FileCache
+ */
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+namespace esp {
+namespace core {
+
+/**
+ * @brief Content-addressed on-disk cache of files, the base of the caches of
+ * built assets such as navmeshes.
+ *
+ * Each entry is a `<key><extension>` file in the cache directory, the key
+ * being a hash of the inputs the entry was built from, see @ref Hasher. Any
+ * change of the inputs just misses the cache, so there is no need to
+ * invalidate anything. Once the files of the directory exceed the maximum
+ * size, the least recently used ones are removed.
+ *
+ * Several processes can share a directory, files are written under a
+ * temporary name and then renamed by @ref commit.
+ */
+class FileCache {
+ public:
+  //! Default maximum size of the cache directory, 1 GiB
+  static constexpr std::size_t DefaultMaxSize = std::size_t{1} << 30;
+
+  /**
+   * @brief 64-bit FNV-1a hash of the inputs of an entry
+   */
+  class Hasher {
+   public:
+    void add(const void* data, std::size_t size) {
+      const unsigned char* bytes = static_cast<const unsigned char*>(data);
+      for (std::size_t i = 0; i < size; ++i) {
+        hash_ = (hash_ ^ bytes[i]) * 1099511628211ull;
+      }
+    }
+
+    template <typename T>
+    void add(const T& value) {
+      add(&value, sizeof(T));
+    }
+
+    uint64_t hash() const { return hash_; }
+
+    /**
+     * @brief The key of the entry, the hash as 16 hexadecimal digits
+     */
+    std::string key() const;
+
+   private:
+    uint64_t hash_ = 14695981039346656037ull;
+  };
+
+  /**
+   * @brief Constructor. The directory is created if needed.
+   *
+   * @param directory The directory holding the cached files
+   * @param extension The extension of the cached files, including the dot
+   * @param description What is cached, for log messages
+   * @param maxSize The maximum total size of the cached files in bytes
+   */
+  FileCache(const std::string& directory,
+            std::string extension,
+            std::string description,
+            std::size_t maxSize);
+
+  const std::string& getDirectory() const { return directory_; }
+
+  std::size_t getMaxSize() const { return maxSize_; }
+
+  void setMaxSize(std::size_t maxSize) { maxSize_ = maxSize; }
+
+  /**
+   * @brief The file of the entry with @p key, which may not exist.
+   */
+  std::string getPath(const std::string& key) const;
+
+  /**
+   * @brief A unique file to write an entry to before @ref commit moves it to
+   * the path of @p key.
+   */
+  std::string getTemporaryPath(const std::string& key) const;
+
+  /**
+   * @brief Moves a file written at @p temporaryPath into the cache under @p
+   * key, then evicts the least recently used entries if the cache is too
+   * large. The temporary file is removed if it cannot be moved.
+   *
+   * @return Whether the entry was added
+   */
+  bool commit(const std::string& temporaryPath, const std::string& key) const;
+
+  /**
+   * @brief Marks the entry with @p key as recently used.
+   */
+  void touch(const std::string& key) const;
+
+  /**
+   * @brief Removes the entry with @p key, e.g. if it fails to load.
+   */
+  void remove(const std::string& key) const;
+
+  /**
+   * @brief The total size of the cached files in bytes.
+   */
+  std::size_t getSize() const;
+
+  /**
+   * @brief Removes the least recently used entries until the cache fits in
+   * its maximum size.
+   */
+  void evict() const;
+
+  /**
+   * @brief Removes all cached files.
+   */
+  void clear() const;
+
+ protected:
+  ~FileCache() = default;
+
+ private:
+  std::string directory_;
+  std::string extension_;
+  std::string description_;
+  std::size_t maxSize_;
+};
+
+}  // namespace core
+}  // namespace esp
+
+#endif  // ESP_CORE_FILECACHE_H_
@@ -36,7 +36,7 @@ namespace replay {
 
 /**
  * @brief Helper class to get notified when a SceneNode is about to be
- * destroyed.
+ * destroyed, and when it moves.
  */
 class NodeDeletionHelper : public Magnum::SceneGraph::AbstractFeature3D {
  public:
@@ -49,9 +49,19 @@ class NodeDeletionHelper : public Magnum::SceneGraph::AbstractFeature3D {
     recorder_->onDeleteRenderAssetInstance(node);
   }
 
+  //! Whether the node moved since the last call to clearMoved
+  bool hasMoved() const { return moved_; }
+
+  void clearMoved() { moved_ = false; }
+
  private:
+  // Called when the node or an ancestor goes from clean to dirty, i.e. on the
+  // first transformation change after the node was cleaned
+  void markDirty() override { moved_ = true; }
+
   Recorder* recorder_ = nullptr;
   const scene::SceneNode* node = nullptr;
+  bool moved_ = true;
 };
 
 Recorder::~Recorder() {
@@ -230,11 +240,22 @@ void Recorder::updateStates() {
 
 void Recorder::updateInstanceStates() {
   for (auto& instanceRecord : instanceRecords_) {
-    auto state = getInstanceState(instanceRecord.node);
-    if (!instanceRecord.recentState || state != instanceRecord.recentState) {
-      getKeyframe().stateUpdates.emplace_back(instanceRecord.instanceKey,
-                                              state);
-      instanceRecord.recentState = state;
+    NodeDeletionHelper& helper = *instanceRecord.deletionHelper;
+    // the state of an instance which didn't move can't have changed
+    if (!skipUnmovedInstances_ || !instanceRecord.recentState ||
+        helper.hasMoved()) {
+      if (skipUnmovedInstances_) {
+        // A dirty node doesn't notify its next moves, so clean it for the
+        // flag to be set again
+        instanceRecord.node->setClean();
+        helper.clearMoved();
+      }
+      auto state = getInstanceState(instanceRecord.node);
+      if (!instanceRecord.recentState || state != instanceRecord.recentState) {
+        getKeyframe().stateUpdates.emplace_back(instanceRecord.instanceKey,
+                                                state);
+        instanceRecord.recentState = state;
+      }
     }
     auto metadata = getInstanceMetadata(instanceRecord.node);
     if (!instanceRecord.metadata || metadata != instanceRecord.metadata) {
@@ -164,6 +164,21 @@ class Recorder {
    */
   int getMaxDecimalPlaces() const;
 
+  /**
+   * @brief Set whether keyframes skip the state updates of the instances
+   * whose nodes didn't move since the previous keyframe, such as those of
+   * sleeping physics objects, instead of recomputing the absolute
+   * transformations of every instance, which mostly static scenes spend their
+   * keyframes on.
+   *
+   * A node moves whenever its transformation or the one of an ancestor
+   * changes, through a physics step or the API alike, so moves between two
+   * keyframes are recorded even if the object fell asleep since.
+   */
+  void setSkipUnmovedInstances(bool skipUnmovedInstances) {
+    skipUnmovedInstances_ = skipUnmovedInstances;
+  }
+
   /**
    * @brief returns JSONized version of given keyframe.
    */
@@ -217,6 +232,7 @@ class Recorder {
   std::unordered_map<int, std::vector<scene::SceneNode*>> rigNodes_;
   std::unordered_map<int, std::vector<Magnum::Matrix4>> rigNodeTransformCache_;
   int maxDecimalPlaces_ = DEFAULT_MAX_DECIMAL_PLACES;
+  bool skipUnmovedInstances_ = false;
 
   ESP_SMART_POINTERS(Recorder)
 };
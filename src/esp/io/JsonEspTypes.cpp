@@ -303,6 +303,7 @@ JsonGenericValue toJsonValue(const esp::nav::NavMeshSettings& x,
   addMember(obj, "filterLedgeSpans", x.filterLedgeSpans, allocator);
   addMember(obj, "filterWalkableLowHeightSpans", x.filterWalkableLowHeightSpans,
             allocator);
+  addMember(obj, "tileSize", x.tileSize, allocator);
 
   return obj;
 }
@@ -325,6 +326,7 @@ bool fromJsonValue(const JsonGenericValue& obj, esp::nav::NavMeshSettings& x) {
   readMember(obj, "filterLedgeSpans", x.filterLedgeSpans);
   readMember(obj, "filterWalkableLowHeightSpans",
              x.filterWalkableLowHeightSpans);
+  readMember(obj, "tileSize", x.tileSize);
 
   return true;
 }
@@ -12,6 +12,8 @@ PhysicsManagerAttributes::PhysicsManagerAttributes(const std::string& handle)
     : AbstractAttributes("PhysicsManagerAttributes", handle) {
   setSimulator("bullet");
   setTimestep(0.008);
+  setNumSubsteps(1);
+  setRenderInterval(1);
   setGravity({0, -9.8, 0});
   setFrictionCoefficient(0.4);
   setRestitutionCoefficient(0.1);
@@ -22,6 +24,8 @@ void PhysicsManagerAttributes::writeValuesToJson(
     io::JsonAllocator& allocator) const {
   writeValueToJson("physics_simulator", jsonObj, allocator);
   writeValueToJson("timestep", jsonObj, allocator);
+  writeValueToJson("num_substeps", jsonObj, allocator);
+  writeValueToJson("render_interval", jsonObj, allocator);
   writeValueToJson("gravity", jsonObj, allocator);
   writeValueToJson("friction_coefficient", jsonObj, allocator);
   writeValueToJson("restitution_coefficient", jsonObj, allocator);
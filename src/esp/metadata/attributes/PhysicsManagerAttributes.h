@@ -53,6 +53,30 @@ class PhysicsManagerAttributes : public AbstractAttributes {
    */
   int getMaxSubsteps() const { return get<int>("max_substeps"); }
 
+  /**
+   * @brief Set the number of fixed timesteps the physical world advances by
+   * per agent action. See @ref esp::sim::Simulator::stepWorldSubsteps.
+   */
+  void setNumSubsteps(int numSubsteps) { set("num_substeps", numSubsteps); }
+  /**
+   * @brief Get the number of fixed timesteps the physical world advances by
+   * per agent action.
+   */
+  int getNumSubsteps() const { return get<int>("num_substeps"); }
+
+  /**
+   * @brief Set the number of physics steps between two renderings of the
+   * observations when stepping with substeps.
+   */
+  void setRenderInterval(int renderInterval) {
+    set("render_interval", renderInterval);
+  }
+  /**
+   * @brief Get the number of physics steps between two renderings of the
+   * observations when stepping with substeps.
+   */
+  int getRenderInterval() const { return get<int>("render_interval"); }
+
   /**
    * @brief Set Simulator-wide gravity.
    */
@@ -88,8 +112,9 @@ class PhysicsManagerAttributes : public AbstractAttributes {
    */
 
   std::string getObjectInfoHeaderInternal() const override {
-    return "Simulator Type,Timestep,Max Substeps,Gravity XYZ,Friction "
-           "Coefficient,Restitution Coefficient,";
+    return "Simulator Type,Timestep,Max Substeps,Num Substeps,Render "
+           "Interval,Gravity XYZ,Friction Coefficient,Restitution "
+           "Coefficient,";
   }
 
   /**
@@ -98,8 +123,9 @@ class PhysicsManagerAttributes : public AbstractAttributes {
    */
   std::string getObjectInfoInternal() const override {
     return Cr::Utility::formatString(
-        "{},{},{},{},{},{}", getSimulator(), getAsString("timestep"),
-        getAsString("max_substeps"), getAsString("gravity"),
+        "{},{},{},{},{},{},{},{}", getSimulator(), getAsString("timestep"),
+        getAsString("max_substeps"), getAsString("num_substeps"),
+        getAsString("render_interval"), getAsString("gravity"),
         getAsString("friction_coefficient"),
         getAsString("restitution_coefficient"));
   }
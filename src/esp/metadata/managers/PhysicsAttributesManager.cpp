@@ -52,6 +52,20 @@ void PhysicsAttributesManager::setValsFromJSONDoc(
       jsonConfig, "max_substeps", [physicsManagerAttributes](int max_substeps) {
         physicsManagerAttributes->setMaxSubsteps(max_substeps);
       });
+
+  // load the number of fixed timesteps per agent action
+  io::jsonIntoSetter<int>(
+      jsonConfig, "num_substeps", [physicsManagerAttributes](int num_substeps) {
+        physicsManagerAttributes->setNumSubsteps(num_substeps);
+      });
+
+  // load the number of physics steps between renderings
+  io::jsonIntoSetter<int>(
+      jsonConfig, "render_interval",
+      [physicsManagerAttributes](int render_interval) {
+        physicsManagerAttributes->setRenderInterval(render_interval);
+      });
+
   // load the friction coefficient
   io::jsonIntoSetter<double>(
       jsonConfig, "friction_coefficient",
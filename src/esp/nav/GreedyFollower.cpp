@@ -8,6 +8,9 @@
 #include <Magnum/EigenIntegration/GeometryIntegration.h>
 #include <Magnum/EigenIntegration/Integration.h>
 
+#include <cmath>
+
+#include "esp/core/Check.h"
 #include "esp/core/Esp.h"
 #include "esp/geo/Geo.h"
 
@@ -17,6 +20,32 @@ using Mn::EigenIntegration::cast;
 namespace esp {
 namespace nav {
 
+namespace {
+
+// A move function executing a default control natively, filtering the move
+// on the navmesh like the python controls of the simulator do
+GreedyGeodesicFollowerImpl::MoveFn nativeMoveFn(
+    const PathFinder::ptr& pathfinder,
+    scene::DefaultControl control,
+    float amount,
+    bool allowSliding) {
+  scene::ObjectControls::MoveFilterFunc filterFunc =
+      [pathfinder, allowSliding](const vec3f& start, const vec3f& end) {
+        if (!pathfinder->isLoaded()) {
+          return end;
+        }
+        return allowSliding ? pathfinder->tryStep(start, end)
+                            : pathfinder->tryStepNoSliding(start, end);
+      };
+  return [control, amount,
+          filterFunc = std::move(filterFunc)](scene::SceneNode* node) {
+    return scene::ObjectControls::applyDefaultControl(*node, control, amount,
+                                                      NAN, filterFunc);
+  };
+}
+
+}  // namespace
+
 GreedyGeodesicFollowerImpl::GreedyGeodesicFollowerImpl(
     PathFinder::ptr& pathfinder,
     MoveFn& moveForward,
@@ -37,6 +66,33 @@ GreedyGeodesicFollowerImpl::GreedyGeodesicFollowerImpl(
       fixThrashing_{fixThrashing},
       thrashingThreshold_{thrashingThreshold} {};
 
+GreedyGeodesicFollowerImpl::GreedyGeodesicFollowerImpl(
+    PathFinder::ptr& pathfinder,
+    double goalDist,
+    double forwardAmount,
+    double turnAmount,
+    bool allowSliding,
+    bool fixThrashing,
+    int thrashingThreshold)
+    : pathfinder_{pathfinder},
+      moveForward_{nativeMoveFn(pathfinder,
+                                scene::DefaultControl::MoveForward,
+                                forwardAmount,
+                                allowSliding)},
+      turnLeft_{nativeMoveFn(pathfinder,
+                             scene::DefaultControl::LookLeft,
+                             float(Mn::Deg{Mn::Rad{float(turnAmount)}}),
+                             allowSliding)},
+      turnRight_{nativeMoveFn(pathfinder,
+                              scene::DefaultControl::LookRight,
+                              float(Mn::Deg{Mn::Rad{float(turnAmount)}}),
+                              allowSliding)},
+      forwardAmount_{forwardAmount},
+      goalDist_{goalDist},
+      turnAmount_{turnAmount},
+      fixThrashing_{fixThrashing},
+      thrashingThreshold_{thrashingThreshold} {};
+
 float GreedyGeodesicFollowerImpl::geoDist(const Mn::Vector3& start,
                                           const Mn::Vector3& end) {
   geoDistPath_.requestedStart = cast<vec3f>(start);
@@ -260,5 +316,105 @@ void GreedyGeodesicFollowerImpl::reset() {
   thrashingActions_.clear();
 }
 
+namespace {
+
+Mn::Quaternion rotationAt(const Eigen::RowMatrixX4f& rotations, int row) {
+  return {{rotations(row, 0), rotations(row, 1), rotations(row, 2)},
+          rotations(row, 3)};
+}
+
+Mn::Vector3 pointAt(const Eigen::RowMatrixX3f& points, int row) {
+  return {points(row, 0), points(row, 1), points(row, 2)};
+}
+
+}  // namespace
+
+BatchGreedyGeodesicFollowerImpl::BatchGreedyGeodesicFollowerImpl(
+    PathFinder::ptr& pathfinder,
+    int numAgents,
+    double goalDist,
+    double forwardAmount,
+    double turnAmount,
+    bool allowSliding,
+    bool fixThrashing,
+    int thrashingThreshold)
+    : lastGoals_{Eigen::RowMatrixX3f::Constant(numAgents, 3, NAN)},
+      pathFollower_{GreedyGeodesicFollowerImpl::create(pathfinder,
+                                                       goalDist,
+                                                       forwardAmount,
+                                                       turnAmount,
+                                                       allowSliding,
+                                                       fixThrashing,
+                                                       thrashingThreshold)} {
+  followers_.reserve(numAgents);
+  for (int i = 0; i < numAgents; ++i) {
+    followers_.emplace_back(GreedyGeodesicFollowerImpl::create(
+        pathfinder, goalDist, forwardAmount, turnAmount, allowSliding,
+        fixThrashing, thrashingThreshold));
+  }
+}
+
+Eigen::VectorXi BatchGreedyGeodesicFollowerImpl::nextActionsAlong(
+    const Eigen::RowMatrixX4f& rotations,
+    const Eigen::RowMatrixX3f& positions,
+    const Eigen::RowMatrixX3f& goals) {
+  const int numAgents = followers_.size();
+  ESP_CHECK(rotations.rows() == numAgents && positions.rows() == numAgents &&
+                goals.rows() == numAgents,
+            "nextActionsAlong: expected a state and a goal for each of the"
+                << numAgents << "agents, got" << rotations.rows()
+                << "rotations," << positions.rows() << "positions and"
+                << goals.rows() << "goals");
+
+  Eigen::VectorXi actions(numAgents);
+  for (int i = 0; i < numAgents; ++i) {
+    // Same tolerance as numpy.allclose, NAN never compares close
+    const bool sameGoal = ((goals.row(i) - lastGoals_.row(i)).array().abs() <=
+                           1e-8f + 1e-5f * lastGoals_.row(i).array().abs())
+                              .all();
+    if (!sameGoal) {
+      followers_[i]->reset();
+      lastGoals_.row(i) = goals.row(i);
+    }
+    actions[i] = static_cast<int>(followers_[i]->nextActionAlong(
+        rotationAt(rotations, i), pointAt(positions, i), pointAt(goals, i)));
+  }
+  return actions;
+}
+
+std::vector<std::vector<GreedyGeodesicFollowerImpl::CODES>>
+BatchGreedyGeodesicFollowerImpl::findPaths(const Eigen::RowMatrixX4f& rotations,
+                                           const Eigen::RowMatrixX3f& positions,
+                                           const Eigen::RowMatrixX3f& goals) {
+  const int numRows = rotations.rows();
+  ESP_CHECK(positions.rows() == numRows && goals.rows() == numRows,
+            "findPaths: got" << numRows << "rotations," << positions.rows()
+                             << "positions and" << goals.rows() << "goals");
+
+  std::vector<std::vector<GreedyGeodesicFollowerImpl::CODES>> paths(numRows);
+  for (int i = 0; i < numRows; ++i) {
+    pathFollower_->reset();
+    paths[i] = pathFollower_->findPath(
+        rotationAt(rotations, i), pointAt(positions, i), pointAt(goals, i));
+  }
+  pathFollower_->reset();
+  return paths;
+}
+
+void BatchGreedyGeodesicFollowerImpl::reset() {
+  for (auto& follower : followers_) {
+    follower->reset();
+  }
+  lastGoals_.setConstant(NAN);
+}
+
+void BatchGreedyGeodesicFollowerImpl::reset(int agentIndex) {
+  ESP_CHECK(agentIndex >= 0 && agentIndex < int(followers_.size()),
+            "reset: agent index" << agentIndex << "out of range for"
+                                 << followers_.size() << "agents");
+  followers_[agentIndex]->reset();
+  lastGoals_.row(agentIndex).setConstant(NAN);
+}
+
 }  // namespace nav
 }  // namespace esp
@@ -8,6 +8,7 @@
 #include "esp/core/Esp.h"
 #include "esp/core/RigidState.h"
 #include "esp/nav/PathFinder.h"
+#include "esp/scene/ObjectControls.h"
 #include "esp/scene/SceneGraph.h"
 #include "esp/scene/SceneNode.h"
 
@@ -81,6 +82,34 @@ class GreedyGeodesicFollowerImpl {
                              bool fixThrashing = true,
                              int thrashingThreshold = 16);
 
+  /**
+   * @brief Constructor for agents using the default controls, which are
+   * executed natively instead of through callbacks
+   *
+   * "move_forward" moves by @p forwardAmount and "turn_left"/"turn_right"
+   * turn by @p turnAmount, each move being filtered by
+   * @ref PathFinder::tryStep or @ref PathFinder::tryStepNoSliding.
+   *
+   * @param[in] pathfinder Instance of the pathfinder used for calculating the
+   *                       geodesic shortest path and filtering the moves
+   * @param[in] goalDist How close the agent needs to get to the goal before
+   *                     calling stop
+   * @param[in] forwardAmount The amount "move_forward" moves the agent
+   * @param[in] turnAmount The amount "turn_left"/"turn_right" turns the agent
+   *                       in radians
+   * @param[in] allowSliding Whether moves slide along walls
+   * @param[in] fixThrashing Whether or not to fix thrashing
+   * @param[in] thrashingThreshold The length of left, right, left, right
+   *                                actions needed to be considered thrashing
+   */
+  GreedyGeodesicFollowerImpl(PathFinder::ptr& pathfinder,
+                             double goalDist,
+                             double forwardAmount,
+                             double turnAmount,
+                             bool allowSliding,
+                             bool fixThrashing = true,
+                             int thrashingThreshold = 16);
+
   /**
    * @brief Calculates the next action to follow the path
    *
@@ -162,6 +191,93 @@ class GreedyGeodesicFollowerImpl {
   ESP_SMART_POINTERS(GreedyGeodesicFollowerImpl)
 };
 
+/**
+ * @brief Greedy geodesic followers for many agents using the default controls
+ *
+ * Each agent has its own @ref GreedyGeodesicFollowerImpl, which keeps track of
+ * its goal and recent actions, while all of them share the navmesh queries of
+ * the pathfinder. Agent states are passed as arrays, so that a whole batch is
+ * planned in a single call.
+ */
+class BatchGreedyGeodesicFollowerImpl {
+ public:
+  /**
+   * @brief Constructor
+   *
+   * @param[in] pathfinder Instance of the pathfinder
+   * @param[in] numAgents The number of agents followed by @ref
+   *                      nextActionsAlong
+   *
+   * See @ref GreedyGeodesicFollowerImpl for the other parameters.
+   */
+  BatchGreedyGeodesicFollowerImpl(PathFinder::ptr& pathfinder,
+                                  int numAgents,
+                                  double goalDist,
+                                  double forwardAmount,
+                                  double turnAmount,
+                                  bool allowSliding = true,
+                                  bool fixThrashing = true,
+                                  int thrashingThreshold = 16);
+
+  /**
+   * @brief The number of agents
+   */
+  int getNumAgents() const { return followers_.size(); }
+
+  /**
+   * @brief Calculates the next action of every agent
+   *
+   * The follower of an agent is reset whenever the goal of the agent changes.
+   *
+   * @param[in] rotations The rotation of each agent as quaternion
+   *                      coefficients (x, y, z, w), one per row
+   * @param[in] positions The position of each agent, one per row
+   * @param[in] goals The goal of each agent, one per row
+   * @return The @ref GreedyGeodesicFollowerImpl::CODES of the next action of
+   * each agent
+   */
+  Eigen::VectorXi nextActionsAlong(const Eigen::RowMatrixX4f& rotations,
+                                   const Eigen::RowMatrixX3f& positions,
+                                   const Eigen::RowMatrixX3f& goals);
+
+  /**
+   * @brief Finds the full path of each row from a start state to a goal
+   *
+   * The rows are independent of the agents followed by @ref
+   * nextActionsAlong, so any number of episodes can be planned at once.
+   *
+   * @param[in] rotations The start rotation of each row as quaternion
+   *                      coefficients (x, y, z, w)
+   * @param[in] positions The start position of each row
+   * @param[in] goals The goal of each row
+   * @return The actions of each row, ending with
+   * @ref GreedyGeodesicFollowerImpl::CODES::STOP, or empty if no path was found
+   */
+  std::vector<std::vector<GreedyGeodesicFollowerImpl::CODES>> findPaths(
+      const Eigen::RowMatrixX4f& rotations,
+      const Eigen::RowMatrixX3f& positions,
+      const Eigen::RowMatrixX3f& goals);
+
+  /**
+   * @brief Reset the followers of all agents.
+   */
+  void reset();
+
+  /**
+   * @brief Reset the follower of one agent, e.g. when it starts a new episode
+   */
+  void reset(int agentIndex);
+
+ private:
+  std::vector<GreedyGeodesicFollowerImpl::ptr> followers_;
+  // the goal of each follower, NAN until it has one
+  Eigen::RowMatrixX3f lastGoals_;
+  // plans the rows of findPaths
+  GreedyGeodesicFollowerImpl::ptr pathFollower_;
+
+  ESP_SMART_POINTERS(BatchGreedyGeodesicFollowerImpl)
+};
+
 }  // namespace nav
 }  // namespace esp
 
@@ -0,0 +1,55 @@
+// Copyright (c) Meta Platforms, Inc. and its affiliates.
+// This source code is licensed under the MIT license found in the
+// LICENSE file in the root directory of this source tree.
+
+#include "NavMeshCache.h"
+
+#include "esp/nav/PathFinder.h"
+
+namespace esp {
+namespace nav {
+
+NavMeshCache::NavMeshCache(const std::string& directory,
+                           const std::size_t maxSize)
+    : FileCache{directory, ".navmesh", "navmesh", maxSize} {}
+
+std::string NavMeshCache::computeKey(const NavMeshSettings& settings,
+                                     const float* verts,
+                                     const int nverts,
+                                     const int* tris,
+                                     const int ntris,
+                                     const float* bmin,
+                                     const float* bmax) {
+  Hasher hasher;
+  // Field by field, the padding of the struct is undefined
+  hasher.add(settings.cellSize);
+  hasher.add(settings.cellHeight);
+  hasher.add(settings.agentHeight);
+  hasher.add(settings.agentRadius);
+  hasher.add(settings.agentMaxClimb);
+  hasher.add(settings.agentMaxSlope);
+  hasher.add(settings.regionMinSize);
+  hasher.add(settings.regionMergeSize);
+  hasher.add(settings.edgeMaxLen);
+  hasher.add(settings.edgeMaxError);
+  hasher.add(settings.vertsPerPoly);
+  hasher.add(settings.detailSampleDist);
+  hasher.add(settings.detailSampleMaxError);
+  hasher.add(settings.filterLowHangingObstacles);
+  hasher.add(settings.filterLedgeSpans);
+  hasher.add(settings.filterWalkableLowHeightSpans);
+  hasher.add(settings.includeStaticObjects);
+  hasher.add(settings.tileSize);
+
+  hasher.add(nverts);
+  hasher.add(verts, sizeof(float) * 3 * nverts);
+  hasher.add(ntris);
+  hasher.add(tris, sizeof(int) * 3 * ntris);
+  hasher.add(bmin, sizeof(float) * 3);
+  hasher.add(bmax, sizeof(float) * 3);
+
+  return hasher.key();
+}
+
+}  // namespace nav
+}  // namespace esp
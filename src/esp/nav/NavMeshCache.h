@@ -0,0 +1,61 @@
+// Copyright (c) Meta Platforms, Inc. and its affiliates.
+// This source code is licensed under the MIT license found in the
+// LICENSE file in the root directory of this source tree.
+
+#ifndef ESP_NAV_NAVMESHCACHE_H_
+#define ESP_NAV_NAVMESHCACHE_H_
+
+#include <cstddef>
+#include <string>
+
+#include "esp/core/Esp.h"
+#include "esp/core/FileCache.h"
+
+namespace esp {
+namespace nav {
+
+struct NavMeshSettings;
+
+/**
+ * @brief Content-addressed on-disk cache of built navmeshes.
+ *
+ * Each navmesh is saved as a `<key>.navmesh` file in the cache directory, the
+ * key being a hash of the geometry the navmesh was built from and of its @ref
+ * NavMeshSettings. A joined mesh including static objects hashes differently
+ * than the stage alone, so there is no need to invalidate anything: any
+ * change of the inputs just misses the cache. Once the files of the directory
+ * exceed the maximum size, the least recently used ones are removed.
+ *
+ * Several processes can share a directory, navmeshes are saved to @ref
+ * getTemporaryPath and then moved into the cache by @ref commit.
+ */
+class NavMeshCache : public core::FileCache {
+ public:
+  /**
+   * @brief Constructor. The directory is created if needed.
+   *
+   * @param directory The directory holding the cached navmeshes
+   * @param maxSize The maximum total size of the cached navmeshes in bytes
+   */
+  explicit NavMeshCache(const std::string& directory,
+                        std::size_t maxSize = DefaultMaxSize);
+
+  /**
+   * @brief Computes the key of a navmesh from the inputs of @ref
+   * PathFinder::build.
+   */
+  static std::string computeKey(const NavMeshSettings& settings,
+                                const float* verts,
+                                int nverts,
+                                const int* tris,
+                                int ntris,
+                                const float* bmin,
+                                const float* bmax);
+
+  ESP_SMART_POINTERS(NavMeshCache)
+};
+
+}  // namespace nav
+}  // namespace esp
+
+#endif  // ESP_NAV_NAVMESHCACHE_H_
@@ -3,9 +3,19 @@
 // LICENSE file in the root directory of this source tree.
 
 #include "PathFinder.h"
+#include <algorithm>
+#include <array>
+#include <atomic>
 #include <cstddef>
+#include <list>
+#include <map>
 #include <numeric>
+#include <queue>
+#include <random>
+#include <set>
 #include <stack>
+#include <thread>
+#include <tuple>
 #include <unordered_map>
 
 #include <Magnum/Magnum.h>
@@ -26,6 +36,7 @@
 
 #include "esp/assets/MeshData.h"
 #include "esp/core/Esp.h"
+#include "esp/nav/NavMeshCache.h"
 
 #include "DetourCommon.h"
 #include "DetourNavMesh.h"
@@ -55,7 +66,8 @@ bool operator==(const NavMeshSettings& a, const NavMeshSettings& b) {
          CLOSE(edgeMaxError) && CLOSE(vertsPerPoly) &&
          CLOSE(detailSampleDist) && CLOSE(detailSampleMaxError) &&
          EQ(filterLowHangingObstacles) && EQ(filterLedgeSpans) &&
-         EQ(filterWalkableLowHeightSpans) && EQ(includeStaticObjects);
+         EQ(filterWalkableLowHeightSpans) && EQ(includeStaticObjects) &&
+         EQ(tileSize);
 
 #undef CLOSE
 #undef EQ
@@ -121,6 +133,31 @@ const std::vector<vec3f>& MultiGoalShortestPath::getRequestedEnds() const {
   return pimpl_->requestedEnds;
 }
 
+struct GeodesicDistanceField::Impl {
+  std::vector<vec3f> goals;
+
+  //! Version of the navmesh the field was built for, -1 if not built.
+  int navMeshVersion = ID_UNDEFINED;
+  //! Distance from each vertex graph node to the closest goal.
+  std::vector<float> nodeDistances;
+  //! Goals snapped to the navmesh, by the polygon they are on.
+  std::unordered_map<dtPolyRef, std::vector<vec3f>> polyGoals;
+};
+
+GeodesicDistanceField::GeodesicDistanceField()
+    : pimpl_{spimpl::make_unique_impl<Impl>()} {};
+
+void GeodesicDistanceField::setGoals(const std::vector<vec3f>& newGoals) {
+  pimpl_->goals = newGoals;
+  pimpl_->navMeshVersion = ID_UNDEFINED;
+  pimpl_->nodeDistances.clear();
+  pimpl_->polyGoals.clear();
+}
+
+const std::vector<vec3f>& GeodesicDistanceField::getGoals() const {
+  return pimpl_->goals;
+}
+
 namespace {
 template <typename T>
 std::tuple<dtStatus, dtPolyRef, vec3f> projectToPoly(
@@ -144,6 +181,58 @@ std::tuple<dtStatus, dtPolyRef, vec3f> projectToPoly(
 
   return std::make_tuple(status, polyRef, polyXYZ);
 }
+
+/**
+ * @brief Splits [0, numItems) into contiguous chunks and calls
+ * fn(begin, end, threadIndex) for each on its own thread. The first chunk runs
+ * on the calling thread.
+ */
+template <typename Fn>
+void parallelForChunks(const int numItems, const int numThreads, Fn&& fn) {
+  if (numThreads <= 1) {
+    fn(0, numItems, 0);
+    return;
+  }
+
+  const int chunkSize = (numItems + numThreads - 1) / numThreads;
+  std::vector<std::thread> threads;
+  threads.reserve(numThreads - 1);
+  for (int iThread = 1; iThread < numThreads; ++iThread) {
+    const int begin = iThread * chunkSize;
+    const int end = std::min(numItems, begin + chunkSize);
+    if (begin >= end)
+      break;
+    threads.emplace_back(fn, begin, end, iThread);
+  }
+  fn(0, std::min(numItems, chunkSize), 0);
+  for (auto& thread : threads)
+    thread.join();
+}
+
+/**
+ * @brief Calls fn(item) for each item of [0, numItems) on @ref numThreads
+ * threads, each thread taking the next item as soon as it is done with the
+ * previous one. Balances items which take uneven amounts of time better than
+ * @ref parallelForChunks.
+ */
+template <typename Fn>
+void parallelForEach(const int numItems, const int numThreads, Fn&& fn) {
+  std::atomic<int> nextItem{0};
+  parallelForChunks(numThreads, numThreads, [&](int, int, int) {
+    for (int item = nextItem++; item < numItems; item = nextItem++) {
+      fn(item);
+    }
+  });
+}
+
+//! Number of threads to split @ref numItems items across, all hardware
+//! threads if @ref numThreads is less than 1
+int resolveNumThreads(int numThreads, const int numItems) {
+  if (numThreads < 1) {
+    numThreads = std::max(1u, std::thread::hardware_concurrency());
+  }
+  return std::max(1, std::min(numThreads, numItems));
+}
 }  // namespace
 
 namespace impl {
@@ -396,6 +485,13 @@ class IslandSystem {
   //! return the island for a navmesh polygon
   inline int getPolyIsland(dtPolyRef polyRef) { return polyToIsland_[polyRef]; }
 
+  //! Same as @ref getPolyIsland, but safe to call from several threads.
+  //! ID_UNDEFINED for polygons without an island.
+  inline int findPolyIsland(dtPolyRef polyRef) const {
+    auto it = polyToIsland_.find(polyRef);
+    return it == polyToIsland_.end() ? ID_UNDEFINED : int(it->second);
+  }
+
  private:
   //! map islands to area for quick query
   std::unordered_map<uint32_t, float> islandsToArea_;
@@ -457,6 +553,193 @@ class IslandSystem {
     }
   }
 };
+
+//! Calls fn(neighbourRef) for each walkable polygon linked to ref.
+template <typename Fn>
+void forEachNeighbourPoly(const dtNavMesh* navMesh,
+                          const dtQueryFilter* filter,
+                          const dtPolyRef ref,
+                          Fn&& fn) {
+  const dtMeshTile* tile = nullptr;
+  const dtPoly* poly = nullptr;
+  navMesh->getTileAndPolyByRefUnsafe(ref, &tile, &poly);
+  for (unsigned int iLink = poly->firstLink; iLink != DT_NULL_LINK;
+       iLink = tile->links[iLink].next) {
+    const dtPolyRef neighbourRef = tile->links[iLink].ref;
+    const dtMeshTile* neighbourTile = nullptr;
+    const dtPoly* neighbourPoly = nullptr;
+    navMesh->getTileAndPolyByRefUnsafe(neighbourRef, &neighbourTile,
+                                       &neighbourPoly);
+    if (filter->passFilter(neighbourRef, neighbourTile, neighbourPoly))
+      fn(neighbourRef);
+  }
+}
+
+//! Whether the straight segment from start, inside startRef, to end stays on
+//! the navmesh.
+inline bool isSegmentWalkable(const dtNavMeshQuery* navQuery,
+                              const dtQueryFilter* filter,
+                              const dtPolyRef startRef,
+                              const vec3f& start,
+                              const vec3f& end) {
+  static const int MAX_POLYS = 16;
+  dtPolyRef polys[MAX_POLYS];
+  int numPolys = 0;
+  float t = 0;
+  vec3f hitNormal;
+  const dtStatus status =
+      navQuery->raycast(startRef, start.data(), end.data(), filter, &t,
+                        hitNormal.data(), polys, &numPolys, MAX_POLYS);
+  // t is FLT_MAX if the ray reached end, ends on polygon edges can report a
+  // hit right at the end instead
+  return dtStatusSucceed(status) && t > 0.999f;
+}
+
+// Graph over the vertices of the navmesh polygons used to build geodesic
+// distance fields. Vertices are merged by position, so vertices shared by
+// polygons in different tiles are a single node. Two nodes are connected if the
+// straight segment between them is walkable: all vertices of a (convex)
+// polygon are connected, and vertices of neighbouring polygons are connected if
+// a raycast between them is unobstructed.
+// Takes O(npolys) raycasts to construct
+class VertexGraph {
+ public:
+  VertexGraph(const dtNavMesh* navMesh,
+              const dtNavMeshQuery* navQuery,
+              const dtQueryFilter* filter) {
+    std::map<std::array<int, 3>, int> nodeIds;
+    for (int iTile = 0; iTile < navMesh->getMaxTiles(); ++iTile) {
+      const dtMeshTile* tile = navMesh->getTile(iTile);
+      if (!tile || !tile->header)
+        continue;
+
+      for (int jPoly = 0; jPoly < tile->header->polyCount; ++jPoly) {
+        const dtPolyRef ref = navMesh->encodePolyId(tile->salt, iTile, jPoly);
+        const dtPoly* poly = &tile->polys[jPoly];
+        if (!navMesh->isValidPolyRef(ref) ||
+            poly->getType() == DT_POLYTYPE_OFFMESH_CONNECTION ||
+            !filter->passFilter(ref, tile, poly))
+          continue;
+
+        std::vector<int>& polyNodes = polyNodes_[ref];
+        for (int iVert = 0; iVert < poly->vertCount; ++iVert) {
+          const vec3f vert = Eigen::Map<const vec3f>(
+              &tile->verts[static_cast<size_t>(poly->verts[iVert]) * 3]);
+          // quantize to mm to merge duplicated tile border vertices
+          const std::array<int, 3> key{
+              static_cast<int>(std::round(vert[0] * 1000)),
+              static_cast<int>(std::round(vert[1] * 1000)),
+              static_cast<int>(std::round(vert[2] * 1000))};
+          auto inserted = nodeIds.emplace(key, nodes_.size());
+          if (inserted.second)
+            nodes_.emplace_back(vert);
+          polyNodes.push_back(inserted.first->second);
+        }
+      }
+    }
+
+    edges_.resize(nodes_.size());
+    std::set<std::pair<int, int>> connected;
+    for (const auto& refNodes : polyNodes_) {
+      vec3f polyCenter = vec3f::Zero();
+      for (int node : refNodes.second)
+        polyCenter += nodes_[node];
+      polyCenter /= refNodes.second.size();
+
+      for (int node : refNodes.second) {
+        // Nudge the start into the polygon, raycasts from exactly a vertex
+        // are not reliable
+        constexpr float nudgeDistance = 1e-4;  // 0.1mm
+        const vec3f start =
+            nodes_[node] +
+            nudgeDistance * (polyCenter - nodes_[node]).normalized();
+        forEachVisibleNode(
+            navMesh, navQuery, filter, refNodes.first, start,
+            [&](const int otherNode, float) {
+              if (otherNode == node || !connected
+                                            .emplace(std::min(node, otherNode),
+                                                     std::max(node, otherNode))
+                                            .second)
+                return;
+              const float length = (nodes_[otherNode] - nodes_[node]).norm();
+              edges_[node].emplace_back(otherNode, length);
+              edges_[otherNode].emplace_back(node, length);
+            });
+      }
+    }
+  }
+
+  //! Nodes of a polygon, empty if the polygon is not walkable.
+  const std::vector<int>& polyNodes(const dtPolyRef ref) const {
+    static const std::vector<int> noNodes;
+    auto itRef = polyNodes_.find(ref);
+    return itRef == polyNodes_.end() ? noNodes : itRef->second;
+  }
+
+  /**
+   * @brief Calls fn(node, distance) for each node that can be reached from pt,
+   * inside polygon ref, in a straight line. Only considers the nodes of ref and
+   * its neighbours.
+   */
+  template <typename Fn>
+  void forEachVisibleNode(const dtNavMesh* navMesh,
+                          const dtNavMeshQuery* navQuery,
+                          const dtQueryFilter* filter,
+                          const dtPolyRef ref,
+                          const vec3f& pt,
+                          Fn&& fn) const {
+    const std::vector<int>& ownNodes = polyNodes(ref);
+    for (int node : ownNodes)
+      fn(node, (nodes_[node] - pt).norm());
+
+    forEachNeighbourPoly(navMesh, filter, ref, [&](const dtPolyRef neighbour) {
+      for (int node : polyNodes(neighbour)) {
+        if (std::find(ownNodes.begin(), ownNodes.end(), node) != ownNodes.end())
+          continue;
+        if (isSegmentWalkable(navQuery, filter, ref, pt, nodes_[node]))
+          fn(node, (nodes_[node] - pt).norm());
+      }
+    });
+  }
+
+  //! Multi-source Dijkstra. Returns the distance of each node from the closest
+  //! source given as (node, initial distance).
+  std::vector<float> distancesFrom(
+      const std::vector<std::pair<int, float>>& sources) const {
+    std::vector<float> distances(nodes_.size(),
+                                 std::numeric_limits<float>::infinity());
+    typedef std::pair<float, int> Entry;
+    std::priority_queue<Entry, std::vector<Entry>, std::greater<Entry>> queue;
+    for (const auto& source : sources) {
+      if (source.second < distances[source.first]) {
+        distances[source.first] = source.second;
+        queue.emplace(source.second, source.first);
+      }
+    }
+
+    while (!queue.empty()) {
+      const Entry entry = queue.top();
+      queue.pop();
+      if (entry.first > distances[entry.second])
+        continue;
+
+      for (const auto& edge : edges_[entry.second]) {
+        const float distance = entry.first + edge.second;
+        if (distance < distances[edge.first]) {
+          distances[edge.first] = distance;
+          queue.emplace(distance, edge.first);
+        }
+      }
+    }
+    return distances;
+  }
+
+ private:
+  std::vector<vec3f> nodes_;
+  //! (node, length) pairs of the edges leaving each node
+  std::vector<std::vector<std::pair<int, float>>> edges_;
+  std::unordered_map<dtPolyRef, std::vector<int>> polyNodes_;
+};
 }  // namespace impl
 
 struct PathFinder::Impl {
@@ -472,6 +755,22 @@ struct PathFinder::Impl {
              const float* bmax);
   bool build(const NavMeshSettings& bs, const esp::assets::MeshData& mesh);
 
+  bool rebuildTiles(const float* verts,
+                    int nverts,
+                    const int* tris,
+                    int ntris,
+                    const std::vector<std::pair<vec3f, vec3f>>& regions);
+  bool rebuildTiles(const esp::assets::MeshData& mesh,
+                    const std::vector<std::pair<vec3f, vec3f>>& regions);
+
+  void setNavMeshCache(NavMeshCache::ptr cache) {
+    navMeshCache_ = std::move(cache);
+  }
+  NavMeshCache::ptr getNavMeshCache() const { return navMeshCache_; }
+
+  void setNumBuildThreads(int numThreads) { numBuildThreads_ = numThreads; }
+  int getNumBuildThreads() const { return numBuildThreads_; }
+
   vec3f getRandomNavigablePoint(int maxTries,
                                 int islandIndex /*= ID_UNDEFINED*/);
   vec3f getRandomNavigablePointAroundSphere(const vec3f& circleCenter,
@@ -520,13 +819,61 @@ struct PathFinder::Impl {
 
   bool isNavigable(const vec3f& pt, float maxYDelta = 0.5) const;
 
+  Eigen::VectorXf geodesicDistanceBatch(const Eigen::RowMatrixX3f& starts,
+                                        const Eigen::RowMatrixX3f& ends,
+                                        int numThreads);
+  Eigen::RowMatrixX3f snapPointBatch(const Eigen::RowMatrixX3f& pts,
+                                     int islandIndex,
+                                     int numThreads);
+  Eigen::RowMatrixX3f tryStepBatch(const Eigen::RowMatrixX3f& starts,
+                                   const Eigen::RowMatrixX3f& ends,
+                                   bool allowSliding,
+                                   int numThreads);
+  Eigen::Matrix<bool, Eigen::Dynamic, 1> isNavigableBatch(
+      const Eigen::RowMatrixX3f& pts,
+      float maxYDelta,
+      int numThreads);
+  Eigen::VectorXf distanceToClosestObstacleBatch(const Eigen::RowMatrixX3f& pts,
+                                                 float maxSearchRadius,
+                                                 int numThreads);
+  SampledEpisodes sampleEpisodes(int numEpisodes,
+                                 const EpisodeSamplingSettings& settings,
+                                 uint32_t seed,
+                                 int numThreads);
+
+  GeodesicDistanceField::ptr getGeodesicDistanceField(
+      const std::vector<vec3f>& goals);
+  float geodesicDistanceToGoals(GeodesicDistanceField& field, const vec3f& pt);
+  Eigen::VectorXf geodesicDistanceToGoalsBatch(GeodesicDistanceField& field,
+                                               const Eigen::RowMatrixX3f& pts,
+                                               int numThreads);
+  void setDistanceFieldCacheSize(int size);
+  int getDistanceFieldCacheSize() const { return distanceFieldCacheSize_; }
+
   std::pair<vec3f, vec3f> bounds() const { return bounds_; };
 
   Eigen::Matrix<bool, Eigen::Dynamic, Eigen::Dynamic>
-  getTopDownView(float metersPerPixel, float height, float eps) const;
+  getTopDownView(float metersPerPixel, float height, float eps);
 
   Eigen::Matrix<int, Eigen::Dynamic, Eigen::Dynamic>
-  getTopDownIslandView(float metersPerPixel, float height, float eps) const;
+  getTopDownIslandView(float metersPerPixel, float height, float eps);
+
+  Eigen::Matrix<bool, Eigen::Dynamic, Eigen::Dynamic> getTopDownViewCrop(
+      float metersPerPixel,
+      float height,
+      const vec3f& center,
+      int radius,
+      float eps);
+
+  Eigen::Matrix<int, Eigen::Dynamic, Eigen::Dynamic> getTopDownIslandViewCrop(
+      float metersPerPixel,
+      float height,
+      const vec3f& center,
+      int radius,
+      float eps);
+
+  void setTopDownViewCacheSize(int size);
+  int getTopDownViewCacheSize() const { return topDownViewCacheSize_; }
 
   assets::MeshData::ptr getNavMeshData(int islandIndex /*= ID_UNDEFINED*/);
 
@@ -547,6 +894,44 @@ struct PathFinder::Impl {
   std::unique_ptr<dtQueryFilter> filter_ = nullptr;
   std::unique_ptr<impl::IslandSystem> islandSystem_ = nullptr;
 
+  //! Query objects for the additional threads of batch queries, thread 0 uses
+  //! navQuery_. Allocated on demand and reset with navQuery_.
+  std::vector<std::unique_ptr<dtNavMeshQuery, NavQueryDeleter>> batchQueries_;
+
+  //! Incremented every time the navmesh changes, used to detect stale
+  //! distance fields.
+  int navMeshVersion_ = 0;
+  //! Built on the first distance field query. Reset with navQuery_.
+  std::unique_ptr<impl::VertexGraph> vertexGraph_ = nullptr;
+  //! Most recently used first, keyed by the sorted goals.
+  std::list<std::pair<std::vector<vec3f>, GeodesicDistanceField::ptr>>
+      distanceFieldCache_;
+  int distanceFieldCacheSize_ = 8;
+
+  //! (metersPerPixel, height, eps) of a top-down view
+  using TopDownViewKey = std::tuple<float, float, float>;
+  template <typename T>
+  using TopDownViewCache =
+      std::list<std::pair<TopDownViewKey,
+                          Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic>>>;
+  //! Most recently used first. Reset with navQuery_.
+  TopDownViewCache<bool> topDownViewCache_;
+  TopDownViewCache<int> topDownIslandViewCache_;
+  int topDownViewCacheSize_ = 8;
+
+  //! The cached view with @ref key, marked as most recently used, nullptr if
+  //! there is none.
+  template <typename T>
+  const Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic>* findTopDownView(
+      TopDownViewCache<T>& cache,
+      const TopDownViewKey& key);
+  //! Caches a view, evicting the least recently used ones if needed.
+  template <typename T>
+  void addTopDownView(
+      TopDownViewCache<T>& cache,
+      const TopDownViewKey& key,
+      const Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic>& topdownMap);
+
   //! Holds triangulated geom/topo. Generated when queried. Reset with
   //! navQuery_.
   std::unordered_map<int, assets::MeshData::ptr> islandMeshData_;
@@ -554,10 +939,78 @@ struct PathFinder::Impl {
 
   std::pair<vec3f, vec3f> bounds_;
 
+  NavMeshCache::ptr navMeshCache_ = nullptr;
+
+  //! Threads building the tiles of tiled navmeshes, all hardware threads if
+  //! less than 1
+  int numBuildThreads_ = 0;
+
   bool initNavQuery();
 
+  //! Builds the navmesh with Recast, without consulting the cache.
+  bool buildNavMesh(const NavMeshSettings& bs,
+                    const float* verts,
+                    int nverts,
+                    const int* tris,
+                    int ntris,
+                    const float* bmin,
+                    const float* bmax);
+
+  //! Builds every tile of a navmesh with NavMeshSettings::tileSize > 0.
+  bool buildTiledNavMesh(const NavMeshSettings& bs,
+                         const rcConfig& cfg,
+                         const float* verts,
+                         int nverts,
+                         const int* tris,
+                         int ntris,
+                         const float* bmin,
+                         const float* bmax);
+
+  /**
+   * @brief Allocates the query objects needed to split @ref numItems queries
+   * across @ref numThreads threads.
+   *
+   * @return The number of threads to use.
+   */
+  int prepareBatchQueries(int numItems, int numThreads);
+
+  //! Returns the query object owned by thread @ref threadIndex of a batch
+  //! query.
+  const dtNavMeshQuery* batchQuery(int threadIndex) const;
+
+  //! Restricts queries to @ref islandIndex until @ref endIslandQuery is called.
+  //! Noop for ID_UNDEFINED.
+  void beginIslandQuery(int islandIndex);
+  void endIslandQuery(int islandIndex);
+
+  float geodesicDistance(const dtNavMeshQuery* navQuery,
+                         const vec3f& start,
+                         const vec3f& end);
+
+  //! (Re)builds field if it is stale.
+  void updateDistanceField(GeodesicDistanceField& field);
+
+  float geodesicDistanceToGoals(const dtNavMeshQuery* navQuery,
+                                const GeodesicDistanceField& field,
+                                const vec3f& pt) const;
+
+  template <typename T>
+  T tryStep(const dtNavMeshQuery* navQuery,
+            const T& start,
+            const T& end,
+            bool allowSliding);
+
+  HitRecord closestObstacleSurfacePoint(const dtNavMeshQuery* navQuery,
+                                        const vec3f& pt,
+                                        float maxSearchRadius) const;
+
+  bool isNavigable(const dtNavMeshQuery* navQuery,
+                   const vec3f& pt,
+                   float maxYDelta) const;
+
   Cr::Containers::Optional<std::tuple<float, std::vector<vec3f>>>
-  findPathInternal(const vec3f& start,
+  findPathInternal(const dtNavMeshQuery* navQuery,
+                   const vec3f& start,
                    dtPolyRef startRef,
                    const vec3f& pathStart,
                    const vec3f& end,
@@ -598,28 +1051,9 @@ enum PolyFlags {
       0x08,               // dynamically set to filter all but a specific island
   POLYFLAGS_ALL = 0xffff  // all abilities
 };
-}  // namespace
-
-PathFinder::Impl::Impl() {
-  filter_ = std::make_unique<dtQueryFilter>();
-  filter_->setIncludeFlags(POLYFLAGS_WALK);
-  filter_->setExcludeFlags(0);
-}
-
-bool PathFinder::Impl::build(const NavMeshSettings& bs,
-                             const float* verts,
-                             const int nverts,
-                             const int* tris,
-                             const int ntris,
-                             const float* bmin,
-                             const float* bmax) {
-  Workspace ws;
-  rcContext ctx;
-
-  //
-  // Step 1. Initialize build config.
-  //
 
+//! Recast configuration of @p bs, without the bounds of the heightfield
+rcConfig navMeshConfig(const NavMeshSettings& bs) {
   // Init build configuration from GUI
   rcConfig cfg{};
   memset(&cfg, 0, sizeof(cfg));
@@ -639,15 +1073,126 @@ bool PathFinder::Impl::build(const NavMeshSettings& bs,
   cfg.detailSampleDist =
       bs.detailSampleDist < 0.9f ? 0 : bs.cellSize * bs.detailSampleDist;
   cfg.detailSampleMaxError = bs.cellHeight * bs.detailSampleMaxError;
+  return cfg;
+}
 
-  // Set the area where the navigation will be build.
-  // Here the bounds of the input mesh are used, but the
-  // area could be specified by an user defined box, etc.
-  rcVcopy(cfg.bmin, bmin);
-  rcVcopy(cfg.bmax, bmax);
-  rcCalcGridSize(cfg.bmin, cfg.bmax, cfg.cs, &cfg.width, &cfg.height);
-  ESP_DEBUG() << "Building navmesh with" << cfg.width << "x" << cfg.height
-              << "cells";
+//! Padding of the tiles in cells, so that neighbouring tiles agree on the
+//! walkable area along their shared edge
+int tileBorderSize(const rcConfig& cfg) {
+  return cfg.walkableRadius + 3;
+}
+
+//! Inclusive range of tile coordinates
+struct TileRange {
+  int minX, minY, maxX, maxY;
+};
+
+//! Tiles of @p params whose bounds, padded by @p border world units, overlap
+//! the XZ-range [@p bmin, @p bmax]
+TileRange overlappingTiles(const dtNavMeshParams& params,
+                           const float border,
+                           const float* bmin,
+                           const float* bmax) {
+  return {static_cast<int>(
+              floorf((bmin[0] - border - params.orig[0]) / params.tileWidth)),
+          static_cast<int>(
+              floorf((bmin[2] - border - params.orig[2]) / params.tileHeight)),
+          static_cast<int>(
+              floorf((bmax[0] + border - params.orig[0]) / params.tileWidth)),
+          static_cast<int>(
+              floorf((bmax[2] + border - params.orig[2]) / params.tileHeight))};
+}
+
+//! Recast configuration of tile (@p tileX, @p tileY), padded by
+//! @ref tileBorderSize cells
+rcConfig tileConfig(rcConfig cfg,
+                    const dtNavMeshParams& params,
+                    const int tileSize,
+                    const float minY,
+                    const float maxY,
+                    const int tileX,
+                    const int tileY) {
+  cfg.tileSize = tileSize;
+  cfg.borderSize = tileBorderSize(cfg);
+  cfg.width = cfg.tileSize + cfg.borderSize * 2;
+  cfg.height = cfg.tileSize + cfg.borderSize * 2;
+  const float border = cfg.borderSize * cfg.cs;
+  cfg.bmin[0] = params.orig[0] + tileX * params.tileWidth - border;
+  cfg.bmin[1] = minY;
+  cfg.bmin[2] = params.orig[2] + tileY * params.tileHeight - border;
+  cfg.bmax[0] = params.orig[0] + (tileX + 1) * params.tileWidth + border;
+  cfg.bmax[1] = maxY;
+  cfg.bmax[2] = params.orig[2] + (tileY + 1) * params.tileHeight + border;
+  return cfg;
+}
+
+void triangleBounds(const float* verts,
+                    const int* tri,
+                    float* bmin,
+                    float* bmax) {
+  rcVcopy(bmin, &verts[3 * tri[0]]);
+  rcVcopy(bmax, &verts[3 * tri[0]]);
+  for (int i = 1; i < 3; ++i) {
+    rcVmin(bmin, &verts[3 * tri[i]]);
+    rcVmax(bmax, &verts[3 * tri[i]]);
+  }
+}
+
+//! Detour data of a tile, freed unless handed over to a dtNavMesh
+struct TileData {
+  unsigned char* data = nullptr;
+  int size = 0;
+
+  TileData() = default;
+  TileData(const TileData&) = delete;
+  TileData& operator=(const TileData&) = delete;
+  ~TileData() { dtFree(data); }
+};
+
+//! Vertex indices of the triangles overlapping the XZ-bounds of @p cfg
+std::vector<int> trianglesInBounds(const rcConfig& cfg,
+                                   const float* verts,
+                                   const int* tris,
+                                   const int ntris) {
+  std::vector<int> boundedTris;
+  float bmin[3];
+  float bmax[3];
+  for (int i = 0; i < ntris; ++i) {
+    triangleBounds(verts, &tris[3 * i], bmin, bmax);
+    if (bmax[0] < cfg.bmin[0] || bmin[0] > cfg.bmax[0] ||
+        bmax[2] < cfg.bmin[2] || bmin[2] > cfg.bmax[2]) {
+      continue;
+    }
+    boundedTris.insert(boundedTris.end(), &tris[3 * i], &tris[3 * i + 3]);
+  }
+  return boundedTris;
+}
+
+/**
+ * @brief Runs Recast on the triangles in the bounds of @p cfg and creates the
+ * Detour data of tile (@p tileX, @p tileY).
+ *
+ * @return Whether or not the build succeeded. @p navData is left nullptr for
+ * tiles without any walkable polygon.
+ */
+bool buildTileData(const NavMeshSettings& bs,
+                   const rcConfig& cfg,
+                   const int tileX,
+                   const int tileY,
+                   const float* verts,
+                   const int nverts,
+                   const int* tris,
+                   const int ntris,
+                   unsigned char*& navData,
+                   int& navDataSize) {
+  navData = nullptr;
+  navDataSize = 0;
+  if (ntris == 0) {
+    return true;
+  }
+
+  Workspace ws;
+  rcContext ctx;
 
   //
   // Step 2. Rasterize input polygon soup.
@@ -771,7 +1316,7 @@ bool PathFinder::Impl::build(const NavMeshSettings& bs,
     return false;
   }
   // Partition the walkable surface into simple regions without holes.
-  if (!rcBuildRegions(&ctx, *ws.chf, 0, cfg.minRegionArea,
+  if (!rcBuildRegions(&ctx, *ws.chf, cfg.borderSize, cfg.minRegionArea,
                       cfg.mergeRegionArea)) {
     ESP_ERROR() << "Could not build watershed regions";
     return false;
@@ -798,6 +1343,9 @@ bool PathFinder::Impl::build(const NavMeshSettings& bs,
     ESP_ERROR() << "Could not create contours";
     return false;
   }
+  if (ws.cset->nconts == 0) {
+    return true;
+  }
 
   //
   // Step 6. Build polygons mesh from contours.
@@ -813,6 +1361,9 @@ bool PathFinder::Impl::build(const NavMeshSettings& bs,
     ESP_ERROR() << "Could not triangulate contours";
     return false;
   }
+  if (ws.pmesh->npolys == 0) {
+    return true;
+  }
 
   //
   // Step 7. Create detail mesh which allows to access approximate height on
@@ -839,78 +1390,121 @@ bool PathFinder::Impl::build(const NavMeshSettings& bs,
   // (Optional) Step 8. Create Detour data from Recast poly mesh.
   //
 
-  // The GUI may allow more max points per polygon than Detour can handle.
-  // Only build the detour navmesh if we do not exceed the limit.
-  if (cfg.maxVertsPerPoly <= DT_VERTS_PER_POLYGON) {
-    unsigned char* navData = nullptr;
-    int navDataSize = 0;
-
-    // Update poly flags from areas.
-    for (int i = 0; i < ws.pmesh->npolys; ++i) {
-      if (ws.pmesh->areas[i] == RC_WALKABLE_AREA) {
-        ws.pmesh->areas[i] = POLYAREA_GROUND;
-      }
-      if (ws.pmesh->areas[i] == POLYAREA_GROUND) {
-        ws.pmesh->flags[i] = POLYFLAGS_WALK;
-      } else if (ws.pmesh->areas[i] == POLYAREA_DOOR) {
-        ws.pmesh->flags[i] = POLYFLAGS_WALK | POLYFLAGS_DOOR;
-      }
+  // Update poly flags from areas.
+  for (int i = 0; i < ws.pmesh->npolys; ++i) {
+    if (ws.pmesh->areas[i] == RC_WALKABLE_AREA) {
+      ws.pmesh->areas[i] = POLYAREA_GROUND;
     }
-
-    dtNavMeshCreateParams params{};
-    memset(&params, 0, sizeof(params));
-    params.verts = ws.pmesh->verts;
-    params.vertCount = ws.pmesh->nverts;
-    params.polys = ws.pmesh->polys;
-    params.polyAreas = ws.pmesh->areas;
-    params.polyFlags = ws.pmesh->flags;
-    params.polyCount = ws.pmesh->npolys;
-    params.nvp = ws.pmesh->nvp;
-    params.detailMeshes = ws.dmesh->meshes;
-    params.detailVerts = ws.dmesh->verts;
-    params.detailVertsCount = ws.dmesh->nverts;
-    params.detailTris = ws.dmesh->tris;
-    params.detailTriCount = ws.dmesh->ntris;
-    // params.offMeshConVerts = geom->getOffMeshConnectionVerts();
-    // params.offMeshConRad = geom->getOffMeshConnectionRads();
-    // params.offMeshConDir = geom->getOffMeshConnectionDirs();
-    // params.offMeshConAreas = geom->getOffMeshConnectionAreas();
-    // params.offMeshConFlags = geom->getOffMeshConnectionFlags();
-    // params.offMeshConUserID = geom->getOffMeshConnectionId();
-    // params.offMeshConCount = geom->getOffMeshConnectionCount();
-    params.walkableHeight = bs.agentHeight;
-    params.walkableRadius = bs.agentRadius;
-    params.walkableClimb = bs.agentMaxClimb;
-    rcVcopy(params.bmin, ws.pmesh->bmin);
-    rcVcopy(params.bmax, ws.pmesh->bmax);
-    params.cs = cfg.cs;
-    params.ch = cfg.ch;
-    params.buildBvTree = true;
-
-    if (!dtCreateNavMeshData(&params, &navData, &navDataSize)) {
-      ESP_ERROR() << "Could not build Detour navmesh";
-      return false;
+    if (ws.pmesh->areas[i] == POLYAREA_GROUND) {
+      ws.pmesh->flags[i] = POLYFLAGS_WALK;
+    } else if (ws.pmesh->areas[i] == POLYAREA_DOOR) {
+      ws.pmesh->flags[i] = POLYFLAGS_WALK | POLYFLAGS_DOOR;
     }
+  }
 
-    navMesh_.reset(dtAllocNavMesh());
-    if (!navMesh_) {
-      dtFree(navData);
-      ESP_ERROR() << "Could not allocate Detour navmesh";
-      return false;
-    }
+  dtNavMeshCreateParams params{};
+  memset(&params, 0, sizeof(params));
+  params.verts = ws.pmesh->verts;
+  params.vertCount = ws.pmesh->nverts;
+  params.polys = ws.pmesh->polys;
+  params.polyAreas = ws.pmesh->areas;
+  params.polyFlags = ws.pmesh->flags;
+  params.polyCount = ws.pmesh->npolys;
+  params.nvp = ws.pmesh->nvp;
+  params.detailMeshes = ws.dmesh->meshes;
+  params.detailVerts = ws.dmesh->verts;
+  params.detailVertsCount = ws.dmesh->nverts;
+  params.detailTris = ws.dmesh->tris;
+  params.detailTriCount = ws.dmesh->ntris;
+  // params.offMeshConVerts = geom->getOffMeshConnectionVerts();
+  // params.offMeshConRad = geom->getOffMeshConnectionRads();
+  // params.offMeshConDir = geom->getOffMeshConnectionDirs();
+  // params.offMeshConAreas = geom->getOffMeshConnectionAreas();
+  // params.offMeshConFlags = geom->getOffMeshConnectionFlags();
+  // params.offMeshConUserID = geom->getOffMeshConnectionId();
+  // params.offMeshConCount = geom->getOffMeshConnectionCount();
+  params.walkableHeight = bs.agentHeight;
+  params.walkableRadius = bs.agentRadius;
+  params.walkableClimb = bs.agentMaxClimb;
+  rcVcopy(params.bmin, ws.pmesh->bmin);
+  rcVcopy(params.bmax, ws.pmesh->bmax);
+  params.cs = cfg.cs;
+  params.ch = cfg.ch;
+  params.buildBvTree = true;
+  params.tileX = tileX;
+  params.tileY = tileY;
+  params.tileLayer = 0;
+
+  if (!dtCreateNavMeshData(&params, &navData, &navDataSize)) {
+    ESP_ERROR() << "Could not build Detour navmesh";
+    return false;
+  }
+  return true;
+}
 
-    dtStatus status = 0;
-    status = navMesh_->init(navData, navDataSize, DT_TILE_FREE_DATA);
-    if (dtStatusFailed(status)) {
-      dtFree(navData);
-      ESP_ERROR() << "Could not init Detour navmesh";
-      return false;
-    }
-    if (!initNavQuery()) {
-      return false;
+}  // namespace
+
+PathFinder::Impl::Impl() {
+  filter_ = std::make_unique<dtQueryFilter>();
+  filter_->setIncludeFlags(POLYFLAGS_WALK);
+  filter_->setExcludeFlags(0);
+}
+
+bool PathFinder::Impl::build(const NavMeshSettings& bs,
+                             const float* verts,
+                             const int nverts,
+                             const int* tris,
+                             const int ntris,
+                             const float* bmin,
+                             const float* bmax) {
+  if (!navMeshCache_) {
+    return buildNavMesh(bs, verts, nverts, tris, ntris, bmin, bmax);
+  }
+
+  const std::string key =
+      NavMeshCache::computeKey(bs, verts, nverts, tris, ntris, bmin, bmax);
+  const std::string path = navMeshCache_->getPath(key);
+  if (Cr::Utility::Path::exists(path)) {
+    if (loadNavMesh(path)) {
+      ESP_DEBUG() << "Loaded navmesh from cache" << path;
+      navMeshCache_->touch(key);
+      // Same bounds as a build, rather than those of the loaded tiles
+      bounds_ = std::make_pair(vec3f(bmin), vec3f(bmax));
+      return true;
     }
-    navMeshSettings_ = {bs};
+    ESP_WARNING() << "Could not load cached navmesh" << path
+                  << ", rebuilding it";
+    navMeshCache_->remove(key);
+  }
+
+  if (!buildNavMesh(bs, verts, nverts, tris, ntris, bmin, bmax)) {
+    return false;
+  }
+  const std::string temporaryPath = navMeshCache_->getTemporaryPath(key);
+  if (saveNavMesh(temporaryPath)) {
+    navMeshCache_->commit(temporaryPath, key);
   } else {
+    ESP_WARNING() << "Could not save navmesh to cache" << temporaryPath;
+    std::remove(temporaryPath.c_str());
+  }
+  return true;
+}
+
+bool PathFinder::Impl::buildNavMesh(const NavMeshSettings& bs,
+                                    const float* verts,
+                                    const int nverts,
+                                    const int* tris,
+                                    const int ntris,
+                                    const float* bmin,
+                                    const float* bmax) {
+  //
+  // Step 1. Initialize build config.
+  //
+  rcConfig cfg = navMeshConfig(bs);
+
+  // The GUI may allow more max points per polygon than Detour can handle.
+  // Only build the detour navmesh if we do not exceed the limit.
+  if (cfg.maxVertsPerPoly > DT_VERTS_PER_POLYGON) {
     ESP_ERROR() << "cfg.maxVertsPerPoly(" << cfg.maxVertsPerPoly
                 << ") > DT_VERTS_PER_POLYGON(" << DT_VERTS_PER_POLYGON
                 << "), so cannot build the Detour NavMesh. Aborting NavMesh "
@@ -918,17 +1512,279 @@ bool PathFinder::Impl::build(const NavMeshSettings& bs,
     return false;
   }
 
+  if (bs.tileSize > 0) {
+    return buildTiledNavMesh(bs, cfg, verts, nverts, tris, ntris, bmin, bmax);
+  }
+
+  // Set the area where the navigation will be build.
+  // Here the bounds of the input mesh are used, but the
+  // area could be specified by an user defined box, etc.
+  rcVcopy(cfg.bmin, bmin);
+  rcVcopy(cfg.bmax, bmax);
+  rcCalcGridSize(cfg.bmin, cfg.bmax, cfg.cs, &cfg.width, &cfg.height);
+  ESP_DEBUG() << "Building navmesh with" << cfg.width << "x" << cfg.height
+              << "cells";
+
+  unsigned char* navData = nullptr;
+  int navDataSize = 0;
+  if (!buildTileData(bs, cfg, 0, 0, verts, nverts, tris, ntris, navData,
+                     navDataSize)) {
+    return false;
+  }
+  if (!navData) {
+    ESP_ERROR() << "Could not build Detour navmesh, nothing is walkable";
+    return false;
+  }
+  const dtMeshHeader* navHeader =
+      reinterpret_cast<const dtMeshHeader*>(navData);
+  const int numVerts = navHeader->vertCount;
+  const int numPolys = navHeader->polyCount;
+
+  navMesh_.reset(dtAllocNavMesh());
+  if (!navMesh_) {
+    dtFree(navData);
+    ESP_ERROR() << "Could not allocate Detour navmesh";
+    return false;
+  }
+
+  dtStatus status = 0;
+  status = navMesh_->init(navData, navDataSize, DT_TILE_FREE_DATA);
+  if (dtStatusFailed(status)) {
+    dtFree(navData);
+    ESP_ERROR() << "Could not init Detour navmesh";
+    return false;
+  }
+  if (!initNavQuery()) {
+    return false;
+  }
+  navMeshSettings_ = {bs};
+
   bounds_ = std::make_pair(vec3f(bmin), vec3f(bmax));
 
-  ESP_DEBUG() << "Created navmesh with" << ws.pmesh->nverts << "vertices"
-              << ws.pmesh->npolys << "polygons";
+  ESP_DEBUG() << "Created navmesh with" << numVerts << "vertices" << numPolys
+              << "polygons";
 
   return true;
 }
 
+bool PathFinder::Impl::buildTiledNavMesh(const NavMeshSettings& bs,
+                                         const rcConfig& cfg,
+                                         const float* verts,
+                                         const int nverts,
+                                         const int* tris,
+                                         const int ntris,
+                                         const float* bmin,
+                                         const float* bmax) {
+  int gridWidth = 0;
+  int gridHeight = 0;
+  rcCalcGridSize(bmin, bmax, cfg.cs, &gridWidth, &gridHeight);
+  const int numTilesX = (gridWidth + bs.tileSize - 1) / bs.tileSize;
+  const int numTilesY = (gridHeight + bs.tileSize - 1) / bs.tileSize;
+  ESP_DEBUG() << "Building navmesh with" << numTilesX << "x" << numTilesY
+              << "tiles of" << bs.tileSize << "x" << bs.tileSize << "cells";
+
+  // 22 bits of the polygon references locate the polygon, split between the
+  // tile and the polygon within the tile
+  const int tileBits = std::min(
+      static_cast<int>(dtIlog2(dtNextPow2(numTilesX * numTilesY))), 14);
+  dtNavMeshParams params{};
+  rcVcopy(params.orig, bmin);
+  params.tileWidth = bs.tileSize * cfg.cs;
+  params.tileHeight = bs.tileSize * cfg.cs;
+  params.maxTiles = 1 << tileBits;
+  params.maxPolys = 1 << (22 - tileBits);
+  if (numTilesX * numTilesY > params.maxTiles) {
+    ESP_ERROR() << "Too many navmesh tiles, increase NavMeshSettings::tileSize";
+    return false;
+  }
+
+  std::unique_ptr<dtNavMesh, NavMeshDeleter> navMesh{dtAllocNavMesh()};
+  if (!navMesh) {
+    ESP_ERROR() << "Could not allocate Detour navmesh";
+    return false;
+  }
+  if (dtStatusFailed(navMesh->init(&params))) {
+    ESP_ERROR() << "Could not init Detour navmesh";
+    return false;
+  }
+
+  // Bucket the triangles by the padded tiles they overlap
+  const float border = tileBorderSize(cfg) * cfg.cs;
+  std::vector<std::vector<int>> tileTris(numTilesX * numTilesY);
+  float triMin[3];
+  float triMax[3];
+  for (int i = 0; i < ntris; ++i) {
+    triangleBounds(verts, &tris[3 * i], triMin, triMax);
+    const TileRange range = overlappingTiles(params, border, triMin, triMax);
+    for (int y = std::max(range.minY, 0);
+         y <= std::min(range.maxY, numTilesY - 1); ++y) {
+      for (int x = std::max(range.minX, 0);
+           x <= std::min(range.maxX, numTilesX - 1); ++x) {
+        std::vector<int>& triangles = tileTris[y * numTilesX + x];
+        triangles.insert(triangles.end(), &tris[3 * i], &tris[3 * i + 3]);
+      }
+    }
+  }
+
+  // Tiles are independent, build them concurrently
+  const int numGridTiles = numTilesX * numTilesY;
+  std::vector<TileData> tiles(numGridTiles);
+  std::atomic<bool> failed{false};
+  parallelForEach(
+      numGridTiles, resolveNumThreads(numBuildThreads_, numGridTiles),
+      [&](const int i) {
+        const int x = i % numTilesX;
+        const int y = i / numTilesX;
+        const rcConfig tileCfg =
+            tileConfig(cfg, params, bs.tileSize, bmin[1], bmax[1], x, y);
+        if (!failed &&
+            !buildTileData(bs, tileCfg, x, y, verts, nverts, tileTris[i].data(),
+                           tileTris[i].size() / 3, tiles[i].data,
+                           tiles[i].size)) {
+          failed = true;
+        }
+      });
+  if (failed) {
+    return false;
+  }
+
+  // Then add them in order, so that the navmesh doesn't depend on the number
+  // of threads
+  int numTiles = 0;
+  for (int i = 0; i < numGridTiles; ++i) {
+    if (!tiles[i].data) {
+      continue;
+    }
+    if (dtStatusFailed(navMesh->addTile(tiles[i].data, tiles[i].size,
+                                        DT_TILE_FREE_DATA, 0, nullptr))) {
+      ESP_ERROR() << "Could not add tile" << i % numTilesX << i / numTilesX
+                  << "to the navmesh";
+      return false;
+    }
+    tiles[i].data = nullptr;
+    ++numTiles;
+  }
+  if (numTiles == 0) {
+    ESP_ERROR() << "Could not build Detour navmesh, nothing is walkable";
+    return false;
+  }
+
+  navMesh_ = std::move(navMesh);
+  if (!initNavQuery()) {
+    return false;
+  }
+  navMeshSettings_ = {bs};
+
+  bounds_ = std::make_pair(vec3f(bmin), vec3f(bmax));
+
+  ESP_DEBUG() << "Created navmesh with" << numTiles << "tiles";
+
+  return true;
+}
+
+bool PathFinder::Impl::rebuildTiles(
+    const float* verts,
+    const int nverts,
+    const int* tris,
+    const int ntris,
+    const std::vector<std::pair<vec3f, vec3f>>& regions) {
+  if (!navMesh_ || !navMeshSettings_ || navMeshSettings_->tileSize <= 0) {
+    ESP_ERROR() << "Only navmeshes built with NavMeshSettings::tileSize > 0 "
+                   "can be partially rebuilt";
+    return false;
+  }
+  const NavMeshSettings& bs = *navMeshSettings_;
+  const rcConfig cfg = navMeshConfig(bs);
+  const dtNavMeshParams params = *navMesh_->getParams();
+
+  // Tiles can only change within the old and the new extents of the scene
+  vec3f bmin = bounds_.first;
+  vec3f bmax = bounds_.second;
+  for (int i = 0; i < nverts; ++i) {
+    rcVmin(bmin.data(), &verts[3 * i]);
+    rcVmax(bmax.data(), &verts[3 * i]);
+  }
+  // Extend the heightfields downwards by whole cells only, so that rebuilt
+  // tiles are voxelized at the same heights as their neighbours
+  float minY = bounds_.first[1];
+  if (bmin[1] < minY) {
+    minY -= ceilf((minY - bmin[1]) / cfg.ch) * cfg.ch;
+  }
+
+  const float border = tileBorderSize(cfg) * cfg.cs;
+  std::set<std::pair<int, int>> tiles;
+  for (const auto& region : regions) {
+    const vec3f regionMin = region.first.cwiseMax(bmin);
+    const vec3f regionMax = region.second.cwiseMin(bmax);
+    if (regionMin[0] > regionMax[0] || regionMin[2] > regionMax[2]) {
+      continue;
+    }
+    const TileRange range =
+        overlappingTiles(params, border, regionMin.data(), regionMax.data());
+    for (int y = range.minY; y <= range.maxY; ++y) {
+      for (int x = range.minX; x <= range.maxX; ++x) {
+        tiles.emplace(x, y);
+      }
+    }
+  }
+
+  const std::vector<std::pair<int, int>> tileCoords(tiles.begin(), tiles.end());
+  const int numTiles = static_cast<int>(tileCoords.size());
+  std::vector<TileData> tileData(numTiles);
+  std::vector<char> built(numTiles, 0);
+  parallelForEach(numTiles, resolveNumThreads(numBuildThreads_, numTiles),
+                  [&](const int i) {
+                    const int x = tileCoords[i].first;
+                    const int y = tileCoords[i].second;
+                    const rcConfig tileCfg = tileConfig(
+                        cfg, params, bs.tileSize, minY, bmax[1], x, y);
+                    const std::vector<int> triangles =
+                        trianglesInBounds(tileCfg, verts, tris, ntris);
+                    built[i] =
+                        buildTileData(bs, tileCfg, x, y, verts, nverts,
+                                      triangles.data(), triangles.size() / 3,
+                                      tileData[i].data, tileData[i].size);
+                  });
+
+  bool success = true;
+  for (int i = 0; i < numTiles; ++i) {
+    const int x = tileCoords[i].first;
+    const int y = tileCoords[i].second;
+    if (!built[i]) {
+      // keep the outdated tile rather than leaving a hole
+      success = false;
+      continue;
+    }
+    navMesh_->removeTile(navMesh_->getTileRefAt(x, y, 0), nullptr, nullptr);
+    if (!tileData[i].data) {
+      continue;
+    }
+    if (dtStatusFailed(navMesh_->addTile(tileData[i].data, tileData[i].size,
+                                         DT_TILE_FREE_DATA, 0, nullptr))) {
+      ESP_ERROR() << "Could not add tile" << x << y << "to the navmesh";
+      success = false;
+      continue;
+    }
+    tileData[i].data = nullptr;
+  }
+
+  bounds_ = std::make_pair(bmin, bmax);
+
+  ESP_DEBUG() << "Rebuilt" << numTiles << "navmesh tiles";
+
+  // Islands, distance fields, etc. span tiles, so they are all recomputed
+  return initNavQuery() && success;
+}
+
 bool PathFinder::Impl::initNavQuery() {
   // if we are reinitializing the NavQuery, then also reset the MeshData
   islandMeshData_.clear();
+  batchQueries_.clear();
+  ++navMeshVersion_;
+  vertexGraph_ = nullptr;
+  distanceFieldCache_.clear();
+  topDownViewCache_.clear();
+  topDownIslandViewCache_.clear();
 
   navQuery_.reset(dtAllocNavMeshQuery());
   dtStatus status = navQuery_->init(navMesh_.get(), 2048);
@@ -971,9 +1827,18 @@ bool PathFinder::Impl::build(const NavMeshSettings& bs,
   return success;
 }
 
+bool PathFinder::Impl::rebuildTiles(
+    const esp::assets::MeshData& mesh,
+    const std::vector<std::pair<vec3f, vec3f>>& regions) {
+  const std::vector<int> indices(mesh.ibo.begin(), mesh.ibo.end());
+  return rebuildTiles(mesh.vbo.empty() ? nullptr : mesh.vbo[0].data(),
+                      mesh.vbo.size(), indices.data(), indices.size() / 3,
+                      regions);
+}
+
 namespace {
 const int NAVMESHSET_MAGIC = 'M' << 24 | 'S' << 16 | 'E' << 8 | 'T';  //'MSET';
-const int NAVMESHSET_VERSION = 2;
+const int NAVMESHSET_VERSION = 3;
 
 struct NavMeshSetHeader {
   int magic;
@@ -1107,8 +1972,11 @@ bool PathFinder::Impl::loadNavMesh(const std::string& path) {
   }
 
   navMeshSettings_ = {NavMeshSettings{}};
-  if (header.version >= 2) {
+  if (header.version >= 3) {
     fread(&(*navMeshSettings_), sizeof(NavMeshSettings), 1, fp);
+  } else if (header.version == 2) {
+    // Settings up to NavMeshSettings::tileSize, which was added in version 3
+    fread(&(*navMeshSettings_), offsetof(NavMeshSettings, tileSize), 1, fp);
   } else {
     ESP_DEBUG()
         << "NavMeshSettings aren't present, guessing that they are the default";
@@ -1175,15 +2043,22 @@ bool PathFinder::Impl::saveNavMesh(const std::string& path) {
   const dtNavMesh* navMesh = navMesh_.get();
   if (!navMesh)
     return false;
+  if (!navMeshSettings_) {
+    ESP_ERROR() << "NavMeshSettings weren't set. Either build or load a "
+                   "navmesh before saving";
+    return false;
+  }
 
   FILE* fp = fopen(path.c_str(), "wb");
   if (!fp)
     return false;
 
-  // Store header.
+  // Store header. Navmeshes that aren't tiled are stored in version 2, which
+  // doesn't have NavMeshSettings::tileSize, so older versions can load them
+  const bool tiled = navMeshSettings_->tileSize > 0;
   NavMeshSetHeader header{};
   header.magic = NAVMESHSET_MAGIC;
-  header.version = NAVMESHSET_VERSION;
+  header.version = tiled ? NAVMESHSET_VERSION : 2;
   header.numTiles = 0;
   for (int i = 0; i < navMesh->getMaxTiles(); ++i) {
     const dtMeshTile* tile = navMesh->getTile(i);
@@ -1193,12 +2068,9 @@ bool PathFinder::Impl::saveNavMesh(const std::string& path) {
   }
   memcpy(&header.params, navMesh->getParams(), sizeof(dtNavMeshParams));
   fwrite(&header, sizeof(NavMeshSetHeader), 1, fp);
-  if (!navMeshSettings_) {
-    ESP_ERROR() << "NavMeshSettings weren't set. Either build or load a "
-                   "navmesh before saving";
-    return false;
-  }
-  fwrite(&(*navMeshSettings_), sizeof(NavMeshSettings), 1, fp);
+  fwrite(&(*navMeshSettings_),
+         tiled ? sizeof(NavMeshSettings) : offsetof(NavMeshSettings, tileSize),
+         1, fp);
 
   // Store tiles.
   for (int i = 0; i < navMesh->getMaxTiles(); ++i) {
@@ -1420,7 +2292,8 @@ bool PathFinder::Impl::findPath(ShortestPath& path) {
 }
 
 Cr::Containers::Optional<std::tuple<float, std::vector<vec3f>>>
-PathFinder::Impl::findPathInternal(const vec3f& start,
+PathFinder::Impl::findPathInternal(const dtNavMeshQuery* navQuery,
+                                   const vec3f& start,
                                    dtPolyRef startRef,
                                    const vec3f& pathStart,
                                    const vec3f& end,
@@ -1441,17 +2314,17 @@ PathFinder::Impl::findPathInternal(const vec3f& start,
 
   int numPolys = 0;
   dtStatus status =
-      navQuery_->findPath(startRef, endRef, pathStart.data(), pathEnd.data(),
-                          filter_.get(), polys, &numPolys, MAX_POLYS);
+      navQuery->findPath(startRef, endRef, pathStart.data(), pathEnd.data(),
+                         filter_.get(), polys, &numPolys, MAX_POLYS);
   if (status != DT_SUCCESS || numPolys == 0) {
     return Cr::Containers::NullOpt;
   }
 
   int numPoints = 0;
   std::vector<vec3f> points(MAX_POLYS);
-  status = navQuery_->findStraightPath(start.data(), end.data(), polys,
-                                       numPolys, points[0].data(), nullptr,
-                                       nullptr, &numPoints, MAX_POLYS);
+  status = navQuery->findStraightPath(start.data(), end.data(), polys, numPolys,
+                                      points[0].data(), nullptr, nullptr,
+                                      &numPoints, MAX_POLYS);
   if (status != DT_SUCCESS || numPoints == 0) {
     return Corrade::Containers::NullOpt;
   }
@@ -1552,8 +2425,8 @@ bool PathFinder::Impl::findPath(MultiGoalShortestPath& path) {
 
     const Cr::Containers::Optional<std::tuple<float, std::vector<vec3f>>>
         findResult =
-            findPathInternal(path.requestedStart, startRef, pathStart,
-                             path.pimpl_->requestedEnds[i],
+            findPathInternal(navQuery_.get(), path.requestedStart, startRef,
+                             pathStart, path.pimpl_->requestedEnds[i],
                              path.pimpl_->endRefs[i], path.pimpl_->pathEnds[i]);
 
     if (findResult && std::get<0>(*findResult) < path.geodesicDistance) {
@@ -1569,6 +2442,14 @@ bool PathFinder::Impl::findPath(MultiGoalShortestPath& path) {
 
 template <typename T>
 T PathFinder::Impl::tryStep(const T& start, const T& end, bool allowSliding) {
+  return tryStep(navQuery_.get(), start, end, allowSliding);
+}
+
+template <typename T>
+T PathFinder::Impl::tryStep(const dtNavMeshQuery* navQuery,
+                            const T& start,
+                            const T& end,
+                            bool allowSliding) {
   static const int MAX_POLYS = 256;
   dtPolyRef polys[MAX_POLYS];
 
@@ -1576,9 +2457,9 @@ T PathFinder::Impl::tryStep(const T& start, const T& end, bool allowSliding) {
   dtPolyRef startRef = 0, endRef = 0;
   vec3f pathStart;
   std::tie(startStatus, startRef, pathStart) =
-      projectToPoly(start, navQuery_.get(), filter_.get());
+      projectToPoly(start, navQuery, filter_.get());
   std::tie(endStatus, endRef, std::ignore) =
-      projectToPoly(end, navQuery_.get(), filter_.get());
+      projectToPoly(end, navQuery, filter_.get());
 
   if (dtStatusFailed(startStatus) || dtStatusFailed(endStatus)) {
     return start;
@@ -1590,9 +2471,9 @@ T PathFinder::Impl::tryStep(const T& start, const T& end, bool allowSliding) {
 
   vec3f endPoint;
   int numPolys = 0;
-  navQuery_->moveAlongSurface(startRef, pathStart.data(), end.data(),
-                              filter_.get(), endPoint.data(), polys, &numPolys,
-                              MAX_POLYS, allowSliding);
+  navQuery->moveAlongSurface(startRef, pathStart.data(), end.data(),
+                             filter_.get(), endPoint.data(), polys, &numPolys,
+                             MAX_POLYS, allowSliding);
   // If there isn't any possible path between start and end, just return
   // start, that is cleanest
   if (numPolys == 0) {
@@ -1607,7 +2488,7 @@ T PathFinder::Impl::tryStep(const T& start, const T& end, bool allowSliding) {
   // surface at the endPoint and set its height to that.
   // Note, this will never fail as endPoint is always within in the poly
   // polys[numPolys - 1]
-  navQuery_->getPolyHeight(polys[numPolys - 1], endPoint.data(), &endPoint[1]);
+  navQuery->getPolyHeight(polys[numPolys - 1], endPoint.data(), &endPoint[1]);
 
   // Hack to deal with infinitely thin walls in recast allowing you to
   // transition between two different connected components
@@ -1615,7 +2496,7 @@ T PathFinder::Impl::tryStep(const T& start, const T& end, bool allowSliding) {
   // is in the same connected component as the startRef according to
   // findNearestPoly
   std::tie(std::ignore, endRef, std::ignore) =
-      projectToPoly(endPoint, navQuery_.get(), filter_.get());
+      projectToPoly(endPoint, navQuery, filter_.get());
   if (!this->islandSystem_->hasConnection(startRef, endRef)) {
     // There isn't a connection!  This happens when endPoint is on an edge
     // shared between two different connected components (aka infinitely thin
@@ -1643,8 +2524,7 @@ T PathFinder::Impl::tryStep(const T& start, const T& end, bool allowSliding) {
   return T{std::move(endPoint)};
 }
 
-template <typename T>
-T PathFinder::Impl::snapPoint(const T& pt, int islandIndex /*=ID_UNDEFINED*/) {
+void PathFinder::Impl::beginIslandQuery(int islandIndex) {
   islandSystem_->assertValidIsland(islandIndex);
 
   // If this query should be island specific
@@ -1656,12 +2536,9 @@ T PathFinder::Impl::snapPoint(const T& pt, int islandIndex /*=ID_UNDEFINED*/) {
     filter_->setExcludeFlags(filter_->getExcludeFlags() |
                              PolyFlags::POLYFLAGS_OFF_ISLAND);
   }
+}
 
-  dtStatus status = 0;
-  vec3f projectedPt;
-  std::tie(status, std::ignore, projectedPt) =
-      projectToPoly(pt, navQuery_.get(), filter_.get());
-
+void PathFinder::Impl::endIslandQuery(int islandIndex) {
   // Clean up if this query was island specific
   if (islandIndex != ID_UNDEFINED) {
     // reset the poly flag identifing polys off the target island
@@ -1671,6 +2548,18 @@ T PathFinder::Impl::snapPoint(const T& pt, int islandIndex /*=ID_UNDEFINED*/) {
     filter_->setExcludeFlags(filter_->getExcludeFlags() &
                              ~PolyFlags::POLYFLAGS_OFF_ISLAND);
   }
+}
+
+template <typename T>
+T PathFinder::Impl::snapPoint(const T& pt, int islandIndex /*=ID_UNDEFINED*/) {
+  beginIslandQuery(islandIndex);
+
+  dtStatus status = 0;
+  vec3f projectedPt;
+  std::tie(status, std::ignore, projectedPt) =
+      projectToPoly(pt, navQuery_.get(), filter_.get());
+
+  endIslandQuery(islandIndex);
 
   if (dtStatusSucceed(status)) {
     return T{std::move(projectedPt)};
@@ -1716,30 +2605,41 @@ float PathFinder::Impl::distanceToClosestObstacle(
 HitRecord PathFinder::Impl::closestObstacleSurfacePoint(
     const vec3f& pt,
     const float maxSearchRadius /*= 2.0*/) const {
+  return closestObstacleSurfacePoint(navQuery_.get(), pt, maxSearchRadius);
+}
+
+HitRecord PathFinder::Impl::closestObstacleSurfacePoint(
+    const dtNavMeshQuery* navQuery,
+    const vec3f& pt,
+    const float maxSearchRadius) const {
   dtPolyRef ptRef = 0;
   dtStatus status = 0;
   vec3f polyPt;
-  std::tie(status, ptRef, polyPt) =
-      projectToPoly(pt, navQuery_.get(), filter_.get());
+  std::tie(status, ptRef, polyPt) = projectToPoly(pt, navQuery, filter_.get());
   if (status != DT_SUCCESS || ptRef == 0) {
     return {vec3f(0, 0, 0), vec3f(0, 0, 0),
             std::numeric_limits<float>::infinity()};
   }
   vec3f hitPos, hitNormal;
   float hitDist = Mn::Constants::nan();
-  navQuery_->findDistanceToWall(ptRef, polyPt.data(), maxSearchRadius,
-                                filter_.get(), &hitDist, hitPos.data(),
-                                hitNormal.data());
+  navQuery->findDistanceToWall(ptRef, polyPt.data(), maxSearchRadius,
+                               filter_.get(), &hitDist, hitPos.data(),
+                               hitNormal.data());
   return {std::move(hitPos), std::move(hitNormal), hitDist};
 }
 
 bool PathFinder::Impl::isNavigable(const vec3f& pt,
                                    const float maxYDelta /*= 0.5*/) const {
+  return isNavigable(navQuery_.get(), pt, maxYDelta);
+}
+
+bool PathFinder::Impl::isNavigable(const dtNavMeshQuery* navQuery,
+                                   const vec3f& pt,
+                                   const float maxYDelta) const {
   dtPolyRef ptRef = 0;
   dtStatus status = 0;
   vec3f polyPt;
-  std::tie(status, ptRef, polyPt) =
-      projectToPoly(pt, navQuery_.get(), filter_.get());
+  std::tie(status, ptRef, polyPt) = projectToPoly(pt, navQuery, filter_.get());
 
   if (status != DT_SUCCESS || ptRef == 0)
     return false;
@@ -1752,36 +2652,568 @@ bool PathFinder::Impl::isNavigable(const vec3f& pt,
   return true;
 }
 
+int PathFinder::Impl::prepareBatchQueries(const int numItems, int numThreads) {
+  numThreads = resolveNumThreads(numThreads, numItems);
+
+  while (static_cast<int>(batchQueries_.size()) + 1 < numThreads) {
+    std::unique_ptr<dtNavMeshQuery, NavQueryDeleter> query(
+        dtAllocNavMeshQuery());
+    if (dtStatusFailed(query->init(navMesh_.get(), 2048))) {
+      ESP_ERROR() << "Could not init Detour navmesh query for batch thread"
+                  << batchQueries_.size() + 1;
+      break;
+    }
+    batchQueries_.emplace_back(std::move(query));
+  }
+  return std::min(numThreads, static_cast<int>(batchQueries_.size()) + 1);
+}
+
+const dtNavMeshQuery* PathFinder::Impl::batchQuery(
+    const int threadIndex) const {
+  return threadIndex == 0 ? navQuery_.get()
+                          : batchQueries_[threadIndex - 1].get();
+}
+
+float PathFinder::Impl::geodesicDistance(const dtNavMeshQuery* navQuery,
+                                         const vec3f& start,
+                                         const vec3f& end) {
+  dtStatus status = 0;
+  dtPolyRef startRef = 0, endRef = 0;
+  vec3f pathStart, pathEnd;
+  std::tie(status, startRef, pathStart) =
+      projectToPoly(start, navQuery, filter_.get());
+  if (status != DT_SUCCESS || startRef == 0) {
+    return std::numeric_limits<float>::infinity();
+  }
+  std::tie(status, endRef, pathEnd) =
+      projectToPoly(end, navQuery, filter_.get());
+  if (status != DT_SUCCESS || endRef == 0) {
+    return std::numeric_limits<float>::infinity();
+  }
+
+  const Cr::Containers::Optional<std::tuple<float, std::vector<vec3f>>>
+      findResult = findPathInternal(navQuery, start, startRef, pathStart, end,
+                                    endRef, pathEnd);
+  return findResult ? std::get<0>(*findResult)
+                    : std::numeric_limits<float>::infinity();
+}
+
+Eigen::VectorXf PathFinder::Impl::geodesicDistanceBatch(
+    const Eigen::RowMatrixX3f& starts,
+    const Eigen::RowMatrixX3f& ends,
+    const int numThreads) {
+  ESP_CHECK(starts.rows() == ends.rows(), "geodesicDistanceBatch: got"
+                                              << starts.rows() << "starts but"
+                                              << ends.rows() << "ends");
+  const int numItems = starts.rows();
+  Eigen::VectorXf distances(numItems);
+  parallelForChunks(numItems, prepareBatchQueries(numItems, numThreads),
+                    [&](const int begin, const int end, const int threadIndex) {
+                      const dtNavMeshQuery* navQuery = batchQuery(threadIndex);
+                      for (int i = begin; i < end; ++i) {
+                        distances[i] = geodesicDistance(
+                            navQuery, starts.row(i).transpose(),
+                            ends.row(i).transpose());
+                      }
+                    });
+  return distances;
+}
+
+Eigen::RowMatrixX3f PathFinder::Impl::snapPointBatch(
+    const Eigen::RowMatrixX3f& pts,
+    const int islandIndex,
+    const int numThreads) {
+  const int numItems = pts.rows();
+  Eigen::RowMatrixX3f snapped(numItems, 3);
+
+  // The island restriction is applied to the shared navmesh flags, so set it
+  // once for the whole batch rather than per point.
+  beginIslandQuery(islandIndex);
+  parallelForChunks(numItems, prepareBatchQueries(numItems, numThreads),
+                    [&](const int begin, const int end, const int threadIndex) {
+                      const dtNavMeshQuery* navQuery = batchQuery(threadIndex);
+                      for (int i = begin; i < end; ++i) {
+                        dtStatus status = 0;
+                        vec3f projectedPt;
+                        std::tie(status, std::ignore, projectedPt) =
+                            projectToPoly(vec3f(pts.row(i).transpose()),
+                                          navQuery, filter_.get());
+                        if (dtStatusSucceed(status)) {
+                          snapped.row(i) = projectedPt.transpose();
+                        } else {
+                          snapped.row(i).setConstant(Mn::Constants::nan());
+                        }
+                      }
+                    });
+  endIslandQuery(islandIndex);
+  return snapped;
+}
+
+Eigen::RowMatrixX3f PathFinder::Impl::tryStepBatch(
+    const Eigen::RowMatrixX3f& starts,
+    const Eigen::RowMatrixX3f& ends,
+    const bool allowSliding,
+    const int numThreads) {
+  ESP_CHECK(starts.rows() == ends.rows(), "tryStepBatch: got"
+                                              << starts.rows() << "starts but"
+                                              << ends.rows() << "ends");
+  const int numItems = starts.rows();
+  Eigen::RowMatrixX3f steps(numItems, 3);
+  parallelForChunks(
+      numItems, prepareBatchQueries(numItems, numThreads),
+      [&](const int begin, const int end, const int threadIndex) {
+        const dtNavMeshQuery* navQuery = batchQuery(threadIndex);
+        for (int i = begin; i < end; ++i) {
+          steps.row(i) = tryStep<vec3f>(navQuery, starts.row(i).transpose(),
+                                        ends.row(i).transpose(), allowSliding)
+                             .transpose();
+        }
+      });
+  return steps;
+}
+
+Eigen::Matrix<bool, Eigen::Dynamic, 1> PathFinder::Impl::isNavigableBatch(
+    const Eigen::RowMatrixX3f& pts,
+    const float maxYDelta,
+    const int numThreads) {
+  const int numItems = pts.rows();
+  Eigen::Matrix<bool, Eigen::Dynamic, 1> navigable(numItems);
+  parallelForChunks(numItems, prepareBatchQueries(numItems, numThreads),
+                    [&](const int begin, const int end, const int threadIndex) {
+                      const dtNavMeshQuery* navQuery = batchQuery(threadIndex);
+                      for (int i = begin; i < end; ++i) {
+                        navigable[i] = isNavigable(
+                            navQuery, pts.row(i).transpose(), maxYDelta);
+                      }
+                    });
+  return navigable;
+}
+
+Eigen::VectorXf PathFinder::Impl::distanceToClosestObstacleBatch(
+    const Eigen::RowMatrixX3f& pts,
+    const float maxSearchRadius,
+    const int numThreads) {
+  const int numItems = pts.rows();
+  Eigen::VectorXf distances(numItems);
+  parallelForChunks(numItems, prepareBatchQueries(numItems, numThreads),
+                    [&](const int begin, const int end, const int threadIndex) {
+                      const dtNavMeshQuery* navQuery = batchQuery(threadIndex);
+                      for (int i = begin; i < end; ++i) {
+                        distances[i] = closestObstacleSurfacePoint(
+                                           navQuery, pts.row(i).transpose(),
+                                           maxSearchRadius)
+                                           .hitDist;
+                      }
+                    });
+  return distances;
+}
+
+namespace {
+// The random stream of the episode being sampled on this thread. Detour takes
+// a plain function as random source, so the stream can't be passed in.
+thread_local std::mt19937 episodeRng;
+
+// Returns a random number [0..1) from episodeRng
+float episodeFrand() {
+  return std::uniform_real_distribution<float>{0.0f, 1.0f}(episodeRng);
+}
+}  // namespace
+
+SampledEpisodes PathFinder::Impl::sampleEpisodes(
+    const int numEpisodes,
+    const EpisodeSamplingSettings& settings,
+    const uint32_t seed,
+    const int numThreads) {
+  ESP_CHECK(
+      numEpisodes >= 0,
+      "sampleEpisodes: numEpisodes must be non-negative, got" << numEpisodes);
+  islandSystem_->assertValidIsland(settings.islandIndex);
+  if (getNavigableArea(settings.islandIndex) <= 0.0)
+    throw std::runtime_error(
+        "NavMesh has no navigable area, this indicates an issue with the "
+        "NavMesh");
+
+  // The geodesic distance is at least the euclidean one, so the ratio bounds
+  // the euclidean distance without a path query
+  const float maxEuclideanDistance =
+      settings.maxGeodesicDistance /
+      std::max(1.0f, settings.minGeodesicToEuclideanRatio);
+  const auto inHeightBand = [&settings](const vec3f& pt) {
+    return pt[1] >= settings.minHeight && pt[1] <= settings.maxHeight;
+  };
+
+  SampledEpisodes episodes;
+  episodes.starts.resize(numEpisodes, 3);
+  episodes.goals.resize(numEpisodes, 3);
+  episodes.geodesicDistances.resize(numEpisodes);
+  episodes.islands.resize(numEpisodes);
+  Eigen::Matrix<bool, Eigen::Dynamic, 1> found =
+      Eigen::Matrix<bool, Eigen::Dynamic, 1>::Constant(numEpisodes, false);
+
+  // The island restriction is applied to the shared navmesh flags, so set it
+  // once for the whole batch rather than per point.
+  beginIslandQuery(settings.islandIndex);
+  parallelForChunks(
+      numEpisodes, prepareBatchQueries(numEpisodes, numThreads),
+      [&](const int begin, const int end, const int threadIndex) {
+        const dtNavMeshQuery* navQuery = batchQuery(threadIndex);
+        for (int i = begin; i < end; ++i) {
+          std::seed_seq episodeSeed{seed, static_cast<uint32_t>(i)};
+          episodeRng.seed(episodeSeed);
+
+          for (int iTry = 0; iTry < settings.maxTries && !found[i]; ++iTry) {
+            vec3f start, goal;
+            dtPolyRef startRef = 0, goalRef = 0;
+            if (dtStatusFailed(navQuery->findRandomPoint(
+                    filter_.get(), episodeFrand, &startRef, start.data())) ||
+                dtStatusFailed(navQuery->findRandomPoint(
+                    filter_.get(), episodeFrand, &goalRef, goal.data()))) {
+              continue;
+            }
+
+            // Cheap rejections first
+            const float euclideanDistance = (goal - start).norm();
+            if (!inHeightBand(start) || !inHeightBand(goal) ||
+                std::abs(goal[1] - start[1]) > settings.maxHeightDifference ||
+                euclideanDistance > maxEuclideanDistance ||
+                !islandSystem_->hasConnection(startRef, goalRef)) {
+              continue;
+            }
+
+            const Cr::Containers::Optional<
+                std::tuple<float, std::vector<vec3f>>>
+                findResult = findPathInternal(navQuery, start, startRef, start,
+                                              goal, goalRef, goal);
+            if (!findResult) {
+              continue;
+            }
+            const float geodesicDistance = std::get<0>(*findResult);
+            if (geodesicDistance < settings.minGeodesicDistance ||
+                geodesicDistance > settings.maxGeodesicDistance ||
+                geodesicDistance <
+                    settings.minGeodesicToEuclideanRatio * euclideanDistance) {
+              continue;
+            }
+
+            episodes.starts.row(i) = start.transpose();
+            episodes.goals.row(i) = goal.transpose();
+            episodes.geodesicDistances[i] = geodesicDistance;
+            episodes.islands[i] = islandSystem_->findPolyIsland(startRef);
+            found[i] = true;
+          }
+        }
+      });
+  endIslandQuery(settings.islandIndex);
+
+  // Drop the episodes which ran out of tries, keeping the others in order
+  int numFound = 0;
+  for (int i = 0; i < numEpisodes; ++i) {
+    if (!found[i]) {
+      continue;
+    }
+    if (numFound != i) {
+      episodes.starts.row(numFound) = episodes.starts.row(i);
+      episodes.goals.row(numFound) = episodes.goals.row(i);
+      episodes.geodesicDistances[numFound] = episodes.geodesicDistances[i];
+      episodes.islands[numFound] = episodes.islands[i];
+    }
+    ++numFound;
+  }
+  if (numFound < numEpisodes) {
+    ESP_WARNING() << "Failed to sample" << numEpisodes - numFound << "of"
+                  << numEpisodes
+                  << "episodes. Try increasing max tries or relaxing the "
+                     "constraints";
+    episodes.starts.conservativeResize(numFound, 3);
+    episodes.goals.conservativeResize(numFound, 3);
+    episodes.geodesicDistances.conservativeResize(numFound);
+    episodes.islands.conservativeResize(numFound);
+  }
+  return episodes;
+}
+
+GeodesicDistanceField::ptr PathFinder::Impl::getGeodesicDistanceField(
+    const std::vector<vec3f>& goals) {
+  std::vector<vec3f> key = goals;
+  std::sort(key.begin(), key.end(), [](const vec3f& a, const vec3f& b) {
+    return std::lexicographical_compare(a.data(), a.data() + 3, b.data(),
+                                        b.data() + 3);
+  });
+
+  for (auto it = distanceFieldCache_.begin(); it != distanceFieldCache_.end();
+       ++it) {
+    if (it->first == key) {
+      distanceFieldCache_.splice(distanceFieldCache_.begin(),
+                                 distanceFieldCache_, it);
+      return it->second;
+    }
+  }
+
+  auto field = GeodesicDistanceField::create();
+  field->setGoals(goals);
+  distanceFieldCache_.emplace_front(std::move(key), field);
+  setDistanceFieldCacheSize(distanceFieldCacheSize_);
+  return field;
+}
+
+void PathFinder::Impl::setDistanceFieldCacheSize(const int size) {
+  distanceFieldCacheSize_ = std::max(0, size);
+  while (static_cast<int>(distanceFieldCache_.size()) >
+         distanceFieldCacheSize_) {
+    distanceFieldCache_.pop_back();
+  }
+}
+
+void PathFinder::Impl::updateDistanceField(GeodesicDistanceField& field) {
+  GeodesicDistanceField::Impl& data = *field.pimpl_;
+  if (data.navMeshVersion == navMeshVersion_)
+    return;
+
+  if (!vertexGraph_) {
+    vertexGraph_ = std::make_unique<impl::VertexGraph>(
+        navMesh_.get(), navQuery_.get(), filter_.get());
+  }
+
+  data.polyGoals.clear();
+  std::vector<std::pair<int, float>> sources;
+  for (const vec3f& goal : data.goals) {
+    dtStatus status = 0;
+    dtPolyRef goalRef = 0;
+    vec3f goalPt;
+    std::tie(status, goalRef, goalPt) =
+        projectToPoly(goal, navQuery_.get(), filter_.get());
+    if (status != DT_SUCCESS || goalRef == 0) {
+      ESP_DEBUG() << "Can't project goal to navmesh, skipping:" << goal;
+      continue;
+    }
+
+    data.polyGoals[goalRef].emplace_back(goalPt);
+    vertexGraph_->forEachVisibleNode(
+        navMesh_.get(), navQuery_.get(), filter_.get(), goalRef, goalPt,
+        [&sources](const int node, const float distance) {
+          sources.emplace_back(node, distance);
+        });
+  }
+
+  data.nodeDistances = vertexGraph_->distancesFrom(sources);
+  data.navMeshVersion = navMeshVersion_;
+}
+
+float PathFinder::Impl::geodesicDistanceToGoals(
+    const dtNavMeshQuery* navQuery,
+    const GeodesicDistanceField& field,
+    const vec3f& pt) const {
+  const GeodesicDistanceField::Impl& data = *field.pimpl_;
+  float distance = std::numeric_limits<float>::infinity();
+
+  dtStatus status = 0;
+  dtPolyRef ptRef = 0;
+  vec3f polyPt;
+  std::tie(status, ptRef, polyPt) = projectToPoly(pt, navQuery, filter_.get());
+  if (status != DT_SUCCESS || ptRef == 0)
+    return distance;
+
+  vertexGraph_->forEachVisibleNode(
+      navMesh_.get(), navQuery, filter_.get(), ptRef, polyPt,
+      [&](const int node, const float nodeDistance) {
+        distance = std::min(distance, nodeDistance + data.nodeDistances[node]);
+      });
+
+  // Goals in the same or a neighbouring polygon may be reachable in a straight
+  // line without passing through any vertex
+  auto itGoals = data.polyGoals.find(ptRef);
+  if (itGoals != data.polyGoals.end()) {
+    for (const vec3f& goal : itGoals->second)
+      distance = std::min(distance, (goal - polyPt).norm());
+  }
+  impl::forEachNeighbourPoly(
+      navMesh_.get(), filter_.get(), ptRef, [&](const dtPolyRef neighbour) {
+        auto itNeighbourGoals = data.polyGoals.find(neighbour);
+        if (itNeighbourGoals == data.polyGoals.end())
+          return;
+        for (const vec3f& goal : itNeighbourGoals->second) {
+          const float goalDistance = (goal - polyPt).norm();
+          if (goalDistance < distance &&
+              impl::isSegmentWalkable(navQuery, filter_.get(), ptRef, polyPt,
+                                      goal))
+            distance = goalDistance;
+        }
+      });
+
+  return distance;
+}
+
+float PathFinder::Impl::geodesicDistanceToGoals(GeodesicDistanceField& field,
+                                                const vec3f& pt) {
+  updateDistanceField(field);
+  return geodesicDistanceToGoals(navQuery_.get(), field, pt);
+}
+
+Eigen::VectorXf PathFinder::Impl::geodesicDistanceToGoalsBatch(
+    GeodesicDistanceField& field,
+    const Eigen::RowMatrixX3f& pts,
+    const int numThreads) {
+  updateDistanceField(field);
+  const int numItems = pts.rows();
+  Eigen::VectorXf distances(numItems);
+  parallelForChunks(numItems, prepareBatchQueries(numItems, numThreads),
+                    [&](const int begin, const int end, const int threadIndex) {
+                      const dtNavMeshQuery* navQuery = batchQuery(threadIndex);
+                      for (int i = begin; i < end; ++i) {
+                        distances[i] = geodesicDistanceToGoals(
+                            navQuery, field, pts.row(i).transpose());
+                      }
+                    });
+  return distances;
+}
+
 typedef Eigen::Matrix<bool, Eigen::Dynamic, Eigen::Dynamic> MatrixXb;
 
-Eigen::Matrix<bool, Eigen::Dynamic, Eigen::Dynamic>
-PathFinder::Impl::getTopDownView(const float metersPerPixel,
-                                 const float height,
-                                 const float eps) const {
-  std::pair<vec3f, vec3f> mapBounds = bounds();
-  vec3f bound1 = std::move(mapBounds.first);
-  vec3f bound2 = std::move(mapBounds.second);
+namespace {
+//! Pixel grid of the top-down views of the navmesh at some resolution
+struct TopDownGrid {
+  float startX;
+  float startZ;
+  int xResolution;
+  int zResolution;
+};
+
+TopDownGrid topDownGrid(const std::pair<vec3f, vec3f>& mapBounds,
+                        const float metersPerPixel) {
+  const vec3f& bound1 = mapBounds.first;
+  const vec3f& bound2 = mapBounds.second;
 
   float xspan = std::abs(bound1[0] - bound2[0]);
   float zspan = std::abs(bound1[2] - bound2[2]);
-  int xResolution = xspan / metersPerPixel;
-  int zResolution = zspan / metersPerPixel;
-  float startx = fmin(bound1[0], bound2[0]);
-  float startz = fmin(bound1[2], bound2[2]);
-  MatrixXb topdownMap(zResolution, xResolution);
-
-  float curz = startz;
-  float curx = startx;
-  for (int h = 0; h < zResolution; ++h) {
-    for (int w = 0; w < xResolution; ++w) {
-      vec3f point = vec3f(curx, height, curz);
-      topdownMap(h, w) = isNavigable(point, eps);
-      curx = curx + metersPerPixel;
+  return {std::fmin(bound1[0], bound2[0]), std::fmin(bound1[2], bound2[2]),
+          static_cast<int>(xspan / metersPerPixel),
+          static_cast<int>(zspan / metersPerPixel)};
+}
+
+//! Row or column of the pixel at @p coordinate
+int topDownPixel(const float coordinate,
+                 const float start,
+                 const float metersPerPixel) {
+  return static_cast<int>(std::lround((coordinate - start) / metersPerPixel));
+}
+
+/**
+ * @brief Rasterizes the @p rows x @p cols window of @p grid starting at
+ * (@p firstRow, @p firstCol) with cellValue(point), or @p outside for pixels
+ * out of the grid.
+ */
+template <typename T, typename CellFn>
+Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> rasterizeTopDownView(
+    const TopDownGrid& grid,
+    const float metersPerPixel,
+    const float height,
+    const int firstRow,
+    const int firstCol,
+    const int rows,
+    const int cols,
+    const T outside,
+    CellFn&& cellValue) {
+  // Accumulated pixel by pixel, so that crops match the full view exactly
+  const auto coordinates = [metersPerPixel](float start, const int count) {
+    std::vector<float> pixelCoordinates(std::max(0, count));
+    for (float& coordinate : pixelCoordinates) {
+      coordinate = start;
+      start = start + metersPerPixel;
+    }
+    return pixelCoordinates;
+  };
+  const std::vector<float> xs =
+      coordinates(grid.startX, std::min(grid.xResolution, firstCol + cols));
+  const std::vector<float> zs =
+      coordinates(grid.startZ, std::min(grid.zResolution, firstRow + rows));
+
+  Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> topdownMap(rows, cols);
+  for (int h = 0; h < rows; ++h) {
+    const int row = firstRow + h;
+    for (int w = 0; w < cols; ++w) {
+      const int col = firstCol + w;
+      if (row < 0 || row >= grid.zResolution || col < 0 ||
+          col >= grid.xResolution) {
+        topdownMap(h, w) = outside;
+        continue;
+      }
+      const vec3f point(xs[col], height, zs[row]);
+      topdownMap(h, w) = cellValue(point);
+    }
+  }
+  return topdownMap;
+}
+
+/**
+ * @brief Copies the @p rows x @p cols window of @p topdownMap starting at
+ * (@p firstRow, @p firstCol), with @p outside for pixels out of the map.
+ */
+template <typename T>
+Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> cropTopDownView(
+    const Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic>& topdownMap,
+    const int firstRow,
+    const int firstCol,
+    const int rows,
+    const int cols,
+    const T outside) {
+  Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic> crop =
+      Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic>::Constant(rows, cols,
+                                                                 outside);
+  const int rowBegin = std::max(0, firstRow);
+  const int rowEnd = std::min<int>(topdownMap.rows(), firstRow + rows);
+  const int colBegin = std::max(0, firstCol);
+  const int colEnd = std::min<int>(topdownMap.cols(), firstCol + cols);
+  if (rowBegin < rowEnd && colBegin < colEnd) {
+    crop.block(rowBegin - firstRow, colBegin - firstCol, rowEnd - rowBegin,
+               colEnd - colBegin) =
+        topdownMap.block(rowBegin, colBegin, rowEnd - rowBegin,
+                         colEnd - colBegin);
+  }
+  return crop;
+}
+}  // namespace
+
+template <typename T>
+const Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic>*
+PathFinder::Impl::findTopDownView(TopDownViewCache<T>& cache,
+                                  const TopDownViewKey& key) {
+  for (auto it = cache.begin(); it != cache.end(); ++it) {
+    if (it->first == key) {
+      cache.splice(cache.begin(), cache, it);
+      return &it->second;
     }
-    curz = curz + metersPerPixel;
-    curx = startx;
+  }
+  return nullptr;
+}
+
+template <typename T>
+void PathFinder::Impl::addTopDownView(
+    TopDownViewCache<T>& cache,
+    const TopDownViewKey& key,
+    const Eigen::Matrix<T, Eigen::Dynamic, Eigen::Dynamic>& topdownMap) {
+  if (topDownViewCacheSize_ == 0) {
+    return;
+  }
+  cache.emplace_front(key, topdownMap);
+  while (static_cast<int>(cache.size()) > topDownViewCacheSize_) {
+    cache.pop_back();
+  }
+}
+
+Eigen::Matrix<bool, Eigen::Dynamic, Eigen::Dynamic>
+PathFinder::Impl::getTopDownView(const float metersPerPixel,
+                                 const float height,
+                                 const float eps) {
+  const TopDownViewKey key{metersPerPixel, height, eps};
+  if (const MatrixXb* cached = findTopDownView(topDownViewCache_, key)) {
+    return *cached;
   }
 
+  const TopDownGrid grid = topDownGrid(bounds(), metersPerPixel);
+  MatrixXb topdownMap = rasterizeTopDownView<bool>(
+      grid, metersPerPixel, height, 0, 0, grid.zResolution, grid.xResolution,
+      false, [&](const vec3f& point) { return isNavigable(point, eps); });
+  addTopDownView(topDownViewCache_, key, topdownMap);
   return topdownMap;
 }
 
@@ -1789,37 +3221,85 @@ typedef Eigen::Matrix<int, Eigen::Dynamic, Eigen::Dynamic> MatrixXi;
 
 MatrixXi PathFinder::Impl::getTopDownIslandView(const float metersPerPixel,
                                                 const float height,
-                                                const float eps) const {
-  std::pair<vec3f, vec3f> mapBounds = bounds();
-  vec3f bound1 = std::move(mapBounds.first);
-  vec3f bound2 = std::move(mapBounds.second);
+                                                const float eps) {
+  const TopDownViewKey key{metersPerPixel, height, eps};
+  if (const MatrixXi* cached = findTopDownView(topDownIslandViewCache_, key)) {
+    return *cached;
+  }
+
+  const TopDownGrid grid = topDownGrid(bounds(), metersPerPixel);
+  MatrixXi topdownMap = rasterizeTopDownView<int>(
+      grid, metersPerPixel, height, 0, 0, grid.zResolution, grid.xResolution,
+      ID_UNDEFINED, [&](const vec3f& point) {
+        // get the island of navigable points
+        return isNavigable(point, eps) ? getIsland(point) : ID_UNDEFINED;
+      });
+  addTopDownView(topDownIslandViewCache_, key, topdownMap);
+  return topdownMap;
+}
 
-  float xspan = std::abs(bound1[0] - bound2[0]);
-  float zspan = std::abs(bound1[2] - bound2[2]);
-  int xResolution = xspan / metersPerPixel;
-  int zResolution = zspan / metersPerPixel;
-  float startx = fmin(bound1[0], bound2[0]);
-  float startz = fmin(bound1[2], bound2[2]);
-  MatrixXi topdownMap(zResolution, xResolution);
-
-  float curz = startz;
-  float curx = startx;
-  for (int h = 0; h < zResolution; ++h) {
-    for (int w = 0; w < xResolution; ++w) {
-      vec3f point = vec3f(curx, height, curz);
-      if (isNavigable(point, eps)) {
-        // get the island
-        topdownMap(h, w) = getIsland(point);
-      } else {
-        topdownMap(h, w) = -1;
-      }
-      curx = curx + metersPerPixel;
-    }
-    curz = curz + metersPerPixel;
-    curx = startx;
+Eigen::Matrix<bool, Eigen::Dynamic, Eigen::Dynamic>
+PathFinder::Impl::getTopDownViewCrop(const float metersPerPixel,
+                                     const float height,
+                                     const vec3f& center,
+                                     const int radius,
+                                     const float eps) {
+  ESP_CHECK(radius >= 0,
+            "getTopDownViewCrop: radius must be non-negative, got" << radius);
+  const TopDownGrid grid = topDownGrid(bounds(), metersPerPixel);
+  const int size = 2 * radius + 1;
+  const int firstRow =
+      topDownPixel(center[2], grid.startZ, metersPerPixel) - radius;
+  const int firstCol =
+      topDownPixel(center[0], grid.startX, metersPerPixel) - radius;
+
+  // Cut from the full view if it was already rasterized
+  const TopDownViewKey key{metersPerPixel, height, eps};
+  if (const MatrixXb* cached = findTopDownView(topDownViewCache_, key)) {
+    return cropTopDownView<bool>(*cached, firstRow, firstCol, size, size,
+                                 false);
+  }
+  return rasterizeTopDownView<bool>(
+      grid, metersPerPixel, height, firstRow, firstCol, size, size, false,
+      [&](const vec3f& point) { return isNavigable(point, eps); });
+}
+
+MatrixXi PathFinder::Impl::getTopDownIslandViewCrop(const float metersPerPixel,
+                                                    const float height,
+                                                    const vec3f& center,
+                                                    const int radius,
+                                                    const float eps) {
+  ESP_CHECK(
+      radius >= 0,
+      "getTopDownIslandViewCrop: radius must be non-negative, got" << radius);
+  const TopDownGrid grid = topDownGrid(bounds(), metersPerPixel);
+  const int size = 2 * radius + 1;
+  const int firstRow =
+      topDownPixel(center[2], grid.startZ, metersPerPixel) - radius;
+  const int firstCol =
+      topDownPixel(center[0], grid.startX, metersPerPixel) - radius;
+
+  const TopDownViewKey key{metersPerPixel, height, eps};
+  if (const MatrixXi* cached = findTopDownView(topDownIslandViewCache_, key)) {
+    return cropTopDownView<int>(*cached, firstRow, firstCol, size, size,
+                                ID_UNDEFINED);
+  }
+  return rasterizeTopDownView<int>(
+      grid, metersPerPixel, height, firstRow, firstCol, size, size,
+      ID_UNDEFINED, [&](const vec3f& point) {
+        return isNavigable(point, eps) ? getIsland(point) : ID_UNDEFINED;
+      });
+}
+
+void PathFinder::Impl::setTopDownViewCacheSize(const int size) {
+  topDownViewCacheSize_ = std::max(0, size);
+  while (static_cast<int>(topDownViewCache_.size()) > topDownViewCacheSize_) {
+    topDownViewCache_.pop_back();
+  }
+  while (static_cast<int>(topDownIslandViewCache_.size()) >
+         topDownViewCacheSize_) {
+    topDownIslandViewCache_.pop_back();
   }
-
-  return topdownMap;
 }
 
 assets::MeshData::ptr PathFinder::Impl::getNavMeshData(
@@ -1889,6 +3369,36 @@ bool PathFinder::build(const NavMeshSettings& bs,
   return pimpl_->build(bs, mesh);
 }
 
+bool PathFinder::rebuildTiles(
+    const float* verts,
+    const int nverts,
+    const int* tris,
+    const int ntris,
+    const std::vector<std::pair<vec3f, vec3f>>& regions) {
+  return pimpl_->rebuildTiles(verts, nverts, tris, ntris, regions);
+}
+bool PathFinder::rebuildTiles(
+    const esp::assets::MeshData& mesh,
+    const std::vector<std::pair<vec3f, vec3f>>& regions) {
+  return pimpl_->rebuildTiles(mesh, regions);
+}
+
+void PathFinder::setNavMeshCache(NavMeshCache::ptr cache) {
+  pimpl_->setNavMeshCache(std::move(cache));
+}
+
+NavMeshCache::ptr PathFinder::getNavMeshCache() const {
+  return pimpl_->getNavMeshCache();
+}
+
+void PathFinder::setNumBuildThreads(const int numThreads) {
+  pimpl_->setNumBuildThreads(numThreads);
+}
+
+int PathFinder::getNumBuildThreads() const {
+  return pimpl_->getNumBuildThreads();
+}
+
 vec3f PathFinder::getRandomNavigablePoint(const int maxTries /*= 10*/,
                                           int islandIndex /*= ID_UNDEFINED*/) {
   return pimpl_->getRandomNavigablePoint(maxTries, islandIndex);
@@ -1990,6 +3500,74 @@ bool PathFinder::isNavigable(const vec3f& pt, const float maxYDelta) const {
   return pimpl_->isNavigable(pt, maxYDelta);
 }
 
+Eigen::VectorXf PathFinder::geodesicDistanceBatch(
+    const Eigen::RowMatrixX3f& starts,
+    const Eigen::RowMatrixX3f& ends,
+    const int numThreads) {
+  return pimpl_->geodesicDistanceBatch(starts, ends, numThreads);
+}
+
+Eigen::RowMatrixX3f PathFinder::snapPointBatch(const Eigen::RowMatrixX3f& pts,
+                                               const int islandIndex,
+                                               const int numThreads) {
+  return pimpl_->snapPointBatch(pts, islandIndex, numThreads);
+}
+
+Eigen::RowMatrixX3f PathFinder::tryStepBatch(const Eigen::RowMatrixX3f& starts,
+                                             const Eigen::RowMatrixX3f& ends,
+                                             const bool allowSliding,
+                                             const int numThreads) {
+  return pimpl_->tryStepBatch(starts, ends, allowSliding, numThreads);
+}
+
+Eigen::Matrix<bool, Eigen::Dynamic, 1> PathFinder::isNavigableBatch(
+    const Eigen::RowMatrixX3f& pts,
+    const float maxYDelta,
+    const int numThreads) {
+  return pimpl_->isNavigableBatch(pts, maxYDelta, numThreads);
+}
+
+Eigen::VectorXf PathFinder::distanceToClosestObstacleBatch(
+    const Eigen::RowMatrixX3f& pts,
+    const float maxSearchRadius,
+    const int numThreads) {
+  return pimpl_->distanceToClosestObstacleBatch(pts, maxSearchRadius,
+                                                numThreads);
+}
+
+SampledEpisodes PathFinder::sampleEpisodes(
+    const int numEpisodes,
+    const EpisodeSamplingSettings& settings,
+    const uint32_t seed,
+    const int numThreads) {
+  return pimpl_->sampleEpisodes(numEpisodes, settings, seed, numThreads);
+}
+
+GeodesicDistanceField::ptr PathFinder::getGeodesicDistanceField(
+    const std::vector<vec3f>& goals) {
+  return pimpl_->getGeodesicDistanceField(goals);
+}
+
+float PathFinder::geodesicDistanceToGoals(GeodesicDistanceField& field,
+                                          const vec3f& pt) {
+  return pimpl_->geodesicDistanceToGoals(field, pt);
+}
+
+Eigen::VectorXf PathFinder::geodesicDistanceToGoalsBatch(
+    GeodesicDistanceField& field,
+    const Eigen::RowMatrixX3f& pts,
+    const int numThreads) {
+  return pimpl_->geodesicDistanceToGoalsBatch(field, pts, numThreads);
+}
+
+void PathFinder::setDistanceFieldCacheSize(const int size) {
+  pimpl_->setDistanceFieldCacheSize(size);
+}
+
+int PathFinder::getDistanceFieldCacheSize() const {
+  return pimpl_->getDistanceFieldCacheSize();
+}
+
 float PathFinder::getNavigableArea(int islandIndex /*= ID_UNDEFINED*/) const {
   return pimpl_->getNavigableArea(islandIndex);
 }
@@ -2012,6 +3590,34 @@ PathFinder::getTopDownIslandView(const float metersPerPixel,
   return pimpl_->getTopDownIslandView(metersPerPixel, height, eps);
 }
 
+Eigen::Matrix<bool, Eigen::Dynamic, Eigen::Dynamic>
+PathFinder::getTopDownViewCrop(const float metersPerPixel,
+                               const float height,
+                               const vec3f& center,
+                               const int radius,
+                               const float eps) {
+  return pimpl_->getTopDownViewCrop(metersPerPixel, height, center, radius,
+                                    eps);
+}
+
+Eigen::Matrix<int, Eigen::Dynamic, Eigen::Dynamic>
+PathFinder::getTopDownIslandViewCrop(const float metersPerPixel,
+                                     const float height,
+                                     const vec3f& center,
+                                     const int radius,
+                                     const float eps) {
+  return pimpl_->getTopDownIslandViewCrop(metersPerPixel, height, center,
+                                          radius, eps);
+}
+
+void PathFinder::setTopDownViewCacheSize(const int size) {
+  pimpl_->setTopDownViewCacheSize(size);
+}
+
+int PathFinder::getTopDownViewCacheSize() const {
+  return pimpl_->getTopDownViewCacheSize();
+}
+
 assets::MeshData::ptr PathFinder::getNavMeshData(
     int islandIndex /*= ID_UNDEFINED*/) {
   return pimpl_->getNavMeshData(islandIndex);
@@ -6,6 +6,8 @@
 #define ESP_NAV_PATHFINDER_H_
 
 #include <Corrade/Containers/Optional.h>
+#include <limits>
+#include <memory>
 #include <string>
 #include <vector>
 
@@ -22,6 +24,7 @@ struct MeshData;
 namespace nav {
 
 class PathFinder;
+class NavMeshCache;
 
 /**
  * @brief Struct for recording closest obstacle information.
@@ -118,6 +121,31 @@ struct MultiGoalShortestPath {
   ESP_SMART_POINTERS_WITH_UNIQUE_PIMPL(MultiGoalShortestPath)
 };
 
+/**
+ * @brief Geodesic distances from the navigation mesh to the closest of a fixed
+ * set of goals. Used in conjunction with @ref
+ * PathFinder::geodesicDistanceToGoals.
+ *
+ * The field is built on its first query with a single Dijkstra pass from the
+ * goals over the navmesh polygon vertices, after which every query is a
+ * lookup over the vertices around the query point. It is rebuilt when the
+ * goals or the navmesh change.
+ */
+struct GeodesicDistanceField {
+  GeodesicDistanceField();
+
+  /**
+   * @brief Set the list of goal points
+   */
+  void setGoals(const std::vector<vec3f>& newGoals);
+
+  const std::vector<vec3f>& getGoals() const;
+
+  friend class PathFinder;
+
+  ESP_SMART_POINTERS_WITH_UNIQUE_PIMPL(GeodesicDistanceField)
+};
+
 /**
  * @brief Configuration structure for NavMesh generation with recast.
  *
@@ -263,6 +291,16 @@ struct NavMeshSettings {
    */
   bool includeStaticObjects{};
 
+  /**
+   * @brief Width and depth of the navmesh tiles in cells, 0 builds the navmesh
+   * as a single tile.
+   *
+   * The tiles of a tiled navmesh can be rebuilt individually with @ref
+   * PathFinder::rebuildTiles when part of the scene changes. A few dozen cells
+   * larger than the agent radius is a good start, e.g. 64 or 128.
+   */
+  int tileSize{};
+
   void setDefaults() {
     cellSize = 0.05f;
     cellHeight = 0.2f;
@@ -281,6 +319,7 @@ struct NavMeshSettings {
     filterLedgeSpans = true;
     filterWalkableLowHeightSpans = true;
     includeStaticObjects = false;
+    tileSize = 0;
   }
 
   //! Load the settings from a JSON file
@@ -305,6 +344,75 @@ bool operator==(const NavMeshSettings& a, const NavMeshSettings& b);
  */
 bool operator!=(const NavMeshSettings& a, const NavMeshSettings& b);
 
+/**
+ * @brief Constraints on the start/goal pairs sampled by @ref
+ * PathFinder::sampleEpisodes.
+ */
+struct EpisodeSamplingSettings {
+  /**
+   * @brief Minimum geodesic distance between the start and the goal.
+   */
+  float minGeodesicDistance = 1.0f;
+
+  /**
+   * @brief Maximum geodesic distance between the start and the goal.
+   */
+  float maxGeodesicDistance = 30.0f;
+
+  /**
+   * @brief Minimum ratio of the geodesic to the euclidean distance between
+   * the start and the goal. Values above 1 reject straight line episodes.
+   */
+  float minGeodesicToEuclideanRatio = 1.0f;
+
+  /**
+   * @brief Minimum height of the start and the goal, e.g. the bottom of a
+   * floor.
+   */
+  float minHeight = -std::numeric_limits<float>::infinity();
+
+  /**
+   * @brief Maximum height of the start and the goal, e.g. the top of a floor.
+   */
+  float maxHeight = std::numeric_limits<float>::infinity();
+
+  /**
+   * @brief Maximum height difference between the start and the goal.
+   */
+  float maxHeightDifference = std::numeric_limits<float>::infinity();
+
+  /**
+   * @brief The island to sample on. Default -1 samples the full navmesh, with
+   * the start and the goal on the same island.
+   */
+  int islandIndex = ID_UNDEFINED;
+
+  /**
+   * @brief How many start/goal pairs to try for each episode before giving
+   * up on it.
+   */
+  int maxTries = 1000;
+
+  ESP_SMART_POINTERS(EpisodeSamplingSettings)
+};
+
+/**
+ * @brief Start/goal pairs sampled by @ref PathFinder::sampleEpisodes, one
+ * episode per row.
+ */
+struct SampledEpisodes {
+  //! The start of each episode.
+  Eigen::RowMatrixX3f starts;
+  //! The goal of each episode.
+  Eigen::RowMatrixX3f goals;
+  //! The geodesic distance from the start to the goal of each episode.
+  Eigen::VectorXf geodesicDistances;
+  //! The island of each episode.
+  Eigen::VectorXi islands;
+
+  ESP_SMART_POINTERS(SampledEpisodes)
+};
+
 /** @brief Loads and/or builds a navigation mesh and then allows point sampling,
  * path finding, collision, and island queries on that navmesh.
  *
@@ -372,6 +480,74 @@ class PathFinder {
    */
   bool build(const NavMeshSettings& bs, const esp::assets::MeshData& mesh);
 
+  /**
+   * @brief Rebuilds the tiles of a tiled navmesh overlapping some regions of
+   * the scene, e.g. the bounding boxes of objects before and after they moved.
+   *
+   * The other tiles are kept as is, so the scene only needs to have changed
+   * inside the regions. The navmesh must have been built or loaded with @ref
+   * NavMeshSettings::tileSize greater than 0, and is rebuilt with its current
+   * @ref NavMeshSettings.
+   *
+   * @param verts Vertex array of the whole updated mesh.
+   * @param nverts Number of verts in the array.
+   * @param tris Index array of the mesh triangles.
+   * @param ntris Number of triangle indices in the array.
+   * @param regions The (min, max) corners of the changed regions.
+   *
+   * @return Whether or not all the tiles were rebuilt.
+   */
+  bool rebuildTiles(const float* verts,
+                    int nverts,
+                    const int* tris,
+                    int ntris,
+                    const std::vector<std::pair<vec3f, vec3f>>& regions);
+
+  /**
+   * @brief Rebuilds the tiles of a tiled navmesh overlapping some regions of
+   * the scene from a @ref MeshData object.
+   *
+   * @param mesh The whole updated joined mesh.
+   * @param regions The (min, max) corners of the changed regions.
+   *
+   * @return Whether or not all the tiles were rebuilt.
+   */
+  bool rebuildTiles(const esp::assets::MeshData& mesh,
+                    const std::vector<std::pair<vec3f, vec3f>>& regions);
+
+  /**
+   * @brief Sets the on-disk cache of navmeshes.
+   *
+   * @ref build loads the navmesh from the cache when it was built from the
+   * same inputs before, and adds the navmeshes it does build to the cache.
+   *
+   * @param cache The cache, nullptr disables caching.
+   */
+  void setNavMeshCache(std::shared_ptr<NavMeshCache> cache);
+
+  /**
+   * @brief The on-disk cache of navmeshes, nullptr if there is none.
+   */
+  std::shared_ptr<NavMeshCache> getNavMeshCache() const;
+
+  /**
+   * @brief Sets the number of threads building the tiles of navmeshes with
+   * @ref NavMeshSettings::tileSize greater than 0, in @ref build and @ref
+   * rebuildTiles.
+   *
+   * The navmesh is the same whatever the number of threads.
+   *
+   * @param numThreads The number of threads, all hardware threads if less than
+   * 1.
+   */
+  void setNumBuildThreads(int numThreads);
+
+  /**
+   * @brief The number of threads building the tiles of tiled navmeshes, all
+   * hardware threads if less than 1.
+   */
+  int getNumBuildThreads() const;
+
   /**
    * @brief Returns a random navigable point.
    *
@@ -444,6 +620,55 @@ class PathFinder {
    */
   bool findPath(MultiGoalShortestPath& path);
 
+  /**
+   * @brief Returns the cached @ref GeodesicDistanceField for a goal set,
+   * creating it if needed.
+   *
+   * Fields are kept in a least-recently-used cache keyed by the set of goals,
+   * see @ref setDistanceFieldCacheSize. The cache is cleared when the navmesh
+   * changes.
+   *
+   * @param[in] goals The goal points. Their order does not matter.
+   */
+  GeodesicDistanceField::ptr getGeodesicDistanceField(
+      const std::vector<vec3f>& goals);
+
+  /**
+   * @brief Approximates the geodesic distance from a point to the closest goal
+   * of a @ref GeodesicDistanceField.
+   *
+   * Builds the field if it was never queried or if the navmesh changed since.
+   * The result follows straight segments between navmesh vertices, so it is
+   * never shorter than and usually within a few percent of the distance found
+   * by @ref findPath.
+   *
+   * @param[inout] field The distance field.
+   * @param[in] pt The query point, snapped to the navmesh.
+   *
+   * @return The distance, inf if no goal is reachable from @ref pt.
+   */
+  float geodesicDistanceToGoals(GeodesicDistanceField& field, const vec3f& pt);
+
+  /**
+   * @brief Batch version of @ref geodesicDistanceToGoals.
+   *
+   * @param[inout] field The distance field.
+   * @param[in] pts The query points, one per row.
+   * @param[in] numThreads The number of threads to use. Values less than 1 use
+   * all available hardware threads.
+   */
+  Eigen::VectorXf geodesicDistanceToGoalsBatch(GeodesicDistanceField& field,
+                                               const Eigen::RowMatrixX3f& pts,
+                                               int numThreads = 1);
+
+  /**
+   * @brief Set the number of @ref GeodesicDistanceField kept by @ref
+   * getGeodesicDistanceField. Evicts the least recently used fields if needed.
+   */
+  void setDistanceFieldCacheSize(int size);
+
+  int getDistanceFieldCacheSize() const;
+
   /**
    * @brief Attempts to move from @ref start to @ref end and returns the
    * navigable point closest to @ref end that is feasibly reachable from @ref
@@ -595,6 +820,113 @@ class PathFinder {
    */
   bool isNavigable(const vec3f& pt, float maxYDelta = 0.5) const;
 
+  /**
+   * @brief Batch version of @ref findPath. Computes the geodesic distance
+   * between each pair of rows of @ref starts and @ref ends.
+   *
+   * The queries run in a native loop, optionally split across @ref numThreads
+   * threads which each use their own Detour query object.
+   *
+   * @param[in] starts The start points, one per row.
+   * @param[in] ends The end points, one per row. Must have as many rows as
+   * @ref starts.
+   * @param[in] numThreads The number of threads to use. Values less than 1 use
+   * all available hardware threads.
+   *
+   * @return The geodesic distance of each pair, infinity for pairs without a
+   * path.
+   */
+  Eigen::VectorXf geodesicDistanceBatch(const Eigen::RowMatrixX3f& starts,
+                                        const Eigen::RowMatrixX3f& ends,
+                                        int numThreads = 1);
+
+  /**
+   * @brief Batch version of @ref snapPoint.
+   *
+   * @param[in] pts The points to snap, one per row.
+   * @param[in] islandIndex Optionally specify the island to snap to. Default -1
+   * queries the full navmesh.
+   * @param[in] numThreads The number of threads to use. Values less than 1 use
+   * all available hardware threads.
+   *
+   * @return The snapped points, rows are `{NAN, NAN, NAN}` where snapping
+   * failed.
+   */
+  Eigen::RowMatrixX3f snapPointBatch(const Eigen::RowMatrixX3f& pts,
+                                     int islandIndex = ID_UNDEFINED,
+                                     int numThreads = 1);
+
+  /**
+   * @brief Batch version of @ref tryStep and @ref tryStepNoSliding.
+   *
+   * @param[in] starts The starting locations, one per row.
+   * @param[in] ends The desired end locations, one per row. Must have as many
+   * rows as @ref starts.
+   * @param[in] allowSliding Whether or not to allow sliding along walls.
+   * @param[in] numThreads The number of threads to use. Values less than 1 use
+   * all available hardware threads.
+   *
+   * @return The found end locations.
+   */
+  Eigen::RowMatrixX3f tryStepBatch(const Eigen::RowMatrixX3f& starts,
+                                   const Eigen::RowMatrixX3f& ends,
+                                   bool allowSliding = true,
+                                   int numThreads = 1);
+
+  /**
+   * @brief Batch version of @ref isNavigable.
+   *
+   * @param[in] pts The locations to check, one per row.
+   * @param[in] maxYDelta The maximum y displacement.
+   * @param[in] numThreads The number of threads to use. Values less than 1 use
+   * all available hardware threads.
+   *
+   * @return Whether or not each location is navigable.
+   */
+  Eigen::Matrix<bool, Eigen::Dynamic, 1> isNavigableBatch(
+      const Eigen::RowMatrixX3f& pts,
+      float maxYDelta = 0.5,
+      int numThreads = 1);
+
+  /**
+   * @brief Batch version of @ref distanceToClosestObstacle.
+   *
+   * @param[in] pts The points to begin searching from, one per row.
+   * @param[in] maxSearchRadius The radius to search in.
+   * @param[in] numThreads The number of threads to use. Values less than 1 use
+   * all available hardware threads.
+   *
+   * @return The distance to the closest non-navigable location for each point.
+   */
+  Eigen::VectorXf distanceToClosestObstacleBatch(const Eigen::RowMatrixX3f& pts,
+                                                 float maxSearchRadius = 2.0,
+                                                 int numThreads = 1);
+
+  /**
+   * @brief Samples start/goal pairs satisfying @ref settings, e.g. to generate
+   * point navigation episodes.
+   *
+   * Each episode draws random starts and goals until a pair satisfies all
+   * constraints, cheapest checks first, so that only candidate pairs pay for
+   * a path query. The episodes are split across @ref numThreads threads, each
+   * using its own Detour query object, and every episode has its own random
+   * stream derived from @p seed, so the result does not depend on @ref
+   * numThreads.
+   *
+   * @param[in] numEpisodes The number of episodes to sample.
+   * @param[in] settings The constraints on the episodes.
+   * @param[in] seed The seed of the random streams.
+   * @param[in] numThreads The number of threads to use. Values less than 1 use
+   * all available hardware threads.
+   *
+   * @return The sampled episodes. Episodes which ran out of tries are left
+   * out, so there may be fewer than @ref numEpisodes rows.
+   */
+  SampledEpisodes sampleEpisodes(int numEpisodes,
+                                 const EpisodeSamplingSettings& settings,
+                                 uint32_t seed,
+                                 int numThreads = 1);
+
   /**
    * Compute and return the total area of all NavMesh polygons.
    *
@@ -619,6 +951,9 @@ class PathFinder {
    * Can be further processed by Habitat-lab utilities. See
    * examples/tutorials/notebooks/ECCV_Navigation.ipynb for details.
    *
+   * Views are cached by (metersPerPixel, height, eps) until the navmesh
+   * changes, see @ref setTopDownViewCacheSize.
+   *
    * @param metersPerPixel size of the discrete grid cells. Controls grid
    * resolution.
    * @param height The vertical height of the 2D slice.
@@ -635,6 +970,7 @@ class PathFinder {
    * non-navigable cells at a specified height and resolution.
    *
    * The size of the grid depends on the navmesh bounds and selected resolution.
+   * Views are cached like those of @ref getTopDownView.
    *
    * @param metersPerPixel size of the discrete grid cells. Controls grid
    * resolution.
@@ -647,6 +983,55 @@ class PathFinder {
   Eigen::Matrix<int, Eigen::Dynamic, Eigen::Dynamic>
   getTopDownIslandView(float metersPerPixel, float height, float eps = 0.5);
 
+  /**
+   * @brief Get the window of @ref getTopDownView centered on a point, e.g. an
+   * agent's position.
+   *
+   * Cut from the cached full view if there is one, otherwise only the pixels
+   * of the window are rasterized. Pixels outside of the full view are marked
+   * as non-navigable.
+   *
+   * @param metersPerPixel size of the discrete grid cells. Controls grid
+   * resolution.
+   * @param height The vertical height of the 2D slice.
+   * @param center The point at the center of the window. Only its X and Z
+   * coordinates are used.
+   * @param radius The window spans radius pixels on each side of the center
+   * pixel, so it is a square of 2 * radius + 1 pixels.
+   * @param eps Sets allowable epsilon meter Y offsets from the configured
+   * height value.
+   *
+   * @return The 2D grid marking cells as navigable or not.
+   */
+  Eigen::Matrix<bool, Eigen::Dynamic, Eigen::Dynamic> getTopDownViewCrop(
+      float metersPerPixel,
+      float height,
+      const vec3f& center,
+      int radius,
+      float eps = 0.5);
+
+  /**
+   * @brief Get the window of @ref getTopDownIslandView centered on a point,
+   * like @ref getTopDownViewCrop.
+   *
+   * @return The 2D grid marking cell islands or -1 for not navigable.
+   */
+  Eigen::Matrix<int, Eigen::Dynamic, Eigen::Dynamic> getTopDownIslandViewCrop(
+      float metersPerPixel,
+      float height,
+      const vec3f& center,
+      int radius,
+      float eps = 0.5);
+
+  /**
+   * @brief Set the number of views kept by @ref getTopDownView and @ref
+   * getTopDownIslandView each. Evicts the least recently used views if needed,
+   * 0 disables caching.
+   */
+  void setTopDownViewCacheSize(int size);
+
+  int getTopDownViewCacheSize() const;
+
   /**
    * @brief Returns a MeshData object containing triangulated NavMesh polys.
    *
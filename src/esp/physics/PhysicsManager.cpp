@@ -5,6 +5,8 @@
 #include "PhysicsManager.h"
 #include <Magnum/Math/Range.h>
 
+#include <algorithm>
+#include <iterator>
 #include <utility>
 #include "esp/assets/CollisionMeshData.h"
 #include "esp/assets/ResourceManager.h"
@@ -684,6 +686,9 @@ void PhysicsManager::removeObject(const int objectId,
   std::string objName = existingObjIter->second->getObjectName();
   existingObjects_.erase(existingObjIter);
   deallocateObjectID(objectId);
+  dirtyObjectIds_.erase(
+      std::remove(dirtyObjectIds_.begin(), dirtyObjectIds_.end(), objectId),
+      dirtyObjectIds_.end());
   if (deleteObjectNode) {
     delete objectNode;
   } else if (visualNode) {
@@ -724,6 +729,9 @@ void PhysicsManager::removeArticulatedObject(int objectId) {
   std::string artObjName = existingAOIter->second->getObjectName();
   existingArticulatedObjects_.erase(existingAOIter);
   deallocateObjectID(objectId);
+  dirtyObjectIds_.erase(
+      std::remove(dirtyObjectIds_.begin(), dirtyObjectIds_.end(), objectId),
+      dirtyObjectIds_.end());
   delete objectNode;
   // remove wrapper if one is present
   if (articulatedObjectManager_->getObjectLibHasHandle(artObjName)) {
@@ -786,6 +794,14 @@ void PhysicsManager::stepPhysics(double dt) {
     dt = fixedTimeStep_;
   }
 
+  dirtyObjectIds_.clear();
+  for (auto& object : existingObjects_) {
+    VelocityControl::ptr velControl = object.second->getVelocityControl();
+    if (velControl->controllingAngVel || velControl->controllingLinVel) {
+      dirtyObjectIds_.push_back(object.first);
+    }
+  }
+
   // handle in-between step times? Ideally dt is a multiple of
   // sceneMetaData_.timestep
   double targetTime = worldTime_ + dt;
@@ -804,6 +820,32 @@ void PhysicsManager::stepPhysics(double dt) {
   }
 }
 
+void PhysicsManager::stepPhysicsSubsteps(int numSubsteps) {
+  if (numSubsteps < 0) {
+    numSubsteps = getNumSubsteps();
+  }
+  std::vector<int> dirtyObjectIds;
+  std::vector<int> mergedObjectIds;
+  for (int i = 0; i < numSubsteps; ++i) {
+    stepPhysics(fixedTimeStep_);
+    // an object asleep at the end may still have moved in an earlier substep
+    mergedObjectIds.clear();
+    std::set_union(dirtyObjectIds.begin(), dirtyObjectIds.end(),
+                   dirtyObjectIds_.begin(), dirtyObjectIds_.end(),
+                   std::back_inserter(mergedObjectIds));
+    dirtyObjectIds.swap(mergedObjectIds);
+  }
+  dirtyObjectIds_ = std::move(dirtyObjectIds);
+}
+
+int PhysicsManager::getNumSubsteps() const {
+  return physicsManagerAttributes_->getNumSubsteps();
+}
+
+int PhysicsManager::getRenderInterval() const {
+  return physicsManagerAttributes_->getRenderInterval();
+}
+
 void PhysicsManager::deferNodesUpdate() {
   for (auto& o : existingObjects_)
     o.second->deferUpdate();
@@ -842,6 +884,314 @@ int PhysicsManager::checkActiveObjects() {
   return numActive;
 }
 
+std::vector<int> PhysicsManager::getActiveObjectIds() const {
+  std::vector<int> objectIds;
+  for (const auto& object : existingObjects_) {
+    if (object.second->isActive()) {
+      objectIds.push_back(object.first);
+    }
+  }
+  for (const auto& articulatedObject : existingArticulatedObjects_) {
+    if (articulatedObject.second->isActive()) {
+      objectIds.push_back(articulatedObject.first);
+    }
+  }
+  // rigid and articulated objects share the ids
+  std::sort(objectIds.begin(), objectIds.end());
+  return objectIds;
+}
+
+namespace {
+
+//! Checks that a batch state has a row per object, or is empty
+template <typename Matrix>
+bool hasBatchRows(const Matrix& state,
+                  const std::size_t numObjects,
+                  const char* name) {
+  ESP_CHECK(
+      state.rows() == 0 || static_cast<std::size_t>(state.rows()) == numObjects,
+      "PhysicsManager: expected" << numObjects << name << "but got"
+                                 << state.rows());
+  return state.rows() != 0;
+}
+
+//! The objects of a batch, all looked up before any of them is modified so
+//! that an unknown ID doesn't leave the batch half-applied
+std::vector<RigidObject*> findBatchObjects(
+    const std::map<int, RigidObject::ptr>& existingObjects,
+    const std::vector<int>& objectIds,
+    const char* caller) {
+  std::vector<RigidObject*> objects;
+  objects.reserve(objectIds.size());
+  for (const int objectId : objectIds) {
+    const auto objIter = existingObjects.find(objectId);
+    ESP_CHECK(objIter != existingObjects.end(),
+              caller << ": no rigid object with ID" << objectId);
+    objects.push_back(objIter->second.get());
+  }
+  return objects;
+}
+
+//! Restores the pose before making an object STATIC. STATIC objects can't be
+//! moved, so an object which is STATIC or becomes STATIC is moved while
+//! KINEMATIC.
+void restoreMotionTypeAndPose(PhysicsObjectBase& object,
+                              const MotionType motionType,
+                              const Mn::Matrix4& transformation) {
+  object.setMotionType(motionType == MotionType::STATIC ? MotionType::KINEMATIC
+                                                        : motionType);
+  object.setTransformation(transformation);
+  object.setMotionType(motionType);
+}
+
+//! Whether a constraint can be updated from @p from to @p to in place
+bool isSameConstraint(const RigidConstraintSettings& from,
+                      const RigidConstraintSettings& to) {
+  // pivotA can't be updated for multibody constraints
+  return from.constraintType == to.constraintType &&
+         from.objectIdA == to.objectIdA && from.objectIdB == to.objectIdB &&
+         from.linkIdA == to.linkIdA && from.linkIdB == to.linkIdB &&
+         from.pivotA == to.pivotA;
+}
+
+}  // namespace
+
+RigidObjectStates PhysicsManager::getRigidObjectStates(
+    const std::vector<int>& objectIds) const {
+  const int numObjects = objectIds.size();
+  RigidObjectStates states;
+  states.translations.resize(numObjects, 3);
+  states.rotations.resize(numObjects, 4);
+  states.linearVelocities.resize(numObjects, 3);
+  states.angularVelocities.resize(numObjects, 3);
+  states.motionTypes.resize(numObjects);
+  for (int i = 0; i < numObjects; ++i) {
+    const auto objIter = existingObjects_.find(objectIds[i]);
+    ESP_CHECK(objIter != existingObjects_.end(),
+              "PhysicsManager::getRigidObjectStates(): no rigid object with ID"
+                  << objectIds[i]);
+    const RigidObject& object = *objIter->second;
+    const Mn::Vector3 translation = object.getTranslation();
+    const Mn::Quaternion rotation = object.getRotation();
+    const Mn::Vector3 linVel = object.getLinearVelocity();
+    const Mn::Vector3 angVel = object.getAngularVelocity();
+    states.translations.row(i) << translation.x(), translation.y(),
+        translation.z();
+    states.rotations.row(i) << rotation.vector().x(), rotation.vector().y(),
+        rotation.vector().z(), rotation.scalar();
+    states.linearVelocities.row(i) << linVel.x(), linVel.y(), linVel.z();
+    states.angularVelocities.row(i) << angVel.x(), angVel.y(), angVel.z();
+    states.motionTypes(i) = static_cast<int>(object.getMotionType());
+  }
+  return states;
+}
+
+void PhysicsManager::setRigidObjectStates(
+    const std::vector<int>& objectIds,
+    const Eigen::RowMatrixX3f& translations,
+    const Eigen::RowMatrixX4f& rotations,
+    const Eigen::RowMatrixX3f& linearVelocities,
+    const Eigen::RowMatrixX3f& angularVelocities,
+    const Eigen::VectorXi& motionTypes) {
+  const std::size_t numObjects = objectIds.size();
+  const bool setTranslations =
+      hasBatchRows(translations, numObjects, "translations");
+  const bool setRotations = hasBatchRows(rotations, numObjects, "rotations");
+  const bool setLinVels =
+      hasBatchRows(linearVelocities, numObjects, "linear velocities");
+  const bool setAngVels =
+      hasBatchRows(angularVelocities, numObjects, "angular velocities");
+  const bool setMotionTypes =
+      hasBatchRows(motionTypes, numObjects, "motion types");
+  if (setMotionTypes) {
+    for (std::size_t i = 0; i < numObjects; ++i) {
+      ESP_CHECK(motionTypes(i) >= static_cast<int>(MotionType::STATIC) &&
+                    motionTypes(i) <= static_cast<int>(MotionType::DYNAMIC),
+                "PhysicsManager::setRigidObjectStates(): invalid motion type"
+                    << motionTypes(i) << "for rigid object with ID"
+                    << objectIds[i]);
+    }
+  }
+  const std::vector<RigidObject*> objects = findBatchObjects(
+      existingObjects_, objectIds, "PhysicsManager::setRigidObjectStates()");
+
+  for (std::size_t i = 0; i < numObjects; ++i) {
+    RigidObject& object = *objects[i];
+    // a single transformation update, so that the pose is synced once
+    if (setTranslations || setRotations) {
+      const Mn::Vector3 translation =
+          setTranslations ? Mn::Vector3{translations(i, 0), translations(i, 1),
+                                        translations(i, 2)}
+                          : object.getTranslation();
+      const Mn::Quaternion rotation =
+          setRotations ? Mn::Quaternion{{rotations(i, 0), rotations(i, 1),
+                                         rotations(i, 2)},
+                                        rotations(i, 3)}
+                             .normalized()
+                       : object.getRotation();
+      const Mn::Matrix4 transformation =
+          Mn::Matrix4::from(rotation.toMatrix(), translation);
+      if (setMotionTypes) {
+        restoreMotionTypeAndPose(
+            object, static_cast<MotionType>(motionTypes(i)), transformation);
+      } else {
+        object.setTransformation(transformation);
+      }
+    } else if (setMotionTypes) {
+      object.setMotionType(static_cast<MotionType>(motionTypes(i)));
+    }
+    if (setLinVels) {
+      object.setLinearVelocity(Mn::Vector3{linearVelocities(i, 0),
+                                           linearVelocities(i, 1),
+                                           linearVelocities(i, 2)});
+    }
+    if (setAngVels) {
+      object.setAngularVelocity(Mn::Vector3{angularVelocities(i, 0),
+                                            angularVelocities(i, 1),
+                                            angularVelocities(i, 2)});
+    }
+  }
+}
+
+void PhysicsManager::applyRigidObjectForces(
+    const std::vector<int>& objectIds,
+    const Eigen::RowMatrixX3f& forces,
+    const Eigen::RowMatrixX3f& relPositions) {
+  const std::size_t numObjects = objectIds.size();
+  ESP_CHECK(static_cast<std::size_t>(forces.rows()) == numObjects,
+            "PhysicsManager::applyRigidObjectForces(): expected"
+                << numObjects << "forces but got" << forces.rows());
+  const bool hasRelPositions =
+      hasBatchRows(relPositions, numObjects, "relative positions");
+  const std::vector<RigidObject*> objects = findBatchObjects(
+      existingObjects_, objectIds, "PhysicsManager::applyRigidObjectForces()");
+
+  for (std::size_t i = 0; i < numObjects; ++i) {
+    const Mn::Vector3 relPos =
+        hasRelPositions ? Mn::Vector3{relPositions(i, 0), relPositions(i, 1),
+                                      relPositions(i, 2)}
+                        : Mn::Vector3{};
+    objects[i]->applyForce(
+        Mn::Vector3{forces(i, 0), forces(i, 1), forces(i, 2)}, relPos);
+  }
+}
+
+PhysicsSnapshot PhysicsManager::saveSnapshot() const {
+  PhysicsSnapshot snapshot;
+  for (const auto& objectIter : existingObjects_) {
+    const RigidObject& object = *objectIter.second;
+    PhysicsSnapshot::RigidObjectState& state =
+        snapshot.rigidObjects[objectIter.first];
+    state.transformation = object.getTransformation();
+    state.linearVelocity = object.getLinearVelocity();
+    state.angularVelocity = object.getAngularVelocity();
+    state.motionType = object.getMotionType();
+    state.active = object.isActive();
+  }
+  for (const auto& aObjectIter : existingArticulatedObjects_) {
+    ArticulatedObject& aObject = *aObjectIter.second;
+    PhysicsSnapshot::ArticulatedObjectState& state =
+        snapshot.articulatedObjects[aObjectIter.first];
+    state.rootTransformation = aObject.getTransformation();
+    state.rootLinearVelocity = aObject.getRootLinearVelocity();
+    state.rootAngularVelocity = aObject.getRootAngularVelocity();
+    state.jointPositions = aObject.getJointPositions();
+    state.jointVelocities = aObject.getJointVelocities();
+    for (const auto& motor : aObject.getExistingJointMotors()) {
+      state.jointMotors[motor.first] =
+          aObject.getJointMotorSettings(motor.first);
+    }
+    state.motionType = aObject.getMotionType();
+    state.active = aObject.isActive();
+  }
+  snapshot.rigidConstraints = rigidConstraintSettings_;
+  snapshot.worldTime = worldTime_;
+  return snapshot;
+}
+
+bool PhysicsManager::restoreSnapshot(PhysicsSnapshot& snapshot) {
+  bool allObjectsFound = true;
+  for (const auto& stateIter : snapshot.rigidObjects) {
+    const auto objectIter = existingObjects_.find(stateIter.first);
+    if (objectIter == existingObjects_.end()) {
+      ESP_WARNING() << "Rigid object" << stateIter.first
+                    << "was removed since the snapshot, skipping it.";
+      allObjectsFound = false;
+      continue;
+    }
+    RigidObject& object = *objectIter->second;
+    const PhysicsSnapshot::RigidObjectState& state = stateIter.second;
+    restoreMotionTypeAndPose(object, state.motionType, state.transformation);
+    object.setLinearVelocity(state.linearVelocity);
+    object.setAngularVelocity(state.angularVelocity);
+    object.setActive(state.active);
+  }
+  for (const auto& stateIter : snapshot.articulatedObjects) {
+    const auto aObjectIter = existingArticulatedObjects_.find(stateIter.first);
+    if (aObjectIter == existingArticulatedObjects_.end()) {
+      ESP_WARNING() << "Articulated object" << stateIter.first
+                    << "was removed since the snapshot, skipping it.";
+      allObjectsFound = false;
+      continue;
+    }
+    ArticulatedObject& aObject = *aObjectIter->second;
+    const PhysicsSnapshot::ArticulatedObjectState& state = stateIter.second;
+    restoreMotionTypeAndPose(aObject, state.motionType,
+                             state.rootTransformation);
+    aObject.setRootLinearVelocity(state.rootLinearVelocity);
+    aObject.setRootAngularVelocity(state.rootAngularVelocity);
+    aObject.setJointPositions(state.jointPositions);
+    aObject.setJointVelocities(state.jointVelocities);
+    for (const auto& motor : aObject.getExistingJointMotors()) {
+      const auto motorIter = state.jointMotors.find(motor.first);
+      if (motorIter != state.jointMotors.end()) {
+        aObject.updateJointMotor(motor.first, motorIter->second);
+      }
+    }
+    aObject.setActive(state.active);
+  }
+
+  // constraints created since the snapshot
+  std::vector<int> constraintsToRemove;
+  for (const auto& constraint : rigidConstraintSettings_) {
+    const auto savedIter = snapshot.rigidConstraints.find(constraint.first);
+    if (savedIter == snapshot.rigidConstraints.end() ||
+        !isSameConstraint(constraint.second, savedIter->second)) {
+      constraintsToRemove.push_back(constraint.first);
+    }
+  }
+  for (const int constraintId : constraintsToRemove) {
+    removeRigidConstraint(constraintId);
+  }
+  // constraints removed since the snapshot, re-created under new ids
+  std::vector<std::pair<int, int>> recreatedConstraints;
+  for (const auto& constraint : snapshot.rigidConstraints) {
+    if (rigidConstraintSettings_.count(constraint.first) > 0) {
+      updateRigidConstraint(constraint.first, constraint.second);
+    } else {
+      const int constraintId = createRigidConstraint(constraint.second);
+      if (constraintId != ID_UNDEFINED) {
+        recreatedConstraints.emplace_back(constraint.first, constraintId);
+      }
+    }
+  }
+  // so that restoring the snapshot again finds them. The new ids may be old
+  // ids of other re-created constraints, so all of these are removed first.
+  std::vector<RigidConstraintSettings> recreatedSettings;
+  recreatedSettings.reserve(recreatedConstraints.size());
+  for (const auto& ids : recreatedConstraints) {
+    recreatedSettings.push_back(snapshot.rigidConstraints.at(ids.first));
+    snapshot.rigidConstraints.erase(ids.first);
+  }
+  for (std::size_t i = 0; i < recreatedConstraints.size(); ++i) {
+    snapshot.rigidConstraints[recreatedConstraints[i].second] =
+        recreatedSettings[i];
+  }
+
+  worldTime_ = snapshot.worldTime;
+  return allObjectsFound;
+}
+
 void PhysicsManager::setObjectBBDraw(int physObjectID,
                                      DrawableGroup* drawables,
                                      bool drawBB) {
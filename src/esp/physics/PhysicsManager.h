@@ -10,9 +10,11 @@
  * PhysicsManager::PhysicsSimulationLibrary
  */
 
+#include <limits>
 #include <map>
 #include <memory>
 #include <string>
+#include <unordered_map>
 #include <vector>
 
 /* Bullet Physics Integration */
@@ -27,6 +29,7 @@
 #include "esp/assets/CollisionMeshData.h"
 #include "esp/assets/GenericSemanticMeshData.h"
 #include "esp/assets/MeshMetaData.h"
+#include "esp/core/EspEigen.h"
 #include "esp/gfx/DrawableGroup.h"
 #include "esp/metadata/URDFParser.h"
 #include "esp/physics/objectWrappers/ManagedArticulatedObject.h"
@@ -88,6 +91,59 @@ struct RaycastResults {
   ESP_SMART_POINTERS(RaycastResults)
 };
 
+/**
+ * @brief Holds the first hit of each ray of a batch cast with @ref
+ * PhysicsManager::castRays, one row per ray.
+ */
+struct BatchRaycastResults {
+  /** @brief Distance along the ray direction from the ray origin to the first
+   * hit (in units of ray length). Infinity for rays which hit nothing. */
+  Eigen::VectorXf distances;
+
+  /** @brief The id of the object hit by each ray, @ref ID_UNDEFINED for rays
+   * which hit nothing. */
+  Eigen::VectorXi objectIds;
+
+  /** @brief The collision object normal at the first hit, zero for rays which
+   * hit nothing. */
+  Eigen::RowMatrixX3f normals;
+
+  /**
+   * @brief Sets all @p numRays rays to miss.
+   */
+  void reset(int numRays) {
+    distances.setConstant(numRays, std::numeric_limits<float>::infinity());
+    objectIds.setConstant(numRays, ID_UNDEFINED);
+    normals.setZero(numRays, 3);
+  }
+
+  ESP_SMART_POINTERS(BatchRaycastResults)
+};
+
+/**
+ * @brief Holds the states of a batch of rigid objects, one row per object. See
+ * @ref PhysicsManager::getRigidObjectStates.
+ */
+struct RigidObjectStates {
+  /** @brief The (N, 3) translations of the objects. */
+  Eigen::RowMatrixX3f translations;
+
+  /** @brief The (N, 4) rotations of the objects, as quaternion coefficients
+   * (x, y, z, w). */
+  Eigen::RowMatrixX4f rotations;
+
+  /** @brief The (N, 3) linear velocities of the objects. */
+  Eigen::RowMatrixX3f linearVelocities;
+
+  /** @brief The (N, 3) angular velocities of the objects. */
+  Eigen::RowMatrixX3f angularVelocities;
+
+  /** @brief The @ref MotionType of each object. */
+  Eigen::VectorXi motionTypes;
+
+  ESP_SMART_POINTERS(RigidObjectStates)
+};
+
 /**
  * @brief based on Bullet b3ContactPointData
  */
@@ -178,6 +234,48 @@ struct RigidConstraintSettings {
   ESP_SMART_POINTERS(RigidConstraintSettings)
 };  // struct RigidConstraintSettings
 
+/**
+ * @brief In-memory snapshot of the simulated state of a physics world. See
+ * @ref PhysicsManager::saveSnapshot.
+ */
+struct PhysicsSnapshot {
+  /** @brief The state of a rigid object. */
+  struct RigidObjectState {
+    Mn::Matrix4 transformation;
+    Mn::Vector3 linearVelocity;
+    Mn::Vector3 angularVelocity;
+    MotionType motionType = MotionType::UNDEFINED;
+    bool active = false;
+  };
+
+  /** @brief The state of an articulated object. */
+  struct ArticulatedObjectState {
+    Mn::Matrix4 rootTransformation;
+    Mn::Vector3 rootLinearVelocity;
+    Mn::Vector3 rootAngularVelocity;
+    std::vector<float> jointPositions;
+    std::vector<float> jointVelocities;
+    //! Settings of the joint motors, keyed by motor id
+    std::unordered_map<int, JointMotorSettings> jointMotors;
+    MotionType motionType = MotionType::UNDEFINED;
+    bool active = false;
+  };
+
+  /** @brief The states of the rigid objects, keyed by object id. */
+  std::map<int, RigidObjectState> rigidObjects;
+
+  /** @brief The states of the articulated objects, keyed by object id. */
+  std::map<int, ArticulatedObjectState> articulatedObjects;
+
+  /** @brief The settings of the rigid constraints, keyed by constraint id. */
+  std::unordered_map<int, RigidConstraintSettings> rigidConstraints;
+
+  /** @brief The world time. */
+  double worldTime = 0.0;
+
+  ESP_SMART_POINTERS(PhysicsSnapshot)
+};
+
 class RigidObjectManager;
 class ArticulatedObjectManager;
 
@@ -401,6 +499,61 @@ class PhysicsManager : public std::enable_shared_from_this<PhysicsManager> {
     return v;
   }
 
+  /**
+   * @brief Get the states of a batch of rigid objects at once, without going
+   * through their wrappers.
+   *
+   * @param objectIds The IDs of the objects in @ref
+   * PhysicsManager::existingObjects_.
+   * @return The states of the objects, one row per ID.
+   */
+  RigidObjectStates getRigidObjectStates(
+      const std::vector<int>& objectIds) const;
+
+  /**
+   * @brief Set the states of a batch of rigid objects at once, without going
+   * through their wrappers.
+   *
+   * The poses are set first, then the motion types and then the velocities.
+   * An object whose motion type is set, including to @ref MotionType::STATIC,
+   * is moved while kinematic, so that setting the states returned by @ref
+   * getRigidObjectStates restores them. Without motion types, the poses of
+   * @ref MotionType::STATIC objects are left unchanged like for single objects.
+   * The velocities of non-dynamic objects are left unchanged. An empty array
+   * leaves the corresponding state of all the objects unchanged.
+   *
+   * @param objectIds The IDs of the objects in @ref
+   * PhysicsManager::existingObjects_.
+   * @param translations The (N, 3) translations of the objects.
+   * @param rotations The (N, 4) rotations of the objects, as quaternion
+   * coefficients (x, y, z, w). Normalized before use.
+   * @param linearVelocities The (N, 3) linear velocities of the objects.
+   * @param angularVelocities The (N, 3) angular velocities of the objects.
+   * @param motionTypes The @ref MotionType of each object. All of them are
+   * checked to be STATIC, KINEMATIC or DYNAMIC before any object is modified.
+   */
+  void setRigidObjectStates(const std::vector<int>& objectIds,
+                            const Eigen::RowMatrixX3f& translations,
+                            const Eigen::RowMatrixX4f& rotations,
+                            const Eigen::RowMatrixX3f& linearVelocities,
+                            const Eigen::RowMatrixX3f& angularVelocities,
+                            const Eigen::VectorXi& motionTypes);
+
+  /**
+   * @brief Apply forces to a batch of rigid objects at once. Only affects
+   * @ref MotionType::DYNAMIC objects, see @ref RigidBase::applyForce.
+   *
+   * @param objectIds The IDs of the objects in @ref
+   * PhysicsManager::existingObjects_.
+   * @param forces The (N, 3) forces in the global coordinate system.
+   * @param relPositions The (N, 3) locations of force application in the
+   * global coordinate system relative to the centers of mass of the objects.
+   * Empty to apply the forces at the centers of mass.
+   */
+  void applyRigidObjectForces(const std::vector<int>& objectIds,
+                              const Eigen::RowMatrixX3f& forces,
+                              const Eigen::RowMatrixX3f& relPositions);
+
   //============= ArticulatedObject functions =============
 
   /**
@@ -560,6 +713,25 @@ class PhysicsManager : public std::enable_shared_from_this<PhysicsManager> {
    */
   virtual void stepPhysics(double dt = 0.0);
 
+  /** @brief Step the physical world forward by a number of increments of
+   * @ref fixedTimeStep_. The dirty objects are those of any of the substeps.
+   * See @ref getDirtyObjectIds.
+   * @param numSubsteps The number of fixed timesteps to advance by, @ref
+   * getNumSubsteps if negative.
+   */
+  void stepPhysicsSubsteps(int numSubsteps = -1);
+
+  /** @brief Get the number of fixed timesteps to advance by per agent action,
+   * configured in the @ref metadata::attributes::PhysicsManagerAttributes.
+   */
+  int getNumSubsteps() const;
+
+  /** @brief Get the number of physics steps between two renderings of the
+   * observations, configured in the @ref
+   * metadata::attributes::PhysicsManagerAttributes.
+   */
+  int getRenderInterval() const;
+
   /** @brief Defers the update of the scene graph nodes until updateNodes is
    * called This is needed to do ownership transfer of the scene graph to a
    * background thread.
@@ -649,6 +821,25 @@ class PhysicsManager : public std::enable_shared_from_this<PhysicsManager> {
    */
   int checkActiveObjects();
 
+  /** @brief Get the ids of the rigid and articulated objects considered active
+   * by the physics simulator currently in use. See @ref
+   * PhysicsObjectBase::isActive.
+   * @return The ids of the awake objects, in increasing order.
+   */
+  std::vector<int> getActiveObjectIds() const;
+
+  /** @brief Get the ids of the rigid and articulated objects whose transforms
+   * the most recent @ref stepPhysics may have changed.
+   *
+   * With dynamics, these are the objects awake at the end of the step: the
+   * physics simulator doesn't move sleeping objects, nor synchronizes their
+   * scene graph nodes. Kinematically, these are the objects moved by their
+   * @ref VelocityControl. Objects moved through the API between steps aren't
+   * included.
+   * @return The ids of the objects, in increasing order.
+   */
+  const std::vector<int>& getDirtyObjectIds() const { return dirtyObjectIds_; }
+
   /** @brief Set bounding box rendering for the object true or false.
    * @param physObjectID The object ID and key identifying the object in @ref
    * PhysicsManager::existingObjects_.
@@ -807,6 +998,43 @@ class PhysicsManager : public std::enable_shared_from_this<PhysicsManager> {
     return results;
   }
 
+  /**
+   * @brief Cast a batch of rays into the collision world and return the first
+   * hit of each ray.
+   *
+   * Much faster than calling @ref castRay per ray, e.g. for lidar-like
+   * sensors: only the closest hit is kept and the rays may be cast on several
+   * threads. The collision world must not be modified meanwhile.
+   *
+   * Note: not implemented here in default PhysicsManager as there are no
+   * collision objects without a simulation implementation.
+   *
+   * @param origins The (N, 3) ray origins.
+   * @param directions The (N, 3) ray directions. Need not be unit length, but
+   * returned hit distances will be in units of ray length. Rays with zero
+   * length hit nothing.
+   * @param maxDistance The maximum distance along the ray directions to
+   * search. In units of ray length.
+   * @param numThreads The number of threads casting the rays, all hardware
+   * threads if less than 1.
+   * @return The first hit of each ray.
+   */
+  virtual BatchRaycastResults castRays(
+      const Eigen::RowMatrixX3f& origins,
+      const Eigen::RowMatrixX3f& directions,
+      CORRADE_UNUSED double maxDistance = 100.0,
+      CORRADE_UNUSED int numThreads = 1) {
+    ESP_CHECK(origins.rows() == directions.rows(),
+              "PhysicsManager::castRays(): got"
+                  << origins.rows() << "origins but" << directions.rows()
+                  << "directions");
+    ESP_ERROR() << "Not implemented in base PhysicsManager. Install with "
+                   "--bullet to use this feature.";
+    BatchRaycastResults results;
+    results.reset(origins.rows());
+    return results;
+  }
+
   /**
    * @brief returns the wrapper manager for the currently created rigid
    * objects.
@@ -902,6 +1130,33 @@ class PhysicsManager : public std::enable_shared_from_this<PhysicsManager> {
               "No RigidConstraint exists with constraintId =" << constraintId);
     return rigidCnstrntSettingsIter->second;
   }
+
+  /**
+   * @brief Save the simulated state of the world in memory: the poses,
+   * velocities, motion types and activation states of all rigid and
+   * articulated objects, the joint states and joint motor settings of the
+   * articulated objects, the rigid constraints and the world time.
+   *
+   * Together with @ref restoreSnapshot, this resets an episode or branches
+   * rollouts without removing, re-adding or reloading any object.
+   * @return The snapshot.
+   */
+  PhysicsSnapshot saveSnapshot() const;
+
+  /**
+   * @brief Restore the state saved by @ref saveSnapshot, reusing the existing
+   * objects of the world.
+   *
+   * Objects removed since the snapshot can't be restored and are skipped,
+   * objects added since the snapshot are left untouched. Constraints created
+   * since the snapshot are removed and constraints removed since the snapshot
+   * are created again, with new ids. These ids replace the old ones in @p
+   * snapshot, so restoring it again reuses the re-created constraints.
+   * @param snapshot The snapshot to restore.
+   * @return Whether all the objects of the snapshot still existed.
+   */
+  bool restoreSnapshot(PhysicsSnapshot& snapshot);
+
   /**
    * @brief This will populate the passed @p sceneInstanceAttrs with the current
    * stage, object and articulated object instances reflecting the current
@@ -1296,6 +1551,11 @@ class PhysicsManager : public std::enable_shared_from_this<PhysicsManager> {
    */
   double worldTime_ = 0.0;
 
+  /** @brief The ids of the objects whose transforms the most recent @ref
+   * stepPhysics may have changed. See @ref getDirtyObjectIds.
+   */
+  std::vector<int> dirtyObjectIds_;
+
  public:
   ESP_SMART_POINTERS(PhysicsManager)
 };  // class PhysicsManager
@@ -220,6 +220,10 @@ void BulletArticulatedObject::constructStaticRigidBaseObject() {
 
 void BulletArticulatedObject::updateNodes(bool force) {
   isDeferringUpdate_ = false;
+  // the links of a sleeping multibody don't move
+  if (!force && !btMultiBody_->isAwake()) {
+    return;
+  }
   if (force || btMultiBody_->getBaseCollider()->isActive()) {
     setRotationScalingFromBulletTransform(btMultiBody_->getBaseWorldTransform(),
                                           &node());
@@ -7,6 +7,8 @@
 
 #include "BulletPhysicsManager.h"
 
+#include <algorithm>
+#include <thread>
 #include <utility>
 #include "BulletArticulatedObject.h"
 #include "BulletDynamics/Featherstone/btMultiBodyLinkCollider.h"
@@ -25,6 +27,47 @@ namespace esp {
 using metadata::attributes::AssetType;
 namespace physics {
 
+namespace {
+
+/**
+ * @brief Broadphase policy of a single ray, like the one of
+ * btCollisionWorld::rayTest, which narrowphase tests the collision objects
+ * whose bounding boxes the ray crosses.
+ */
+struct SingleRayTester : btDbvt::ICollide {
+  SingleRayTester(const btVector3& from,
+                  const btVector3& to,
+                  btCollisionWorld::RayResultCallback& resultCallback)
+      : resultCallback_{resultCallback} {
+    fromTrans_.setIdentity();
+    fromTrans_.setOrigin(from);
+    toTrans_.setIdentity();
+    toTrans_.setOrigin(to);
+  }
+
+  void Process(const btDbvtNode* leaf) override {
+    // the ray already hits something right at its origin
+    if (resultCallback_.m_closestHitFraction == btScalar(0)) {
+      return;
+    }
+    auto* proxy = static_cast<btBroadphaseProxy*>(leaf->data);
+    const auto* collisionObject =
+        static_cast<const btCollisionObject*>(proxy->m_clientObject);
+    if (resultCallback_.needsCollision(proxy)) {
+      btCollisionWorld::rayTestSingle(fromTrans_, toTrans_, collisionObject,
+                                      collisionObject->getCollisionShape(),
+                                      collisionObject->getWorldTransform(),
+                                      resultCallback_);
+    }
+  }
+
+  btTransform fromTrans_;
+  btTransform toTrans_;
+  btCollisionWorld::RayResultCallback& resultCallback_;
+};
+
+}  // namespace
+
 BulletPhysicsManager::BulletPhysicsManager(
     assets::ResourceManager& _resourceManager,
     const metadata::attributes::PhysicsManagerAttributes::cptr&
@@ -36,6 +79,12 @@ BulletPhysicsManager::BulletPhysicsManager(
   if (_resourceManager.getCreateRenderer()) {
     debugDrawer_ = std::make_unique<Magnum::BulletIntegration::DebugDraw>();
   }
+  const std::string cacheDirectory =
+      _resourceManager.getCollisionShapeCacheDirectory();
+  if (!cacheDirectory.empty()) {
+    collisionShapeCache_ = CollisionShapeCache::create(
+        cacheDirectory, _resourceManager.getCollisionShapeCacheMaxSize());
+  }
 }
 
 BulletPhysicsManager::~BulletPhysicsManager() {
@@ -86,7 +135,7 @@ bool BulletPhysicsManager::initPhysicsFinalize() {
   //! Create new scene node
   staticStageObject_ = physics::BulletRigidStage::create(
       &physicsNode_->createChild(), resourceManager_, bWorld_,
-      collisionObjToObjIds_);
+      collisionObjToObjIds_, collisionShapeCache_);
 
   recentNumSubStepsTaken_ = -1;
   return true;
@@ -441,6 +490,8 @@ void BulletPhysicsManager::stepPhysics(double dt) {
   worldTime_ += numSubStepsTaken * fixedTimeStep_;
   recentNumSubStepsTaken_ = numSubStepsTaken;
   recentTimeStep_ = fixedTimeStep_;
+  // Bullet only synchronizes the motion states of awake bodies
+  dirtyObjectIds_ = getActiveObjectIds();
 }
 
 void BulletPhysicsManager::setStageFrictionCoefficient(
@@ -517,6 +568,93 @@ RaycastResults BulletPhysicsManager::castRay(const esp::geo::Ray& ray,
   return results;
 }
 
+BatchRaycastResults BulletPhysicsManager::castRays(
+    const Eigen::RowMatrixX3f& origins,
+    const Eigen::RowMatrixX3f& directions,
+    const double maxDistance,
+    int numThreads) {
+  ESP_CHECK(origins.rows() == directions.rows(),
+            "BulletPhysicsManager::castRays(): got"
+                << origins.rows() << "origins but" << directions.rows()
+                << "directions");
+  const int numRays = origins.rows();
+  BatchRaycastResults results;
+  results.reset(numRays);
+  if (numRays == 0) {
+    return results;
+  }
+
+  // btDbvtBroadphase::rayTest() shares one traversal stack between all rays,
+  // so each thread walks the broadphase trees with its own
+  const auto castRange = [&](const int begin, const int end) {
+    btAlignedObjectArray<const btDbvtNode*> stack;
+    for (int i = begin; i < end; ++i) {
+      const btVector3 from{origins(i, 0), origins(i, 1), origins(i, 2)};
+      const btVector3 direction{directions(i, 0), directions(i, 1),
+                                directions(i, 2)};
+      if (direction.length2() == btScalar(0)) {
+        continue;
+      }
+      const btVector3 to = from + direction * maxDistance;
+
+      btCollisionWorld::ClosestRayResultCallback closestResult(from, to);
+      SingleRayTester tester(from, to, closestResult);
+      const btVector3 rayDir = (to - from).normalized();
+      btVector3 rayDirectionInverse;
+      unsigned int signs[3];
+      for (int axis = 0; axis < 3; ++axis) {
+        rayDirectionInverse[axis] = rayDir[axis] == btScalar(0)
+                                        ? btScalar(BT_LARGE_FLOAT)
+                                        : btScalar(1) / rayDir[axis];
+        signs[axis] = rayDirectionInverse[axis] < btScalar(0);
+      }
+      const btScalar lambdaMax = rayDir.dot(to - from);
+      // static and dynamic trees
+      for (const btDbvt& tree : bBroadphase_.m_sets) {
+        tree.rayTestInternal(tree.m_root, from, to, rayDirectionInverse, signs,
+                             lambdaMax, btVector3{0, 0, 0}, btVector3{0, 0, 0},
+                             stack, tester);
+      }
+      if (!closestResult.hasHit()) {
+        continue;
+      }
+
+      results.distances(i) = static_cast<float>(
+          static_cast<double>(closestResult.m_closestHitFraction) *
+          maxDistance);
+      const btVector3& normal = closestResult.m_hitNormalWorld;
+      results.normals.row(i) << normal.x(), normal.y(), normal.z();
+      // default to RIGID_STAGE_ID for "scene collision" if we don't know which
+      // object was involved
+      results.objectIds(i) = RIGID_STAGE_ID;
+      auto rawColObjIdIter =
+          collisionObjToObjIds_->find(closestResult.m_collisionObject);
+      if (rawColObjIdIter != collisionObjToObjIds_->end()) {
+        results.objectIds(i) = rawColObjIdIter->second;
+      }
+    }
+  };
+
+  if (numThreads < 1) {
+    numThreads = std::max(1u, std::thread::hardware_concurrency());
+  }
+  numThreads = std::min(numThreads, numRays);
+  if (numThreads == 1) {
+    castRange(0, numRays);
+    return results;
+  }
+  std::vector<std::thread> threads;
+  threads.reserve(numThreads);
+  for (int t = 0; t < numThreads; ++t) {
+    threads.emplace_back(castRange, t * numRays / numThreads,
+                         (t + 1) * numRays / numThreads);
+  }
+  for (std::thread& thread : threads) {
+    thread.join();
+  }
+  return results;
+}
+
 void BulletPhysicsManager::lookUpObjectIdAndLinkId(
     const btCollisionObject* colObj,
     int* objectId,
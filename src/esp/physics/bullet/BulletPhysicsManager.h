@@ -23,6 +23,7 @@
 
 #include "BulletCollisionHelper.h"
 #include "BulletDynamics/Featherstone/btMultiBodyDynamicsWorld.h"
+#include "CollisionShapeCache.h"
 #include "esp/physics/PhysicsManager.h"
 #include "esp/physics/bullet/BulletArticulatedObject.h"
 
@@ -198,6 +199,28 @@ class BulletPhysicsManager : public PhysicsManager {
   RaycastResults castRay(const esp::geo::Ray& ray,
                          double maxDistance = 100.0) override;
 
+  /**
+   * @brief Cast a batch of rays into the collision world and return the first
+   * hit of each ray.
+   *
+   * Each ray walks the broadphase with its own traversal stack, so that the
+   * rays can be cast on several threads.
+   *
+   * @param origins The (N, 3) ray origins.
+   * @param directions The (N, 3) ray directions. Need not be unit length, but
+   * returned hit distances will be in units of ray length. Rays with zero
+   * length hit nothing.
+   * @param maxDistance The maximum distance along the ray directions to
+   * search. In units of ray length.
+   * @param numThreads The number of threads casting the rays, all hardware
+   * threads if less than 1.
+   * @return The first hit of each ray.
+   */
+  BatchRaycastResults castRays(const Eigen::RowMatrixX3f& origins,
+                               const Eigen::RowMatrixX3f& directions,
+                               double maxDistance = 100.0,
+                               int numThreads = 1) override;
+
   /**
    * @brief Query the number of contact points that were active during the
    * collision detection check.
@@ -387,6 +410,9 @@ class BulletPhysicsManager : public PhysicsManager {
   std::shared_ptr<std::map<const btCollisionObject*, int>>
       collisionObjToObjIds_;
 
+  //! on-disk cache of the stage collision shapes, nullptr if disabled
+  CollisionShapeCache::ptr collisionShapeCache_;
+
   //! necessary to acquire forces from impulses
   double recentTimeStep_ = fixedTimeStep_;
   //! for recent call to stepPhysics
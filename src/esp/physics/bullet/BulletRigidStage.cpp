@@ -25,9 +25,11 @@ BulletRigidStage::BulletRigidStage(
     const assets::ResourceManager& resMgr,
     std::shared_ptr<btMultiBodyDynamicsWorld> bWorld,
     std::shared_ptr<std::map<const btCollisionObject*, int> >
-        collisionObjToObjIds)
+        collisionObjToObjIds,
+    CollisionShapeCache::ptr collisionShapeCache)
     : BulletBase(std::move(bWorld), std::move(collisionObjToObjIds)),
-      RigidStage{rigidBodyNode, resMgr} {}
+      RigidStage{rigidBodyNode, resMgr},
+      collisionShapeCache_{std::move(collisionShapeCache)} {}
 
 BulletRigidStage::~BulletRigidStage() {
   // remove collision objects from the world
@@ -138,18 +140,37 @@ void BulletRigidStage::constructBulletSceneFromMeshes(
     //! Embed 3D mesh into bullet shape
     //! btBvhTriangleMeshShape is the most generic/slow choice
     //! which allows concavity if the object is static
+    //! The BVH is built or loaded once the scaling is known, the margin
+    //! doesn't affect it
     std::unique_ptr<btBvhTriangleMeshShape> meshShape =
-        std::make_unique<btBvhTriangleMeshShape>(indexedVertexArray.get(),
-                                                 true);
+        std::make_unique<btBvhTriangleMeshShape>(indexedVertexArray.get(), true,
+                                                 /*buildBvh*/ false);
     auto initAttr = PhysicsObjectBase::getInitializationAttributes<
         metadata::attributes::StageAttributes>();
     meshShape->setMargin(initAttr->getMargin());
-    meshShape->setLocalScaling(
-        btVector3{transformFromLocalToWorld
-                      .scaling()});  // scale is a property of the shape
-
-    // re-build the bvh after setting margin
-    meshShape->buildOptimizedBvh();
+    // scale is a property of the shape
+    const Magnum::Vector3 scaling = transformFromLocalToWorld.scaling();
+
+    std::string cacheKey;
+    std::unique_ptr<CollisionShapeCache::MappedBvh> mappedBvh;
+    if (collisionShapeCache_) {
+      cacheKey = CollisionShapeCache::computeKey(v_data, ui_data, scaling);
+      mappedBvh = collisionShapeCache_->load(cacheKey);
+    }
+    if (mappedBvh) {
+      // sets the scaling without rebuilding the BVH
+      meshShape->setOptimizedBvh(mappedBvh->getBvh(), btVector3{scaling});
+      bStageBvhs_.emplace_back(std::move(mappedBvh));
+    } else {
+      // builds the BVH if the scaling isn't 1
+      meshShape->setLocalScaling(btVector3{scaling});
+      if (!meshShape->getOptimizedBvh()) {
+        meshShape->buildOptimizedBvh();
+      }
+      if (collisionShapeCache_) {
+        collisionShapeCache_->save(cacheKey, *meshShape->getOptimizedBvh());
+      }
+    }
     // mass == 0 to indicate static. See isStaticObject assert below. See also
     // examples/MultiThreadedDemo/CommonRigidBodyMTBase.h
     btVector3 localInertia(0, 0, 0);
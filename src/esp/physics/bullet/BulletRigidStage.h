@@ -7,6 +7,7 @@
 
 #include "esp/physics/RigidStage.h"
 #include "esp/physics/bullet/BulletBase.h"
+#include "esp/physics/bullet/CollisionShapeCache.h"
 
 /** @file
  * @brief Class @ref esp::physics::BulletRigidStage
@@ -25,7 +26,8 @@ class BulletRigidStage : public BulletBase, public RigidStage {
                    const assets::ResourceManager& resMgr,
                    std::shared_ptr<btMultiBodyDynamicsWorld> bWorld,
                    std::shared_ptr<std::map<const btCollisionObject*, int>>
-                       collisionObjToObjIds);
+                       collisionObjToObjIds,
+                   CollisionShapeCache::ptr collisionShapeCache = nullptr);
 
   /**
    * @brief Destructor cleans up simulation structures for the stage object.
@@ -108,6 +110,13 @@ class BulletRigidStage : public BulletBase, public RigidStage {
  private:
   // === Physical stage ===
 
+  //! Loads and saves the BVHs of the stage shapes, nullptr if disabled
+  CollisionShapeCache::ptr collisionShapeCache_;
+
+  //! Stage data: BVHs mapped from @ref collisionShapeCache_, outliving the
+  //! shapes using them
+  std::vector<std::unique_ptr<CollisionShapeCache::MappedBvh>> bStageBvhs_;
+
   //! Stage data: Bullet triangular mesh vertices
   std::vector<std::unique_ptr<btTriangleIndexVertexArray>> bStageArrays_;
 
@@ -0,0 +1,115 @@
+// Copyright (c) Meta Platforms, Inc. and its affiliates.
+// This source code is licensed under the MIT license found in the
+// LICENSE file in the root directory of this source tree.
+
+#include "CollisionShapeCache.h"
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#include <cstdio>
+
+#include "BulletCollision/CollisionShapes/btOptimizedBvh.h"
+#include "LinearMath/btAlignedAllocator.h"
+#include "LinearMath/btScalar.h"
+#include "esp/core/Logging.h"
+
+namespace Cr = Corrade;
+namespace Mn = Magnum;
+
+namespace esp {
+namespace physics {
+
+CollisionShapeCache::MappedBvh::~MappedBvh() {
+  munmap(data_, size_);
+}
+
+CollisionShapeCache::CollisionShapeCache(const std::string& directory,
+                                         const std::size_t maxSize)
+    : FileCache{directory, ".bvh", "collision shape", maxSize} {}
+
+std::string CollisionShapeCache::computeKey(
+    Cr::Containers::ArrayView<const Mn::Vector3> positions,
+    Cr::Containers::ArrayView<const Mn::UnsignedInt> indices,
+    const Mn::Vector3& scaling) {
+  Hasher hasher;
+  // serialized BVHs are raw memory, only valid for the same Bullet build
+  hasher.add(int{BT_BULLET_VERSION});
+  hasher.add(sizeof(void*));
+  hasher.add(sizeof(btScalar));
+
+  hasher.add(positions.size());
+  hasher.add(positions.data(), sizeof(Mn::Vector3) * positions.size());
+  hasher.add(indices.size());
+  hasher.add(indices.data(), sizeof(Mn::UnsignedInt) * indices.size());
+  hasher.add(scaling.data(), sizeof(Mn::Vector3));
+
+  return hasher.key();
+}
+
+std::unique_ptr<CollisionShapeCache::MappedBvh> CollisionShapeCache::load(
+    const std::string& key) const {
+  const std::string path = getPath(key);
+  const int fd = open(path.c_str(), O_RDONLY);
+  if (fd < 0) {
+    return nullptr;
+  }
+  struct stat info {};
+  if (fstat(fd, &info) != 0 ||
+      static_cast<std::size_t>(info.st_size) < sizeof(btOptimizedBvh)) {
+    close(fd);
+    return nullptr;
+  }
+  const std::size_t size = info.st_size;
+  // Private writable mapping: deserializing fixes up the pointers of the
+  // header in place, which copies only the pages it touches. The nodes stay
+  // shared with every other process mapping the file.
+  void* data = mmap(nullptr, size, PROT_READ | PROT_WRITE, MAP_PRIVATE, fd, 0);
+  close(fd);
+  if (data == MAP_FAILED) {
+    return nullptr;
+  }
+
+  btOptimizedBvh* bvh = btOptimizedBvh::deSerializeInPlace(
+      data, static_cast<unsigned>(size), /*i_swapEndian*/ false);
+  if (!bvh) {
+    ESP_WARNING() << "Removing the invalid" << path
+                  << "from the collision shape cache";
+    munmap(data, size);
+    remove(key);
+    return nullptr;
+  }
+  touch(key);
+  return std::make_unique<MappedBvh>(data, size, bvh);
+}
+
+bool CollisionShapeCache::save(const std::string& key,
+                               const btOptimizedBvh& bvh) const {
+  const unsigned size = bvh.calculateSerializeBufferSize();
+  // serialization requires a 16 byte aligned buffer
+  void* buffer = btAlignedAlloc(size, 16);
+  bool success = bvh.serializeInPlace(buffer, size, /*i_swapEndian*/ false);
+
+  const std::string temporaryPath = getTemporaryPath(key);
+  if (success) {
+    std::FILE* file = std::fopen(temporaryPath.c_str(), "wb");
+    success = file && std::fwrite(buffer, 1, size, file) == size;
+    if (file) {
+      success = std::fclose(file) == 0 && success;
+    }
+  }
+  btAlignedFree(buffer);
+
+  if (!success) {
+    ESP_WARNING() << "Could not add" << getPath(key)
+                  << "to the collision shape cache";
+    std::remove(temporaryPath.c_str());
+    return false;
+  }
+  return commit(temporaryPath, key);
+}
+
+}  // namespace physics
+}  // namespace esp
@@ -0,0 +1,110 @@
+// Copyright (c) Meta Platforms, Inc. and its affiliates.
+// This source code is licensed under the MIT license found in the
+// LICENSE file in the root directory of this source tree.
+
+#ifndef ESP_PHYSICS_BULLET_COLLISIONSHAPECACHE_H_
+#define ESP_PHYSICS_BULLET_COLLISIONSHAPECACHE_H_
+
+/** @file
+ * @brief Class @ref esp::physics::CollisionShapeCache
+ */
+
+#include <cstddef>
+#include <memory>
+#include <string>
+
+#include <Corrade/Containers/ArrayView.h>
+#include <Magnum/Magnum.h>
+#include <Magnum/Math/Vector3.h>
+
+#include "esp/core/Esp.h"
+#include "esp/core/FileCache.h"
+
+class btOptimizedBvh;
+
+namespace esp {
+namespace physics {
+
+/**
+ * @brief Content-addressed on-disk cache of the Bullet bounding volume
+ * hierarchies of static triangle meshes, such as the collision meshes of
+ * stages.
+ *
+ * Each BVH is serialized to a `<key>.bvh` file in the cache directory, the key
+ * being a hash of the triangles and of the scaling the BVH was built for. Any
+ * change of the inputs just misses the cache. Cached BVHs are memory-mapped
+ * rather than read: the pages of a file are shared by all the processes of a
+ * node loading it, only the header the deserialization fixes up is copied.
+ * Once the files of the directory exceed the maximum size, the least recently
+ * used ones are removed. Processes which mapped an evicted file keep their
+ * mapping, the file is only freed once unmapped.
+ *
+ * Several processes can share a directory, files are written under a
+ * temporary name and then renamed.
+ */
+class CollisionShapeCache : public core::FileCache {
+ public:
+  /**
+   * @brief A BVH mapped from the cache. The memory is unmapped on destruction,
+   * so it must outlive the shapes using the BVH.
+   */
+  class MappedBvh {
+   public:
+    MappedBvh(void* data, std::size_t size, btOptimizedBvh* bvh)
+        : data_{data}, size_{size}, bvh_{bvh} {}
+    ~MappedBvh();
+
+    MappedBvh(const MappedBvh&) = delete;
+    MappedBvh& operator=(const MappedBvh&) = delete;
+
+    btOptimizedBvh* getBvh() const { return bvh_; }
+
+   private:
+    void* data_;
+    std::size_t size_;
+    btOptimizedBvh* bvh_;
+  };
+
+  /**
+   * @brief Constructor. The directory is created if needed.
+   *
+   * @param directory The directory holding the cached BVHs
+   * @param maxSize The maximum total size of the cached BVHs in bytes
+   */
+  explicit CollisionShapeCache(const std::string& directory,
+                               std::size_t maxSize = DefaultMaxSize);
+
+  /**
+   * @brief Computes the key of the BVH of a triangle mesh.
+   *
+   * @param positions The vertices of the mesh
+   * @param indices The indices of the triangles of the mesh
+   * @param scaling The local scaling of the mesh shape
+   */
+  static std::string computeKey(
+      Corrade::Containers::ArrayView<const Magnum::Vector3> positions,
+      Corrade::Containers::ArrayView<const Magnum::UnsignedInt> indices,
+      const Magnum::Vector3& scaling);
+
+  /**
+   * @brief Maps the BVH with @p key and marks it as recently used.
+   *
+   * @return The mapped BVH, nullptr if it isn't cached or fails to load
+   */
+  std::unique_ptr<MappedBvh> load(const std::string& key) const;
+
+  /**
+   * @brief Serializes @p bvh into the cache under @p key, then evicts the
+   * least recently used BVHs if the cache is too large.
+   *
+   * @return Whether the BVH was added
+   */
+  bool save(const std::string& key, const btOptimizedBvh& bvh) const;
+
+  ESP_SMART_POINTERS(CollisionShapeCache)
+};
+
+}  // namespace physics
+}  // namespace esp
+
+#endif  // ESP_PHYSICS_BULLET_COLLISIONSHAPECACHE_H_
@@ -75,5 +75,34 @@ RigidObjectManager::removePhysObjectByHandle(const std::string& objectHandle,
   return nullptr;
 }  // RigidObjectManager::removeObjectByHandle
 
+RigidObjectStates RigidObjectManager::getStates(
+    const std::vector<int>& objectIDs) const {
+  if (auto physMgr = this->getPhysicsManager()) {
+    return physMgr->getRigidObjectStates(objectIDs);
+  }
+  return {};
+}  // RigidObjectManager::getStates
+
+void RigidObjectManager::setStates(const std::vector<int>& objectIDs,
+                                   const Eigen::RowMatrixX3f& translations,
+                                   const Eigen::RowMatrixX4f& rotations,
+                                   const Eigen::RowMatrixX3f& linearVelocities,
+                                   const Eigen::RowMatrixX3f& angularVelocities,
+                                   const Eigen::VectorXi& motionTypes) {
+  if (auto physMgr = this->getPhysicsManager()) {
+    physMgr->setRigidObjectStates(objectIDs, translations, rotations,
+                                  linearVelocities, angularVelocities,
+                                  motionTypes);
+  }
+}  // RigidObjectManager::setStates
+
+void RigidObjectManager::applyForces(const std::vector<int>& objectIDs,
+                                     const Eigen::RowMatrixX3f& forces,
+                                     const Eigen::RowMatrixX3f& relPositions) {
+  if (auto physMgr = this->getPhysicsManager()) {
+    physMgr->applyRigidObjectForces(objectIDs, forces, relPositions);
+  }
+}  // RigidObjectManager::applyForces
+
 }  // namespace physics
 }  // namespace esp
@@ -137,6 +137,50 @@ class RigidObjectManager
       bool deleteObjectNode = true,
       bool deleteVisualNode = true);
 
+  /**
+   * @brief Get the states of a batch of rigid objects in a single call,
+   * without the cost of copying their wrappers. See @ref
+   * PhysicsManager::getRigidObjectStates.
+   *
+   * @param objectIDs The IDs of the objects.
+   * @return The states of the objects, one row per ID.
+   */
+  RigidObjectStates getStates(const std::vector<int>& objectIDs) const;
+
+  /**
+   * @brief Set the states of a batch of rigid objects in a single call,
+   * without the cost of copying their wrappers. Empty arrays leave the
+   * corresponding states unchanged. See @ref
+   * PhysicsManager::setRigidObjectStates.
+   *
+   * @param objectIDs The IDs of the objects.
+   * @param translations The (N, 3) translations of the objects.
+   * @param rotations The (N, 4) rotations of the objects, as quaternion
+   * coefficients (x, y, z, w).
+   * @param linearVelocities The (N, 3) linear velocities of the objects.
+   * @param angularVelocities The (N, 3) angular velocities of the objects.
+   * @param motionTypes The @ref MotionType of each object.
+   */
+  void setStates(const std::vector<int>& objectIDs,
+                 const Eigen::RowMatrixX3f& translations,
+                 const Eigen::RowMatrixX4f& rotations,
+                 const Eigen::RowMatrixX3f& linearVelocities,
+                 const Eigen::RowMatrixX3f& angularVelocities,
+                 const Eigen::VectorXi& motionTypes);
+
+  /**
+   * @brief Apply forces to a batch of rigid objects in a single call. See
+   * @ref PhysicsManager::applyRigidObjectForces.
+   *
+   * @param objectIDs The IDs of the objects.
+   * @param forces The (N, 3) forces in the global coordinate system.
+   * @param relPositions The (N, 3) locations of force application relative to
+   * the centers of mass of the objects, or empty for the centers of mass.
+   */
+  void applyForces(const std::vector<int>& objectIDs,
+                   const Eigen::RowMatrixX3f& forces,
+                   const Eigen::RowMatrixX3f& relPositions);
+
  protected:
   /**
    * @brief This method will remove rigid objects from physics manager.  The
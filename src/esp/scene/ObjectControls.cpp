@@ -6,16 +6,116 @@
 
 #include <Magnum/EigenIntegration/Integration.h>
 
+#include <cmath>
 #include <utility>
 
 #include "SceneNode.h"
+#include "esp/core/Check.h"
 #include "esp/core/Esp.h"
 
+namespace Mn = Magnum;
 using Magnum::EigenIntegration::cast;
 
 namespace esp {
 namespace scene {
 
+namespace {
+
+// epsilon used to deal with machine precision, as in the python controls
+constexpr float kCollisionEps = 1e-5f;
+
+Eigen::RowVector3f absolutePosition(const SceneNode& object) {
+  const Mn::Vector3 position = object.absoluteTransformation().translation();
+  return {position.x(), position.y(), position.z()};
+}
+
+void moveAlong(SceneNode& object, float distance, int axis) {
+  // TODO: this assumes no scale is applied
+  object.translateLocal(object.transformation()[axis].xyz() * distance);
+}
+
+void rotateLocal(SceneNode& object,
+                 float angleInDegrees,
+                 int axis,
+                 float constraintInDegrees) {
+  Mn::Rad theta{Mn::Deg{angleInDegrees}};
+  if (!std::isnan(constraintInDegrees)) {
+    const Mn::Quaternion rotation = object.rotation();
+    ESP_CHECK(float(rotation.angle()) == 0.0f ||
+                  1.0f - std::abs(rotation.axis().normalized()[axis]) <= 1e-3f,
+              "Constrained look only works for a singular look action type");
+
+    const Mn::Vector3 lookVector =
+        rotation.transformVector(Mn::Vector3{0.0f, 0.0f, -1.0f});
+    const Mn::Rad lookAngle{axis == 0
+                                ? std::atan2(lookVector.y(), -lookVector.z())
+                                : -std::atan2(lookVector.x(), -lookVector.z())};
+    const Mn::Rad newAngle = lookAngle + theta;
+    const Mn::Rad constraint{Mn::Deg{constraintInDegrees}};
+    if (newAngle > constraint) {
+      theta = constraint - lookAngle;
+    } else if (newAngle < -constraint) {
+      theta = -constraint - lookAngle;
+    }
+  }
+
+  if (axis == 0) {
+    object.rotateXLocal(theta);
+  } else {
+    object.rotateYLocal(theta);
+  }
+  object.setRotation(object.rotation().normalized());
+}
+
+void applyControl(SceneNode& object,
+                  DefaultControl control,
+                  float amount,
+                  float constraint) {
+  switch (control) {
+    case DefaultControl::MoveForward:
+      moveAlong(object, -amount, 2);
+      break;
+    case DefaultControl::MoveBackward:
+      moveAlong(object, amount, 2);
+      break;
+    case DefaultControl::MoveRight:
+      moveAlong(object, amount, 0);
+      break;
+    case DefaultControl::MoveLeft:
+      moveAlong(object, -amount, 0);
+      break;
+    case DefaultControl::MoveUp:
+      moveAlong(object, amount, 1);
+      break;
+    case DefaultControl::MoveDown:
+      moveAlong(object, -amount, 1);
+      break;
+    case DefaultControl::LookLeft:
+      rotateLocal(object, amount, 1, constraint);
+      break;
+    case DefaultControl::LookRight:
+      rotateLocal(object, -amount, 1, constraint);
+      break;
+    case DefaultControl::LookUp:
+      rotateLocal(object, amount, 0, constraint);
+      break;
+    case DefaultControl::LookDown:
+      rotateLocal(object, -amount, 0, constraint);
+      break;
+  }
+}
+
+// NB: the filter can move the end position without a collision, e.g. when
+// going up stairs, so a collision is a move shortened by the filter
+bool isCollision(const Eigen::RowVector3f& start,
+                 const Eigen::RowVector3f& end,
+                 const Eigen::RowVector3f& filteredEnd) {
+  return (filteredEnd - start).squaredNorm() + kCollisionEps <
+         (end - start).squaredNorm();
+}
+
+}  // namespace
+
 SceneNode& moveRight(SceneNode& object, float distance) {
   // TODO: this assumes no scale is applied
   object.translateLocal(object.transformation().right() * distance);
@@ -112,5 +212,80 @@ ObjectControls& ObjectControls::action(SceneNode& object,
   return *this;
 }
 
+bool ObjectControls::applyDefaultControl(SceneNode& object,
+                                         DefaultControl control,
+                                         float amount,
+                                         float constraint,
+                                         const MoveFilterFunc& filterFunc) {
+  if (!filterFunc) {
+    applyControl(object, control, amount, constraint);
+    return false;
+  }
+
+  const Eigen::RowVector3f start = absolutePosition(object);
+  applyControl(object, control, amount, constraint);
+  const Eigen::RowVector3f end = absolutePosition(object);
+  const Eigen::RowVector3f filteredEnd =
+      filterFunc(start.transpose(), end.transpose()).transpose();
+  const Eigen::RowVector3f correction = filteredEnd - end;
+  object.translate(Mn::Vector3{correction[0], correction[1], correction[2]});
+  return isCollision(start, end, filteredEnd);
+}
+
+Eigen::Matrix<bool, Eigen::Dynamic, 1> ObjectControls::applyDefaultControls(
+    const std::vector<SceneNode*>& objects,
+    const std::vector<DefaultControl>& controls,
+    const Eigen::VectorXf& amounts,
+    const Eigen::VectorXf& constraints,
+    const Eigen::Matrix<bool, Eigen::Dynamic, 1>& applyFilter,
+    const BatchMoveFilterFunc& filterFunc) {
+  const int numObjects = objects.size();
+  ESP_CHECK(controls.size() == objects.size() && amounts.size() == numObjects &&
+                constraints.size() == numObjects &&
+                applyFilter.size() == numObjects,
+            "applyDefaultControls: got"
+                << numObjects << "objects but" << controls.size() << "controls,"
+                << amounts.size() << "amounts," << constraints.size()
+                << "constraints and" << applyFilter.size() << "filter flags");
+
+  // Only the filtered moves are gathered, so that the filter is called once
+  // with exactly the rows it has to process
+  std::vector<int> filtered;
+  filtered.reserve(numObjects);
+  Eigen::RowMatrixX3f starts(numObjects, 3);
+  Eigen::RowMatrixX3f ends(numObjects, 3);
+  for (int i = 0; i < numObjects; ++i) {
+    SceneNode& object = *objects[i];
+    const bool filter = filterFunc && applyFilter[i];
+    if (filter) {
+      starts.row(filtered.size()) = absolutePosition(object);
+    }
+    applyControl(object, controls[i], amounts[i], constraints[i]);
+    if (filter) {
+      ends.row(filtered.size()) = absolutePosition(object);
+      filtered.push_back(i);
+    }
+  }
+
+  Eigen::Matrix<bool, Eigen::Dynamic, 1> collided =
+      Eigen::Matrix<bool, Eigen::Dynamic, 1>::Constant(numObjects, false);
+  if (filtered.empty()) {
+    return collided;
+  }
+
+  const int numFiltered = filtered.size();
+  starts.conservativeResize(numFiltered, Eigen::NoChange);
+  ends.conservativeResize(numFiltered, Eigen::NoChange);
+  const Eigen::RowMatrixX3f filteredEnds = filterFunc(starts, ends);
+  for (int k = 0; k < numFiltered; ++k) {
+    const Eigen::RowVector3f correction = filteredEnds.row(k) - ends.row(k);
+    objects[filtered[k]]->translate(
+        Mn::Vector3{correction[0], correction[1], correction[2]});
+    collided[filtered[k]] =
+        isCollision(starts.row(k), ends.row(k), filteredEnds.row(k));
+  }
+  return collided;
+}
+
 }  // namespace scene
 }  // namespace esp
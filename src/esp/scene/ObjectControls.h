@@ -5,9 +5,11 @@
 #ifndef ESP_SCENE_OBJECTCONTROLS_H_
 #define ESP_SCENE_OBJECTCONTROLS_H_
 
+#include <cmath>
 #include <functional>
 #include <map>
 #include <string>
+#include <vector>
 
 #include "esp/core/Esp.h"
 #include "esp/core/EspEigen.h"
@@ -18,12 +20,36 @@ namespace scene {
 // forward declaration
 class SceneNode;
 
+/**
+ * @brief The default controls of the python agent, which can be executed
+ * natively by @ref ObjectControls::applyDefaultControls.
+ */
+enum class DefaultControl {
+  MoveForward,
+  MoveBackward,
+  MoveRight,
+  MoveLeft,
+  MoveUp,
+  MoveDown,
+  LookLeft,
+  LookRight,
+  LookUp,
+  LookDown,
+};
+
 class ObjectControls {
  public:
   ObjectControls();
 
   typedef std::function<SceneNode&(SceneNode&, float)> MoveFunc;
   typedef std::function<vec3f(const vec3f&, const vec3f&)> MoveFilterFunc;
+  /**
+   * @brief Filters many moves at once, mapping the (N, 3) start and end
+   * positions to the (N, 3) filtered end positions.
+   */
+  typedef std::function<Eigen::RowMatrixX3f(const Eigen::RowMatrixX3f&,
+                                            const Eigen::RowMatrixX3f&)>
+      BatchMoveFilterFunc;
   ObjectControls& setMoveFilterFunction(MoveFilterFunc filterFunc);
 
   ObjectControls& action(SceneNode& object,
@@ -41,6 +67,48 @@ class ObjectControls {
     return moveFuncMap_;
   }
 
+  /**
+   * @brief Applies a default control to an object, then filters its move.
+   *
+   * @param object The object to act on
+   * @param control The control to apply
+   * @param amount The distance of a move or the angle in degrees of a look
+   * @param constraint The largest look angle in degrees, NAN for none
+   * @param filterFunc Filters the move, may be empty
+   * @return Whether the filter shortened the move
+   */
+  static bool applyDefaultControl(SceneNode& object,
+                                  DefaultControl control,
+                                  float amount,
+                                  float constraint = NAN,
+                                  const MoveFilterFunc& filterFunc = {});
+
+  /**
+   * @brief Applies a default control to each of several objects, then
+   * filters all the moves with a single call to @p filterFunc.
+   *
+   * The controls match the python default controls: moves translate the
+   * object along one of its local axes and looks rotate it around one of
+   * its local axes, optionally clamping the look angle.
+   *
+   * @param objects The objects to act on
+   * @param controls The control applied to each object
+   * @param amounts The distance of each move or the angle in degrees of each
+   * look
+   * @param constraints The largest look angle in degrees for each object, NAN
+   * for none
+   * @param applyFilter Whether to filter the move of each object
+   * @param filterFunc Filters the moves, may be empty
+   * @return Whether the filter shortened the move of each object
+   */
+  static Eigen::Matrix<bool, Eigen::Dynamic, 1> applyDefaultControls(
+      const std::vector<SceneNode*>& objects,
+      const std::vector<DefaultControl>& controls,
+      const Eigen::VectorXf& amounts,
+      const Eigen::VectorXf& constraints,
+      const Eigen::Matrix<bool, Eigen::Dynamic, 1>& applyFilter,
+      const BatchMoveFilterFunc& filterFunc);
+
  protected:
   MoveFilterFunc moveFilterFunc_ = [](const vec3f& /*start*/,
                                       const vec3f& end) { return end; };
@@ -156,6 +156,10 @@ void Simulator::reconfigure(const SimulatorConfiguration& cfg) {
   // TODO can optimize to do partial re-initialization instead of from-scratch
   config_ = cfg;
 
+  if (auto recorder = gfxReplayMgr_->getRecorder()) {
+    recorder->setSkipUnmovedInstances(config_.gfxReplaySkipSleepingObjects);
+  }
+
   if (!config_.createRenderer) {
     config_.requiresTextures = false;
   }
@@ -256,6 +260,16 @@ bool Simulator::createSceneInstance(const std::string& activeSceneName) {
       curSceneInstanceAttributes_->getNavmeshHandle();
   // create pathfinder and load navmesh if available
   pathfinder_ = nav::PathFinder::create();
+  if (config_.navMeshCacheDirectory.empty()) {
+    navMeshCache_ = nullptr;
+  } else {
+    if (!navMeshCache_ ||
+        navMeshCache_->getDirectory() != config_.navMeshCacheDirectory) {
+      navMeshCache_ = nav::NavMeshCache::create(config_.navMeshCacheDirectory);
+    }
+    navMeshCache_->setMaxSize(config_.navMeshCacheMaxSize);
+  }
+  pathfinder_->setNavMeshCache(navMeshCache_);
   if (navmeshFileHandle.empty()) {
     ESP_DEBUG() << "No navmesh file handle provided in scene instance.";
 
@@ -845,6 +859,19 @@ double Simulator::stepWorld(const double dt) {
   return getWorldTime();
 }
 
+double Simulator::stepWorldSubsteps(const int numSubsteps) {
+  if (physicsManager_ != nullptr) {
+    physicsManager_->deferNodesUpdate();
+    physicsManager_->stepPhysicsSubsteps(numSubsteps);
+    if (renderer_) {
+      renderer_->waitSceneGraph();
+    }
+
+    physicsManager_->updateNodes();
+  }
+  return getWorldTime();
+}
+
 // get the simulated world time (0 if no physics enabled)
 double Simulator::getWorldTime() {
   if (physicsManager_ != nullptr) {
@@ -878,6 +905,42 @@ bool Simulator::recomputeNavMesh(nav::PathFinder& pathfinder,
   return true;
 }
 
+bool Simulator::updateNavMesh(nav::PathFinder& pathfinder,
+                              const std::vector<Magnum::Range3D>& regions) {
+  const Cr::Containers::Optional<nav::NavMeshSettings> navMeshSettings =
+      pathfinder.getNavMeshSettings();
+  if (!pathfinder.isLoaded() || !navMeshSettings) {
+    ESP_ERROR() << "No navmesh to update, recompute it first";
+    return false;
+  }
+  if (navMeshSettings->tileSize <= 0) {
+    ESP_WARNING() << "The navmesh isn't tiled, recomputing all of it";
+    return recomputeNavMesh(pathfinder, *navMeshSettings);
+  }
+
+  assets::MeshData::ptr joinedMesh =
+      getJoinedMesh(navMeshSettings->includeStaticObjects);
+
+  std::vector<std::pair<vec3f, vec3f>> tileRegions;
+  tileRegions.reserve(regions.size());
+  for (const Magnum::Range3D& region : regions) {
+    tileRegions.emplace_back(
+        Magnum::EigenIntegration::cast<vec3f>(region.min()),
+        Magnum::EigenIntegration::cast<vec3f>(region.max()));
+  }
+  if (!pathfinder.rebuildTiles(*joinedMesh, tileRegions)) {
+    ESP_ERROR() << "Failed to update navmesh";
+    return false;
+  }
+
+  if (&pathfinder == pathfinder_.get()) {
+    resetNavMeshVisIfActive();
+  }
+
+  ESP_DEBUG() << "navmesh update successful";
+  return true;
+}
+
 assets::MeshData::ptr Simulator::getJoinedMesh(
     const bool includeStaticObjects) {
   assets::MeshData::ptr joinedMesh = assets::MeshData::create();
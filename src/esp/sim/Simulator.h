@@ -357,6 +357,29 @@ class Simulator {
     return physicsManager_->getNumActiveOverlappingPairs();
   }
 
+  /**
+   * @brief Get the ids of the rigid and articulated objects which are awake.
+   * See @ref esp::physics::PhysicsManager::getActiveObjectIds.
+   */
+  std::vector<int> getActiveObjectIds() const {
+    if (sceneHasPhysics()) {
+      return physicsManager_->getActiveObjectIds();
+    }
+    return {};
+  }
+
+  /**
+   * @brief Get the ids of the rigid and articulated objects whose transforms
+   * the most recent @ref stepWorld may have changed. See @ref
+   * esp::physics::PhysicsManager::getDirtyObjectIds.
+   */
+  std::vector<int> getDirtyObjectIds() const {
+    if (sceneHasPhysics()) {
+      return physicsManager_->getDirtyObjectIds();
+    }
+    return {};
+  }
+
   /**
    * @brief See BulletPhysicsManager.h getStepCollisionSummary
    */
@@ -428,6 +451,36 @@ class Simulator {
     return esp::physics::RaycastResults();
   }
 
+  /**
+   * @brief Raycast a batch of rays into the collision world of a scene and
+   * return the first hit of each ray.
+   *
+   * Note: A default @ref physics::PhysicsManager has no collision world, so
+   * physics must be enabled for this feature.
+   *
+   * @param origins The (N, 3) ray origins.
+   * @param directions The (N, 3) ray directions. Need not be unit length, but
+   * returned hit distances will be in units of ray length.
+   * @param maxDistance The maximum distance along the ray directions to
+   * search. In units of ray length.
+   * @param numThreads The number of threads casting the rays, all hardware
+   * threads if less than 1.
+   * @return The first hit of each ray.
+   */
+  esp::physics::BatchRaycastResults castRays(
+      const Eigen::RowMatrixX3f& origins,
+      const Eigen::RowMatrixX3f& directions,
+      double maxDistance = 100.0,
+      int numThreads = 1) {
+    if (sceneHasPhysics()) {
+      return physicsManager_->castRays(origins, directions, maxDistance,
+                                       numThreads);
+    }
+    esp::physics::BatchRaycastResults results;
+    results.reset(origins.rows());
+    return results;
+  }
+
   /**
    * @brief the physical world has a notion of time which passes during
    * animation/simulation/action/etc... Step the physical world forward in time
@@ -441,6 +494,44 @@ class Simulator {
    */
   double stepWorld(double dt = 1.0 / 60.0);
 
+  /**
+   * @brief Step the physical world forward by a number of fixed timesteps,
+   * e.g. per agent action. The scene graph nodes are only synchronized after
+   * the last substep, so stable small timesteps don't pay the synchronization
+   * cost at physics rate. See @ref
+   * esp::physics::PhysicsManager::stepPhysicsSubsteps.
+   * @param numSubsteps The number of fixed timesteps to advance by, @ref
+   * getPhysicsNumSubsteps if negative.
+   * @return The new world time after stepping.
+   */
+  double stepWorldSubsteps(int numSubsteps = -1);
+
+  /**
+   * @brief Get the number of fixed timesteps @ref stepWorldSubsteps advances
+   * by, configured in the @ref
+   * esp::metadata::attributes::PhysicsManagerAttributes. This is always 1 if
+   * no @ref esp::physics::PhysicsManager is initialized.
+   */
+  int getPhysicsNumSubsteps() const {
+    if (physicsManager_ != nullptr) {
+      return physicsManager_->getNumSubsteps();
+    }
+    return 1;
+  }
+
+  /**
+   * @brief Get the number of physics steps between two renderings of the
+   * observations when stepping with @ref stepWorldSubsteps, configured in the
+   * @ref esp::metadata::attributes::PhysicsManagerAttributes. This is always 1
+   * if no @ref esp::physics::PhysicsManager is initialized.
+   */
+  int getPhysicsRenderInterval() const {
+    if (physicsManager_ != nullptr) {
+      return physicsManager_->getRenderInterval();
+    }
+    return 1;
+  }
+
   /**
    * @brief Get the current time in the simulated world. This is always 0 if no
    * @ref esp::physics::PhysicsManager is initialized. See @ref stepWorld. See
@@ -450,6 +541,33 @@ class Simulator {
    */
   double getWorldTime();
 
+  /**
+   * @brief Save the simulated state of the physical world in memory. See
+   * @ref esp::physics::PhysicsManager::saveSnapshot.
+   * @return The snapshot, empty if no @ref esp::physics::PhysicsManager is
+   * initialized.
+   */
+  esp::physics::PhysicsSnapshot savePhysicsSnapshot() const {
+    if (sceneHasPhysics()) {
+      return physicsManager_->saveSnapshot();
+    }
+    return {};
+  }
+
+  /**
+   * @brief Restore a snapshot saved by @ref savePhysicsSnapshot, reusing the
+   * existing objects. See @ref
+   * esp::physics::PhysicsManager::restoreSnapshot.
+   * @param snapshot The snapshot to restore.
+   * @return Whether all the objects of the snapshot still existed.
+   */
+  bool restorePhysicsSnapshot(esp::physics::PhysicsSnapshot& snapshot) {
+    if (sceneHasPhysics()) {
+      return physicsManager_->restoreSnapshot(snapshot);
+    }
+    return false;
+  }
+
   /**
    * @brief Get the last physics timestep in seconds
    *
@@ -508,6 +626,23 @@ class Simulator {
   bool recomputeNavMesh(nav::PathFinder& pathfinder,
                         const nav::NavMeshSettings& navMeshSettings);
 
+  /**
+   * @brief Rebuild the tiles of a tiled navmesh overlapping regions of the
+   * simulator's current active scene that changed, e.g. where STATIC objects
+   * were added, removed or moved from.
+   *
+   * Much cheaper than @ref recomputeNavMesh when only a few objects changed.
+   * The navmesh must have been computed with @ref
+   * nav::NavMeshSettings::tileSize greater than 0, otherwise all of it is
+   * recomputed.
+   * @param pathfinder The pathfinder object whose navmesh will be updated.
+   * @param regions The world space bounding boxes of the changed regions, e.g.
+   * of the objects before and after they moved.
+   * @return Whether or not the navmesh update succeeded.
+   */
+  bool updateNavMesh(nav::PathFinder& pathfinder,
+                     const std::vector<Magnum::Range3D>& regions);
+
   /**
    * @brief Get the joined mesh data for all objects in the scene
    * @param includeStaticObjects flag to include static objects
@@ -981,6 +1116,8 @@ class Simulator {
   std::vector<agent::Agent::ptr> agents_;
 
   nav::PathFinder::ptr pathfinder_;
+  //! Shared by the pathfinders of all scenes, nullptr if disabled
+  nav::NavMeshCache::ptr navMeshCache_;
   // state indicating frustum culling is enabled or not
   //
   // TODO:
@@ -16,6 +16,7 @@ bool operator==(const SimulatorConfiguration& a,
          a.frustumCulling == b.frustumCulling &&
          a.enablePhysics == b.enablePhysics &&
          a.enableGfxReplaySave == b.enableGfxReplaySave &&
+         a.gfxReplaySkipSleepingObjects == b.gfxReplaySkipSleepingObjects &&
          a.loadSemanticMesh == b.loadSemanticMesh &&
          a.forceSeparateSemanticSceneGraph ==
              b.forceSeparateSemanticSceneGraph &&
@@ -27,7 +28,12 @@ bool operator==(const SimulatorConfiguration& a,
          a.physicsConfigFile == b.physicsConfigFile &&
          a.overrideSceneLightDefaults == b.overrideSceneLightDefaults &&
          a.sceneLightSetupKey == b.sceneLightSetupKey &&
-         a.enableHBAO == b.enableHBAO && a.navMeshSettings == b.navMeshSettings;
+         a.enableHBAO == b.enableHBAO &&
+         a.navMeshSettings == b.navMeshSettings &&
+         a.navMeshCacheDirectory == b.navMeshCacheDirectory &&
+         a.navMeshCacheMaxSize == b.navMeshCacheMaxSize &&
+         a.collisionShapeCacheDirectory == b.collisionShapeCacheDirectory &&
+         a.collisionShapeCacheMaxSize == b.collisionShapeCacheMaxSize;
 }
 
 bool operator!=(const SimulatorConfiguration& a,
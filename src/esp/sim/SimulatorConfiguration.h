@@ -9,6 +9,7 @@
 
 #include "esp/core/Esp.h"
 #include "esp/gfx/configure.h"
+#include "esp/nav/NavMeshCache.h"
 #include "esp/nav/PathFinder.h"
 #include "esp/physics/configure.h"
 
@@ -47,6 +48,13 @@ struct SimulatorConfiguration {
    * These keyframes can be used later to replay the graphics of a simulation.
    */
   bool enableGfxReplaySave = false;
+  /**
+   * @brief Whether the recorded render keyframes skip updating the instances
+   * which didn't move since the previous keyframe, such as those of sleeping
+   * physics objects, instead of checking every instance of the scene. See
+   * @ref esp::gfx::replay::Recorder::setSkipUnmovedInstances.
+   */
+  bool gfxReplaySkipSleepingObjects = false;
   /**
    * @brief Whether or not to load the semantic mesh
    */
@@ -103,6 +111,35 @@ struct SimulatorConfiguration {
    */
   nav::NavMeshSettings::ptr navMeshSettings = nullptr;
 
+  /**
+   * @brief Optionally provide a directory to cache built NavMeshes in. A
+   * NavMesh recompute then loads the NavMesh from the cache when the same
+   * scene geometry and NavMeshSettings were built before, by any process
+   * sharing the directory. Empty disables the cache.
+   */
+  std::string navMeshCacheDirectory;
+
+  /**
+   * @brief The maximum total size in bytes of the NavMesh cache. The least
+   * recently used NavMeshes are removed from the cache beyond it.
+   */
+  std::size_t navMeshCacheMaxSize = nav::NavMeshCache::DefaultMaxSize;
+
+  /**
+   * @brief Optionally provide a directory to cache the collision shapes of
+   * stages in. Loading a stage then maps its Bullet BVHs from the cache when
+   * the same collision meshes were loaded before, by any process sharing the
+   * directory, instead of building them. Empty disables the cache.
+   */
+  std::string collisionShapeCacheDirectory;
+
+  /**
+   * @brief The maximum total size in bytes of the collision shape cache. The
+   * least recently used shapes are removed from the cache beyond it. Default
+   * 1 GiB.
+   */
+  std::size_t collisionShapeCacheMaxSize = std::size_t{1} << 30;
+
   /**
    * @brief Enable HBAO visual effect that adds soft shadows to corners and
    * crevices.
@@ -370,6 +370,8 @@ void AttributesConfigsTest::testPhysicsAttrVals(
 
   CORRADE_COMPARE(physMgrAttr->getGravity(), Mn::Vector3(1, 2, 3));
   CORRADE_COMPARE(physMgrAttr->getTimestep(), 1.0);
+  CORRADE_COMPARE(physMgrAttr->getNumSubsteps(), 4);
+  CORRADE_COMPARE(physMgrAttr->getRenderInterval(), 8);
   CORRADE_COMPARE(physMgrAttr->getSimulator(), "bullet_test");
   CORRADE_COMPARE(physMgrAttr->getFrictionCoefficient(), 1.4);
   CORRADE_COMPARE(physMgrAttr->getRestitutionCoefficient(), 1.1);
@@ -392,6 +394,8 @@ void AttributesConfigsTest::testPhysicsJSONLoad() {
   const std::string& jsonString = R"({
   "physics_simulator": "bullet_test",
   "timestep": 1.0,
+  "num_substeps": 4,
+  "render_interval": 8,
   "gravity": [1,2,3],
   "friction_coefficient": 1.4,
   "restitution_coefficient": 1.1,
@@ -36,6 +36,7 @@ if not getattr(builtins, "__HSIM_SETUP__", False):
         Agent,
         AgentConfiguration,
         AgentState,
+        AgentStates,
         SixDOFPose,
     )
     from habitat_sim.agent.controls import (  # noqa: F401
@@ -62,6 +63,9 @@ if not getattr(builtins, "__HSIM_SETUP__", False):
         stage_id,
     )
     from habitat_sim.nav import (  # noqa: F401
+        BatchGreedyGeodesicFollower,
+        EpisodeSamplingSettings,
+        GeodesicDistanceField,
         GreedyFollowerCodes,
         GreedyGeodesicFollower,
         HitRecord,
@@ -92,6 +96,7 @@ if not getattr(builtins, "__HSIM_SETUP__", False):
         VisualSensorSpec,
     )
     from habitat_sim.simulator import Configuration, Simulator  # noqa: F401
+    from habitat_sim.vector_simulator import VectorSimulator  # noqa: F401
 
     __all__ = [
         "agent",
@@ -111,6 +116,7 @@ if not getattr(builtins, "__HSIM_SETUP__", False):
         "sim",
         "simulator",
         "utils",
+        "vector_simulator",
         "MapStringString",
         "registry",
     ]
@@ -4,7 +4,7 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import attr
 import magnum as mn
@@ -19,6 +19,7 @@ from habitat_sim.utils.common import (
     quat_from_coeffs,
     quat_from_magnum,
     quat_rotate_vector,
+    quat_to_coeffs,
     quat_to_magnum,
 )
 from habitat_sim.utils.validators import (
@@ -30,7 +31,14 @@ from habitat_sim.utils.validators import (
 
 from .controls import ActuationSpec, ObjectControls
 
-__all__ = ["ActionSpec", "SixDOFPose", "AgentState", "AgentConfiguration", "Agent"]
+__all__ = [
+    "ActionSpec",
+    "SixDOFPose",
+    "AgentState",
+    "AgentStates",
+    "AgentConfiguration",
+    "Agent",
+]
 
 
 @attr.s(auto_attribs=True)
@@ -91,6 +99,80 @@ class AgentState:
     )
 
 
+@attr.s(auto_attribs=True, slots=True)
+class AgentStates:
+    r"""The states of several agents, stored as arrays
+
+    :property positions: :py:`(N, 3)` position of each agent
+    :property rotations: :py:`(N, 4)` rotation of each agent, as quaternion
+        coefficients in the :py:`[b, c, d, a]` format of `quat_from_coeffs()`
+    :property sensor_uuids: The sensor of each column of `sensor_poses`
+    :property sensor_poses: :py:`(N, S, 7)` position followed by rotation
+        coefficients of each sensor. The poses of sensors an agent does not
+        have are NaN.
+
+    `Agent.get_state_into()` and `Agent.set_state_from()` read and write rows
+    directly from the scene graph, `AgentState` objects are only built by
+    `get_state()`.
+    """
+
+    positions: np.ndarray
+    rotations: np.ndarray
+    sensor_uuids: List[str]
+    sensor_poses: np.ndarray
+
+    @classmethod
+    def empty(cls, num_agents: int, sensor_uuids: Sequence[str]) -> "AgentStates":
+        r"""Allocates the states of :p:`num_agents` agents with the given
+        sensors
+        """
+        return cls(
+            np.zeros((num_agents, 3)),
+            np.tile([0.0, 0.0, 0.0, 1.0], (num_agents, 1)),
+            list(sensor_uuids),
+            np.full((num_agents, len(sensor_uuids), 7), np.nan),
+        )
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @NoAttrValidationContext()
+    def get_state(self, index: int) -> AgentState:
+        r"""Builds the `AgentState` of an agent"""
+        state = AgentState(
+            self.positions[index].copy(), quat_from_coeffs(self.rotations[index])
+        )
+        for uuid, pose in zip(self.sensor_uuids, self.sensor_poses[index]):
+            if not np.isnan(pose[0]):
+                state.sensor_states[uuid] = SixDOFPose(
+                    pose[:3].copy(), quat_from_coeffs(pose[3:])
+                )
+        return state
+
+    def set_state(self, index: int, state: AgentState) -> None:
+        r"""Stores an `AgentState` in the row of an agent"""
+        self.positions[index] = state.position
+        rotation = state.rotation
+        self.rotations[index] = (
+            quat_to_coeffs(rotation)
+            if isinstance(rotation, qt.quaternion)
+            else rotation
+        )
+        for column, uuid in enumerate(self.sensor_uuids):
+            pose = self.sensor_poses[index, column]
+            sensor_state = state.sensor_states.get(uuid)
+            if sensor_state is None:
+                pose[:] = np.nan
+                continue
+            pose[:3] = sensor_state.position
+            rotation = sensor_state.rotation
+            pose[3:] = (
+                quat_to_coeffs(rotation)
+                if isinstance(rotation, qt.quaternion)
+                else rotation
+            )
+
+
 @attr.s(auto_attribs=True, slots=True)
 class AgentConfiguration:
     height: float = 1.5
@@ -177,26 +259,68 @@ class Agent:
             `agent_config.action_space <AgentConfiguration.action_space>`
         :return: Whether or not the action taken resulted in a collision
         """
+        return bool(Agent.act_batch([self], [action_id])[0])
 
-        habitat_sim.errors.assert_obj_valid(self.body)
-        assert (
-            action_id in self.agent_config.action_space
-        ), f"No action {action_id} in action space"
-        action = self.agent_config.action_space[action_id]
-
-        did_collide = False
-        if self.controls.is_body_action(action.name):
-            did_collide = self.controls.action(
-                self.scene_node, action.name, action.actuation, apply_filter=True
+    @staticmethod
+    def act_batch(agents: Sequence["Agent"], action_ids: Sequence[Any]) -> np.ndarray:
+        r"""Take one action per agent, see `act()`
+
+        :param agents: The agents
+        :param action_ids: The ID of the action of each agent
+        :return: Whether or not the action of each agent resulted in a
+            collision
+
+        The actions of agents with equal controls, e.g. the agents of a
+        `Simulator`, go through a single `ObjectControls.action_batch()` call,
+        which applies all their default controls natively at once.
+        """
+        if len(action_ids) != len(agents):
+            raise ValueError(
+                f"Expected one action per agent, got {len(action_ids)} actions "
+                f"for {len(agents)} agents"
             )
-        else:
-            for v in self._sensors.values():
-                habitat_sim.errors.assert_obj_valid(v)
-                self.controls.action(
-                    v.object, action.name, action.actuation, apply_filter=False
-                )
 
-        return did_collide
+        # The objects to act on, grouped by controls. Each object is the body
+        # of the agent at the given index or, for -1, a sensor.
+        groups: List[Tuple[ObjectControls, List[Tuple[Any, ActionSpec, bool, int]]]]
+        groups = []
+        for index, (agent, action_id) in enumerate(zip(agents, action_ids)):
+            habitat_sim.errors.assert_obj_valid(agent.body)
+            assert (
+                action_id in agent.agent_config.action_space
+            ), f"No action {action_id} in action space"
+            action = agent.agent_config.action_space[action_id]
+
+            if agent.controls.is_body_action(action.name):
+                objs = [(agent.scene_node, action, True, index)]
+            else:
+                objs = []
+                for v in agent._sensors.values():
+                    habitat_sim.errors.assert_obj_valid(v)
+                    objs.append((v.object, action, False, -1))
+
+            for controls, group in groups:
+                if controls == agent.controls:
+                    group.extend(objs)
+                    break
+            else:
+                groups.append((agent.controls, objs))
+
+        collided = np.zeros(len(agents), dtype=bool)
+        for controls, group in groups:
+            if len(group) == 0:
+                continue
+            group_collided = controls.action_batch(
+                [obj for obj, _, _, _ in group],
+                [action.name for _, action, _, _ in group],
+                [action.actuation for _, action, _, _ in group],
+                [apply_filter for _, _, apply_filter, _ in group],
+            )
+            for (_, _, _, index), did_collide in zip(group, group_collided):
+                if index >= 0:
+                    collided[index] = did_collide
+
+        return collided
 
     @NoAttrValidationContext()
     def get_state(self) -> AgentState:
@@ -277,6 +401,77 @@ class Agent:
         if is_initial:
             self.initial_state = state
 
+    def get_state_into(self, states: AgentStates, index: int) -> None:
+        r"""Writes the state of the agent into a row of :p:`states`, without
+        building `AgentState` objects
+
+        :param states: The states to write into
+        :param index: The row of this agent
+        """
+        habitat_sim.errors.assert_obj_valid(self.body)
+        node = self.body.object
+        rotation = node.rotation
+        states.positions[index] = node.absolute_translation
+        states.rotations[index, :3] = rotation.vector
+        states.rotations[index, 3] = rotation.scalar
+
+        for column, uuid in enumerate(states.sensor_uuids):
+            pose = states.sensor_poses[index, column]
+            sensor = self._sensors.get(uuid)
+            if sensor is None:
+                pose[:] = np.nan
+                continue
+            sensor_rotation = rotation * sensor.node.rotation
+            pose[:3] = sensor.node.absolute_translation
+            pose[3:6] = sensor_rotation.vector
+            pose[6] = sensor_rotation.scalar
+
+    def set_state_from(
+        self,
+        states: AgentStates,
+        index: int,
+        reset_sensors: bool = True,
+        infer_sensor_states: bool = True,
+    ) -> None:
+        r"""Sets the state of the agent from a row of :p:`states`
+
+        :param states: The states to read from
+        :param index: The row of this agent
+        :param reset_sensors: See `set_state()`
+        :param infer_sensor_states: See `set_state()`. When :py:`False`, the
+            sensors with a NaN pose are left untouched.
+
+        Unlike `set_state()`, the state is not validated: positions must be
+        finite and rotations unit quaternions.
+        """
+        habitat_sim.errors.assert_obj_valid(self.body)
+        node = self.body.object
+        position = mn.Vector3(states.positions[index])
+        coeffs = states.rotations[index]
+        rotation = mn.Quaternion(mn.Vector3(coeffs[:3]), coeffs[3])
+
+        node.reset_transformation()
+        node.translate(position)
+        node.rotation = rotation
+
+        if reset_sensors:
+            for v in self._sensors.values():
+                v.set_transformation_from_spec()
+
+        if not infer_sensor_states:
+            inverse_rotation = rotation.inverted()
+            for uuid, pose in zip(states.sensor_uuids, states.sensor_poses[index]):
+                if np.isnan(pose[0]):
+                    continue
+                s = self._sensors[uuid]
+                s.node.reset_transformation()
+                s.node.translate(
+                    inverse_rotation.transform_vector(mn.Vector3(pose[:3]) - position)
+                )
+                s.node.rotation = inverse_rotation * mn.Quaternion(
+                    mn.Vector3(pose[3:6]), pose[6]
+                )
+
     @property
     def scene_node(self) -> SceneNode:
         habitat_sim.errors.assert_obj_valid(self.body)
@@ -6,11 +6,12 @@
 
 from habitat_sim.agent.controls.controls import ActuationSpec, SceneNodeControl
 from habitat_sim.agent.controls.default_controls import *  # noqa: F401, F403
-from habitat_sim.agent.controls.object_controls import ObjectControls
+from habitat_sim.agent.controls.object_controls import NavMeshMoveFilter, ObjectControls
 from habitat_sim.agent.controls.pyrobot_noisy_controls import PyRobotNoisyActuationSpec
 
 __all__ = [
     "ActuationSpec",
+    "NavMeshMoveFilter",
     "ObjectControls",
     "SceneNodeControl",
     "PyRobotNoisyActuationSpec",
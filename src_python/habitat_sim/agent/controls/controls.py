@@ -5,7 +5,7 @@
 # LICENSE file in the root directory of this source tree.
 
 import abc
-from typing import Optional
+from typing import Optional, Sequence
 
 import attr
 
@@ -58,3 +58,17 @@ class SceneNodeControl(abc.ABC):
         :param scene_node: The scene node to control
         :param acutation_spec: Struct holding any parameters of the control
         """
+
+    def apply_batch(
+        self,
+        scene_nodes: Sequence[hsim.SceneNode],
+        actuation_specs: Sequence[ActuationSpec],
+    ) -> None:
+        r"""Applies the control to several scene nodes. Override to share work
+        between the nodes, e.g. drawing random numbers in bulk.
+
+        :param scene_nodes: The scene nodes to control
+        :param actuation_specs: The parameters of the control for each node
+        """
+        for scene_node, actuation_spec in zip(scene_nodes, actuation_specs):
+            self(scene_node, actuation_spec)
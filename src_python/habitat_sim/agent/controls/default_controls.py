@@ -9,6 +9,7 @@ from typing import List, Optional
 import magnum as mn
 import numpy as np
 
+from habitat_sim._ext.habitat_sim_bindings import DefaultControl
 from habitat_sim.agent.controls.controls import ActuationSpec, SceneNodeControl
 from habitat_sim.geo import FRONT
 from habitat_sim.registry import registry
@@ -152,3 +153,27 @@ class RotateSensorAntiClockwise(SceneNodeControl):
         _rotate_local(
             scene_node, -actuation_spec.amount, _Z_AXIS, actuation_spec.constraint
         )
+
+
+# The controls above that have a native implementation. Subclasses may change
+# their behavior, so only these exact classes are executed natively.
+_native_controls = {
+    MoveForward: DefaultControl.MOVE_FORWARD,
+    MoveBackward: DefaultControl.MOVE_BACKWARD,
+    MoveRight: DefaultControl.MOVE_RIGHT,
+    MoveLeft: DefaultControl.MOVE_LEFT,
+    MoveUp: DefaultControl.MOVE_UP,
+    MoveDown: DefaultControl.MOVE_DOWN,
+    LookLeft: DefaultControl.LOOK_LEFT,
+    LookRight: DefaultControl.LOOK_RIGHT,
+    LookUp: DefaultControl.LOOK_UP,
+    LookDown: DefaultControl.LOOK_DOWN,
+}
+
+
+def native_control(move_fn: SceneNodeControl) -> Optional[DefaultControl]:
+    r"""The native implementation of a control, if it has one
+
+    :param move_fn: A control, as returned by `registry.get_move_fn()`
+    """
+    return _native_controls.get(type(move_fn))
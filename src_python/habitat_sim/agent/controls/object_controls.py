@@ -4,7 +4,7 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
-from typing import Callable, Tuple, Union
+from typing import Callable, Dict, List, Sequence, Tuple, Union
 
 import attr
 import magnum as mn
@@ -12,7 +12,11 @@ import numpy as np
 import quaternion  # noqa: F401
 
 from habitat_sim import bindings as hsim
+from habitat_sim._ext.habitat_sim_bindings import (
+    ObjectControls as _NativeObjectControls,
+)
 from habitat_sim.agent.controls.controls import ActuationSpec
+from habitat_sim.agent.controls.default_controls import native_control
 from habitat_sim.registry import registry
 
 # epislon used to deal with machine precision
@@ -24,12 +28,36 @@ def _noop_filter(start: _3d_point, end: _3d_point) -> _3d_point:
     return end
 
 
+@attr.s(auto_attribs=True, slots=True)
+class NavMeshMoveFilter:
+    r"""A move filter keeping moves on the navmesh of a pathfinder
+
+    :property pathfinder: The pathfinder. Moves are not filtered while it is
+        not loaded.
+    :property allow_sliding: Whether to use `PathFinder.try_step` or
+        `PathFinder.try_step_no_sliding`
+
+    `ObjectControls.action_batch()` applies this filter natively.
+    """
+
+    pathfinder: hsim.PathFinder
+    allow_sliding: bool = True
+
+    def __call__(self, start: _3d_point, end: _3d_point) -> _3d_point:
+        if not self.pathfinder.is_loaded:
+            return end
+        if self.allow_sliding:
+            return self.pathfinder.try_step(start, end)
+        return self.pathfinder.try_step_no_sliding(start, end)
+
+
 @attr.s(auto_attribs=True)
 class ObjectControls:
     r"""Used to implement actions
 
     :property move_filter_fn: A function that is applied after actions to
-        handle collisions
+        handle collisions. A `NavMeshMoveFilter` lets `action_batch()` filter
+        the moves natively.
     """
 
     move_filter_fn: Callable[[_3d_point, _3d_point], _3d_point] = attr.ib(
@@ -69,22 +97,106 @@ class ObjectControls:
         move_fn = registry.get_move_fn(action_name)
         assert move_fn is not None, f"No move_fn for action '{action_name}'"
         move_fn(obj, actuation_spec)
-        end_pos = obj.absolute_translation
 
         collided = False
         if apply_filter:
-            filter_end = self.move_filter_fn(start_pos, end_pos)
-            # Update the position to respect the filter
-            obj.translate(filter_end - end_pos)
-
-            dist_moved_before_filter = (end_pos - start_pos).dot()
-            dist_moved_after_filter = (filter_end - start_pos).dot()
-
-            # NB: There are some cases where ||filter_end - end_pos|| > 0 when a
-            # collision _didn't_ happen. One such case is going up stairs.  Instead,
-            # we check to see if the the amount moved after the application of the filter
-            # is _less_ the the amount moved before the application of the filter
-            collided = (dist_moved_after_filter + EPS) < dist_moved_before_filter
+            collided = self._filter_move(obj, start_pos)
+
+        return collided
+
+    def _filter_move(self, obj: hsim.SceneNode, start_pos: mn.Vector3) -> bool:
+        r"""Applies the `move_filter_fn` to the move of the object from
+        :p:`start_pos`, returning whether it collided
+        """
+        end_pos = obj.absolute_translation
+        filter_end = self.move_filter_fn(start_pos, end_pos)
+        # Update the position to respect the filter
+        obj.translate(filter_end - end_pos)
+
+        dist_moved_before_filter = (end_pos - start_pos).dot()
+        dist_moved_after_filter = (filter_end - start_pos).dot()
+
+        # NB: There are some cases where ||filter_end - end_pos|| > 0 when a
+        # collision _didn't_ happen. One such case is going up stairs.  Instead,
+        # we check to see if the the amount moved after the application of the filter
+        # is _less_ the the amount moved before the application of the filter
+        return (dist_moved_after_filter + EPS) < dist_moved_before_filter
+
+    def action_batch(
+        self,
+        objs: Sequence[hsim.SceneNode],
+        action_names: Sequence[str],
+        actuation_specs: Sequence[ActuationSpec],
+        apply_filter: Union[bool, Sequence[bool]] = True,
+    ) -> np.ndarray:
+        r"""Performs an action on each of several objects, see `action()`
+
+        :param objs: The objects to perform the actions on
+        :param action_names: The name of the action of each object
+        :param actuation_specs: The parameters of the action of each object
+        :param apply_filter: Whether or not to apply the `move_filter_fn`
+            after the action of each object
+        :return: Whether or not the action of each object resulted in a
+            collision
+
+        The default controls are applied in a single native call, which also
+        filters their moves when `move_filter_fn` is a `NavMeshMoveFilter`.
+        Other controls are applied once per action with
+        `SceneNodeControl.apply_batch()`.
+        """
+        num_objs = len(objs)
+        if isinstance(apply_filter, bool):
+            apply_filter = [apply_filter] * num_objs
+        if not (
+            len(action_names) == len(actuation_specs) == len(apply_filter) == num_objs
+        ):
+            raise ValueError(
+                f"Expected one action per object, got {num_objs} objects, "
+                f"{len(action_names)} actions, {len(actuation_specs)} "
+                f"actuation specs and {len(apply_filter)} filter flags"
+            )
+
+        filter_fn = self.move_filter_fn
+        native_filter = filter_fn is _noop_filter or isinstance(
+            filter_fn, NavMeshMoveFilter
+        )
+        collided = np.zeros(num_objs, dtype=bool)
+        native: List[int] = []
+        controls = []
+        others: Dict[str, List[int]] = {}
+        for i, (action_name, filtered) in enumerate(zip(action_names, apply_filter)):
+            move_fn = registry.get_move_fn(action_name)
+            assert move_fn is not None, f"No move_fn for action '{action_name}'"
+            control = native_control(move_fn)
+            if control is not None and (native_filter or not filtered):
+                native.append(i)
+                controls.append(control)
+            else:
+                others.setdefault(action_name, []).append(i)
+
+        for action_name, indices in others.items():
+            start_positions = [objs[i].absolute_translation for i in indices]
+            registry.get_move_fn(action_name).apply_batch(
+                [objs[i] for i in indices], [actuation_specs[i] for i in indices]
+            )
+            for i, start_pos in zip(indices, start_positions):
+                if apply_filter[i]:
+                    collided[i] = self._filter_move(objs[i], start_pos)
+
+        if len(native) > 0:
+            constraints = [actuation_specs[i].constraint for i in native]
+            collided[native] = _NativeObjectControls.apply_default_controls(
+                [objs[i] for i in native],
+                controls,
+                np.array([actuation_specs[i].amount for i in native], dtype=np.float32),
+                np.array(
+                    [np.nan if c is None else c for c in constraints],
+                    dtype=np.float32,
+                ),
+                np.array([apply_filter[i] for i in native], dtype=bool),
+                pathfinder=getattr(filter_fn, "pathfinder", None),
+                allow_sliding=getattr(filter_fn, "allow_sliding", True),
+            )
 
         return collided
 
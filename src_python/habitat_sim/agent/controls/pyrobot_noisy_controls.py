@@ -12,12 +12,12 @@ https://github.com/facebookresearch/pyrobot
 Please cite PyRobot if you use this noise model
 """
 
-from typing import Any, List, Optional, Sequence, Tuple
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Tuple
 
 import attr
 import magnum as mn
 import numpy as np
-import scipy.stats
+import scipy.special
 from attr import Attribute
 from numpy import ndarray
 
@@ -25,9 +25,20 @@ from habitat_sim import bindings as hsim
 from habitat_sim.agent.controls.controls import ActuationSpec, SceneNodeControl
 from habitat_sim.registry import registry
 
+_Truncation = Optional[List[Optional[Tuple[Optional[Any], Optional[Any]]]]]
+
 
 @attr.s(auto_attribs=True, init=False, slots=True)
 class _TruncatedMultivariateGaussian:
+    r"""A gaussian with diagonal covariance, truncated to 3 standard
+    deviations and optionally tighter bounds.
+
+    Samples are drawn by inverting the CDF of the truncated distribution on
+    uniform samples of :py:`np.random`, for all dimensions of all samples at
+    once, since drawing from `scipy.stats.truncnorm` has a high fixed cost
+    per call. The samples only depend on the state of :py:`np.random`, so
+    seeding it reproduces the noise.
+    """
     mean: np.ndarray
     cov: np.ndarray
 
@@ -41,32 +52,41 @@ class _TruncatedMultivariateGaussian:
             np.count_nonzero(self.cov - np.diag(np.diagonal(self.cov))) == 0
         ), "Only supports diagonal covariance"
 
-    def sample(
-        self,
-        truncation: Optional[
-            List[Optional[Tuple[Optional[Any], Optional[Any]]]]
-        ] = None,
-    ) -> ndarray:
+    def _bounds(self, truncation: _Truncation) -> Tuple[np.ndarray, np.ndarray]:
+        r"""The truncation of each dimension in standard deviations"""
         if truncation is not None:
             assert len(truncation) == len(self.mean)
 
-        sample = np.zeros_like(self.mean)
-        for i in range(len(self.mean)):
-            stdev = np.sqrt(self.cov[i, i])
-            mean = self.mean[i]
-            # Always truncate to 3 standard deviations
-            a, b = -3, 3
-
-            if truncation is not None and truncation[i] is not None:
-                trunc = truncation[i]
+        stdev = np.sqrt(np.diagonal(self.cov))
+        # Always truncate to 3 standard deviations
+        a = np.full(len(self.mean), -3.0)
+        b = np.full(len(self.mean), 3.0)
+        for i, trunc in enumerate(truncation or []):
+            if trunc is None:
+                continue
+            with np.errstate(divide="ignore", invalid="ignore"):
                 if trunc[0] is not None:
-                    a = max((trunc[0] - mean) / stdev, a)
+                    a[i] = max((trunc[0] - self.mean[i]) / stdev[i], a[i])
                 if trunc[1] is not None:
-                    b = min((trunc[1] - mean) / stdev, b)
+                    b[i] = min((trunc[1] - self.mean[i]) / stdev[i], b[i])
+        return a, b
+
+    def sample(self, truncation: _Truncation = None) -> ndarray:
+        return self.sample_batch(1, truncation)[0]
 
-            sample[i] = scipy.stats.truncnorm.rvs(a, b, mean, stdev)
+    def sample_batch(self, num_samples: int, truncation: _Truncation = None) -> ndarray:
+        r"""Draws :p:`num_samples` samples with the same truncation
 
-        return sample
+        :return: A :py:`(num_samples, len(mean))` array
+        """
+        a, b = self._bounds(truncation)
+        cdf_a = scipy.special.ndtr(a)
+        cdf_b = scipy.special.ndtr(b)
+        uniform = np.random.random_sample((num_samples, len(self.mean)))
+        standard = scipy.special.ndtri(cdf_a + uniform * (cdf_b - cdf_a))
+        # ndtri(ndtr(x)) may round slightly outside of the bounds
+        standard = np.clip(standard, a, b)
+        return self.mean + standard * np.sqrt(np.diagonal(self.cov))
 
 
 @attr.s(auto_attribs=True, slots=True)
@@ -201,122 +221,122 @@ _Z_AXIS = 2
 
 
 def _noisy_action_impl(
-    scene_node: hsim.SceneNode,
+    scene_nodes: Sequence[hsim.SceneNode],
     translate_amount: float,
     rotate_amount: float,
     multiplier: float,
     model: MotionNoiseModel,
     motion_type: str,
 ) -> None:
-    # Perform the action in the coordinate system of the node
-    transform = scene_node.transformation
-    move_ax = -transform[_Z_AXIS].xyz
-    perp_ax = transform[_X_AXIS].xyz
-
+    num_nodes = len(scene_nodes)
     if motion_type == "rotational":
-        translation_noise = multiplier * model.linear.sample()
+        translation_noise = multiplier * model.linear.sample_batch(num_nodes)
     else:
         # The robot will always move a little bit.  This has to be defined based on the intended actuation
         # as otherwise small rotation amounts would be invalid.  However, pretty quickly, we'll
         # get to the truncation of 3 sigma
         trunc = [(-0.95 * np.abs(translate_amount), None), None]
 
-        translation_noise = multiplier * model.linear.sample(trunc)
+        translation_noise = multiplier * model.linear.sample_batch(num_nodes, trunc)
 
     # + EPS to make sure 0 is positive.  We multiply by the sign of the translation
     # as otherwise forward would overshoot on average and backward would undershoot, while
     # both should overshoot
     translation_noise *= np.sign(translate_amount + 1e-8)
 
-    scene_node.translate_local(
-        move_ax * (translate_amount + translation_noise[0])
-        + perp_ax * translation_noise[1]
-    )
-
     if motion_type == "linear":
-        rot_noise = multiplier * model.rotation.sample()
+        rot_noise = multiplier * model.rotation.sample_batch(num_nodes)
     else:
         # The robot will always turn a little bit.  This has to be defined based on the intended actuation
         # as otherwise small rotation amounts would be invalid.  However, pretty quickly, we'll
         # get to the truncation of 3 sigma
         trunc = [(-0.95 * np.abs(np.deg2rad(rotate_amount)), None)]
 
-        rot_noise = multiplier * model.rotation.sample(trunc)
+        rot_noise = multiplier * model.rotation.sample_batch(num_nodes, trunc)
 
     # Same deal with rotation about + EPS and why we multiply by the sign
     rot_noise *= np.sign(rotate_amount + 1e-8)
 
-    scene_node.rotate_y_local(mn.Deg(rotate_amount) + mn.Rad(rot_noise))
-    scene_node.rotation = scene_node.rotation.normalized()
+    for scene_node, node_translation_noise, node_rot_noise in zip(
+        scene_nodes, translation_noise, rot_noise
+    ):
+        # Perform the action in the coordinate system of the node
+        transform = scene_node.transformation
+        move_ax = -transform[_Z_AXIS].xyz
+        perp_ax = transform[_X_AXIS].xyz
+
+        scene_node.translate_local(
+            move_ax * (translate_amount + node_translation_noise[0])
+            + perp_ax * node_translation_noise[1]
+        )
+        scene_node.rotate_y_local(
+            mn.Deg(rotate_amount) + mn.Rad(float(node_rot_noise[0]))
+        )
+        scene_node.rotation = scene_node.rotation.normalized()
 
 
-@registry.register_move_fn(body_action=True)
-class PyrobotNoisyMoveBackward(SceneNodeControl):
+@attr.s(auto_attribs=True)
+class _PyrobotNoisyControl(SceneNodeControl):
+    r"""Base of the PyRobot noisy controls, moving or turning by the amount
+    of the actuation spec times :py:`_translate_sign` or
+    :py:`_rotate_sign`
+    """
+
+    _translate_sign: ClassVar[float] = 0.0
+    _rotate_sign: ClassVar[float] = 0.0
+    _motion_type: ClassVar[str] = "linear"
+
     def __call__(
         self, scene_node: hsim.SceneNode, actuation_spec: ActuationSpec
     ) -> None:
-        assert isinstance(actuation_spec, PyRobotNoisyActuationSpec)
-        _noisy_action_impl(
-            scene_node,
-            -actuation_spec.amount,
-            0.0,
-            actuation_spec.noise_multiplier,
-            pyrobot_noise_models[actuation_spec.robot][
-                actuation_spec.controller
-            ].linear_motion,
-            "linear",
-        )
+        self.apply_batch([scene_node], [actuation_spec])
+
+    def apply_batch(
+        self,
+        scene_nodes: Sequence[hsim.SceneNode],
+        actuation_specs: Sequence[ActuationSpec],
+    ) -> None:
+        # The noise of the nodes with the same parameters is sampled at once
+        groups: Dict[Tuple[str, str, float, float], List[hsim.SceneNode]] = {}
+        for scene_node, actuation_spec in zip(scene_nodes, actuation_specs):
+            assert isinstance(actuation_spec, PyRobotNoisyActuationSpec)
+            key = (
+                actuation_spec.robot,
+                actuation_spec.controller,
+                actuation_spec.noise_multiplier,
+                actuation_spec.amount,
+            )
+            groups.setdefault(key, []).append(scene_node)
+
+        for (robot, controller, multiplier, amount), nodes in groups.items():
+            controller_model = pyrobot_noise_models[robot][controller]
+            _noisy_action_impl(
+                nodes,
+                self._translate_sign * amount,
+                self._rotate_sign * amount,
+                multiplier,
+                getattr(controller_model, f"{self._motion_type}_motion"),
+                self._motion_type,
+            )
 
 
 @registry.register_move_fn(body_action=True)
-class PyrobotNoisyMoveForward(SceneNodeControl):
-    def __call__(
-        self, scene_node: hsim.SceneNode, actuation_spec: ActuationSpec
-    ) -> None:
-        assert isinstance(actuation_spec, PyRobotNoisyActuationSpec)
-        _noisy_action_impl(
-            scene_node,
-            actuation_spec.amount,
-            0.0,
-            actuation_spec.noise_multiplier,
-            pyrobot_noise_models[actuation_spec.robot][
-                actuation_spec.controller
-            ].linear_motion,
-            "linear",
-        )
+class PyrobotNoisyMoveBackward(_PyrobotNoisyControl):
+    _translate_sign = -1.0
 
 
 @registry.register_move_fn(body_action=True)
-class PyrobotNoisyTurnLeft(SceneNodeControl):
-    def __call__(
-        self, scene_node: hsim.SceneNode, actuation_spec: ActuationSpec
-    ) -> None:
-        assert isinstance(actuation_spec, PyRobotNoisyActuationSpec)
-        _noisy_action_impl(
-            scene_node,
-            0.0,
-            actuation_spec.amount,
-            actuation_spec.noise_multiplier,
-            pyrobot_noise_models[actuation_spec.robot][
-                actuation_spec.controller
-            ].rotational_motion,
-            "rotational",
-        )
+class PyrobotNoisyMoveForward(_PyrobotNoisyControl):
+    _translate_sign = 1.0
 
 
 @registry.register_move_fn(body_action=True)
-class PyrobotNoisyTurnRight(SceneNodeControl):
-    def __call__(
-        self, scene_node: hsim.SceneNode, actuation_spec: ActuationSpec
-    ) -> None:
-        assert isinstance(actuation_spec, PyRobotNoisyActuationSpec)
-        _noisy_action_impl(
-            scene_node,
-            0.0,
-            -actuation_spec.amount,
-            actuation_spec.noise_multiplier,
-            pyrobot_noise_models[actuation_spec.robot][
-                actuation_spec.controller
-            ].rotational_motion,
-            "rotational",
-        )
+class PyrobotNoisyTurnLeft(_PyrobotNoisyControl):
+    _rotate_sign = 1.0
+    _motion_type = "rotational"
+
+
+@registry.register_move_fn(body_action=True)
+class PyrobotNoisyTurnRight(_PyrobotNoisyControl):
+    _rotate_sign = -1.0
+    _motion_type = "rotational"
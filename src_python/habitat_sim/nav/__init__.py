@@ -3,26 +3,43 @@
 # LICENSE file in the root directory of this source tree.
 
 from habitat_sim._ext.habitat_sim_bindings import (
+    BatchGreedyGeodesicFollowerImpl,
+    EpisodeSamplingSettings,
+    GeodesicDistanceField,
     GreedyFollowerCodes,
     GreedyGeodesicFollowerImpl,
     HitRecord,
     MultiGoalShortestPath,
+    NavMeshCache,
     NavMeshSettings,
     PathFinder,
+    SampledEpisodes,
     ShortestPath,
     VectorGreedyCodes,
 )
 
-from .greedy_geodesic_follower import GreedyGeodesicFollower
+from .episode_generation import generate_episodes, save_episodes
+from .greedy_geodesic_follower import (
+    BatchGreedyGeodesicFollower,
+    GreedyGeodesicFollower,
+)
 
 __all__ = [
+    "BatchGreedyGeodesicFollower",
+    "BatchGreedyGeodesicFollowerImpl",
+    "EpisodeSamplingSettings",
+    "GeodesicDistanceField",
     "GreedyGeodesicFollower",
     "GreedyGeodesicFollowerImpl",
     "GreedyFollowerCodes",
     "MultiGoalShortestPath",
+    "NavMeshCache",
     "NavMeshSettings",
     "PathFinder",
+    "SampledEpisodes",
     "ShortestPath",
     "HitRecord",
     "VectorGreedyCodes",
+    "generate_episodes",
+    "save_episodes",
 ]
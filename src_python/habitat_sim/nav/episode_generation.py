@@ -0,0 +1,140 @@
+# Copyright (c) Meta Platforms, Inc. and its affiliates.
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import gzip
+import json
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from habitat_sim.nav import EpisodeSamplingSettings, PathFinder, SampledEpisodes
+
+
+def generate_episodes(
+    pathfinder: PathFinder,
+    num_episodes: int,
+    settings: Optional[EpisodeSamplingSettings] = None,
+    *,
+    seed: int = 0,
+    num_threads: int = 0,
+    chunk_size: int = 10000,
+) -> Iterator[SampledEpisodes]:
+    r"""Samples point navigation episodes natively, in chunks
+
+    :param pathfinder: The pathfinder of the scene, with its navmesh loaded
+    :param num_episodes: The number of episodes to sample
+    :param settings: The constraints on the episodes, defaults to
+        `EpisodeSamplingSettings()`
+    :param seed: Seed of the episodes. The same seed gives the same episodes
+        whatever :p:`num_threads` is.
+    :param num_threads: The number of threads sampling each chunk, all hardware
+        threads if less than 1
+    :param chunk_size: The number of episodes sampled per call to
+        `PathFinder.sample_episodes()`
+    :return: The episodes of each chunk. Episodes that ran out of tries are
+        left out, so chunks may be smaller than :p:`chunk_size`.
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    if settings is None:
+        settings = EpisodeSamplingSettings()
+    return _generate_chunks(
+        pathfinder, num_episodes, settings, seed, num_threads, chunk_size
+    )
+
+
+def _generate_chunks(
+    pathfinder: PathFinder,
+    num_episodes: int,
+    settings: EpisodeSamplingSettings,
+    seed: int,
+    num_threads: int,
+    chunk_size: int,
+) -> Iterator[SampledEpisodes]:
+    num_chunks = -(-num_episodes // chunk_size)
+    # Independent seeds, so that chunks don't share random streams
+    chunk_seeds = np.random.SeedSequence(seed).generate_state(num_chunks)
+    for chunk, chunk_seed in enumerate(chunk_seeds):
+        yield pathfinder.sample_episodes(
+            min(chunk_size, num_episodes - chunk * chunk_size),
+            settings,
+            int(chunk_seed),
+            num_threads,
+        )
+
+
+def save_episodes(
+    path: str,
+    episodes: Iterable[SampledEpisodes],
+    scene_id: str = "",
+    *,
+    seed: int = 0,
+    goal_radius: Optional[float] = None,
+) -> int:
+    r"""Writes sampled episodes to a compressed file
+
+    :param path: The file to write. A ``.json.gz`` file uses the point
+        navigation dataset format, episodes starting with a random heading,
+        and is written chunk by chunk as the episodes come in. Any other file
+        is written with `numpy.savez_compressed()`, with the ``starts``,
+        ``goals``, ``geodesic_distances`` and ``islands`` arrays, once all the
+        chunks have been gathered.
+    :param episodes: The episodes, e.g. from `generate_episodes()`
+    :param scene_id: The scene of the episodes
+    :param seed: Seed of the start headings of ``.json.gz`` files
+    :param goal_radius: The goal radius of ``.json.gz`` files
+    :return: The number of episodes written
+    """
+    if not path.endswith(".json.gz"):
+        chunks = list(episodes)
+
+        def _concatenate(name: str, empty: np.ndarray) -> np.ndarray:
+            return np.concatenate([empty] + [getattr(c, name) for c in chunks])
+
+        np.savez_compressed(
+            path,
+            starts=_concatenate("starts", np.empty((0, 3), dtype=np.float32)),
+            goals=_concatenate("goals", np.empty((0, 3), dtype=np.float32)),
+            geodesic_distances=_concatenate(
+                "geodesic_distances", np.empty(0, dtype=np.float32)
+            ),
+            islands=_concatenate("islands", np.empty(0, dtype=np.int32)),
+            scene_id=scene_id,
+        )
+        return sum(len(c) for c in chunks)
+
+    rng = np.random.default_rng(seed)
+    num_written = 0
+    with gzip.open(path, "wt") as f:
+        f.write('{"episodes": [')
+        for chunk in episodes:
+            headings = rng.uniform(0, 2 * np.pi, size=len(chunk))
+            for start, goal, geodesic_distance, heading in zip(
+                chunk.starts.tolist(),
+                chunk.goals.tolist(),
+                chunk.geodesic_distances.tolist(),
+                headings,
+            ):
+                if num_written > 0:
+                    f.write(", ")
+                json.dump(
+                    {
+                        "episode_id": str(num_written),
+                        "scene_id": scene_id,
+                        "start_position": start,
+                        # [x, y, z, w] rotation about the up axis
+                        "start_rotation": [
+                            0.0,
+                            float(np.sin(heading / 2)),
+                            0.0,
+                            float(np.cos(heading / 2)),
+                        ],
+                        "info": {"geodesic_distance": geodesic_distance},
+                        "goals": [{"position": goal, "radius": goal_radius}],
+                    },
+                    f,
+                )
+                num_written += 1
+        f.write("]}")
+    return num_written
@@ -8,12 +8,77 @@ import attr
 import numpy as np
 
 from habitat_sim import errors, scene
-from habitat_sim.agent.agent import Agent
+from habitat_sim._ext.habitat_sim_bindings import DefaultControl
+from habitat_sim.agent.agent import Agent, AgentStates
+from habitat_sim.agent.controls import NavMeshMoveFilter
 from habitat_sim.agent.controls.controls import ActuationSpec
-from habitat_sim.nav import GreedyFollowerCodes, GreedyGeodesicFollowerImpl, PathFinder
+from habitat_sim.agent.controls.default_controls import native_control
+from habitat_sim.nav import (
+    BatchGreedyGeodesicFollowerImpl,
+    GreedyFollowerCodes,
+    GreedyGeodesicFollowerImpl,
+    PathFinder,
+)
+from habitat_sim.registry import registry
 from habitat_sim.utils.common import quat_to_magnum
 
 
+def _find_action(agent: Agent, name: str) -> Tuple[str, ActuationSpec]:
+    candidates = list(
+        filter(
+            lambda kv: kv[1].name == name,
+            agent.agent_config.action_space.items(),
+        )
+    )
+
+    assert (
+        len(candidates) == 1
+    ), f"Could not find an action spec corresponding to {name}"
+
+    return candidates[0][0], candidates[0][1].actuation
+
+
+def _native_allow_sliding(
+    pathfinder: PathFinder,
+    agent: Agent,
+    forward_spec: ActuationSpec,
+    left_spec: ActuationSpec,
+    right_spec: ActuationSpec,
+) -> Optional[bool]:
+    r"""Whether the moves of the agent slide along walls, or :py:`None` if the
+    native follower cannot reproduce them
+
+    Only the default controls, filtered on the navmesh of this pathfinder, are
+    executed natively.
+    """
+    move_filter = agent.controls.move_filter_fn
+    if (
+        not isinstance(move_filter, NavMeshMoveFilter)
+        or move_filter.pathfinder is not pathfinder
+    ):
+        return None
+
+    controls = [
+        native_control(registry.get_move_fn(name))
+        for name in ("move_forward", "turn_left", "turn_right")
+    ]
+    if controls != [
+        DefaultControl.MOVE_FORWARD,
+        DefaultControl.LOOK_LEFT,
+        DefaultControl.LOOK_RIGHT,
+    ]:
+        return None
+
+    if (
+        left_spec.amount != right_spec.amount
+        or left_spec.constraint is not None
+        or right_spec.constraint is not None
+    ):
+        return None
+
+    return move_filter.allow_sliding
+
+
 @attr.s(auto_attribs=True, init=False)
 class GreedyGeodesicFollower:
     r"""Planner that greedily fits actions to follow the geodesic shortest path.
@@ -110,31 +175,40 @@ class GreedyGeodesicFollower:
             0.75 * self.forward_spec.amount if goal_radius is None else goal_radius
         )
 
-        self.impl = GreedyGeodesicFollowerImpl(
+        # The default controls are executed natively, saving a round trip
+        # through python for each move tried while planning
+        allow_sliding = _native_allow_sliding(
             self.pathfinder,
-            self._move_forward,
-            self._turn_left,
-            self._turn_right,
-            self.goal_radius,
-            self.forward_spec.amount,
-            np.deg2rad(self.left_spec.amount),
-            fix_thrashing,
-            thrashing_threshold,
+            self.agent,
+            self.forward_spec,
+            self.left_spec,
+            self.right_spec,
         )
-
-    def _find_action(self, name: str) -> Tuple[str, ActuationSpec]:
-        candidates = list(
-            filter(
-                lambda kv: kv[1].name == name,
-                self.agent.agent_config.action_space.items(),
+        if allow_sliding is not None:
+            self.impl = GreedyGeodesicFollowerImpl(
+                self.pathfinder,
+                self.goal_radius,
+                self.forward_spec.amount,
+                np.deg2rad(self.left_spec.amount),
+                allow_sliding,
+                fix_thrashing,
+                thrashing_threshold,
+            )
+        else:
+            self.impl = GreedyGeodesicFollowerImpl(
+                self.pathfinder,
+                self._move_forward,
+                self._turn_left,
+                self._turn_right,
+                self.goal_radius,
+                self.forward_spec.amount,
+                np.deg2rad(self.left_spec.amount),
+                fix_thrashing,
+                thrashing_threshold,
             )
-        )
-
-        assert (
-            len(candidates) == 1
-        ), f"Could not find an action spec corresponding to {name}"
 
-        return candidates[0][0], candidates[0][1].actuation
+    def _find_action(self, name: str) -> Tuple[str, ActuationSpec]:
+        return _find_action(self.agent, name)
 
     def _move_forward(self, obj: scene.SceneNode) -> bool:
         return self.agent.controls(obj, "move_forward", self.forward_spec, True)
@@ -198,3 +272,133 @@ class GreedyGeodesicFollower:
     def reset(self) -> None:
         self.impl.reset()
         self.last_goal = None
+
+
+@attr.s(auto_attribs=True, init=False)
+class BatchGreedyGeodesicFollower:
+    r"""`GreedyGeodesicFollower` for many agents at once
+
+    All agents share the action space of a template agent, whose
+    ``move_forward``, ``turn_left`` and ``turn_right`` actions must be the
+    default controls filtered by a `NavMeshMoveFilter` on :py:`pathfinder`, as
+    set up by the simulator. Planning happens natively for the whole batch,
+    with agent states passed as `AgentStates`.
+    """
+
+    pathfinder: PathFinder
+    num_agents: int
+    goal_radius: float
+    action_mapping: Dict[GreedyFollowerCodes, Any]
+    impl: BatchGreedyGeodesicFollowerImpl
+    forward_spec: ActuationSpec
+    turn_spec: ActuationSpec
+
+    def __init__(
+        self,
+        pathfinder: PathFinder,
+        agent: Agent,
+        num_agents: int,
+        goal_radius: Optional[float] = None,
+        *,
+        stop_key: Optional[Any] = None,
+        forward_key: Optional[Any] = None,
+        left_key: Optional[Any] = None,
+        right_key: Optional[Any] = None,
+        fix_thrashing: bool = True,
+        thrashing_threshold: int = 16,
+    ) -> None:
+        r"""Constructor
+
+        :param pathfinder: Instance of the pathfinder that has the correct
+            navmesh already loaded
+        :param agent: Agent whose configuration specifies the actions of all
+            agents
+        :param num_agents: The number of agents followed by
+            `next_actions_along()`
+
+        See `GreedyGeodesicFollower` for the other parameters.
+        """
+        self.pathfinder = pathfinder
+        self.num_agents = num_agents
+
+        forward_name, self.forward_spec = _find_action(agent, "move_forward")
+        left_name, self.turn_spec = _find_action(agent, "turn_left")
+        right_name, right_spec = _find_action(agent, "turn_right")
+
+        allow_sliding = _native_allow_sliding(
+            pathfinder, agent, self.forward_spec, self.turn_spec, right_spec
+        )
+        assert (
+            allow_sliding is not None
+        ), "The batch follower requires the default controls filtered on the navmesh of the pathfinder"
+
+        self.action_mapping = {
+            GreedyFollowerCodes.STOP: stop_key,
+            GreedyFollowerCodes.FORWARD: (
+                forward_name if forward_key is None else forward_key
+            ),
+            GreedyFollowerCodes.LEFT: left_name if left_key is None else left_key,
+            GreedyFollowerCodes.RIGHT: right_name if right_key is None else right_key,
+        }
+
+        self.goal_radius = (
+            0.75 * self.forward_spec.amount if goal_radius is None else goal_radius
+        )
+
+        self.impl = BatchGreedyGeodesicFollowerImpl(
+            pathfinder,
+            num_agents,
+            self.goal_radius,
+            self.forward_spec.amount,
+            np.deg2rad(self.turn_spec.amount),
+            allow_sliding,
+            fix_thrashing,
+            thrashing_threshold,
+        )
+
+    def next_actions_along(self, states: AgentStates, goals: np.ndarray) -> List[Any]:
+        r"""Find the next action of each agent to greedily follow the geodesic
+        shortest path to its goal
+
+        :param states: The state of each agent
+        :param goals: :py:`(num_agents, 3)` goal of each agent. The follower of
+            an agent is reset whenever its goal changes.
+        :return: The action each agent should take
+        """
+        codes = self.impl.next_actions_along(
+            states.rotations, states.positions, np.asarray(goals, dtype=np.float32)
+        )
+
+        failed = np.flatnonzero(codes == int(GreedyFollowerCodes.ERROR))
+        if len(failed) > 0:
+            raise errors.GreedyFollowerError(
+                f"No path to the goal for agents {failed.tolist()}"
+            )
+        return [self.action_mapping[GreedyFollowerCodes(c)] for c in codes]
+
+    def find_paths(
+        self, states: AgentStates, goals: np.ndarray
+    ) -> List[Optional[List[Any]]]:
+        r"""Finds the sequence of actions from each state to its goal
+
+        :param states: The start states, any number of them
+        :param goals: :py:`(len(states), 3)` goal of each state
+        :return: The list of actions of each state, ending with the stop key,
+            or :py:`None` if there is no path to the goal
+
+        Has the same caveats as `GreedyGeodesicFollower.find_path()`.
+        """
+        paths = self.impl.find_paths(
+            states.rotations, states.positions, np.asarray(goals, dtype=np.float32)
+        )
+        return [
+            [self.action_mapping[v] for v in path] if len(path) > 0 else None
+            for path in paths
+        ]
+
+    def reset(self, agent_index: Optional[int] = None) -> None:
+        r"""Reset the followers of all agents, or only of :p:`agent_index`"""
+        if agent_index is None:
+            self.impl.reset()
+        else:
+            self.impl.reset(agent_index)
@@ -4,6 +4,7 @@
 
 from habitat_sim._ext.habitat_sim_bindings import (
     ArticulatedObjectManager,
+    BatchRaycastResults,
     CollisionGroupHelper,
     CollisionGroups,
     ContactPointData,
@@ -16,11 +17,13 @@ from habitat_sim._ext.habitat_sim_bindings import (
     ManagedRigidObject,
     MotionType,
     PhysicsSimulationLibrary,
+    PhysicsSnapshot,
     RaycastResults,
     RayHitInfo,
     RigidConstraintSettings,
     RigidConstraintType,
     RigidObjectManager,
+    RigidObjectStates,
     VelocityControl,
 )
 
@@ -30,12 +33,15 @@ __all__ = [
     "ManagedArticulatedObject",
     "ManagedBulletArticulatedObject",
     "RigidObjectManager",
+    "RigidObjectStates",
     "ArticulatedObjectManager",
     "PhysicsSimulationLibrary",
+    "PhysicsSnapshot",
     "MotionType",
     "VelocityControl",
     "RayHitInfo",
     "RaycastResults",
+    "BatchRaycastResults",
     "ContactPointData",
     "CollisionGroups",
     "CollisionGroupHelper",
@@ -4,50 +4,148 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import math
+from typing import Optional, Sequence
+
 import attr
+import numba
 import numpy as np
 from numpy import ndarray
 
 from habitat_sim.registry import registry
 from habitat_sim.sensor import SensorType
-from habitat_sim.sensors.noise_models.sensor_noise_model import SensorNoiseModel
-
-
-def _simulate(image: ndarray) -> ndarray:
-    image = image / 255.0
-
-    values = len(np.unique(image))
-    values = 2 ** np.ceil(np.log2(values))
-
-    noisy = np.random.poisson(image * values) / float(values)
-    noisy_rgb = np.clip(noisy, 0, 1)
-    noisy_rgb = (noisy_rgb * 255).astype(np.uint8)
-
-    return noisy_rgb
+from habitat_sim.sensors.noise_models.random_stream import (
+    RandomStream,
+    next_frames,
+    uniforms,
+)
+from habitat_sim.sensors.noise_models.sensor_noise_model import (
+    SensorNoiseModel,
+    check_output_buffer,
+)
+
+_GUIDE_SIZE = 256
+
+
+@numba.jit(nopython=True)
+def _count_values(image):
+    # Number of distinct uint8 values, a histogram is much cheaper than
+    # sorting the image with np.unique
+    H, W, C = image.shape
+    seen = np.zeros(256, dtype=np.bool_)
+    for j in range(H):
+        for i in range(W):
+            for c in range(C):
+                seen[image[j, i, c]] = True
+    return seen.sum()
+
+
+@numba.jit(nopython=True)
+def _inverse_cdfs(values, cdfs, guides, levels):
+    # Per image and pixel value, the CDF of the Poisson counts, inverted with
+    # a single uniform per element. Counts of at least the number of values
+    # all saturate, so the CDF stops there with an entry above any uniform
+    for b in range(len(values)):
+        n = int(values[b])
+        for v in range(256):
+            lam = v * values[b] / 255.0
+            p = math.exp(-lam)
+            cdf = p
+            for k in range(n):
+                cdfs[b, v, k] = cdf
+                p *= lam / (k + 1)
+                cdf += p
+            cdfs[b, v, n:] = 2.0
+            # The first count whose CDF reaches g / G, where the search for
+            # a uniform in [g / G, (g + 1) / G) starts
+            k = 0
+            for g in range(_GUIDE_SIZE):
+                while cdfs[b, v, k] < g / _GUIDE_SIZE:
+                    k += 1
+                guides[b, v, g] = k
+        for k in range(n + 1):
+            levels[b, k] = np.uint8(k / values[b] * 255.0)
+
+
+@numba.jit(nopython=True, parallel=True, fastmath=True)
+def _simulate(images, cdfs, guides, levels, out, frames, k0s, k1s):
+    B, H, W, C = images.shape
+
+    for bj in numba.prange(B * H):
+        b = bj // H
+        j = bj % H
+        for i in range(W):
+            for c in range(C):
+                if c % 4 == 0:
+                    u = uniforms(j * W + i, c // 4, frames[b], k0s[b], k1s[b])
+                v = images[b, j, i, c]
+                k = guides[b, v, int(u[c % 4] * _GUIDE_SIZE)]
+                while cdfs[b, v, k] < u[c % 4]:
+                    k += 1
+                out[b, j, i, c] = levels[b, k]
+
+    return out
 
 
 @attr.s(auto_attribs=True, slots=True)
 class PoissonNoiseModelCPUImpl:
-    @staticmethod
-    def simulate(image: ndarray) -> ndarray:
-        return _simulate(image)
+    rng: RandomStream = attr.Factory(RandomStream)
+
+    def simulate(self, image: ndarray, out: Optional[ndarray] = None) -> ndarray:
+        out = check_output_buffer(image, out)
+        self.simulate_batch(image[None], out[None])
+        return out
+
+    def simulate_batch(
+        self,
+        images: ndarray,
+        out: Optional[ndarray] = None,
+        rngs: Optional[Sequence[RandomStream]] = None,
+    ) -> ndarray:
+        out = check_output_buffer(images, out)
+        values = 2.0 ** np.ceil(
+            np.log2([_count_values(image) for image in images], dtype=np.float64)
+        )
+        cdfs = np.empty((len(images), 256, int(values.max()) + 1), dtype=np.float64)
+        guides = np.empty((len(images), 256, _GUIDE_SIZE), dtype=np.int16)
+        levels = np.empty((len(images), cdfs.shape[2]), dtype=np.uint8)
+        _inverse_cdfs(values, cdfs, guides, levels)
+        _, frames, k0s, k1s = next_frames(rngs or self.rng, len(images))
+        return _simulate(images, cdfs, guides, levels, out, frames, k0s, k1s)
 
 
 @registry.register_noise_model
 @attr.s(auto_attribs=True, kw_only=True, slots=True)
 class PoissonNoiseModel(SensorNoiseModel):
+    supports_out_buffer = True
+    supports_batch = True
+
     _impl: PoissonNoiseModelCPUImpl = None
 
     def __attrs_post_init__(self) -> None:
-        self._impl = PoissonNoiseModelCPUImpl()
+        self._impl = PoissonNoiseModelCPUImpl(self.rng)
 
     @staticmethod
     def is_valid_sensor_type(sensor_type: SensorType) -> bool:
         return sensor_type == SensorType.COLOR
 
-    def simulate(self, image: ndarray) -> ndarray:
-        return self._impl.simulate(image)
+    def simulate(self, image: ndarray, out: Optional[ndarray] = None) -> ndarray:
+        r"""Applies the noise to a uint8 image
+
+        :param image: The clean image
+        :param out: Optional buffer receiving the noisy image, see
+            `check_output_buffer()`
+        """
+        return self._impl.simulate(image, out)
 
-    def apply(self, image: ndarray) -> ndarray:
+    def apply(self, image: ndarray, out: Optional[ndarray] = None) -> ndarray:
         r"""Alias of `simulate()` to conform to base-class and expected API"""
-        return self.simulate(image)
+        return self.simulate(image, out)
+
+    def apply_batch(
+        self,
+        images: ndarray,
+        out: Optional[ndarray] = None,
+        rngs: Optional[Sequence[RandomStream]] = None,
+    ) -> ndarray:
+        return self._impl.simulate_batch(images, out, rngs)
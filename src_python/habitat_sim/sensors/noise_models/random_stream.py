@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+
+# Copyright (c) Meta Platforms, Inc. and its affiliates.
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+r"""Counter-based random numbers for the noise model kernels.
+
+Numbers are generated with Philox4x32-10 (Salmon et al., "Parallel Random
+Numbers: As Easy as 1, 2, 3", SC 2011). Every call maps a counter of four
+32-bit words and a 64-bit key to four independent 32-bit words, so a kernel
+can draw the random numbers of any element directly from the element index
+without sharing generator state between threads. The results only depend on
+the key and the counters, so they are reproducible regardless of how the work
+is split across threads.
+"""
+
+import hashlib
+import math
+from collections import deque
+from typing import Deque, Optional, Sequence, Tuple, Union
+
+import attr
+import numba
+import numpy as np
+
+_MASK32 = np.uint64(0xFFFFFFFF)
+_SHIFT32 = np.uint64(32)
+_PHILOX_M0 = np.uint64(0xD2511F53)
+_PHILOX_M1 = np.uint64(0xCD9E8D57)
+_PHILOX_W0 = np.uint64(0x9E3779B9)
+_PHILOX_W1 = np.uint64(0xBB67AE85)
+_UNIFORM_SCALE = np.float32(1.0 / (1 << 23))
+_TWO_PI = np.float32(2.0 * math.pi)
+
+
+@numba.jit(nopython=True)
+def philox4x32(c0, c1, c2, c3, k0, k1):
+    r"""Philox4x32-10 bijection of the counter (c0, c1, c2, c3) under the key
+    (k0, k1). All values are 32-bit words held in integers.
+    """
+    c0 = np.uint64(c0)
+    c1 = np.uint64(c1)
+    c2 = np.uint64(c2)
+    c3 = np.uint64(c3)
+    k0 = np.uint64(k0)
+    k1 = np.uint64(k1)
+    for _ in range(10):
+        p0 = _PHILOX_M0 * c0
+        p1 = _PHILOX_M1 * c2
+        c0, c1, c2, c3 = (
+            ((p1 >> _SHIFT32) ^ c1 ^ k0) & _MASK32,
+            p1 & _MASK32,
+            ((p0 >> _SHIFT32) ^ c3 ^ k1) & _MASK32,
+            p0 & _MASK32,
+        )
+        k0 = (k0 + _PHILOX_W0) & _MASK32
+        k1 = (k1 + _PHILOX_W1) & _MASK32
+    return c0, c1, c2, c3
+
+
+@numba.jit(nopython=True, fastmath=True)
+def uniform(word):
+    r"""Maps a 32-bit word to a float32 in the open interval (0, 1)."""
+    # 23 bits keep (2^23 - 0.5) / 2^23 exactly representable below 1
+    return (np.float32(np.uint64(word) >> np.uint64(9)) + np.float32(0.5)) * (
+        _UNIFORM_SCALE
+    )
+
+
+@numba.jit(nopython=True, fastmath=True)
+def uniforms(element, draw, frame, k0, k1):
+    r"""Four float32 uniforms in (0, 1) for the draw-th block of an element."""
+    w0, w1, w2, w3 = philox4x32(
+        element, draw, np.uint64(frame) & _MASK32, np.uint64(frame) >> _SHIFT32, k0, k1
+    )
+    return uniform(w0), uniform(w1), uniform(w2), uniform(w3)
+
+
+@numba.jit(nopython=True, fastmath=True)
+def normals(element, draw, frame, k0, k1):
+    r"""Four float32 standard normals for the draw-th block of an element,
+    using the Box-Muller transform.
+    """
+    u0, u1, u2, u3 = uniforms(element, draw, frame, k0, k1)
+    r0 = np.sqrt(np.float32(-2.0) * np.log(u0))
+    r1 = np.sqrt(np.float32(-2.0) * np.log(u2))
+    return (
+        r0 * np.cos(_TWO_PI * u1),
+        r0 * np.sin(_TWO_PI * u1),
+        r1 * np.cos(_TWO_PI * u3),
+        r1 * np.sin(_TWO_PI * u3),
+    )
+
+
+@numba.jit(nopython=True, fastmath=True)
+def poisson(lam, element, frame, k0, k1):
+    r"""A Poisson distributed sample with mean lam for an element.
+
+    Uses multiplication of uniforms for small means and the transformed
+    rejection method with squeeze (PTRS, Hörmann 1993) otherwise, as NumPy
+    does.
+    """
+    if lam <= 0.0:
+        return 0
+
+    draw = 0
+    if lam < 10.0:
+        limit = math.exp(-lam)
+        k = 0
+        prod = 1.0
+        while True:
+            u0, u1, u2, u3 = uniforms(element, draw, frame, k0, k1)
+            draw += 1
+            for u in (u0, u1, u2, u3):
+                prod *= u
+                if prod <= limit:
+                    return k
+                k += 1
+
+    slam = math.sqrt(lam)
+    loglam = math.log(lam)
+    b = 0.931 + 2.53 * slam
+    a = -0.059 + 0.02483 * b
+    invalpha = 1.1239 + 1.1328 / (b - 3.4)
+    vr = 0.9277 - 3.6224 / (b - 2.0)
+    while True:
+        u0, v0, u1, v1 = uniforms(element, draw, frame, k0, k1)
+        draw += 1
+        for u, v in ((u0, v0), (u1, v1)):
+            u = u - 0.5
+            us = 0.5 - abs(u)
+            k = math.floor((2.0 * a / us + b) * u + lam + 0.43)
+            if us >= 0.07 and v <= vr:
+                return int(k)
+            if k < 0 or (us < 0.013 and v > us):
+                continue
+            if math.log(v) + math.log(invalpha) - math.log(
+                a / (us * us) + b
+            ) <= -lam + k * loglam - math.lgamma(k + 1.0):
+                return int(k)
+
+
+@numba.jit(nopython=True, parallel=True, fastmath=True)
+def _fill_normals(out, first_frame, k0, k1):
+    K, N, C = out.shape
+
+    for e in numba.prange(K * N):
+        f = e // N
+        n = e % N
+        for c in range(C):
+            if c % 4 == 0:
+                z = normals(n, c // 4, first_frame + f, k0, k1)
+            out[f, n, c] = z[c % 4]
+
+    return out
+
+
+def stream_seed(seed: int, *keys: Union[int, str]) -> int:
+    r"""Derives the seed of an independent stream from a base seed and keys,
+    e.g. an agent id and a sensor uuid.
+
+    Unlike :py:`hash()`, the result is the same in every process.
+    """
+    entropy = [seed & 0xFFFFFFFFFFFFFFFF]
+    for key in keys:
+        if isinstance(key, str):
+            key = int.from_bytes(hashlib.sha256(key.encode()).digest()[:8], "little")
+        entropy.append(key & 0xFFFFFFFFFFFFFFFF)
+    return int(np.random.SeedSequence(entropy).generate_state(1, np.uint64)[0])
+
+
+@attr.s(auto_attribs=True, slots=True)
+class RandomStream:
+    r"""A stream of counter-based random numbers owned by a noise model.
+
+    :property seed: Seed of the stream. When :py:`None`, a seed is drawn from
+        :py:`np.random` so that seeding NumPy keeps the noise reproducible.
+
+    Each call to `next_frame()` reserves a fresh frame of counters. Kernels
+    index the random numbers of a frame by element, see `uniforms()`,
+    `normals()` and `poisson()`.
+
+    Kernels drawing one block of `normals()` per element and per four
+    channels can instead reserve frames with `next_normals()`, which hands out
+    the normals of frames filled ahead of time by `pregenerate_normals()`.
+    Since the numbers only depend on the counters, both give the same noise.
+    """
+
+    seed: Optional[int] = None
+    _key: Tuple[int, int] = attr.ib(init=False, default=(0, 0))
+    _frame: int = attr.ib(init=False, default=0)
+    _pregenerated: Deque[Tuple[int, np.ndarray]] = attr.ib(init=False, factory=deque)
+
+    def __attrs_post_init__(self) -> None:
+        self.reseed(self.seed)
+
+    def reseed(self, seed: Optional[int]) -> None:
+        r"""Restarts the stream from a new seed."""
+        if seed is None:
+            seed = int(np.random.randint(0, np.iinfo(np.int64).max, dtype=np.int64))
+        self.seed = seed
+        seed &= 0xFFFFFFFFFFFFFFFF
+        self._key = (seed & 0xFFFFFFFF, seed >> 32)
+        self._frame = 0
+        self._pregenerated.clear()
+
+    def next_frame(self) -> Tuple[int, int, int]:
+        r"""Reserves the counters of the next frame.
+
+        :return: The ``(frame, k0, k1)`` arguments of the kernels.
+        """
+        frame = self._frame
+        self._frame += 1
+        return frame, self._key[0], self._key[1]
+
+    def next_normals(
+        self, shape: Tuple[int, ...]
+    ) -> Tuple[Optional[np.ndarray], int, int, int]:
+        r"""Reserves the next frame, with its normals if they were
+        pre-generated for this shape.
+
+        :param shape: The shape of the normals of a frame, the last dimension
+            being the channels of an element.
+        :return: The ``(normals, frame, k0, k1)`` arguments of the kernels,
+            where ``normals`` is :py:`None` when the kernel has to draw them.
+        """
+        if self._pregenerated:
+            frame, normals = self._pregenerated.popleft()
+            if normals.shape == tuple(shape):
+                return normals, frame, self._key[0], self._key[1]
+            # The observation changed shape, the remaining frames are useless
+            self._pregenerated.clear()
+        return (None, *self.next_frame())
+
+    def pregenerate_normals(self, shape: Tuple[int, ...], num_frames: int) -> None:
+        r"""Draws the normals of the next frames in a single parallel pass.
+
+        :param shape: The shape of the normals of a frame, see `next_normals()`
+        :param num_frames: How many frames to draw.
+        """
+        shape = tuple(shape)
+        normals = np.empty(
+            (num_frames, int(np.prod(shape[:-1])), shape[-1]), dtype=np.float32
+        )
+        first_frame, k0, k1 = self._frame, self._key[0], self._key[1]
+        self._frame += num_frames
+        _fill_normals(normals, first_frame, k0, k1)
+
+        normals = normals.reshape((num_frames, *shape))
+        for i in range(num_frames):
+            self._pregenerated.append((first_frame + i, normals[i]))
+
+
+def next_frames(
+    rngs: Union[RandomStream, Sequence[RandomStream]],
+    batch_size: int,
+    normals_shape: Optional[Tuple[int, ...]] = None,
+) -> Tuple[Optional[np.ndarray], np.ndarray, np.ndarray, np.ndarray]:
+    r"""Reserves the frames of a batch of observations, for the kernels
+    processing batches.
+
+    :param rngs: The stream of each observation of the batch, or a single
+        stream giving consecutive frames to all of them.
+    :param batch_size: The number of observations of the batch.
+    :param normals_shape: For kernels taking pre-generated normals, the shape
+        of the normals of one observation, see `RandomStream.next_normals()`.
+    :return: The ``(normals, frames, k0s, k1s)`` arguments of the kernels.
+        ``normals`` are only stacked when every stream pre-generated them, the
+        kernels draw the same numbers otherwise.
+    """
+    if isinstance(rngs, RandomStream):
+        rngs = [rngs] * batch_size
+    elif len(rngs) != batch_size:
+        raise ValueError(
+            f"Expected one random stream per observation, got {len(rngs)} "
+            f"streams for {batch_size} observations"
+        )
+
+    frames = np.empty(batch_size, dtype=np.uint64)
+    k0s = np.empty(batch_size, dtype=np.uint64)
+    k1s = np.empty(batch_size, dtype=np.uint64)
+    normals = []
+    for b, rng in enumerate(rngs):
+        if normals_shape is None:
+            frames[b], k0s[b], k1s[b] = rng.next_frame()
+        else:
+            noise, frames[b], k0s[b], k1s[b] = rng.next_normals(normals_shape)
+            normals.append(noise)
+
+    if len(normals) == 0 or any(noise is None for noise in normals):
+        return None, frames, k0s, k1s
+    if len(normals) == 1:
+        return normals[0][None], frames, k0s, k1s
+    return np.stack(normals), frames, k0s, k1s
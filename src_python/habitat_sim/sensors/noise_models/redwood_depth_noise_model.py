@@ -5,7 +5,7 @@
 # LICENSE file in the root directory of this source tree.
 
 from os import path as osp
-from typing import Union
+from typing import Dict, Optional, Sequence, Tuple, Union
 
 import attr
 import numba
@@ -21,7 +21,15 @@ except ImportError:
 from habitat_sim._ext.habitat_sim_bindings import SensorType
 from habitat_sim.bindings import cuda_enabled
 from habitat_sim.registry import registry
-from habitat_sim.sensors.noise_models.sensor_noise_model import SensorNoiseModel
+from habitat_sim.sensors.noise_models.random_stream import (
+    RandomStream,
+    next_frames,
+    normals,
+)
+from habitat_sim.sensors.noise_models.sensor_noise_model import (
+    SensorNoiseModel,
+    check_output_buffer,
+)
 
 if cuda_enabled:
     from habitat_sim._ext.habitat_sim_bindings import RedwoodNoiseModelGPUImpl
@@ -29,89 +37,162 @@ if cuda_enabled:
 
 # Read about the noise model here: http://www.alexteichman.com/octo/clams/
 # Original source code: http://redwood-data.org/indoor/data/simdepth.py
-@numba.jit(nopython=True, fastmath=True)
-def _undistort(x, y, z, model):
-    i2 = int((z + 1) / 2)
-    i1 = int(i2 - 1)
+#
+# The distortion model is a 80x80 grid of cells over a 640x480 sensor, each
+# holding the distortion at 5 depths (1m, 3m, ..., 9m). In between, it is
+# linearly interpolated and it is constant outside. Sampling it every
+# 1/_DEPTH_STEPS_PER_METER meters, with the knots on the samples, gives a
+# dense table whose linear interpolation is the same function. It is only
+# evaluated in a different order, so the distortion matches the per-pixel
+# computation up to float rounding, which can flip the rounding of the
+# disparity of a few pixels.
+_MAX_DEPTH = 10.0
+_DEPTH_STEPS_PER_METER = 8
+
+
+def _undistortion_table(model: ndarray) -> ndarray:
+    z = np.arange(int(_MAX_DEPTH) * _DEPTH_STEPS_PER_METER + 1) / float(
+        _DEPTH_STEPS_PER_METER
+    )
+    i2 = ((z + 1) / 2).astype(np.int64)
+    i1 = i2 - 1
     a = (z - (i1 * 2.0 + 1.0)) / 2.0
-    x = x // 8
-    y = y // 6
-    f = (1.0 - a) * model[y, x, min(max(i1, 0), 4)] + a * model[y, x, min(i2, 4)]
+    return np.ascontiguousarray(
+        (1.0 - a) * model[..., np.clip(i1, 0, 4)] + a * model[..., np.minimum(i2, 4)],
+        dtype=np.float32,
+    )
 
-    if f < 1e-5:
-        return 0.0
 
-    return z / f
+def _model_remap(size: int, model_size: int, cell_size: int) -> ndarray:
+    # The noise model was originally made for a 640x480 sensor, so re-map our
+    # arbitrarily sized sensor to that size, then to the cells of the model
+    pixels = np.arange(size) / max(size - 1.0, 1.0) * (model_size - 1.0) + 0.5
+    return (pixels.astype(np.int64) // cell_size).astype(np.int32)
 
 
 @numba.jit(nopython=True, parallel=True, fastmath=True)
-def _simulate(gt_depth, model, noise_multiplier):
-    noisy_depth = np.empty_like(gt_depth)
-
-    H, W = gt_depth.shape
+def _simulate(
+    gt_depths,
+    model_rows,
+    model_cols,
+    undistortion,
+    noise_multiplier,
+    noisy_depths,
+    noise,
+    frames,
+    k0s,
+    k1s,
+):
+    B, H, W = gt_depths.shape
     ymax, xmax = H - 1.0, W - 1.0
-
-    rand_nums = np.random.randn(H, W, 3).astype(np.float32)
+    last_step = undistortion.shape[2] - 2
 
     # Parallelize just the outer loop.  This doesn't change the speed
     # noticably but reduces CPU usage compared to two parallel loops
-    for j in numba.prange(H):
+    for bj in numba.prange(B * H):
+        b = bj // H
+        j = bj % H
+        gt_depth = gt_depths[b]
+        noisy_depth = noisy_depths[b]
         for i in range(W):
+            if noise is None:
+                rand_nums = normals(j * W + i, 0, frames[b], k0s[b], k1s[b])
+            else:
+                rand_nums = (
+                    noise[b, j, i, 0],
+                    noise[b, j, i, 1],
+                    noise[b, j, i, 2],
+                    np.float32(0.0),
+                )
             y = int(
-                min(max(j + rand_nums[j, i, 0] * 0.25 * noise_multiplier, 0.0), ymax)
-                + 0.5
+                min(max(j + rand_nums[0] * 0.25 * noise_multiplier, 0.0), ymax) + 0.5
             )
             x = int(
-                min(max(i + rand_nums[j, i, 1] * 0.25 * noise_multiplier, 0.0), xmax)
-                + 0.5
+                min(max(i + rand_nums[1] * 0.25 * noise_multiplier, 0.0), xmax) + 0.5
             )
 
             # Downsample
             d = gt_depth[y - y % 2, x - x % 2]
             # If the depth is greater than 10, the sensor will just return 0
-            if d >= 10.0:
+            if d >= _MAX_DEPTH:
                 noisy_depth[j, i] = 0.0
-            else:
-                # Distort
-                # The noise model was originally made for a 640x480 sensor,
-                # so re-map our arbitrarily sized sensor to that size!
-                undistorted_d = _undistort(
-                    int(x / xmax * 639.0 + 0.5), int(y / ymax * 479.0 + 0.5), d, model
-                )
+                continue
 
-                if undistorted_d == 0.0:
-                    noisy_depth[j, i] = 0.0
-                else:
-                    denom = round(
-                        (
-                            35.130 / undistorted_d
-                            + rand_nums[j, i, 2] * 0.027778 * noise_multiplier
-                        )
-                        * 8.0
-                    )
-                    if denom <= 1e-5:
-                        noisy_depth[j, i] = 0.0
-                    else:
-                        noisy_depth[j, i] = 35.130 * 8.0 / denom
+            # Distort
+            t = d * _DEPTH_STEPS_PER_METER
+            step = min(max(int(t), 0), last_step)
+            a = t - step
+            cell = undistortion[model_rows[y], model_cols[x]]
+            f = (1.0 - a) * cell[step] + a * cell[step + 1]
+            if f < 1e-5 or d == 0.0:
+                noisy_depth[j, i] = 0.0
+                continue
+
+            denom = round(
+                (35.130 * f / d + rand_nums[2] * 0.027778 * noise_multiplier) * 8.0
+            )
+            if denom <= 1e-5:
+                noisy_depth[j, i] = 0.0
+            else:
+                noisy_depth[j, i] = 35.130 * 8.0 / denom
 
-    return noisy_depth
+    return noisy_depths
 
 
 @attr.s(auto_attribs=True)
 class RedwoodNoiseModelCPUImpl:
     model: np.ndarray
     noise_multiplier: float
+    rng: RandomStream = attr.Factory(RandomStream)
+    _undistortion: np.ndarray = attr.ib(init=False, default=None)
+    # (H, W) -> model row of each pixel row and model column of each column
+    _remaps: Dict[Tuple[int, int], Tuple[ndarray, ndarray]] = attr.ib(
+        init=False, factory=dict
+    )
 
     def __attrs_post_init__(self):
         self.model = self.model.reshape(80, 80, 5)
+        self._undistortion = _undistortion_table(self.model)
+
+    def _remap(self, resolution: Tuple[int, int]) -> Tuple[ndarray, ndarray]:
+        remap = self._remaps.get(resolution)
+        if remap is None:
+            remap = (
+                _model_remap(resolution[0], 480, 6),
+                _model_remap(resolution[1], 640, 8),
+            )
+            self._remaps[resolution] = remap
+        return remap
+
+    def simulate(self, gt_depth: ndarray, out: Optional[ndarray] = None) -> ndarray:
+        out = check_output_buffer(gt_depth, out)
+        self.simulate_batch(gt_depth[None], out[None])
+        return out
 
-    def simulate(self, gt_depth):
-        return _simulate(gt_depth, self.model, self.noise_multiplier)
+    def simulate_batch(
+        self,
+        gt_depths: ndarray,
+        out: Optional[ndarray] = None,
+        rngs: Optional[Sequence[RandomStream]] = None,
+    ) -> ndarray:
+        model_rows, model_cols = self._remap(gt_depths.shape[1:])
+        return _simulate(
+            gt_depths,
+            model_rows,
+            model_cols,
+            self._undistortion,
+            self.noise_multiplier,
+            check_output_buffer(gt_depths, out),
+            *next_frames(rngs or self.rng, len(gt_depths), (*gt_depths.shape[1:], 3)),
+        )
 
 
 @registry.register_noise_model
 @attr.s(auto_attribs=True, kw_only=True)
 class RedwoodDepthNoiseModel(SensorNoiseModel):
+    supports_out_buffer = True
+    supports_batch = not cuda_enabled
+
     noise_multiplier: float = 1.0
 
     def __attrs_post_init__(self) -> None:
@@ -124,16 +205,34 @@ class RedwoodDepthNoiseModel(SensorNoiseModel):
                 dist, self.gpu_device_id, self.noise_multiplier
             )
         else:
-            self._impl = RedwoodNoiseModelCPUImpl(dist, self.noise_multiplier)
+            self._impl = RedwoodNoiseModelCPUImpl(dist, self.noise_multiplier, self.rng)
 
     @staticmethod
     def is_valid_sensor_type(sensor_type: SensorType) -> bool:
         return sensor_type == SensorType.DEPTH
 
-    def simulate(self, gt_depth: Union[ndarray, "Tensor"]) -> Union[ndarray, "Tensor"]:
+    def pregenerate(self, observation_shape: Tuple[int, ...], num_frames: int) -> None:
+        # The CUDA implementation draws its own numbers with cuRAND
+        if not cuda_enabled:
+            self.rng.pregenerate_normals((*observation_shape[:2], 3), num_frames)
+
+    def simulate(
+        self, gt_depth: Union[ndarray, "Tensor"], out: Optional[ndarray] = None
+    ) -> Union[ndarray, "Tensor"]:
+        r"""Applies the noise to a depth image
+
+        :param gt_depth: The clean depth image
+        :param out: Optional buffer receiving the noisy depth of a numpy
+            depth image, see `check_output_buffer()`
+        """
         if cuda_enabled:
             if isinstance(gt_depth, np.ndarray):
-                return self._impl.simulate_from_cpu(gt_depth)
+                noisy_depth = self._impl.simulate_from_cpu(gt_depth)
+                if out is None:
+                    return noisy_depth
+                out = check_output_buffer(gt_depth, out)
+                out[...] = noisy_depth
+                return out
             noisy_depth = torch.empty_like(gt_depth)
             rows, cols = gt_depth.size()
             self._impl.simulate_from_gpu(
@@ -141,8 +240,20 @@ class RedwoodDepthNoiseModel(SensorNoiseModel):
             )
             return noisy_depth
         else:
-            return self._impl.simulate(gt_depth)
+            return self._impl.simulate(gt_depth, out)
 
-    def apply(self, gt_depth: Union[ndarray, "Tensor"]) -> Union[ndarray, "Tensor"]:
+    def apply(
+        self, gt_depth: Union[ndarray, "Tensor"], out: Optional[ndarray] = None
+    ) -> Union[ndarray, "Tensor"]:
         r"""Alias of `simulate()` to conform to base-class and expected API"""
-        return self.simulate(gt_depth)
+        return self.simulate(gt_depth, out)
+
+    def apply_batch(
+        self,
+        gt_depths: ndarray,
+        out: Optional[ndarray] = None,
+        rngs: Optional[Sequence[RandomStream]] = None,
+    ) -> ndarray:
+        if cuda_enabled:
+            return super().apply_batch(gt_depths, out, rngs)
+        return self._impl.simulate_batch(gt_depths, out, rngs)
@@ -4,57 +4,126 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+from typing import Optional, Sequence
 
 import attr
+import numba
 import numpy as np
 from numpy import ndarray
 
 from habitat_sim.registry import registry
 from habitat_sim.sensor import SensorType
-from habitat_sim.sensors.noise_models.sensor_noise_model import SensorNoiseModel
-
-
-def _simulate(image: ndarray, s_vs_p: float, amount: float) -> ndarray:
-    noisy_rgb = np.copy(image)
-    # Salt
-    num_salt = np.ceil(amount * image.size * s_vs_p)
-    coords = [np.random.randint(0, i - 1, int(num_salt)) for i in image.shape]
-    noisy_rgb[tuple(coords)] = 1
-
-    # Pepper
-    num_pepper = np.ceil(amount * image.size * (1.0 - s_vs_p))
-    coords = [np.random.randint(0, i - 1, int(num_pepper)) for i in image.shape]
-    noisy_rgb[tuple(coords)] = 0
-
-    return noisy_rgb
+from habitat_sim.sensors.noise_models.random_stream import (
+    RandomStream,
+    next_frames,
+    poisson,
+    uniforms,
+)
+from habitat_sim.sensors.noise_models.sensor_noise_model import (
+    SensorNoiseModel,
+    check_output_buffer,
+)
+
+
+@numba.jit(nopython=True, fastmath=True)
+def _scatter(row, value, lam, stream, frame, k0, k1):
+    # Draws how many elements of the row turn into the value, then only that
+    # many coordinates. The counters of the count and of the coordinates are
+    # the elements 2 * stream and 2 * stream + 1.
+    W, C = row.shape
+    row_size = W * C
+    count = poisson(lam, 2 * stream, frame, k0, k1)
+    for k in range(count):
+        if k % 4 == 0:
+            u = uniforms(2 * stream + 1, k // 4, frame, k0, k1)
+        e = min(int(u[k % 4] * row_size), row_size - 1)
+        row[e // C, e % C] = value
+
+
+@numba.jit(nopython=True, parallel=True, fastmath=True)
+def _simulate(out, salt, pepper, frames, k0s, k1s):
+    B, H, W, C = out.shape
+
+    # Each element independently turns into salt with probability salt, then
+    # into pepper with probability pepper, which matches drawing
+    # amount * image.size coordinates up to duplicates. Only the noisy
+    # elements are drawn, their number in a row following the Poisson
+    # approximation of its binomial distribution.
+    for bj in numba.prange(B * H):
+        b = bj // H
+        j = bj % H
+        row = out[b, j]
+        _scatter(row, 1, salt * W * C, 2 * j, frames[b], k0s[b], k1s[b])
+        _scatter(row, 0, pepper * W * C, 2 * j + 1, frames[b], k0s[b], k1s[b])
+
+    return out
 
 
 @attr.s(auto_attribs=True, slots=True)
 class SaltAndPepperNoiseModelCPUImpl:
     s_vs_p: float
     amount: float
-
-    def simulate(self, image: ndarray) -> ndarray:
-        return _simulate(image, self.s_vs_p, self.amount)
+    rng: RandomStream = attr.Factory(RandomStream)
+
+    def simulate(self, image: ndarray, out: Optional[ndarray] = None) -> ndarray:
+        out = check_output_buffer(image, out)
+        self.simulate_batch(image[None], out[None])
+        return out
+
+    def simulate_batch(
+        self,
+        images: ndarray,
+        out: Optional[ndarray] = None,
+        rngs: Optional[Sequence[RandomStream]] = None,
+    ) -> ndarray:
+        _, frames, k0s, k1s = next_frames(rngs or self.rng, len(images))
+        out = check_output_buffer(images, out)
+        # The kernel only writes the noisy elements
+        np.copyto(out, images)
+        return _simulate(
+            out,
+            self.amount * self.s_vs_p,
+            self.amount * (1.0 - self.s_vs_p),
+            frames,
+            k0s,
+            k1s,
+        )
 
 
 @registry.register_noise_model
 @attr.s(auto_attribs=True, kw_only=True, slots=True)
 class SaltAndPepperNoiseModel(SensorNoiseModel):
+    supports_out_buffer = True
+    supports_batch = True
+
     s_vs_p: float = 0.5
     amount: float = 0.05
     _impl: SaltAndPepperNoiseModelCPUImpl = None
 
     def __attrs_post_init__(self) -> None:
-        self._impl = SaltAndPepperNoiseModelCPUImpl(self.s_vs_p, self.amount)
+        self._impl = SaltAndPepperNoiseModelCPUImpl(self.s_vs_p, self.amount, self.rng)
 
     @staticmethod
     def is_valid_sensor_type(sensor_type: SensorType) -> bool:
         return sensor_type == SensorType.COLOR
 
-    def simulate(self, image):
-        return self._impl.simulate(image)
+    def simulate(self, image: ndarray, out: Optional[ndarray] = None) -> ndarray:
+        r"""Applies the noise to a uint8 image
+
+        :param image: The clean image
+        :param out: Optional buffer receiving the noisy image, see
+            `check_output_buffer()`
+        """
+        return self._impl.simulate(image, out)
 
-    def apply(self, image):
+    def apply(self, image: ndarray, out: Optional[ndarray] = None) -> ndarray:
         r"""Alias of `simulate()` to conform to base-class and expected API"""
-        return self.simulate(image)
+        return self.simulate(image, out)
+
+    def apply_batch(
+        self,
+        images: ndarray,
+        out: Optional[ndarray] = None,
+        rngs: Optional[Sequence[RandomStream]] = None,
+    ) -> ndarray:
+        return self._impl.simulate_batch(images, out, rngs)
@@ -5,9 +5,10 @@
 # LICENSE file in the root directory of this source tree.
 
 import abc
-from typing import Optional, Union
+from typing import ClassVar, Optional, Sequence, Tuple, Union
 
 import attr
+import numpy as np
 from numpy import ndarray
 
 try:
@@ -16,12 +17,55 @@ except ImportError:
     pass
 
 from habitat_sim.sensor import SensorType
+from habitat_sim.sensors.noise_models.random_stream import RandomStream
 
 
 @attr.s(auto_attribs=True, kw_only=True)
 class SensorNoiseModel(abc.ABC):
-    r"""Base class for all sensor noise models"""
+    r"""Base class for all sensor noise models
+
+    :property gpu_device_id: The CUDA device used by GPU implementations
+    :property seed: Seed of the random numbers of the model. When
+        :py:`None`, the seed is drawn from :py:`np.random`. The `Simulator`
+        seeds the noise model of each sensor from its own seed and the uuid of
+        the sensor, unless the noise model kwargs of the sensor set it.
+    """
+    #: Whether `apply()` takes an ``out`` buffer for numpy observations, see
+    #: `check_output_buffer()`
+    supports_out_buffer: ClassVar[bool] = False
+    #: Whether `apply_batch()` processes a batch in a single kernel
+    supports_batch: ClassVar[bool] = False
+
     gpu_device_id: Optional[int] = None
+    seed: Optional[int] = None
+    _rng: Optional[RandomStream] = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
+
+    @property
+    def rng(self) -> RandomStream:
+        r"""The counter-based random stream of the model, created on first
+        use
+        """
+        if self._rng is None:
+            self._rng = RandomStream(self.seed)
+        return self._rng
+
+    def reseed(self, seed: Optional[int]) -> None:
+        r"""Restarts the random numbers of the model from a new seed"""
+        self.seed = seed
+        if self._rng is not None:
+            self._rng.reseed(seed)
+
+    def pregenerate(self, observation_shape: Tuple[int, ...], num_frames: int) -> None:
+        r"""Draws the random numbers of the next frames ahead of time
+
+        :param observation_shape: The shape of the observations of the sensor
+        :param num_frames: How many frames to draw
+
+        The noise is the same whether or not it was pre-generated. Models
+        whose random numbers depend on the observation ignore this.
+        """
 
     @staticmethod
     @abc.abstractmethod
@@ -42,8 +86,65 @@ class SensorNoiseModel(abc.ABC):
         :return: The sensor observation with noise applied.
         """
 
+    def apply_batch(
+        self,
+        sensor_observations: ndarray,
+        out: Optional[ndarray] = None,
+        rngs: Optional[Sequence[RandomStream]] = None,
+    ) -> ndarray:
+        r"""Applies the noise model to a stack of sensor observations
+
+        :param sensor_observations: A :py:`(B, ...)` stack of clean
+            observations. Should not be modified.
+        :param out: Optional buffer receiving the noisy observations, see
+            `check_output_buffer()`
+        :param rngs: The random stream of each observation, e.g. those of the
+            noise models of several sensors sharing this configuration. By
+            default, the observations use the next frames of `rng`, which
+            gives the noise of calling `apply()` on each of them in turn.
+
+        Models with `supports_batch` process the whole stack in one kernel,
+        others apply the noise to one observation at a time, with `rng`
+        bound to the stream of that observation.
+        """
+        if rngs is not None and len(rngs) != len(sensor_observations):
+            raise ValueError(
+                f"Expected one random stream per observation, got {len(rngs)} "
+                f"streams for {len(sensor_observations)} observations"
+            )
+        out = check_output_buffer(sensor_observations, out)
+        own_rng = self._rng
+        try:
+            for b, (observation, noisy) in enumerate(zip(sensor_observations, out)):
+                if rngs is not None:
+                    self._rng = rngs[b]
+                noisy[...] = self.apply(observation)
+        finally:
+            self._rng = own_rng
+        return out
+
     def __call__(
         self, sensor_observation: Union[ndarray, "Tensor"]
     ) -> Union[ndarray, "Tensor"]:
         r"""Alias of `apply()`"""
         return self.apply(sensor_observation)
+
+
+def check_output_buffer(image: ndarray, out: Optional[ndarray]) -> ndarray:
+    r"""Returns the buffer a noise kernel writes into
+
+    :param image: The clean sensor observation
+    :param out: A caller provided buffer with the shape and dtype of
+        ``image``, which may be ``image`` itself. A new array is allocated
+        when :py:`None`.
+    """
+    if out is None:
+        return np.empty_like(image)
+    if out.shape != image.shape or out.dtype != image.dtype:
+        raise ValueError(
+            f"Output buffer of shape {out.shape} and dtype {out.dtype} does not "
+            f"match the observation of shape {image.shape} and dtype {image.dtype}"
+        )
+    if not out.flags.writeable:
+        raise ValueError("Output buffer is read-only")
+    return out
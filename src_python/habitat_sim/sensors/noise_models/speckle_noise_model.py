@@ -4,26 +4,47 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+from typing import Optional, Sequence, Tuple
+
 import attr
+import numba
 import numpy as np
 from numpy import ndarray
 
 from habitat_sim.registry import registry
 from habitat_sim.sensor import SensorType
-from habitat_sim.sensors.noise_models.sensor_noise_model import SensorNoiseModel
-
-
-def _simulate(
-    image: ndarray, intensity_constant: float, mean: int, sigma: int
-) -> ndarray:
-    image = image / 255.0
-
-    noise = np.random.normal(mean, sigma, image.shape)
-    noisy_rgb = np.clip((image + (image * noise * intensity_constant)), 0, 1)
-
-    noisy_rgb = (noisy_rgb * 255).astype(np.uint8)
-
-    return noisy_rgb
+from habitat_sim.sensors.noise_models.random_stream import (
+    RandomStream,
+    next_frames,
+    normals,
+)
+from habitat_sim.sensors.noise_models.sensor_noise_model import (
+    SensorNoiseModel,
+    check_output_buffer,
+)
+
+
+@numba.jit(nopython=True, parallel=True, fastmath=True)
+def _simulate(images, intensity_constant, mean, sigma, out, noise, frames, k0s, k1s):
+    B, H, W, C = images.shape
+    inv_255 = np.float32(1.0 / 255.0)
+
+    for bj in numba.prange(B * H):
+        b = bj // H
+        j = bj % H
+        for i in range(W):
+            for c in range(C):
+                if noise is None:
+                    if c % 4 == 0:
+                        z = normals(j * W + i, c // 4, frames[b], k0s[b], k1s[b])
+                    n = z[c % 4]
+                else:
+                    n = noise[b, j, i, c]
+                v = np.float32(images[b, j, i, c]) * inv_255
+                v += v * (n * sigma + mean) * intensity_constant
+                out[b, j, i, c] = np.uint8(min(max(v, 0.0), 1.0) * 255.0)
+
+    return out
 
 
 @attr.s(auto_attribs=True, slots=True)
@@ -31,14 +52,35 @@ class SpeckleNoiseModelCPUImpl:
     intensity_constant: float
     mean: int
     sigma: int
-
-    def simulate(self, image: ndarray) -> ndarray:
-        return _simulate(image, self.intensity_constant, self.mean, self.sigma)
+    rng: RandomStream = attr.Factory(RandomStream)
+
+    def simulate(self, image: ndarray, out: Optional[ndarray] = None) -> ndarray:
+        out = check_output_buffer(image, out)
+        self.simulate_batch(image[None], out[None])
+        return out
+
+    def simulate_batch(
+        self,
+        images: ndarray,
+        out: Optional[ndarray] = None,
+        rngs: Optional[Sequence[RandomStream]] = None,
+    ) -> ndarray:
+        return _simulate(
+            images,
+            np.float32(self.intensity_constant),
+            np.float32(self.mean),
+            np.float32(self.sigma),
+            check_output_buffer(images, out),
+            *next_frames(rngs or self.rng, len(images), images.shape[1:]),
+        )
 
 
 @registry.register_noise_model
 @attr.s(auto_attribs=True, kw_only=True, slots=True)
 class SpeckleNoiseModel(SensorNoiseModel):
+    supports_out_buffer = True
+    supports_batch = True
+
     intensity_constant: float = 0.2
     mean: int = 0
     sigma: int = 1
@@ -46,16 +88,33 @@ class SpeckleNoiseModel(SensorNoiseModel):
 
     def __attrs_post_init__(self) -> None:
         self._impl = SpeckleNoiseModelCPUImpl(
-            self.intensity_constant, self.mean, self.sigma
+            self.intensity_constant, self.mean, self.sigma, self.rng
         )
 
     @staticmethod
     def is_valid_sensor_type(sensor_type: SensorType) -> bool:
         return sensor_type == SensorType.COLOR
 
-    def simulate(self, image: ndarray) -> ndarray:
-        return self._impl.simulate(image)
+    def pregenerate(self, observation_shape: Tuple[int, ...], num_frames: int) -> None:
+        self.rng.pregenerate_normals(observation_shape, num_frames)
+
+    def simulate(self, image: ndarray, out: Optional[ndarray] = None) -> ndarray:
+        r"""Applies the noise to a uint8 image
+
+        :param image: The clean image
+        :param out: Optional buffer receiving the noisy image, see
+            `check_output_buffer()`
+        """
+        return self._impl.simulate(image, out)
 
-    def apply(self, image: ndarray) -> ndarray:
+    def apply(self, image: ndarray, out: Optional[ndarray] = None) -> ndarray:
         r"""Alias of `simulate()` to conform to base-class and expected API"""
-        return self.simulate(image)
+        return self.simulate(image, out)
+
+    def apply_batch(
+        self,
+        images: ndarray,
+        out: Optional[ndarray] = None,
+        rngs: Optional[Sequence[RandomStream]] = None,
+    ) -> ndarray:
+        return self._impl.simulate_batch(images, out, rngs)
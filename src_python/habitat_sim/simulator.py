@@ -7,9 +7,9 @@
 import time
 from collections import OrderedDict
 from collections.abc import MutableMapping
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, List
 from typing import MutableMapping as MutableMapping_T
-from typing import Optional, Union, cast, overload
+from typing import Optional, Sequence, Tuple, Union, cast, overload
 
 import attr
 import magnum as mn
@@ -26,13 +26,19 @@ except ImportError:
     _HAS_TORCH = False
 
 import habitat_sim.errors
-from habitat_sim.agent.agent import Agent, AgentConfiguration, AgentState
+from habitat_sim.agent.agent import Agent, AgentConfiguration, AgentState, AgentStates
+from habitat_sim.agent.controls import NavMeshMoveFilter
 from habitat_sim.bindings import cuda_enabled
 from habitat_sim.logging import LoggingContext, logger
 from habitat_sim.metadata import MetadataMediator
 from habitat_sim.nav import GreedyGeodesicFollower
 from habitat_sim.sensor import SensorSpec, SensorType
-from habitat_sim.sensors.noise_models import make_sensor_noise_model
+from habitat_sim.sensors.noise_models import (
+    NoSensorNoiseModel,
+    SensorNoiseModel,
+    make_sensor_noise_model,
+)
+from habitat_sim.sensors.noise_models.random_stream import stream_seed
 from habitat_sim.sim import SimulatorBackend, SimulatorConfiguration
 from habitat_sim.utils.common import quat_from_angle_axis
 
@@ -47,6 +53,10 @@ class Configuration:
     :property sim_cfg: The configuration of the backend of the simulator
     :property agents: A list of agent configurations
     :property metadata_mediator: (optional) The metadata mediator to build the simulator from.
+    :property observation_ring_size: (optional) When greater than zero, CPU
+        sensors render into a ring of this many preallocated buffers and
+        return read-only views into the ring instead of copies. A view is
+        overwritten once the sensor has produced this many newer observations.
 
     Ties together a backend config, `sim_cfg` and a list of agent
     configurations `agents`.
@@ -57,6 +67,28 @@ class Configuration:
     # An existing Metadata Mediator can also be used to construct a SimulatorBackend
     metadata_mediator: Optional[MetadataMediator] = None
     enable_batch_renderer: bool = False
+    observation_ring_size: int = 0
+
+
+@attr.s(auto_attribs=True, slots=True)
+class _NoiseBatch:
+    r"""Buffers of sensors whose noise `Simulator.get_sensor_observations()`
+    applies in a single batch. :p:`noisy` cycles through
+    ``observation_ring_size`` stacks and is empty without an observation ring.
+    """
+
+    clean: ndarray
+    noisy: List[ndarray]
+    index: int = 0
+
+
+@attr.s(auto_attribs=True, slots=True)
+class _PipelinedFrame:
+    r"""The frame being rendered for `Simulator.step_pipelined()`"""
+
+    frame_index: int
+    collided: Dict[int, bool]
+    return_single: bool
 
 
 @attr.s(auto_attribs=True)
@@ -80,7 +112,20 @@ class Simulator(SimulatorBackend):
         default=0.0, init=False
     )  # track the compute time of each step
     _async_draw_agent_ids: Optional[Union[int, List[int]]] = None
+    # The state of each agent after its last action is kept in
+    # __last_states, __last_state caches the AgentState objects built from it
     __last_state: Dict[int, AgentState] = attr.ib(factory=dict, init=False)
+    __last_states: Optional[AgentStates] = attr.ib(default=None, init=False)
+    __move_filter: Optional[NavMeshMoveFilter] = attr.ib(default=None, init=False)
+    __batch_observations: Dict[str, Union[ndarray, "Tensor"]] = attr.ib(
+        factory=dict, init=False
+    )
+    __pipelined_frame: Optional[_PipelinedFrame] = attr.ib(default=None, init=False)
+    __physics_steps_since_render: int = attr.ib(default=0, init=False)
+    __noise_seed: int = attr.ib(default=0, init=False)
+    __noise_batches: Dict[Tuple[Tuple[int, str], ...], _NoiseBatch] = attr.ib(
+        factory=dict, init=False
+    )
 
     @staticmethod
     def _sanitize_config(config: Configuration) -> None:
@@ -148,6 +193,10 @@ class Simulator(SimulatorBackend):
         self.agents = []
 
         self.__last_state.clear()
+        self.__last_states = None
+        self.__batch_observations.clear()
+        self.__noise_batches.clear()
+        self.__pipelined_frame = None
 
         super().close(destroy)
 
@@ -160,6 +209,21 @@ class Simulator(SimulatorBackend):
     def seed(self, new_seed: int) -> None:
         super().seed(new_seed)
         self.pathfinder.seed(new_seed)
+        self.__noise_seed = new_seed
+        for agent_id, agent_sensorsuite in enumerate(self.__sensors):
+            for uuid, sensor in agent_sensorsuite.items():
+                sensor.seed_noise_model(stream_seed(new_seed, agent_id, uuid))
+
+    def pregenerate_noise(self, num_frames: int) -> None:
+        r"""Draws the random numbers of the noise models of all sensors for
+        the next frames in bulk. The observations are the same as without
+        pre-generation.
+
+        :param num_frames: How many frames to draw
+        """
+        for agent_sensorsuite in self.__sensors:
+            for sensor in agent_sensorsuite.values():
+                sensor.pregenerate_noise(num_frames)
 
     @overload
     def reset(self, agent_ids: List[int]) -> Dict[int, ObservationDict]:
@@ -175,6 +239,7 @@ class Simulator(SimulatorBackend):
         super().reset()
         for i in range(len(self.agents)):
             self.reset_agent(i)
+        self.__physics_steps_since_render = 0
 
         if agent_ids is None:
             agent_ids = [self._default_agent_id]
@@ -229,24 +294,35 @@ class Simulator(SimulatorBackend):
         self._config_pathfinder(config)
         self.frustum_culling = config.sim_cfg.frustum_culling
 
+        self.__move_filter = NavMeshMoveFilter(
+            self.pathfinder, config.sim_cfg.allow_sliding
+        )
         for i in range(len(self.agents)):
-            self.agents[i].controls.move_filter_fn = self.step_filter
+            self.agents[i].controls.move_filter_fn = self.__move_filter
 
         self._default_agent_id = config.sim_cfg.default_agent_id
+        self.__noise_seed = config.sim_cfg.random_seed
 
         self.__sensors: List[Dict[str, Sensor]] = [
             dict() for i in range(len(config.agents))
         ]
         self.__last_state = dict()
+        self.__last_states = AgentStates.empty(
+            len(self.agents), self._sensor_uuids(range(len(self.agents)))
+        )
+        self.__batch_observations = dict()
+        self.__noise_batches = dict()
+        self.__pipelined_frame = None
         for agent_id, agent_cfg in enumerate(config.agents):
             for spec in agent_cfg.sensor_specifications:
                 self._update_simulator_sensors(spec.uuid, agent_id=agent_id)
             self.initialize_agent(agent_id)
 
     def _update_simulator_sensors(self, uuid: str, agent_id: int) -> None:
-        self.__sensors[agent_id][uuid] = Sensor(
-            sim=self, agent=self.get_agent(agent_id), sensor_id=uuid
-        )
+        sensor = Sensor(sim=self, agent=self.get_agent(agent_id), sensor_id=uuid)
+        # Each sensor draws its noise from its own stream
+        sensor.seed_noise_model(stream_seed(self.__noise_seed, agent_id, uuid))
+        self.__sensors[agent_id][uuid] = sensor
 
     def add_sensor(
         self, sensor_spec: SensorSpec, agent_id: Optional[int] = None
@@ -276,10 +352,91 @@ class Simulator(SimulatorBackend):
         agent = self.get_agent(agent_id=agent_id)
         agent._add_sensor(sensor_spec)
         self._update_simulator_sensors(sensor_spec.uuid, agent_id=agent_id)
+        self.__batch_observations = dict()
+        self.__noise_batches = dict()
+        self.__last_state = dict()
+        self.__last_states = self.get_agent_states()
 
     def get_agent(self, agent_id: int) -> Agent:
         return self.agents[agent_id]
 
+    def _sensor_uuids(self, agent_ids: Iterable[int]) -> List[str]:
+        r"""The sensors of the agents, in order of first appearance"""
+        uuids: Dict[str, None] = {}
+        for agent_id in agent_ids:
+            uuids.update(dict.fromkeys(self.agents[agent_id]._sensors.keys()))
+        return list(uuids)
+
+    def get_agent_states(
+        self,
+        agent_ids: Optional[Sequence[int]] = None,
+        out: Optional[AgentStates] = None,
+    ) -> AgentStates:
+        r"""Reads the states of several agents at once, without building
+        `AgentState` objects
+
+        :param agent_ids: The agents, all of them by default
+        :param out: Optional states to write into, e.g. returned by a previous
+            call for the same agents
+        :return: The states, the i-th row holding the state of the i-th agent
+            of :p:`agent_ids`
+        """
+        if agent_ids is None:
+            agent_ids = range(len(self.agents))
+        if out is None:
+            out = AgentStates.empty(len(agent_ids), self._sensor_uuids(agent_ids))
+        elif len(out) != len(agent_ids):
+            raise ValueError(
+                f"Expected states for {len(agent_ids)} agents, got {len(out)}"
+            )
+
+        for index, agent_id in enumerate(agent_ids):
+            self.agents[agent_id].get_state_into(out, index)
+        return out
+
+    def set_agent_states(
+        self,
+        states: AgentStates,
+        agent_ids: Optional[Sequence[int]] = None,
+        reset_sensors: bool = True,
+        infer_sensor_states: bool = True,
+    ) -> None:
+        r"""Sets the states of several agents at once, see
+        `Agent.set_state_from()`. The states are not validated.
+
+        :param states: The states, the i-th row holding the state of the i-th
+            agent of :p:`agent_ids`
+        :param agent_ids: The agents, all of them by default
+        :param reset_sensors: See `Agent.set_state()`
+        :param infer_sensor_states: See `Agent.set_state()`
+        """
+        if agent_ids is None:
+            agent_ids = range(len(self.agents))
+        if len(states) != len(agent_ids):
+            raise ValueError(
+                f"Expected states for {len(agent_ids)} agents, got {len(states)}"
+            )
+
+        for index, agent_id in enumerate(agent_ids):
+            self.agents[agent_id].set_state_from(
+                states, index, reset_sensors, infer_sensor_states
+            )
+
+    def __act(
+        self, agent_ids: Sequence[int], actions: Sequence[Union[str, int]]
+    ) -> List[bool]:
+        r"""Acts the agents in a single batch, see `Agent.act_batch()`"""
+        # The agents share the filter, follow the pathfinder if it was replaced
+        self.__move_filter.pathfinder = self.pathfinder
+        collided = Agent.act_batch([self.agents[i] for i in agent_ids], actions)
+        for agent_id in agent_ids:
+            self.__update_last_state(agent_id)
+        return collided.tolist()
+
+    def __update_last_state(self, agent_id: int) -> None:
+        self.agents[agent_id].get_state_into(self.__last_states, agent_id)
+        self.__last_state.pop(agent_id, None)
+
     def initialize_agent(
         self, agent_id: int, initial_state: Optional[AgentState] = None
     ) -> Agent:
@@ -293,7 +450,7 @@ class Simulator(SimulatorBackend):
                 )
 
         agent.set_state(initial_state, is_initial=True)
-        self.__last_state[agent_id] = agent.state
+        self.__update_last_state(agent_id)
         return agent
 
     def start_async_render_and_step_physics(
@@ -408,17 +565,76 @@ class Simulator(SimulatorBackend):
             # Sensors are only used as data containers.
             pass
 
-        # Get observations.
+        # Get observations. Sensors sharing a noise model configuration apply
+        # their noise in a single batch.
+        noise_batches: Dict[Tuple[Any, ...], List[Tuple[int, str, Sensor]]] = {}
         for agent_id in agent_ids:
             agent_observations: ObservationDict = {}
             for sensor_uuid, sensor in self.__sensors[agent_id].items():
-                agent_observations[sensor_uuid] = sensor.get_observation()
+                noise_batch_key = sensor._noise_batch_key()
+                if noise_batch_key is None:
+                    agent_observations[sensor_uuid] = sensor.get_observation()
+                else:
+                    # Filled in below, keeps the order of the sensors
+                    agent_observations[sensor_uuid] = None
+                    noise_batches.setdefault(noise_batch_key, []).append(
+                        (agent_id, sensor_uuid, sensor)
+                    )
             observations[agent_id] = agent_observations
 
+        for sensors in noise_batches.values():
+            if len(sensors) == 1:
+                agent_id, sensor_uuid, sensor = sensors[0]
+                observations[agent_id][sensor_uuid] = sensor.get_observation()
+                continue
+            noisy = self._apply_noise_batch(sensors)
+            for (agent_id, sensor_uuid, _), obs in zip(sensors, noisy):
+                observations[agent_id][sensor_uuid] = obs
+
         if return_single:
             return next(iter(observations.values()))
         return observations
 
+    def _apply_noise_batch(self, sensors: List[Tuple[int, str, "Sensor"]]) -> ndarray:
+        r"""Reads the frames of sensors sharing a noise model configuration and
+        applies their noise in a single batch, each sensor drawing from its
+        own random stream.
+
+        :return: The :py:`(len(sensors), ...)` noisy observations
+        """
+        key = tuple((agent_id, sensor_uuid) for agent_id, sensor_uuid, _ in sensors)
+        batch = self.__noise_batches.get(key)
+        if batch is None:
+            reference = sensors[0][2]._buffer
+            clean = np.empty((len(sensors), *reference.shape), dtype=reference.dtype)
+            batch = _NoiseBatch(
+                clean,
+                [
+                    np.empty_like(clean)
+                    for _ in range(self.config.observation_ring_size)
+                ],
+            )
+            self.__noise_batches[key] = batch
+
+        for b, (_, _, sensor) in enumerate(sensors):
+            batch.clean[b] = sensor._read_frame()
+
+        noisy: Optional[ndarray] = None
+        if len(batch.noisy) > 0:
+            noisy = batch.noisy[batch.index]
+            batch.index = (batch.index + 1) % len(batch.noisy)
+            noisy.flags.writeable = True
+
+        noise_model = sensors[0][2]._noise_model
+        noisy = noise_model.apply_batch(
+            batch.clean,
+            noisy,
+            rngs=[sensor._noise_model.rng for _, _, sensor in sensors],
+        )
+        if len(batch.noisy) > 0:
+            noisy.flags.writeable = False
+        return noisy
+
     @property
     def _default_agent(self) -> Agent:
         # TODO Deprecate and remove
@@ -427,11 +643,12 @@ class Simulator(SimulatorBackend):
     @property
     def _last_state(self) -> AgentState:
         # TODO Deprecate and remove
-        return self.__last_state[self._default_agent_id]
+        return self.last_state(self._default_agent_id)
 
     @_last_state.setter
     def _last_state(self, state: AgentState) -> None:
         # TODO Deprecate and remove
+        self.__last_states.set_state(self._default_agent_id, state)
         self.__last_state[self._default_agent_id] = state
 
     @property
@@ -442,7 +659,11 @@ class Simulator(SimulatorBackend):
     def last_state(self, agent_id: Optional[int] = None) -> AgentState:
         if agent_id is None:
             agent_id = self._default_agent_id
-        return self.__last_state[agent_id]
+        state = self.__last_state.get(agent_id)
+        if state is None:
+            state = self.__last_states.get_state(agent_id)
+            self.__last_state[agent_id] = state
+        return state
 
     @overload
     def step(self, action: Union[str, int], dt: float = 1.0 / 60.0) -> ObservationDict:
@@ -459,22 +680,75 @@ class Simulator(SimulatorBackend):
         action: Union[str, int, MutableMapping_T[int, Union[str, int]]],
         dt: float = 1.0 / 60.0,
     ) -> Union[ObservationDict, Dict[int, ObservationDict],]:
+        step_world = super().step_world
+
+        def step_physics() -> bool:
+            step_world(dt)
+            return True
+
+        return cast(
+            Union[ObservationDict, Dict[int, ObservationDict]],
+            self.__step(action, step_physics),
+        )
+
+    def step_substeps(
+        self,
+        action: Union[str, int, MutableMapping_T[int, Union[str, int]]],
+        num_substeps: int = -1,
+    ) -> Optional[Union[ObservationDict, Dict[int, ObservationDict]]]:
+        r"""Steps like `step()`, but advances physics by a number of fixed
+        timesteps and only renders every
+        `PhysicsManagerAttributes.render_interval` physics steps.
+
+        :param action: The action(s) to take, as for `step()`.
+        :param num_substeps: The number of fixed timesteps to advance by,
+            `PhysicsManagerAttributes.num_substeps` if negative.
+        :return: The observations as for `step()`, or :py:`None` if the
+            observations weren't rendered this step.
+
+        The scene graph is only synchronized after the last substep. Save
+        replay keyframes after this call to record the state once per action
+        rather than once per substep.
+        """
+        if num_substeps < 0:
+            num_substeps = self.get_physics_num_substeps()
+        step_world_substeps = super().step_world_substeps
+
+        def step_physics() -> bool:
+            step_world_substeps(num_substeps)
+            self.__physics_steps_since_render += num_substeps
+            render_interval = max(self.get_physics_render_interval(), 1)
+            if self.__physics_steps_since_render < render_interval:
+                return False
+            self.__physics_steps_since_render %= render_interval
+            return True
+
+        return self.__step(action, step_physics)
+
+    def __step(
+        self,
+        action: Union[str, int, MutableMapping_T[int, Union[str, int]]],
+        step_physics: Callable[[], bool],
+    ) -> Optional[Union[ObservationDict, Dict[int, ObservationDict]]]:
+        r"""Takes the action(s), steps physics with :p:`step_physics` and
+        renders the observations, unless :p:`step_physics` returns
+        :py:`False`.
+        """
         self._num_total_frames += 1
         if isinstance(action, MutableMapping):
             return_single = False
         else:
             action = cast(Dict[int, Union[str, int]], {self._default_agent_id: action})
             return_single = True
-        collided_dict: Dict[int, bool] = {}
-        for agent_id, agent_act in action.items():
-            agent = self.get_agent(agent_id)
-            collided_dict[agent_id] = agent.act(agent_act)
-            self.__last_state[agent_id] = agent.get_state()
+        collided_dict = dict(
+            zip(action.keys(), self.__act(list(action.keys()), list(action.values())))
+        )
 
-        # step physics by dt
         step_start_Time = time.time()
-        super().step_world(dt)
+        render = step_physics()
         self._previous_step_time = time.time() - step_start_Time
+        if not render:
+            return None
 
         multi_observations = self.get_sensor_observations(agent_ids=list(action.keys()))
         for agent_id, agent_observation in multi_observations.items():
@@ -483,6 +757,151 @@ class Simulator(SimulatorBackend):
             return multi_observations[self._default_agent_id]
         return multi_observations
 
+    def step_pipelined(
+        self,
+        action: Union[str, int, MutableMapping_T[int, Union[str, int]]],
+        dt: float = 1.0 / 60.0,
+    ) -> Optional[Tuple[int, Union[ObservationDict, Dict[int, ObservationDict]]]]:
+        r"""Steps like `step()`, but renders each frame in the background
+        while the following step acts and runs physics.
+
+        :param action: The action(s) to take, as for `step()`.
+        :param dt: The amount of time to step the world by.
+        :return: ``(frame_index, observations)`` for the frame issued by the
+            previous call, or :py:`None` on the first call.
+            ``frame_index`` counts steps the same way as `step()` does.
+
+        The renderer draws one frame at a time, so the observations are
+        delivered one call late. Call `flush_pipeline()` to collect the frame
+        still in flight, e.g. before calling `reset()`.
+        """
+        assert not self.config.enable_batch_renderer
+        assert self.renderer is not None
+        if self._async_draw_agent_ids is not None and self.__pipelined_frame is None:
+            raise RuntimeError(
+                "start_async_render_and_step_physics was already called.  "
+                "Call get_sensor_observations_async_finish before calling "
+                "step_pipelined."
+            )
+
+        if isinstance(action, MutableMapping):
+            return_single = False
+        else:
+            action = cast(Dict[int, Union[str, int]], {self._default_agent_id: action})
+            return_single = True
+
+        # The render thread hands the scene graph back once it has captured
+        # the transforms of the frame in flight.
+        self.renderer.wait_scene_graph()
+
+        self._num_total_frames += 1
+        collided_dict = dict(
+            zip(action.keys(), self.__act(list(action.keys()), list(action.values())))
+        )
+
+        # step physics by dt
+        step_start_Time = time.time()
+        super().step_world(dt)
+        self._previous_step_time = time.time() - step_start_Time
+
+        previous_frame = self.flush_pipeline()
+
+        self.start_async_render(
+            self._default_agent_id if return_single else list(action.keys())
+        )
+        self.__pipelined_frame = _PipelinedFrame(
+            self._num_total_frames, collided_dict, return_single
+        )
+        return previous_frame
+
+    def flush_pipeline(
+        self,
+    ) -> Optional[Tuple[int, Union[ObservationDict, Dict[int, ObservationDict]]]]:
+        r"""Waits for the frame being rendered by `step_pipelined()`
+
+        :return: ``(frame_index, observations)`` for that frame, or
+            :py:`None` if no frame is in flight.
+        """
+        frame = self.__pipelined_frame
+        if frame is None:
+            return None
+        self.__pipelined_frame = None
+
+        observations = self.get_sensor_observations_async_finish()
+        if frame.return_single:
+            observations["collided"] = frame.collided[self._default_agent_id]
+        else:
+            for agent_id, agent_observation in observations.items():
+                agent_observation["collided"] = frame.collided[agent_id]
+        return frame.frame_index, observations
+
+    def step_batch(
+        self,
+        actions: Union[ndarray, List[Any]],
+        dt: float = 1.0 / 60.0,
+    ) -> Dict[str, Union[ndarray, "Tensor"]]:
+        r"""Acts all agents, steps the world once and returns the observations
+        of every agent stacked agent-major.
+
+        :param actions: One action key per agent, indexed by agent id.
+        :param dt: The amount of time to step the world by.
+        :return: A dict mapping each sensor uuid to a ``(num_agents, ...)``
+            array and ``collided`` to a ``(num_agents,)`` boolean array.
+
+        All agents must have the same sensors. The returned arrays are
+        preallocated and reused by every call, so copy them if they need to
+        outlive the next call to `step_batch()`.
+        """
+        assert not self.config.enable_batch_renderer
+        if len(actions) != len(self.agents):
+            raise ValueError(
+                f"step_batch expects one action per agent, got {len(actions)} "
+                f"actions for {len(self.agents)} agents"
+            )
+
+        self._num_total_frames += 1
+        batch_observations = self._get_batch_observation_buffers()
+        batch_observations["collided"][...] = self.__act(
+            range(len(self.agents)), actions
+        )
+
+        # step physics by dt
+        step_start_Time = time.time()
+        super().step_world(dt)
+        self._previous_step_time = time.time() - step_start_Time
+
+        for agent_sensorsuite in self.__sensors:
+            for sensor in agent_sensorsuite.values():
+                sensor.draw_observation()
+
+        for agent_id, agent_sensorsuite in enumerate(self.__sensors):
+            for sensor_uuid, sensor in agent_sensorsuite.items():
+                sensor._get_observation_into(batch_observations[sensor_uuid][agent_id])
+
+        return batch_observations
+
+    def _get_batch_observation_buffers(self) -> Dict[str, Union[ndarray, "Tensor"]]:
+        if len(self.__batch_observations) > 0:
+            return self.__batch_observations
+
+        num_agents = len(self.agents)
+        reference_sensors = self.__sensors[self._default_agent_id]
+        for agent_id, agent_sensorsuite in enumerate(self.__sensors):
+            if agent_sensorsuite.keys() != reference_sensors.keys() or any(
+                sensor._buffer_layout() != reference_sensors[uuid]._buffer_layout()
+                for uuid, sensor in agent_sensorsuite.items()
+            ):
+                raise RuntimeError(
+                    f"step_batch requires all agents to have the same sensors, "
+                    f"but agent {agent_id} differs from agent {self._default_agent_id}"
+                )
+
+        for sensor_uuid, sensor in reference_sensors.items():
+            self.__batch_observations[sensor_uuid] = sensor._allocate_batch(num_agents)
+        self.__batch_observations["collided"] = np.zeros(num_agents, dtype=bool)
+
+        return self.__batch_observations
+
     def make_greedy_follower(
         self,
         agent_id: Optional[int] = None,
@@ -547,6 +966,11 @@ class Sensor:
         self._sensor_object = self._agent._sensors[sensor_id]
 
         self._spec = self._sensor_object.specification()
+        self._ring: List[Tuple[ndarray, mn.MutableImageView2D]] = []
+        # Noisy observations of the ring slots, for noise models writing into
+        # a buffer
+        self._noisy_ring: List[ndarray] = []
+        self._noise_model: Optional[SensorNoiseModel] = None
 
         # When using the batch renderer, no memory is allocated here.
         if not self._sim.config.enable_batch_renderer:
@@ -582,37 +1006,12 @@ class Sensor:
                     resolution[0], resolution[1], 4, dtype=torch.uint8, device=device
                 )
         else:
-            size = self._sensor_object.framebuffer_size
-            if self._spec.sensor_type == SensorType.SEMANTIC:
-                self._buffer = np.empty(
-                    (self._spec.resolution[0], self._spec.resolution[1]),
-                    dtype=np.uint32,
-                )
-                self.view = mn.MutableImageView2D(
-                    mn.PixelFormat.R32UI, size, self._buffer
-                )
-            elif self._spec.sensor_type == SensorType.DEPTH:
-                self._buffer = np.empty(
-                    (self._spec.resolution[0], self._spec.resolution[1]),
-                    dtype=np.float32,
-                )
-                self.view = mn.MutableImageView2D(
-                    mn.PixelFormat.R32F, size, self._buffer
-                )
-            else:
-                self._buffer = np.empty(
-                    (
-                        self._spec.resolution[0],
-                        self._spec.resolution[1],
-                        self._spec.channels,
-                    ),
-                    dtype=np.uint8,
-                )
-                self.view = mn.MutableImageView2D(
-                    mn.PixelFormat.RGBA8_UNORM,
-                    size,
-                    self._buffer.reshape(self._spec.resolution[0], -1),
-                )
+            ring_size = self._sim.config.observation_ring_size
+            self._ring = [self._allocate_buffer() for _ in range(ring_size)]
+            self._ring_index = 0
+            self._buffer, self.view = (
+                self._ring[0] if ring_size > 0 else self._allocate_buffer()
+            )
 
         noise_model_kwargs = self._spec.noise_model_kwargs
         self._noise_model = make_sensor_noise_model(
@@ -624,6 +1023,102 @@ class Sensor:
         ), "Noise model '{}' is not valid for sensor '{}'".format(
             self._spec.noise_model, self._spec.uuid
         )
+        if self._noise_model.supports_out_buffer:
+            self._noisy_ring = [np.empty_like(buffer) for buffer, _ in self._ring]
+
+    def _noise_batch_key(self) -> Optional[Tuple[Any, ...]]:
+        r"""Sensors with equal keys can have their noise applied in a single
+        batch, see `SensorNoiseModel.apply_batch()`. :py:`None` when the noise
+        of this sensor cannot be batched.
+        """
+        if (
+            self._noise_model is None
+            or not self._noise_model.supports_batch
+            or self._spec.gpu2gpu_transfer
+        ):
+            return None
+        return (
+            self._spec.noise_model,
+            repr(sorted(self._spec.noise_model_kwargs.items())),
+            self._buffer_layout(),
+        )
+
+    def seed_noise_model(self, seed: int) -> None:
+        r"""Restarts the random numbers of the noise model from a seed, unless
+        the noise model kwargs of the sensor spec set one.
+        """
+        if self._noise_model is None or "seed" in self._spec.noise_model_kwargs:
+            return
+        self._noise_model.reseed(seed)
+
+    def pregenerate_noise(self, num_frames: int) -> None:
+        r"""Draws the random numbers of the noise model for the next frames,
+        see `SensorNoiseModel.pregenerate()`.
+        """
+        if self._noise_model is None or self._spec.gpu2gpu_transfer:
+            return
+        self._noise_model.pregenerate(self._buffer.shape, num_frames)
+
+    def _allocate_buffer(self) -> Tuple[ndarray, mn.MutableImageView2D]:
+        r"""Allocates a CPU buffer for this sensor and a view of it that the
+        render target can read into.
+        """
+        size = self._sensor_object.framebuffer_size
+        if self._spec.sensor_type == SensorType.SEMANTIC:
+            buffer = np.empty(
+                (self._spec.resolution[0], self._spec.resolution[1]),
+                dtype=np.uint32,
+            )
+            view = mn.MutableImageView2D(mn.PixelFormat.R32UI, size, buffer)
+        elif self._spec.sensor_type == SensorType.DEPTH:
+            buffer = np.empty(
+                (self._spec.resolution[0], self._spec.resolution[1]),
+                dtype=np.float32,
+            )
+            view = mn.MutableImageView2D(mn.PixelFormat.R32F, size, buffer)
+        else:
+            buffer = np.empty(
+                (
+                    self._spec.resolution[0],
+                    self._spec.resolution[1],
+                    self._spec.channels,
+                ),
+                dtype=np.uint8,
+            )
+            view = mn.MutableImageView2D(
+                mn.PixelFormat.RGBA8_UNORM,
+                size,
+                buffer.reshape(self._spec.resolution[0], -1),
+            )
+        return buffer, view
+
+    def _advance_ring(self) -> None:
+        r"""Points the sensor buffer at the next slot of the observation ring,
+        if there is one, before a new frame is drawn into it.
+        """
+        if self._spec.gpu2gpu_transfer or len(self._ring) == 0:
+            return
+        self._ring_index = (self._ring_index + 1) % len(self._ring)
+        self._buffer, self.view = self._ring[self._ring_index]
+
+    def _finalize_observation(
+        self, obs: Union[ndarray, "Tensor"]
+    ) -> Union[ndarray, "Tensor"]:
+        r"""Applies the noise model, or, in ring mode without noise, hands out
+        a read-only view of the ring slot instead of a copy. In ring mode, noise
+        models supporting it write into a buffer owned by the ring slot.
+        """
+        if isinstance(obs, np.ndarray) and len(self._ring) > 0:
+            if isinstance(self._noise_model, NoSensorNoiseModel):
+                obs.flags.writeable = False
+                return obs
+            if len(self._noisy_ring) > 0:
+                noisy = self._noisy_ring[self._ring_index]
+                noisy.flags.writeable = True
+                self._noise_model.apply(obs, out=noisy)
+                noisy.flags.writeable = False
+                return noisy
+        return self._noise_model(obs)
 
     def draw_observation(self) -> None:
         # Batch rendering happens elsewhere.
@@ -642,6 +1137,7 @@ class Sensor:
                 "Sensor observation requested but sensor is invalid.\
                     (has it been detached from a scene node?)"
             )
+        self._advance_ring()
         self._sim.renderer.draw(self._sensor_object, self._sim)
 
     def _draw_observation_async(self) -> None:
@@ -703,18 +1199,15 @@ class Sensor:
         if self._sim.frustum_culling:
             render_flags |= habitat_sim.gfx.Camera.Flags.FRUSTUM_CULLING
 
+        self._advance_ring()
         self._sim.renderer.enqueue_async_draw_job(
             self._sensor_object, scene, self.view, render_flags
         )
 
-    def get_observation(self) -> Union[ndarray, "Tensor"]:
-        if self._spec.sensor_type == SensorType.AUDIO:
-            return self._get_audio_observation()
-
-        # Placeholder until batch renderer emplaces the final value.
-        if self._sim.config.enable_batch_renderer:
-            return None
-
+    def _read_frame(self) -> Union[ndarray, "Tensor"]:
+        r"""Reads the rendered frame into the sensor buffer and returns it
+        flipped to image orientation, without noise applied.
+        """
         assert self._sim.renderer is not None
         tgt = self._sensor_object.render_target
 
@@ -727,18 +1220,62 @@ class Sensor:
                 else:
                     tgt.read_frame_rgba_gpu(self._buffer.data_ptr())  # type: ignore[attr-defined, union-attr]
 
-                obs = self._buffer.flip(0)  # type: ignore[union-attr]
+                return self._buffer.flip(0)  # type: ignore[union-attr]
+
+        if self._spec.sensor_type == SensorType.SEMANTIC:
+            tgt.read_frame_object_id(self.view)
+        elif self._spec.sensor_type == SensorType.DEPTH:
+            tgt.read_frame_depth(self.view)
         else:
-            if self._spec.sensor_type == SensorType.SEMANTIC:
-                tgt.read_frame_object_id(self.view)
-            elif self._spec.sensor_type == SensorType.DEPTH:
-                tgt.read_frame_depth(self.view)
-            else:
-                tgt.read_frame_rgba(self.view)
+            tgt.read_frame_rgba(self.view)
 
-            obs = np.flip(self._buffer, axis=0)
+        return np.flip(self._buffer, axis=0)
 
-        return self._noise_model(obs)
+    def get_observation(self) -> Union[ndarray, "Tensor"]:
+        if self._spec.sensor_type == SensorType.AUDIO:
+            return self._get_audio_observation()
+
+        # Placeholder until batch renderer emplaces the final value.
+        if self._sim.config.enable_batch_renderer:
+            return None
+
+        return self._finalize_observation(self._read_frame())
+
+    def _buffer_layout(self) -> Tuple[Any, ...]:
+        if self._spec.sensor_type == SensorType.AUDIO:
+            return (self._spec.sensor_type,)
+        return (self._spec.sensor_type, tuple(self._buffer.shape), self._buffer.dtype)
+
+    def _allocate_batch(self, batch_size: int) -> Union[ndarray, "Tensor"]:
+        r"""Allocates a ``(batch_size, ...)`` array matching this sensor's
+        observations. Used by `Simulator.step_batch()`.
+        """
+        if self._spec.sensor_type == SensorType.AUDIO:
+            raise RuntimeError("step_batch does not support audio sensors")
+
+        if self._spec.gpu2gpu_transfer:
+            return torch.empty(
+                (batch_size, *self._buffer.shape),
+                dtype=self._buffer.dtype,
+                device=self._buffer.device,  # type: ignore[union-attr]
+            )
+        return np.empty((batch_size, *self._buffer.shape), dtype=self._buffer.dtype)
+
+    def _get_observation_into(self, out: Union[ndarray, "Tensor"]) -> None:
+        r"""Reads the rendered frame, applies the noise model and writes the
+        result into :p:`out`.
+
+        With no noise model the flipped frame is copied straight into
+        :p:`out`, and noise models supporting it write into :p:`out`, instead
+        of going through an intermediate copy.
+        """
+        obs = self._read_frame()
+        if isinstance(self._noise_model, NoSensorNoiseModel):
+            out[...] = obs
+        elif self._noise_model.supports_out_buffer and isinstance(out, np.ndarray):
+            self._noise_model.apply(obs, out=out)
+        else:
+            out[...] = self._noise_model(obs)
 
     def _get_observation_async(self) -> Union[ndarray, "Tensor"]:
         if self._spec.sensor_type == SensorType.AUDIO:
@@ -748,7 +1285,7 @@ class Sensor:
         else:
             obs = np.flip(self._buffer, axis=0)
 
-        return self._noise_model(obs)
+        return self._finalize_observation(obs)
 
     def _get_audio_observation(self) -> Union[ndarray, "Tensor"]:
         assert self._spec.sensor_type == SensorType.AUDIO
@@ -57,6 +57,10 @@ default_sim_settings: Dict[str, Any] = {
     "default_agent_navmesh": True,
     # if configuring a navmesh, should STATIC MotionType objects be included
     "navmesh_include_static_objects": False,
+    # directory to cache built navmeshes in, shared across processes. Empty disables the cache.
+    "navmesh_cache_directory": "",
+    # directory to cache the collision shapes of stages in, shared across processes. Empty disables the cache.
+    "collision_shape_cache_directory": "",
     # Enable horizon-based ambient occlusion, which provides soft shadows in corners and crevices.
     "enable_hbao": False,
 }
@@ -86,6 +90,10 @@ def make_cfg(settings: Dict[str, Any]):
     if "scene_light_setup" in settings:
         sim_cfg.scene_light_setup = settings["scene_light_setup"]
     sim_cfg.enable_hbao = settings.get("enable_hbao", False)
+    sim_cfg.navmesh_cache_directory = settings.get("navmesh_cache_directory", "")
+    sim_cfg.collision_shape_cache_directory = settings.get(
+        "collision_shape_cache_directory", ""
+    )
     sim_cfg.gpu_device_id = 0
 
     if not hasattr(sim_cfg, "scene_id"):
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+
+# Copyright (c) Meta Platforms, Inc. and its affiliates.
+# This source code is licensed under the MIT license found in the
+# LICENSE file in the root directory of this source tree.
+
+import multiprocessing
+import sys
+import traceback
+from multiprocessing import resource_tracker, shared_memory
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+
+from habitat_sim.simulator import Configuration, Simulator
+
+__all__ = ["VectorSimulator"]
+
+_SETUP = "setup"
+_RESET = "reset"
+_STEP = "step"
+_CALL = "call"
+_CLOSE = "close"
+
+# uuid -> (shape, dtype) of each observation of a single simulator
+_ObservationLayout = Dict[str, Tuple[Tuple[int, ...], str]]
+
+
+def _observation_layout(observations: Dict[str, Any]) -> _ObservationLayout:
+    layout: _ObservationLayout = {}
+    for uuid, obs in observations.items():
+        if not isinstance(obs, np.ndarray):
+            raise TypeError(
+                f"VectorSimulator only supports numpy observations, but sensor "
+                f"{uuid} returned {type(obs).__name__}"
+            )
+        layout[uuid] = (obs.shape, obs.dtype.str)
+    return layout
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    r"""Attaches to a shared memory block owned by the parent process.
+
+    The block must not be registered with the resource tracker of the
+    worker, which may unlink it when the worker exits. Unregistering it after
+    attaching isn't an option either: the tracker may be the one of the
+    parent, which would then lose track of the block.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)  # type: ignore[call-arg]
+    # Before Python 3.13 attaching always registers the block. This only runs
+    # in the single-threaded worker setup, so swapping the function is safe.
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None  # type: ignore[assignment]
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register  # type: ignore[assignment]
+
+
+def _worker_loop(
+    connection: Connection, make_config: Callable[[], Configuration]
+) -> None:
+    sim = None
+    blocks: List[shared_memory.SharedMemory] = []
+    slots: Dict[str, np.ndarray] = {}
+    try:
+        try:
+            sim = Simulator(make_config())
+            observations = sim.reset()
+            connection.send((True, _observation_layout(observations)))
+        except Exception:
+            connection.send((False, traceback.format_exc()))
+            return
+
+        # The parent allocates one block per sensor holding the observations
+        # of all the simulators, this worker writes into its own slot.
+        command, data = connection.recv()
+        if command == _CLOSE:
+            return
+        block_names, index, num_envs = data
+        for uuid, (shape, dtype) in _observation_layout(observations).items():
+            block = _attach_shared_memory(block_names[uuid])
+            blocks.append(block)
+            slots[uuid] = np.ndarray(
+                (num_envs, *shape), dtype=np.dtype(dtype), buffer=block.buf
+            )[index]
+
+        def write_observations(observations: Dict[str, Any]) -> None:
+            for uuid, slot in slots.items():
+                slot[...] = observations[uuid]
+
+        write_observations(observations)
+        connection.send((True, None))
+
+        while True:
+            command, data = connection.recv()
+            if command == _CLOSE:
+                break
+            try:
+                if command == _STEP:
+                    observations = sim.step(data)
+                    collided = observations.pop("collided")
+                    write_observations(observations)
+                    result: Any = collided
+                elif command == _RESET:
+                    write_observations(sim.reset())
+                    result = None
+                elif command == _CALL:
+                    name, args, kwargs = data
+                    result = getattr(sim, name)(*args, **kwargs)
+                else:
+                    raise ValueError(f"Unknown command {command}")
+            except Exception:
+                connection.send((False, traceback.format_exc()))
+            else:
+                connection.send((True, result))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Only the parent unlinks the shared memory
+        slots.clear()
+        for block in blocks:
+            block.close()
+        if sim is not None:
+            sim.close()
+        connection.close()
+
+
+class VectorSimulator:
+    r"""Runs several `Simulator` instances in worker processes.
+
+    :param make_config_fns: One callable per simulator returning its
+        `Configuration`. They are called in the worker processes, so they must
+        be picklable, e.g. a module level function or a :py:`functools.partial`
+        of one.
+    :param multiprocessing_start_method: The multiprocessing start method used
+        to create the workers. Forking a process that already holds an OpenGL
+        context is not safe, so this defaults to :py:`"forkserver"`.
+
+    Actions are sent to the workers over pipes, while observations are written
+    by the workers into shared memory, one block per sensor laid out as an
+    :py:`(num_envs, *observation_shape)` array. `reset()` and `step()` return
+    views into those blocks, so the parent never unpickles frames. The views
+    are overwritten by the next call to `reset()` or `step()`; copy them if
+    they need to outlive it.
+
+    All simulators must have the same sensors and only the observations of
+    the default agent are collected.
+    """
+
+    def __init__(
+        self,
+        make_config_fns: Sequence[Callable[[], Configuration]],
+        multiprocessing_start_method: str = "forkserver",
+    ) -> None:
+        self._waiting = False
+        self._connections: List[Connection] = []
+        self._processes: List[multiprocessing.process.BaseProcess] = []
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self._observations: Dict[str, np.ndarray] = {}
+        self._closed = False
+
+        num_envs = len(make_config_fns)
+        if num_envs == 0:
+            raise ValueError("VectorSimulator needs at least one simulator")
+
+        context = multiprocessing.get_context(multiprocessing_start_method)
+        for make_config in make_config_fns:
+            parent_connection, worker_connection = context.Pipe()
+            process = context.Process(
+                target=_worker_loop,
+                args=(worker_connection, make_config),
+                daemon=True,
+            )
+            process.start()
+            worker_connection.close()
+            self._connections.append(parent_connection)
+            self._processes.append(process)
+
+        try:
+            layouts = self._receive_all()
+            if any(layout != layouts[0] for layout in layouts[1:]):
+                raise ValueError(
+                    "All simulators of a VectorSimulator must have the same sensors"
+                )
+
+            for uuid, (shape, dtype) in layouts[0].items():
+                dtype = np.dtype(dtype)
+                nbytes = num_envs * int(np.prod(shape)) * dtype.itemsize
+                block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+                self._blocks.append(block)
+                self._observations[uuid] = np.ndarray(
+                    (num_envs, *shape), dtype=dtype, buffer=block.buf
+                )
+
+            block_names = {
+                uuid: block.name
+                for uuid, block in zip(self._observations.keys(), self._blocks)
+            }
+            for index, connection in enumerate(self._connections):
+                connection.send((_SETUP, (block_names, index, num_envs)))
+            self._receive_all()
+        except Exception:
+            self.close()
+            raise
+
+        self._collided = np.zeros(num_envs, dtype=bool)
+
+    @property
+    def num_envs(self) -> int:
+        return len(self._connections)
+
+    def _receive_all(self) -> List[Any]:
+        results = [connection.recv() for connection in self._connections]
+        for index, (success, result) in enumerate(results):
+            if not success:
+                raise RuntimeError(f"Simulator {index} raised an error:\n{result}")
+        return [result for _, result in results]
+
+    def _batch(self) -> Dict[str, Union[np.ndarray, Any]]:
+        batch: Dict[str, Union[np.ndarray, Any]] = dict(self._observations)
+        batch["collided"] = self._collided
+        return batch
+
+    def reset(self) -> Dict[str, np.ndarray]:
+        r"""Resets all simulators.
+
+        :return: The stacked observations of all simulators.
+        """
+        for connection in self._connections:
+            connection.send((_RESET, None))
+        self._receive_all()
+        self._collided[...] = False
+        return self._batch()
+
+    def step_async(self, actions: Sequence[Union[str, int]]) -> None:
+        r"""Sends one action to each simulator without waiting for the
+        result. Call `step_wait()` to collect the observations.
+        """
+        if len(actions) != self.num_envs:
+            raise ValueError(
+                f"Expected {self.num_envs} actions, but got {len(actions)}"
+            )
+        if self._waiting:
+            raise RuntimeError("step_async called twice without step_wait")
+        for connection, action in zip(self._connections, actions):
+            connection.send((_STEP, action))
+        self._waiting = True
+
+    def step_wait(self) -> Dict[str, np.ndarray]:
+        r"""Waits for the actions sent by `step_async()`.
+
+        :return: The stacked observations of all simulators, with a boolean
+            :py:`"collided"` array.
+        """
+        if not self._waiting:
+            raise RuntimeError("step_wait called without step_async")
+        self._waiting = False
+        self._collided[...] = self._receive_all()
+        return self._batch()
+
+    def step(self, actions: Sequence[Union[str, int]]) -> Dict[str, np.ndarray]:
+        r"""Steps every simulator with its action, see `Simulator.step()`.
+
+        :param actions: One action per simulator.
+        :return: The stacked observations of all simulators, with a boolean
+            :py:`"collided"` array.
+        """
+        self.step_async(actions)
+        return self.step_wait()
+
+    def call(self, name: str, *args: Any, **kwargs: Any) -> List[Any]:
+        r"""Calls a `Simulator` method in every worker and returns the
+        (pickled) results.
+        """
+        for connection in self._connections:
+            connection.send((_CALL, (name, args, kwargs)))
+        return self._receive_all()
+
+    def call_at(self, index: int, name: str, *args: Any, **kwargs: Any) -> Any:
+        r"""Calls a `Simulator` method in a single worker and returns the
+        (pickled) result.
+        """
+        connection = self._connections[index]
+        connection.send((_CALL, (name, args, kwargs)))
+        success, result = connection.recv()
+        if not success:
+            raise RuntimeError(f"Simulator {index} raised an error:\n{result}")
+        return result
+
+    def close(self) -> None:
+        r"""Stops the workers and frees the shared memory."""
+        if self._closed:
+            return
+        self._closed = True
+
+        for connection in self._connections:
+            try:
+                if self._waiting:
+                    connection.recv()
+                connection.send((_CLOSE, None))
+            except (BrokenPipeError, EOFError):
+                pass
+        self._waiting = False
+        for process in self._processes:
+            process.join()
+        for connection in self._connections:
+            connection.close()
+
+        self._observations.clear()
+        for block in self._blocks:
+            try:
+                block.close()
+            except BufferError:
+                # Views returned by reset or step are still alive, the mapping
+                # is released once they are garbage collected
+                pass
+            block.unlink()
+        self._blocks.clear()
+
+    def __enter__(self) -> "VectorSimulator":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
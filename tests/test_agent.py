@@ -87,3 +87,94 @@ def test_change_state():
             _check_state_same(v, new_state.sensor_states[k])
 
     np.random.set_state(random_state)
+
+
+def test_agent_states():
+    random_state = np.random.get_state()
+    np.random.seed(234)
+    scene_graph = habitat_sim.SceneGraph()
+    agents = [
+        habitat_sim.Agent(scene_graph.get_root_node().create_child()) for _ in range(3)
+    ]
+
+    expected = []
+    for agent in agents:
+        state = agent.state
+        state.position += np.random.uniform(-1, 1, size=3)
+        state.rotation *= quat_from_angle_axis(
+            np.random.uniform(0, 2 * np.pi), np.array([0.0, 1.0, 0.0])
+        )
+        agent.set_state(state)
+        expected.append(agent.state)
+
+    # A sensor none of the agents has is NaN and skipped
+    states = habitat_sim.AgentStates.empty(len(agents), ["missing"])
+    for index, agent in enumerate(agents):
+        agent.get_state_into(states, index)
+    assert np.isnan(states.sensor_poses).all()
+    for index, state in enumerate(expected):
+        _check_state_same(states.get_state(index), state)
+        assert len(states.get_state(index).sensor_states) == 0
+
+    # Round trip through set_state_from, in reverse order
+    for index, agent in enumerate(reversed(agents)):
+        agent.set_state_from(states, index)
+    for agent, state in zip(reversed(agents), expected):
+        _check_state_same(agent.state, state)
+
+    states.set_state(0, expected[1])
+    _check_state_same(states.get_state(0), expected[1])
+
+    np.random.set_state(random_state)
+
+
+@pytest.mark.parametrize(
+    "action_name",
+    [
+        "move_forward",
+        "move_backward",
+        "move_left",
+        "move_right",
+        "move_up",
+        "move_down",
+        "turn_left",
+        "turn_right",
+        "look_up",
+        "look_down",
+    ],
+)
+def test_native_default_controls(action_name):
+    scene_graph = habitat_sim.SceneGraph()
+    agents = [
+        habitat_sim.Agent(scene_graph.get_root_node().create_child()) for _ in range(2)
+    ]
+    for agent in agents:
+        agent.agent_config.action_space = {
+            action_name: habitat_sim.ActionSpec(
+                action_name, habitat_sim.ActuationSpec(amount=7.0, constraint=20.0)
+            )
+        }
+    state = agents[0].state
+    state.position = np.array([0.5, 0.0, -1.0])
+    state.rotation = quat_from_angle_axis(0.3, np.array([0.0, 1.0, 0.0]))
+    for agent in agents:
+        agent.set_state(state)
+
+    # The registry implementation against the native one, several times to
+    # reach the look constraint
+    move_fn = habitat_sim.registry.get_move_fn(action_name)
+    action = agents[0].agent_config.action_space[action_name]
+    for _ in range(4):
+        if move_fn.body_action:
+            objs = [agents[0].scene_node]
+        else:
+            objs = [v.object for v in agents[0]._sensors.values()]
+        for obj in objs:
+            move_fn(obj, action.actuation)
+        collided = habitat_sim.Agent.act_batch(agents[1:], [action_name])
+        assert not collided.any()
+
+        expected, state = agents[0].state, agents[1].state
+        _check_state_same(expected, state)
+        for k, v in expected.sensor_states.items():
+            _check_state_same(v, state.sensor_states[k])
@@ -10,6 +10,7 @@ import pytest
 import tqdm
 
 import habitat_sim
+from habitat_sim.nav.greedy_geodesic_follower import _native_allow_sliding
 
 NUM_TESTS = 100
 TURN_DEGREE = 30.0
@@ -188,3 +189,94 @@ def test_greedy_follower(test_navmesh, move_filter_fn, action_noise, pbar):
 
     if not test_all:
         assert test_spl / NUM_TESTS >= ACCEPTABLE_SPLS[(move_filter_fn, action_noise)]
+
+
+@pytest.mark.parametrize("test_navmesh", test_navmeshes)
+@pytest.mark.parametrize("allow_sliding", [True, False])
+def test_batch_greedy_follower(test_navmesh, allow_sliding):
+    if not osp.exists(test_navmesh):
+        pytest.skip(f"{test_navmesh} not found")
+
+    num_agents = 4
+    pathfinder = habitat_sim.PathFinder()
+    pathfinder.load_nav_mesh(test_navmesh)
+    assert pathfinder.is_loaded
+    pathfinder.seed(0)
+
+    scene_graph = habitat_sim.SceneGraph()
+    agents = [
+        habitat_sim.Agent(scene_graph.get_root_node().create_child())
+        for _ in range(num_agents)
+    ]
+    for agent in agents:
+        agent.controls.move_filter_fn = habitat_sim.agent.NavMeshMoveFilter(
+            pathfinder, allow_sliding
+        )
+        agent.agent_config.action_space["turn_left"].actuation.amount = TURN_DEGREE
+        agent.agent_config.action_space["turn_right"].actuation.amount = TURN_DEGREE
+
+    # The reference followers go through the python callbacks, which the
+    # native path of the other followers must reproduce
+    reference_agents = [
+        habitat_sim.Agent(scene_graph.get_root_node().create_child())
+        for _ in range(num_agents)
+    ]
+    navmesh_filter = habitat_sim.agent.NavMeshMoveFilter(pathfinder, allow_sliding)
+    for agent in reference_agents:
+        agent.controls.move_filter_fn = lambda start, end: navmesh_filter(start, end)
+        agent.agent_config.action_space["turn_left"].actuation.amount = TURN_DEGREE
+        agent.agent_config.action_space["turn_right"].actuation.amount = TURN_DEGREE
+
+    followers = [habitat_sim.GreedyGeodesicFollower(pathfinder, a) for a in agents]
+    reference_followers = [
+        habitat_sim.GreedyGeodesicFollower(pathfinder, a) for a in reference_agents
+    ]
+    for follower in reference_followers:
+        assert (
+            _native_allow_sliding(
+                pathfinder,
+                follower.agent,
+                follower.forward_spec,
+                follower.left_spec,
+                follower.right_spec,
+            )
+            is None
+        )
+    batch_follower = habitat_sim.BatchGreedyGeodesicFollower(
+        pathfinder, agents[0], num_agents
+    )
+
+    states = habitat_sim.AgentStates.empty(num_agents, [])
+    goals = np.empty((num_agents, 3), dtype=np.float32)
+    for index, agent in enumerate(agents):
+        state = habitat_sim.AgentState()
+        while True:
+            state.position = pathfinder.get_random_navigable_point()
+            goals[index] = pathfinder.get_random_navigable_point()
+            path = habitat_sim.ShortestPath()
+            path.requested_start = state.position
+            path.requested_end = goals[index]
+            if pathfinder.find_path(path) and path.geodesic_distance > 2.0:
+                break
+        agent.state = state
+        reference_agents[index].state = state
+        agent.get_state_into(states, index)
+
+    # Whole paths, for any number of rows at once
+    paths = batch_follower.find_paths(states, goals)
+    for follower, goal, path in zip(followers, goals, paths):
+        assert path == follower.find_path(goal)
+
+    # Step by step, each agent having its own follower
+    for _ in range(20):
+        actions = batch_follower.next_actions_along(states, goals)
+        for index, (agent, action) in enumerate(zip(agents, actions)):
+            assert action == followers[index].next_action_along(goals[index])
+            assert action == reference_followers[index].next_action_along(goals[index])
+            if action is not None:
+                agent.act(action)
+                reference_agents[index].act(action)
+            agent.get_state_into(states, index)
+
+    for agent, reference_agent in zip(agents, reference_agents):
+        assert np.allclose(agent.state.position, reference_agent.state.position)
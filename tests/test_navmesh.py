@@ -16,6 +16,12 @@ EPS = 1e-5
 
 base_dir = osp.abspath(osp.join(osp.dirname(__file__), ".."))
 
+
+def _navmesh_version(path):
+    # The version follows the magic number in the header of the file
+    return int(np.fromfile(path, dtype=np.int32, count=2)[1])
+
+
 test_scenes = [
     osp.join(base_dir, "data/scene_datasets/mp3d_example/17DRP5sb8fy/17DRP5sb8fy.glb"),
     osp.join(base_dir, "data/scene_datasets/habitat-test-scenes/skokloster-castle.glb"),
@@ -195,6 +201,8 @@ def test_save_navmesh_settings(agent_radius_mul, tmpdir):
     with habitat_sim.Simulator(hab_cfg) as sim:
         assert sim.pathfinder.is_loaded
         sim.pathfinder.save_nav_mesh(osp.join(tmpdir, "out.navmesh"))
+        # Navmeshes that aren't tiled keep the format of older versions
+        assert _navmesh_version(osp.join(tmpdir, "out.navmesh")) == 2
         pathfinder = habitat_sim.PathFinder()
         assert pathfinder.nav_mesh_settings is None
         pathfinder.load_nav_mesh(osp.join(tmpdir, "out.navmesh"))
@@ -202,6 +210,165 @@ def test_save_navmesh_settings(agent_radius_mul, tmpdir):
         assert sim.pathfinder.nav_mesh_settings == pathfinder.nav_mesh_settings
 
 
+def test_navmesh_cache(tmpdir):
+    test_scene = osp.join(
+        base_dir, "data/scene_datasets/habitat-test-scenes/van-gogh-room.glb"
+    )
+    if not osp.exists(test_scene):
+        pytest.skip(f"{test_scene} not found")
+
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = test_scene
+    cfg_settings["navmesh_cache_directory"] = str(tmpdir.join("cache"))
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        cache = sim.pathfinder.navmesh_cache
+        assert cache is not None
+        navmesh_settings = habitat_sim.NavMeshSettings()
+        navmesh_settings.set_defaults()
+        navmesh_settings.agent_radius = 0.3
+
+        # The first build fills the cache, the second one loads from it
+        cache.clear()
+        assert sim.recompute_navmesh(sim.pathfinder, navmesh_settings)
+        built_area = sim.pathfinder.navigable_area
+        built_bounds = sim.pathfinder.get_bounds()
+        cache_size = cache.size
+        assert cache_size > 0
+        assert sim.recompute_navmesh(sim.pathfinder, navmesh_settings)
+        assert cache.size == cache_size
+        assert np.isclose(sim.pathfinder.navigable_area, built_area)
+        assert np.allclose(sim.pathfinder.get_bounds(), built_bounds)
+        assert sim.pathfinder.nav_mesh_settings == navmesh_settings
+
+        # Other settings are another entry
+        navmesh_settings.agent_radius = 0.2
+        assert sim.recompute_navmesh(sim.pathfinder, navmesh_settings)
+        assert cache.size > cache_size
+
+        # Other pathfinders share the cache
+        pathfinder = habitat_sim.PathFinder()
+        pathfinder.navmesh_cache = habitat_sim.nav.NavMeshCache(cache.directory)
+        assert sim.recompute_navmesh(pathfinder, navmesh_settings)
+        assert np.isclose(pathfinder.navigable_area, sim.pathfinder.navigable_area)
+
+        cache.max_size = cache_size
+        cache.evict()
+        assert cache.size <= cache_size
+        cache.clear()
+        assert cache.size == 0
+
+
+@pytest.mark.parametrize("test_scene", test_scenes)
+def test_tiled_navmesh_build(test_scene):
+    if not osp.exists(test_scene):
+        pytest.skip(f"{test_scene} not found")
+
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = test_scene
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        navmesh_settings = habitat_sim.NavMeshSettings()
+        navmesh_settings.set_defaults()
+        assert sim.recompute_navmesh(sim.pathfinder, navmesh_settings)
+        single_tile_area = sim.pathfinder.navigable_area
+        sim.pathfinder.seed(0)
+        samples = [
+            (
+                sim.pathfinder.get_random_navigable_point(),
+                sim.pathfinder.get_random_navigable_point(),
+            )
+            for _ in range(20)
+        ]
+        single_tile_results = get_shortest_path(sim, samples)
+
+        navmesh_settings.tile_size = 64
+        tiled_areas = []
+        for num_build_threads in [1, 4]:
+            sim.pathfinder.num_build_threads = num_build_threads
+            assert sim.recompute_navmesh(sim.pathfinder, navmesh_settings)
+            assert sim.pathfinder.nav_mesh_settings.tile_size == 64
+            tiled_areas.append(sim.pathfinder.navigable_area)
+
+        # The same navmesh whatever the number of threads, close to the
+        # single tile one
+        assert tiled_areas[0] == tiled_areas[1]
+        assert np.isclose(tiled_areas[0], single_tile_area, rtol=0.05)
+        for (found, distance, _), (tiled_found, tiled_distance, _) in zip(
+            single_tile_results, get_shortest_path(sim, samples)
+        ):
+            if found and tiled_found:
+                assert np.isclose(distance, tiled_distance, rtol=0.1, atol=0.1)
+
+
+def test_update_navmesh_tiles(tmpdir):
+    test_scene = osp.join(
+        base_dir, "data/scene_datasets/habitat-test-scenes/van-gogh-room.glb"
+    )
+    if not osp.exists(test_scene):
+        pytest.skip(f"{test_scene} not found")
+
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = test_scene
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+
+    def world_bb(obj):
+        return habitat_sim.geo.get_transformed_bb(
+            obj.root_scene_node.cumulative_bb, obj.transformation
+        )
+
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        navmesh_settings = habitat_sim.NavMeshSettings()
+        navmesh_settings.set_defaults()
+        navmesh_settings.include_static_objects = True
+        navmesh_settings.tile_size = 32
+        assert sim.recompute_navmesh(sim.pathfinder, navmesh_settings)
+        empty_area = sim.pathfinder.navigable_area
+        assert empty_area > 0
+
+        sim.pathfinder.seed(0)
+        start = sim.pathfinder.get_random_navigable_point()
+        goal = sim.pathfinder.get_random_navigable_point()
+
+        # Added
+        obj_template_mgr = sim.get_object_template_manager()
+        rigid_obj_mgr = sim.get_rigid_object_manager()
+        cube = rigid_obj_mgr.add_object_by_template_handle(
+            obj_template_mgr.get_template_handles("cubeSolid")[0]
+        )
+        cube.translation = start
+        cube.motion_type = habitat_sim.physics.MotionType.STATIC
+        assert sim.update_navmesh(sim.pathfinder, [world_bb(cube)])
+        assert sim.pathfinder.navigable_area < empty_area
+
+        # Moved, same as recomputing everything
+        old_bb = world_bb(cube)
+        cube.motion_type = habitat_sim.physics.MotionType.KINEMATIC
+        cube.translation = goal
+        cube.motion_type = habitat_sim.physics.MotionType.STATIC
+        assert sim.update_navmesh(sim.pathfinder, [old_bb, world_bb(cube)])
+        updated_area = sim.pathfinder.navigable_area
+        updated_islands = sim.pathfinder.num_islands
+        assert sim.recompute_navmesh(sim.pathfinder, navmesh_settings)
+        assert np.isclose(updated_area, sim.pathfinder.navigable_area, rtol=1e-3)
+        assert updated_islands == sim.pathfinder.num_islands
+
+        # The tile size is saved with the navmesh
+        sim.pathfinder.save_nav_mesh(osp.join(tmpdir, "tiled.navmesh"))
+        assert _navmesh_version(osp.join(tmpdir, "tiled.navmesh")) == 3
+        pathfinder = habitat_sim.PathFinder()
+        assert pathfinder.load_nav_mesh(osp.join(tmpdir, "tiled.navmesh"))
+        assert pathfinder.nav_mesh_settings == navmesh_settings
+        assert pathfinder.nav_mesh_settings.tile_size == 32
+
+        # Removed
+        old_bb = world_bb(cube)
+        rigid_obj_mgr.remove_object_by_id(cube.object_id)
+        assert sim.update_navmesh(sim.pathfinder, [old_bb])
+        assert np.isclose(sim.pathfinder.navigable_area, empty_area, rtol=1e-3)
+
+
 # cached test results for assertions
 cached_islandtest_scene_results: Dict[str, Dict[str, Any]] = {
     "17DRP5sb8fy": {
@@ -368,3 +535,225 @@ def test_topdown_map(test_scene):
         if generate_test_map_images:
             island_colored_map_image.save(filename + ".png")
             # island_colored_map_image.show()
+
+
+@pytest.mark.parametrize("test_scene", test_scenes)
+def test_topdown_view_cache(test_scene):
+    if not osp.exists(test_scene):
+        pytest.skip(f"{test_scene} not found")
+
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = test_scene
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        pf = sim.pathfinder
+        navmesh_verts = pf.build_navmesh_vertices(-1)
+        height = min(x[1] for x in navmesh_verts)
+        lower_bound, _ = pf.get_bounds()
+        meters_per_pixel = 0.1
+        radius = 10
+
+        def expected_crop(view, row, col, outside):
+            padded = np.pad(view, radius, constant_values=outside)
+            return padded[row : row + 2 * radius + 1, col : col + 2 * radius + 1]
+
+        for cache_size in [8, 0]:
+            pf.topdown_view_cache_size = cache_size
+            assert pf.topdown_view_cache_size == cache_size
+            # crops rasterized directly when nothing is cached
+            for row, col in [(5, 7), (-3, 2)]:
+                center = np.array(
+                    [
+                        lower_bound[0] + col * meters_per_pixel,
+                        height,
+                        lower_bound[2] + row * meters_per_pixel,
+                    ],
+                    dtype=np.float32,
+                )
+                crop = pf.get_topdown_view_crop(
+                    meters_per_pixel, height, center, radius
+                )
+                island_crop = pf.get_topdown_island_view_crop(
+                    meters_per_pixel, height, center, radius
+                )
+                view = pf.get_topdown_view(meters_per_pixel, height)
+                island_view = pf.get_topdown_island_view(meters_per_pixel, height)
+                assert crop.shape == (2 * radius + 1, 2 * radius + 1)
+                assert np.array_equal(crop, expected_crop(view, row, col, False))
+                assert np.array_equal(
+                    island_crop, expected_crop(island_view, row, col, -1)
+                )
+
+                # cut from the cached views this time
+                assert np.array_equal(
+                    crop,
+                    pf.get_topdown_view_crop(meters_per_pixel, height, center, radius),
+                )
+                assert np.array_equal(
+                    island_crop,
+                    pf.get_topdown_island_view_crop(
+                        meters_per_pixel, height, center, radius
+                    ),
+                )
+                assert np.array_equal(
+                    view, pf.get_topdown_view(meters_per_pixel, height)
+                )
+
+        with pytest.raises(AssertionError):
+            pf.get_topdown_view_crop(meters_per_pixel, height, center, -1)
+        with pytest.raises(AssertionError):
+            pf.get_topdown_island_view_crop(meters_per_pixel, height, center, -1)
+
+
+@pytest.mark.parametrize("test_scene", test_scenes)
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_batch_queries(test_scene, num_threads):
+    if not osp.exists(test_scene):
+        pytest.skip(f"{test_scene} not found")
+
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = test_scene
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        pf = sim.pathfinder
+        pf.seed(0)
+        num_samples = 100
+        starts = np.array(
+            [pf.get_random_navigable_point() for _ in range(num_samples)],
+            dtype=np.float32,
+        )
+        ends = np.array(
+            [pf.get_random_navigable_point() for _ in range(num_samples)],
+            dtype=np.float32,
+        )
+        # include some points off the navmesh
+        offsets = np.random.uniform(-1.0, 1.0, size=(num_samples, 3))
+        points = (starts + offsets).astype(np.float32)
+
+        distances = pf.geodesic_distance_batch(starts, ends, num_threads)
+        assert distances.shape == (num_samples,)
+        for i, (_, geodesic_distance, _) in enumerate(
+            get_shortest_path(sim, zip(starts, ends))
+        ):
+            assert np.isclose(distances[i], geodesic_distance, rtol=1e-4)
+
+        snapped = pf.snap_point_batch(points, num_threads=num_threads)
+        assert snapped.shape == (num_samples, 3)
+        steps = pf.try_step_batch(starts, ends, num_threads)
+        steps_no_sliding = pf.try_step_no_sliding_batch(starts, ends, num_threads)
+        navigable = pf.is_navigable_batch(points, num_threads=num_threads)
+        obstacle_distances = pf.distance_to_closest_obstacle_batch(
+            points, num_threads=num_threads
+        )
+        for i in range(num_samples):
+            assert np.allclose(snapped[i], pf.snap_point(points[i]), equal_nan=True)
+            assert np.allclose(steps[i], pf.try_step(starts[i], ends[i]))
+            assert np.allclose(
+                steps_no_sliding[i], pf.try_step_no_sliding(starts[i], ends[i])
+            )
+            assert navigable[i] == pf.is_navigable(points[i])
+            assert np.isclose(
+                obstacle_distances[i], pf.distance_to_closest_obstacle(points[i])
+            )
+
+        with pytest.raises(AssertionError):
+            pf.geodesic_distance_batch(starts, ends[:-1])
+
+
+@pytest.mark.parametrize("test_scene", test_scenes)
+def test_geodesic_distance_field(test_scene):
+    if not osp.exists(test_scene):
+        pytest.skip(f"{test_scene} not found")
+
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = test_scene
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        pf = sim.pathfinder
+        pf.seed(0)
+        goals = [pf.get_random_navigable_point() for _ in range(3)]
+        field = pf.get_geodesic_distance_field(goals)
+        # the cache is keyed by the set of goals
+        assert pf.get_geodesic_distance_field(goals[::-1]) is field
+
+        points = np.array(
+            [pf.get_random_navigable_point() for _ in range(100)], dtype=np.float32
+        )
+        distances = pf.geodesic_distance_to_goals_batch(field, points, 4)
+        for point, distance in zip(points, distances):
+            assert np.isclose(
+                distance, pf.geodesic_distance_to_goals(field, point), rtol=1e-5
+            )
+
+            path = habitat_sim.MultiGoalShortestPath()
+            path.requested_start = point
+            path.requested_ends = goals
+            if not pf.find_path(path):
+                assert distance == np.inf
+                continue
+            # the field follows straight segments between navmesh vertices, so
+            # it can only be slightly longer than the exact shortest path
+            assert distance >= path.geodesic_distance - 1e-2
+            assert distance <= 1.1 * path.geodesic_distance + 0.1
+
+        for goal in goals:
+            assert np.isclose(pf.geodesic_distance_to_goals(field, goal), 0.0)
+
+        pf.distance_field_cache_size = 1
+        other_field = pf.get_geodesic_distance_field(goals[:1])
+        assert pf.get_geodesic_distance_field(goals) is not field
+        assert pf.get_geodesic_distance_field(goals[:1]) is not other_field
+
+
+@pytest.mark.parametrize("test_scene", test_scenes)
+def test_sample_episodes(test_scene, tmpdir):
+    if not osp.exists(test_scene):
+        pytest.skip(f"{test_scene} not found")
+
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = test_scene
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        pf = sim.pathfinder
+        settings = habitat_sim.EpisodeSamplingSettings()
+        settings.min_geodesic_distance = 1.0
+        settings.max_geodesic_distance = 10.0
+        settings.min_geodesic_to_euclidean_ratio = 1.05
+        settings.max_height_difference = 0.5
+
+        episodes = pf.sample_episodes(50, settings, seed=3, num_threads=1)
+        assert 0 < len(episodes) <= 50
+        # every episode has its own random stream
+        threaded = pf.sample_episodes(50, settings, seed=3, num_threads=4)
+        assert np.allclose(threaded.starts, episodes.starts)
+        assert np.allclose(threaded.goals, episodes.goals)
+
+        distances = pf.geodesic_distance_batch(episodes.starts, episodes.goals)
+        assert np.allclose(distances, episodes.geodesic_distances, rtol=1e-4)
+        euclidean_distances = np.linalg.norm(episodes.goals - episodes.starts, axis=1)
+        assert (distances >= settings.min_geodesic_distance).all()
+        assert (distances <= settings.max_geodesic_distance).all()
+        assert (distances >= 1.05 * euclidean_distances - EPS).all()
+        assert (
+            np.abs(episodes.goals[:, 1] - episodes.starts[:, 1])
+            <= settings.max_height_difference
+        ).all()
+        for start, island in zip(episodes.starts, episodes.islands):
+            assert pf.get_island(start) == island
+
+        with pytest.raises(ValueError):
+            habitat_sim.nav.generate_episodes(pf, 30, settings, chunk_size=0)
+
+        # written to a compressed file
+        chunks = habitat_sim.nav.generate_episodes(
+            pf, 30, settings, seed=3, num_threads=2, chunk_size=8
+        )
+        path = str(tmpdir.join("episodes.npz"))
+        num_written = habitat_sim.nav.save_episodes(path, chunks, test_scene)
+        saved = np.load(path)
+        assert saved["starts"].shape == (num_written, 3)
+        assert saved["goals"].shape == (num_written, 3)
@@ -6,15 +6,23 @@
 
 from os import path as osp
 
+import attr
 import numpy as np
 import pytest
 
 import habitat_sim
-from habitat_sim.sensors.noise_models import redwood_depth_noise_model
+from habitat_sim.sensors.noise_models import (
+    GaussianNoiseModel,
+    PoissonNoiseModel,
+    SaltAndPepperNoiseModel,
+    SpeckleNoiseModel,
+    redwood_depth_noise_model,
+)
 from habitat_sim.sensors.noise_models.redwood_depth_noise_model import (
     RedwoodDepthNoiseModel,
     RedwoodNoiseModelCPUImpl,
 )
+from habitat_sim.sensors.noise_models.sensor_noise_model import SensorNoiseModel
 
 
 @pytest.mark.gfxtest
@@ -45,3 +53,160 @@ def test_compare_gpu_cpu_redwood_depth(noise_multiplier: float, tolerance: float
     cpu_depth = np.mean(np.stack(cpu_depths, 0), 0)
 
     assert np.abs(cuda_depth - cpu_depth).mean() <= tolerance
+
+
+@pytest.mark.parametrize(
+    "noise_model_cls", [PoissonNoiseModel, SpeckleNoiseModel, SaltAndPepperNoiseModel]
+)
+def test_color_noise_models(noise_model_cls):
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, size=(64, 48, 4), dtype=np.uint8)
+    image_copy = image.copy()
+
+    noisy = noise_model_cls(seed=5).apply(image)
+    assert noisy.shape == image.shape and noisy.dtype == np.uint8
+    assert np.array_equal(image, image_copy)
+    assert not np.array_equal(noisy, image)
+
+    # Same seed, same noise, whether or not the output buffer is provided
+    out = np.zeros_like(image)
+    assert noise_model_cls(seed=5).apply(image, out) is out
+    assert np.array_equal(out, noisy)
+    assert not np.array_equal(noise_model_cls(seed=6).apply(image), noisy)
+
+    # Consecutive frames get different noise
+    model = noise_model_cls(seed=5)
+    assert not np.array_equal(model.apply(image), model.apply(image))
+
+    with pytest.raises(ValueError):
+        model.apply(image, np.empty((64, 48, 3), dtype=np.uint8))
+
+
+@pytest.mark.parametrize(
+    "noise_model_cls,shape,dtype",
+    [
+        (GaussianNoiseModel, (64, 48, 4), np.uint8),
+        (SpeckleNoiseModel, (64, 48, 4), np.uint8),
+        (RedwoodDepthNoiseModel, (64, 48), np.float32),
+    ],
+)
+def test_noise_model_random_streams(noise_model_cls, shape, dtype):
+    if noise_model_cls is RedwoodDepthNoiseModel and habitat_sim.cuda_enabled:
+        pytest.skip("The CUDA implementation does not use the random streams")
+    rng = np.random.default_rng(0)
+    obs = (rng.random(shape) * (255 if dtype == np.uint8 else 12)).astype(dtype)
+
+    model = noise_model_cls(seed=3)
+    frames = [model.apply(obs) for _ in range(4)]
+    assert not np.array_equal(frames[0], frames[1])
+
+    # Pre-generated noise is the noise that would have been drawn on the fly
+    pregenerated = noise_model_cls(seed=3)
+    pregenerated.pregenerate(shape, 3)
+    for frame in frames:
+        assert np.array_equal(pregenerated.apply(obs), frame)
+
+    model.reseed(3)
+    assert np.array_equal(model.apply(obs), frames[0])
+    model.reseed(4)
+    assert not np.array_equal(model.apply(obs), frames[0])
+
+
+def test_redwood_depth_noise_model_tables():
+    dist = np.load(
+        osp.join(
+            osp.dirname(redwood_depth_noise_model.__file__),
+            "data",
+            "redwood-depth-dist-model.npy",
+        )
+    )
+    impl = RedwoodNoiseModelCPUImpl(dist, noise_multiplier=0.0)
+    model = dist.reshape(80, 80, 5)
+
+    for H, W in [(480, 640), (97, 131)]:
+        depth = np.random.default_rng(H).uniform(0.1, 12.0, (H, W)).astype(np.float32)
+        out = np.empty_like(depth)
+        assert impl.simulate(depth, out) is out
+
+        # The original per-pixel model, without noise
+        y, x = np.mgrid[0:H, 0:W]
+        d = depth[y - y % 2, x - x % 2].astype(np.float64)
+        model_y = (y / (H - 1.0) * 479.0 + 0.5).astype(int) // 6
+        model_x = (x / (W - 1.0) * 639.0 + 0.5).astype(int) // 8
+        i2 = ((d + 1) / 2).astype(int)
+        i1 = i2 - 1
+        a = (d - (i1 * 2.0 + 1.0)) / 2.0
+        f = (1.0 - a) * model[model_y, model_x, np.clip(i1, 0, 4)] + a * model[
+            model_y, model_x, np.minimum(i2, 4)
+        ]
+        denom = np.round(35.130 * f / d * 8.0)
+        expected = 35.130 * 8.0 / np.maximum(denom, 1.0)
+        expected[(d >= 10.0) | (denom <= 1e-5)] = 0.0
+
+        # The tables only match the model up to float rounding, so the
+        # rounding of the disparity may differ close to ties
+        assert np.isclose(out, expected, rtol=1e-4).mean() > 0.999
+
+
+@pytest.mark.parametrize(
+    "noise_model_cls,shape,dtype",
+    [
+        (GaussianNoiseModel, (5, 32, 24, 4), np.uint8),
+        (PoissonNoiseModel, (5, 32, 24, 4), np.uint8),
+        (SpeckleNoiseModel, (5, 32, 24, 4), np.uint8),
+        (SaltAndPepperNoiseModel, (5, 32, 24, 4), np.uint8),
+        (RedwoodDepthNoiseModel, (5, 32, 24), np.float32),
+    ],
+)
+def test_noise_model_apply_batch(noise_model_cls, shape, dtype):
+    rng = np.random.default_rng(0)
+    stack = (rng.random(shape) * (255 if dtype == np.uint8 else 12)).astype(dtype)
+
+    # With the streams of several models, a batch gets the noise each model
+    # would have applied on its own
+    models = [noise_model_cls(seed=seed) for seed in range(len(stack))]
+    expected = [model.apply(obs) for model, obs in zip(models, stack)]
+    for model in models:
+        model.reseed(model.seed)
+    out = np.empty_like(stack)
+    assert (
+        models[0].apply_batch(stack, out, rngs=[model.rng for model in models]) is out
+    )
+    for noisy, frame in zip(out, expected):
+        assert np.array_equal(noisy, frame)
+
+    # By default, the batch uses consecutive frames of the model
+    model = noise_model_cls(seed=7)
+    expected = [model.apply(obs) for obs in stack]
+    model.reseed(7)
+    assert np.array_equal(model.apply_batch(stack), np.stack(expected))
+
+    with pytest.raises(ValueError):
+        model.apply_batch(stack, rngs=[model.rng])
+
+
+@attr.s(auto_attribs=True, kw_only=True)
+class _FrameOffsetNoiseModel(SensorNoiseModel):
+    @staticmethod
+    def is_valid_sensor_type(sensor_type) -> bool:
+        return True
+
+    def apply(self, sensor_observation):
+        frame, k0, _ = self.rng.next_frame()
+        return sensor_observation + np.float32(frame + k0 % 1000)
+
+
+def test_noise_model_apply_batch_fallback():
+    stack = np.zeros((4, 8, 6), dtype=np.float32)
+
+    # Models without a batch kernel apply each observation with its own stream
+    models = [_FrameOffsetNoiseModel(seed=seed) for seed in range(len(stack))]
+    expected = [model.apply(obs) for model, obs in zip(models, stack)]
+    for model in models:
+        model.reseed(model.seed)
+    out = models[0].apply_batch(stack, rngs=[model.rng for model in models])
+    assert np.array_equal(out, np.stack(expected))
+
+    # Each stream advanced by one frame, the model keeping its own stream
+    for model in models:
+        assert model.rng.next_frame()[0] == 1
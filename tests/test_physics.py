@@ -4,7 +4,9 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import json
 import math
+import os
 import random
 from os import path as osp
 
@@ -596,6 +598,450 @@ def test_raycast():
             ).length() < 0.001
 
 
+@pytest.mark.skipif(
+    not osp.exists("data/scene_datasets/habitat-test-scenes/apartment_1.glb"),
+    reason="Requires the habitat-test-scenes",
+)
+@pytest.mark.skipif(
+    not habitat_sim.bindings.built_with_bullet,
+    reason="Bullet physics used for validation.",
+)
+def test_bulk_rigid_object_states():
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = "data/scene_datasets/habitat-test-scenes/apartment_1.glb"
+    cfg_settings["enable_physics"] = True
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        obj_template_mgr = sim.get_object_template_manager()
+        rigid_obj_mgr = sim.get_rigid_object_manager()
+        cube_prim_handle = obj_template_mgr.get_template_handles("cube")[0]
+        cubes = [
+            rigid_obj_mgr.add_object_by_template_handle(cube_prim_handle)
+            for _ in range(4)
+        ]
+        object_ids = [cube.object_id for cube in cubes]
+        num_objects = len(cubes)
+
+        # far enough apart not to touch each other
+        translations = np.array(
+            [[-2.0, 0.0, -2.0], [2.0, 0.0, -2.0], [-2.0, 0.0, 2.0], [2.0, 0.0, 2.0]],
+            dtype=np.float32,
+        )
+        rotation = mn.Quaternion.rotation(mn.Deg(30.0), mn.Vector3.y_axis())
+        rotations = np.array(
+            [[*rotation.vector, rotation.scalar]] * num_objects, dtype=np.float32
+        )
+        lin_vels = np.array([[0.0, 0.0, 1.0]] * num_objects, dtype=np.float32)
+        ang_vels = np.array([[0.0, 1.0, 0.0]] * num_objects, dtype=np.float32)
+        rigid_obj_mgr.set_states(
+            object_ids, translations, rotations, lin_vels, ang_vels
+        )
+
+        # the states match the per-object properties
+        states = rigid_obj_mgr.get_states(object_ids)
+        assert states.translations.shape == (num_objects, 3)
+        assert states.rotations.shape == (num_objects, 4)
+        assert np.allclose(states.translations, translations, atol=1e-5)
+        assert np.allclose(states.rotations, rotations, atol=1e-5)
+        assert np.allclose(states.linear_velocities, lin_vels, atol=1e-5)
+        assert np.allclose(states.angular_velocities, ang_vels, atol=1e-5)
+        for i, cube in enumerate(cubes):
+            assert np.allclose(cube.translation, translations[i], atol=1e-5)
+            assert np.allclose(cube.linear_velocity, lin_vels[i], atol=1e-5)
+            assert states.motion_types[i] == int(cube.motion_type)
+
+        # empty arrays leave states unchanged
+        kinematic = int(habitat_sim.physics.MotionType.KINEMATIC)
+        rigid_obj_mgr.set_states(
+            object_ids[:1], motion_types=np.array([kinematic], dtype=np.int32)
+        )
+        assert cubes[0].motion_type == habitat_sim.physics.MotionType.KINEMATIC
+        assert np.allclose(cubes[0].translation, translations[0], atol=1e-5)
+        rigid_obj_mgr.set_states(
+            object_ids[:1],
+            motion_types=np.array(
+                [int(habitat_sim.physics.MotionType.DYNAMIC)], dtype=np.int32
+            ),
+        )
+
+        # bulk forces act like forces applied object by object
+        rigid_obj_mgr.set_states(
+            object_ids,
+            translations,
+            rotations,
+            np.zeros((num_objects, 3), dtype=np.float32),
+            np.zeros((num_objects, 3), dtype=np.float32),
+        )
+        forces = np.array([[5.0, 0.0, 0.0]] * num_objects, dtype=np.float32)
+        rigid_obj_mgr.apply_forces(object_ids[:2], forces[:2])
+        for cube, force in zip(cubes[2:], forces[2:]):
+            cube.apply_force(force, np.zeros(3))
+        sim.step_physics(1.0 / 60.0)
+        states = rigid_obj_mgr.get_states(object_ids)
+        assert np.all(states.linear_velocities[:, 0] > 0)
+        assert np.allclose(
+            states.linear_velocities[:2], states.linear_velocities[2:], atol=1e-4
+        )
+
+        with pytest.raises(AssertionError):
+            rigid_obj_mgr.get_states([max(object_ids) + 100])
+        with pytest.raises(AssertionError):
+            rigid_obj_mgr.apply_forces(object_ids, forces[:1])
+
+        # a batch with an unknown ID is rejected before modifying any object
+        unknown_ids = object_ids[:1] + [max(object_ids) + 100]
+        translation = cubes[0].translation
+        with pytest.raises(AssertionError):
+            rigid_obj_mgr.set_states(unknown_ids, translations[:2])
+        assert cubes[0].translation == translation
+        with pytest.raises(AssertionError):
+            rigid_obj_mgr.apply_forces(unknown_ids, forces[:2])
+        sim.step_physics(1.0 / 60.0)
+        assert np.allclose(
+            cubes[0].linear_velocity, cubes[2].linear_velocity, atol=1e-4
+        )
+
+        # setting saved states restores the poses of STATIC objects too
+        static = habitat_sim.physics.MotionType.STATIC
+        cubes[1].motion_type = static
+        saved_states = rigid_obj_mgr.get_states(object_ids)
+        cubes[1].motion_type = habitat_sim.physics.MotionType.KINEMATIC
+        cubes[1].translation = translations[1] + 1.0
+        cubes[1].motion_type = static
+        rigid_obj_mgr.set_states(
+            object_ids,
+            saved_states.translations,
+            saved_states.rotations,
+            motion_types=saved_states.motion_types,
+        )
+        assert cubes[1].motion_type == static
+        states = rigid_obj_mgr.get_states(object_ids)
+        assert np.allclose(states.translations, saved_states.translations, atol=1e-5)
+        assert np.array_equal(states.motion_types, saved_states.motion_types)
+
+        # invalid motion types are rejected before modifying any object
+        with pytest.raises(AssertionError):
+            rigid_obj_mgr.set_states(
+                object_ids[:2],
+                translations[:2] + 1.0,
+                motion_types=np.array([int(static), 7], dtype=np.int32),
+            )
+        assert np.allclose(
+            rigid_obj_mgr.get_states(object_ids).translations,
+            saved_states.translations,
+            atol=1e-5,
+        )
+
+
+@pytest.mark.skipif(
+    not osp.exists("data/scene_datasets/habitat-test-scenes/apartment_1.glb"),
+    reason="Requires the habitat-test-scenes",
+)
+@pytest.mark.skipif(
+    not habitat_sim.bindings.built_with_bullet,
+    reason="Bullet physics used for validation.",
+)
+def test_physics_snapshot():
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = "data/scene_datasets/habitat-test-scenes/apartment_1.glb"
+    cfg_settings["enable_physics"] = True
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        obj_template_mgr = sim.get_object_template_manager()
+        rigid_obj_mgr = sim.get_rigid_object_manager()
+        cube_prim_handle = obj_template_mgr.get_template_handles("cube")[0]
+        cube = rigid_obj_mgr.add_object_by_template_handle(cube_prim_handle)
+        cube.translation = [2.0, 0.0, 2.0]
+        kinematic_cube = rigid_obj_mgr.add_object_by_template_handle(cube_prim_handle)
+        kinematic_cube.translation = [-2.0, 0.0, 2.0]
+        kinematic_cube.motion_type = habitat_sim.physics.MotionType.KINEMATIC
+        static_cube = rigid_obj_mgr.add_object_by_template_handle(cube_prim_handle)
+        static_cube.translation = [0.0, 0.0, 4.0]
+        static_cube.motion_type = habitat_sim.physics.MotionType.STATIC
+        object_ids = [cube.object_id, kinematic_cube.object_id]
+
+        cube.linear_velocity = [0.5, 0.0, 0.0]
+        sim.step_physics(0.1)
+        snapshot = sim.save_physics_snapshot()
+        assert snapshot.world_time == sim.get_world_time()
+        assert sorted(snapshot.rigid_object_ids) == sorted(
+            object_ids + [static_cube.object_id]
+        )
+        saved_states = rigid_obj_mgr.get_states(object_ids)
+
+        def rollout():
+            for _ in range(10):
+                cube.apply_force([0.0, 0.0, 10.0], [0.0, 0.0, 0.0])
+                sim.step_physics(1.0 / 60.0)
+            return rigid_obj_mgr.get_states(object_ids)
+
+        first_states = rollout()
+        # change the motion types and add a constraint and an object meanwhile
+        kinematic_cube.motion_type = habitat_sim.physics.MotionType.DYNAMIC
+        constraint_settings = habitat_sim.physics.RigidConstraintSettings()
+        constraint_settings.object_id_a = cube.object_id
+        constraint_id = sim.create_rigid_constraint(constraint_settings)
+        new_cube = rigid_obj_mgr.add_object_by_template_handle(cube_prim_handle)
+        new_cube.translation = [0.0, 0.0, -2.0]
+        # rearrange the STATIC object
+        static_cube.motion_type = habitat_sim.physics.MotionType.KINEMATIC
+        static_cube.translation = [1.0, 0.0, 4.0]
+        static_cube.motion_type = habitat_sim.physics.MotionType.STATIC
+
+        # restores the world without re-adding anything
+        assert sim.restore_physics_snapshot(snapshot)
+        assert sim.get_world_time() == snapshot.world_time
+        assert kinematic_cube.motion_type == habitat_sim.physics.MotionType.KINEMATIC
+        with pytest.raises(AssertionError):
+            sim.get_rigid_constraint_settings(constraint_id)
+        assert new_cube.is_alive
+        assert np.allclose(new_cube.translation, [0.0, 0.0, -2.0])
+        assert static_cube.motion_type == habitat_sim.physics.MotionType.STATIC
+        assert np.allclose(static_cube.translation, [0.0, 0.0, 4.0], atol=1e-5)
+        restored_states = rigid_obj_mgr.get_states(object_ids)
+        assert np.allclose(
+            restored_states.translations, saved_states.translations, atol=1e-5
+        )
+        assert np.allclose(restored_states.rotations, saved_states.rotations, atol=1e-5)
+        assert np.allclose(
+            restored_states.linear_velocities,
+            saved_states.linear_velocities,
+            atol=1e-5,
+        )
+
+        # the same rollout from the restored state
+        second_states = rollout()
+        assert np.allclose(
+            second_states.translations, first_states.translations, atol=1e-2
+        )
+
+        # constraints removed since the snapshot are created again, and their
+        # new ids are written back so that restoring again reuses them
+        removed_constraint_id = sim.create_rigid_constraint(constraint_settings)
+        constrained_snapshot = sim.save_physics_snapshot()
+        assert constrained_snapshot.rigid_constraint_ids == [removed_constraint_id]
+        sim.remove_rigid_constraint(removed_constraint_id)
+        assert sim.restore_physics_snapshot(constrained_snapshot)
+        (restored_constraint_id,) = constrained_snapshot.rigid_constraint_ids
+        assert (
+            sim.get_rigid_constraint_settings(restored_constraint_id).object_id_a
+            == cube.object_id
+        )
+        assert sim.restore_physics_snapshot(constrained_snapshot)
+        assert constrained_snapshot.rigid_constraint_ids == [restored_constraint_id]
+        assert (
+            sim.get_rigid_constraint_settings(restored_constraint_id).object_id_a
+            == cube.object_id
+        )
+
+        # removed objects are skipped
+        rigid_obj_mgr.remove_object_by_id(kinematic_cube.object_id)
+        assert not sim.restore_physics_snapshot(snapshot)
+        assert np.allclose(cube.translation, saved_states.translations[0], atol=1e-5)
+
+
+@pytest.mark.skipif(
+    not osp.exists("data/scene_datasets/habitat-test-scenes/apartment_1.glb"),
+    reason="Requires the habitat-test-scenes",
+)
+@pytest.mark.skipif(
+    not habitat_sim.bindings.built_with_bullet,
+    reason="Raycasts require Bullet physics.",
+)
+@pytest.mark.parametrize("num_threads", [1, 4])
+def test_batch_raycast(num_threads):
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = "data/scene_datasets/habitat-test-scenes/apartment_1.glb"
+    cfg_settings["enable_physics"] = True
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        obj_template_mgr = sim.get_object_template_manager()
+        rigid_obj_mgr = sim.get_rigid_object_manager()
+        cube_prim_handle = obj_template_mgr.get_template_handles("cube")[0]
+        cube_obj = rigid_obj_mgr.add_object_by_template_handle(cube_prim_handle)
+        cube_obj.translation = [2.0, 0.0, 2.0]
+
+        # a lidar-like ring of beams around two origins, with non-unit
+        # directions and a zero length ray
+        num_beams = 360
+        angles = np.linspace(0, 2 * np.pi, num_beams, endpoint=False)
+        ring = np.stack([np.cos(angles), np.zeros(num_beams), np.sin(angles)], 1)
+        directions = np.concatenate([ring, 0.5 * ring, np.zeros((1, 3))]).astype(
+            np.float32
+        )
+        origins = np.zeros_like(directions)
+        origins[num_beams:] = [0.0, 0.0, 2.0]
+        max_distance = 5.0
+
+        results = sim.cast_rays(origins, directions, max_distance, num_threads)
+        assert results.distances.shape == (len(directions),)
+        assert results.object_ids.shape == (len(directions),)
+        assert results.normals.shape == (len(directions), 3)
+        assert np.any(results.object_ids == cube_obj.object_id)
+        assert np.isinf(results.distances[-1])
+        assert results.object_ids[-1] == -1
+
+        for i, (origin, direction) in enumerate(zip(origins[:-1], directions[:-1])):
+            ray = habitat_sim.geo.Ray(mn.Vector3(origin), mn.Vector3(direction))
+            raycast_results = sim.cast_ray(ray, max_distance)
+            if not raycast_results.has_hits():
+                assert np.isinf(results.distances[i])
+                assert results.object_ids[i] == -1
+                assert np.all(results.normals[i] == 0)
+                continue
+            hit = raycast_results.hits[0]
+            assert abs(results.distances[i] - hit.ray_distance) < 0.001
+            assert results.object_ids[i] == hit.object_id
+            assert np.allclose(results.normals[i], hit.normal, atol=0.001)
+
+
+@pytest.mark.skipif(
+    not osp.exists("data/scene_datasets/habitat-test-scenes/apartment_1.glb"),
+    reason="Requires the habitat-test-scenes",
+)
+@pytest.mark.skipif(
+    not habitat_sim.bindings.built_with_bullet,
+    reason="Sleeping requires Bullet physics.",
+)
+def test_active_and_dirty_objects():
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = "data/scene_datasets/habitat-test-scenes/apartment_1.glb"
+    cfg_settings["enable_physics"] = True
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+    hab_cfg.sim_cfg.enable_gfx_replay_save = True
+    hab_cfg.sim_cfg.gfx_replay_skip_sleeping_objects = True
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        obj_template_mgr = sim.get_object_template_manager()
+        rigid_obj_mgr = sim.get_rigid_object_manager()
+        cube_prim_handle = obj_template_mgr.get_template_handles("cube")[0]
+        sim.set_gravity(mn.Vector3(0.0, 0.0, 0.0))
+        cube1 = rigid_obj_mgr.add_object_by_template_handle(cube_prim_handle)
+        cube2 = rigid_obj_mgr.add_object_by_template_handle(cube_prim_handle)
+        cube1.translation = [0.0, 5.0, 0.0]
+        cube2.translation = [3.0, 5.0, 0.0]
+        cube1.linear_velocity = [0.0, 0.0, 0.1]
+        expected_ids = sorted([cube1.object_id, cube2.object_id])
+
+        sim.step_physics(0.01)
+        assert sim.get_active_object_ids() == expected_ids
+        assert sim.get_dirty_object_ids() == expected_ids
+
+        # a sleeping object isn't moved by the step anymore
+        cube2.awake = False
+        sim.step_physics(0.01)
+        assert not cube2.awake
+        assert sim.get_active_object_ids() == [cube1.object_id]
+        assert sim.get_dirty_object_ids() == [cube1.object_id]
+
+        # the first keyframe records every instance, the next ones skip the
+        # sleeping cube
+        sim.gfx_replay_manager.extract_keyframe()
+        sim.step_physics(0.01)
+        keyframe = json.loads(sim.gfx_replay_manager.extract_keyframe())["keyframe"]
+        assert len(keyframe["stateUpdates"]) == 1
+
+        # moving the sleeping cube wakes it up, so its move is recorded
+        cube1.awake = False
+        sim.step_physics(0.01)
+        assert sim.get_dirty_object_ids() == []
+        sim.gfx_replay_manager.extract_keyframe()
+        cube2.translation = [3.0, 4.0, 0.0]
+        assert cube2.awake
+        keyframe = json.loads(sim.gfx_replay_manager.extract_keyframe())["keyframe"]
+        assert len(keyframe["stateUpdates"]) == 1
+        assert np.allclose(
+            keyframe["stateUpdates"][0]["state"]["absTransform"]["translation"],
+            [3.0, 4.0, 0.0],
+        )
+
+        # removed objects leave the dirty set
+        sim.step_physics(0.01)
+        assert sim.get_dirty_object_ids() == [cube2.object_id]
+        rigid_obj_mgr.remove_object_by_id(cube2.object_id)
+        assert sim.get_dirty_object_ids() == []
+
+        # moves between two keyframes are recorded even if the objects are
+        # asleep by the time the keyframe is saved
+        cube3 = rigid_obj_mgr.add_object_by_template_handle(cube_prim_handle)
+        cube3.translation = [6.0, 5.0, 0.0]
+        cube3.motion_type = habitat_sim.physics.MotionType.STATIC
+        sim.step_physics(0.01)
+        sim.gfx_replay_manager.extract_keyframe()
+        # a static object teleported through a kinematic toggle
+        cube3.motion_type = habitat_sim.physics.MotionType.KINEMATIC
+        cube3.translation = [6.0, 4.0, 0.0]
+        cube3.motion_type = habitat_sim.physics.MotionType.STATIC
+        # a sleeping object moved, then put back to sleep before the keyframe
+        cube1.translation = [0.0, 4.0, 0.0]
+        sim.step_physics(0.01)
+        cube1.awake = False
+        sim.step_physics(0.01)
+        assert not cube1.awake
+        keyframe = json.loads(sim.gfx_replay_manager.extract_keyframe())["keyframe"]
+        assert len(keyframe["stateUpdates"]) == 2
+        for update in keyframe["stateUpdates"]:
+            assert np.isclose(update["state"]["absTransform"]["translation"][1], 4.0)
+
+
+@pytest.mark.skipif(
+    not osp.exists("data/scene_datasets/habitat-test-scenes/apartment_1.glb"),
+    reason="Requires the habitat-test-scenes",
+)
+@pytest.mark.skipif(
+    not habitat_sim.bindings.built_with_bullet,
+    reason="Bullet physics used for validation.",
+)
+def test_step_substeps(tmpdir):
+    physics_config_file = str(tmpdir.join("substeps.physics_config.json"))
+    with open(physics_config_file, "w") as f:
+        json.dump(
+            {
+                "physics_simulator": "bullet",
+                "timestep": 0.004,
+                "gravity": [0, -9.8, 0],
+                "num_substeps": 4,
+                "render_interval": 8,
+            },
+            f,
+        )
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = "data/scene_datasets/habitat-test-scenes/apartment_1.glb"
+    cfg_settings["enable_physics"] = True
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+    hab_cfg.sim_cfg.physics_config_file = physics_config_file
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        assert sim.get_physics_num_substeps() == 4
+        assert sim.get_physics_render_interval() == 8
+        obj_template_mgr = sim.get_object_template_manager()
+        rigid_obj_mgr = sim.get_rigid_object_manager()
+        cube_prim_handle = obj_template_mgr.get_template_handles("cube")[0]
+        cube = rigid_obj_mgr.add_object_by_template_handle(cube_prim_handle)
+        cube.translation = [0.0, 5.0, 0.0]
+
+        # 4 substeps of 4ms per action, rendered every 8 physics steps
+        start_time = sim.get_world_time()
+        assert sim.step_substeps("move_forward") is None
+        assert np.isclose(sim.get_world_time() - start_time, 0.016)
+        # the scene graph node is synchronized after the last substep
+        assert cube.root_scene_node.translation[1] < 5.0
+        observations = sim.step_substeps("move_forward")
+        assert observations is not None
+        assert "color_sensor" in observations
+        assert "collided" in observations
+        assert sim.step_substeps("move_forward") is None
+
+        # a single action may render every time
+        observations = sim.step_substeps("move_forward", num_substeps=8)
+        assert observations is not None
+        assert np.isclose(sim.get_world_time() - start_time, 0.08)
+
+        # without rendering, stepping only syncs the scene graph once
+        sim.step_world_substeps(2)
+        assert np.isclose(sim.get_world_time() - start_time, 0.088)
+        assert sim.get_dirty_object_ids() == [cube.object_id]
+        assert cube.root_scene_node.translation == cube.translation
+
+
 @pytest.mark.skipif(
     not osp.exists("data/scene_datasets/habitat-test-scenes/apartment_1.glb"),
     reason="Requires the habitat-test-scenes",
@@ -2084,3 +2530,46 @@ def test_bullet_collision_helper():
             sim.get_physics_step_collision_summary()
             == "(no active collision manifolds)\n"
         )
+
+
+@pytest.mark.skipif(
+    not osp.exists("data/scene_datasets/habitat-test-scenes/apartment_1.glb")
+    or not habitat_sim.bindings.built_with_bullet,
+    reason="Requires the habitat-test-scenes and Bullet physics.",
+)
+def test_collision_shape_cache(tmpdir):
+    cache_dir = str(tmpdir.join("collision_shapes"))
+    cfg_settings = habitat_sim.utils.settings.default_sim_settings.copy()
+    cfg_settings["scene"] = "data/scene_datasets/habitat-test-scenes/apartment_1.glb"
+    cfg_settings["enable_physics"] = True
+    cfg_settings["collision_shape_cache_directory"] = cache_dir
+    hab_cfg = habitat_sim.utils.settings.make_cfg(cfg_settings)
+
+    num_beams = 360
+    angles = np.linspace(0, 2 * np.pi, num_beams, endpoint=False)
+    directions = np.stack(
+        [np.cos(angles), np.full(num_beams, -0.2), np.sin(angles)], 1
+    ).astype(np.float32)
+    origins = np.zeros_like(directions)
+
+    # the first simulator builds the stage BVHs and fills the cache
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        built_results = sim.cast_rays(origins, directions, 10.0)
+    cached_files = sorted(os.listdir(cache_dir))
+    assert len(cached_files) > 0
+    assert all(f.endswith(".bvh") for f in cached_files)
+
+    # the second one maps them, giving the same collision geometry
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        cached_results = sim.cast_rays(origins, directions, 10.0)
+        assert sorted(os.listdir(cache_dir)) == cached_files
+        assert np.array_equal(cached_results.object_ids, built_results.object_ids)
+        assert np.allclose(cached_results.distances, built_results.distances)
+        assert np.allclose(cached_results.normals, built_results.normals)
+
+        # shapes built beyond the maximum size are evicted right away
+        for f in cached_files:
+            os.remove(osp.join(cache_dir, f))
+        hab_cfg.sim_cfg.collision_shape_cache_max_size = 0
+        sim.reconfigure(hab_cfg)
+        assert len(os.listdir(cache_dir)) == 0
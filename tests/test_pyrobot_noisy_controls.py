@@ -140,3 +140,67 @@ def test_pyrobot_noisy_actions(noise_multiplier, robot, controller):
             )
             < EPS
         )
+
+
+def test_pyrobot_noise_samples():
+    noise_model = pyrobot_noise_models["LoCoBot"]["ILQR"].linear_motion.linear
+    truncation = [(-0.01, None), None]
+
+    np.random.seed(0)
+    samples = noise_model.sample_batch(3000, truncation)
+    assert samples.shape == (3000, 2)
+    assert (samples[:, 0] >= -0.01).all()
+    stdev = np.sqrt(np.diagonal(noise_model.cov))
+    assert (np.abs(samples - noise_model.mean) <= 3 * stdev + 1e-12).all()
+
+    # Single samples consume np.random the same way as batches
+    np.random.seed(0)
+    single_samples = np.stack([noise_model.sample(truncation) for _ in range(3000)])
+    assert np.array_equal(single_samples, samples)
+
+
+def test_pyrobot_noisy_actions_batch(num_agents=300):
+    np.random.seed(0)
+    scene_graph = SceneGraph()
+    agent_config = habitat_sim.AgentConfiguration()
+    agent_config.action_space = dict(
+        noisy_move_forward=habitat_sim.ActionSpec(
+            "pyrobot_noisy_move_forward",
+            habitat_sim.PyRobotNoisyActuationSpec(amount=1.0),
+        ),
+        move_forward=habitat_sim.ActionSpec(
+            "move_forward", habitat_sim.ActuationSpec(amount=1.0)
+        ),
+    )
+    agents = [
+        habitat_sim.Agent(scene_graph.get_root_node().create_child(), agent_config)
+        for _ in range(num_agents)
+    ]
+    initial_states = [agent.state for agent in agents]
+
+    agents[0].act("move_forward")
+    base_state = agents[0].state
+    agents[0].state = initial_states[0]
+
+    collided = habitat_sim.Agent.act_batch(agents, ["noisy_move_forward"] * num_agents)
+    assert not collided.any()
+    delta_translations = np.stack(
+        [_delta_translation(base_state, agent.state) for agent in agents]
+    )
+    noise_model = pyrobot_noise_models["LoCoBot"]["ILQR"].linear_motion
+    assert (
+        np.linalg.norm(noise_model.linear.mean - np.abs(delta_translations.mean(0)))
+        < 5e-2
+    )
+
+
+def test_pyrobot_noise_seeding():
+    noise_model = pyrobot_noise_models["LoCoBot"]["ILQR"].rotational_motion.rotation
+
+    np.random.seed(1)
+    samples = noise_model.sample_batch(10)
+    np.random.seed(1)
+    reseeded_samples = noise_model.sample_batch(5)
+    np.random.seed(1)
+    assert np.array_equal(reseeded_samples, samples[:5])
+    assert np.array_equal(noise_model.sample_batch(10), samples)
@@ -363,3 +363,36 @@ def test_rgba_noise(scene_and_dataset, model_name, make_cfg_settings):
         assert np.linalg.norm(
             obs["color_sensor"].astype(float) - gt.astype(float)
         ) > 1.5e-2 * np.linalg.norm(gt.astype(float)), "Incorrect color_sensor output"
+
+
+@pytest.mark.gfxtest
+@pytest.mark.parametrize("scene_and_dataset", _test_scenes)
+@pytest.mark.parametrize("ring_size", [1, 3])
+def test_observation_ring(scene_and_dataset, ring_size, make_cfg_settings):
+    scene = scene_and_dataset[0]
+    if not osp.exists(scene):
+        pytest.skip("Skipping {}".format(scene))
+    scene_dataset_config = scene_and_dataset[1]
+    make_cfg_settings["depth_sensor"] = True
+    make_cfg_settings["color_sensor"] = True
+    make_cfg_settings["semantic_sensor"] = False
+    make_cfg_settings["scene"] = scene
+    make_cfg_settings["scene_dataset_config_file"] = scene_dataset_config
+    hsim_cfg = make_cfg(make_cfg_settings)
+    hsim_cfg.observation_ring_size = ring_size
+
+    with habitat_sim.Simulator(hsim_cfg) as sim:
+        obs, gt = _render_and_load_gt(sim, scene, "color_sensor", False)
+        assert np.linalg.norm(
+            obs["color_sensor"].astype(float) - gt.astype(float)
+        ) < 1.5e-2 * np.linalg.norm(gt.astype(float)), "Incorrect color_sensor output"
+        for sensor_type in ["color_sensor", "depth_sensor"]:
+            assert not obs[sensor_type].flags.writeable
+
+        # the first observation's slot is only reused after ring_size draws
+        history = [sim.get_sensor_observations()["color_sensor"]]
+        for _ in range(ring_size):
+            history.append(sim.get_sensor_observations()["color_sensor"])
+        assert np.shares_memory(history[0], history[-1])
+        if ring_size > 1:
+            assert not np.shares_memory(history[0], history[1])
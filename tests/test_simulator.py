@@ -2,6 +2,7 @@
 # This source code is licensed under the MIT license found in the
 # LICENSE file in the root directory of this source tree.
 
+import functools
 import random
 from copy import copy
 from os import path as osp
@@ -261,3 +262,110 @@ def test_object_template_editing():
 def test_no_config():
     with pytest.raises(TypeError):
         _ = habitat_sim.Simulator()  # type: ignore[call-arg]
+
+
+def test_step_batch(make_cfg_settings, num_agents=4):
+    make_cfg_settings["semantic_sensor"] = False
+    hab_cfg = habitat_sim.utils.settings.make_cfg(make_cfg_settings)
+    for _ in range(1, num_agents):
+        hab_cfg.agents.append(copy(hab_cfg.agents[0]))
+
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        for i in range(num_agents):
+            sim.initialize_agent(i)
+
+        action_keys = list(hab_cfg.agents[0].action_space.keys())
+        actions = np.array([random.choice(action_keys) for _ in range(num_agents)])
+        batch_obs = sim.step_batch(actions)
+
+        assert batch_obs["collided"].shape == (num_agents,)
+        assert batch_obs["collided"].dtype == bool
+
+        # observations should match what the per-agent path renders for the
+        # same agent states
+        multi_obs = sim.get_sensor_observations(agent_ids=list(range(num_agents)))
+        for agent_id, agent_obs in multi_obs.items():
+            for uuid, obs in agent_obs.items():
+                assert batch_obs[uuid].shape[0] == num_agents
+                assert np.array_equal(batch_obs[uuid][agent_id], obs)
+
+        # buffers are reused across steps
+        color_buffer = batch_obs["color_sensor"]
+        assert sim.step_batch(actions)["color_sensor"] is color_buffer
+
+
+def test_step_pipelined(make_cfg_settings):
+    make_cfg_settings["semantic_sensor"] = False
+    hab_cfg = habitat_sim.utils.settings.make_cfg(make_cfg_settings)
+    actions = ["move_forward", "turn_left", "move_forward", "turn_right"]
+
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        sim.initialize_agent(0)
+        expected = [
+            {uuid: np.copy(obs) for uuid, obs in sim.step(action).items()}
+            for action in actions
+        ]
+
+        sim.reset()
+        first_frame_index = sim._num_total_frames + 1
+        frames = [sim.step_pipelined(action) for action in actions]
+        # The observations of a frame are delivered by the following call
+        assert frames[0] is None
+        frames = frames[1:] + [sim.flush_pipeline()]
+        assert sim.flush_pipeline() is None
+
+        for i, (frame_index, obs) in enumerate(frames):
+            assert frame_index == first_frame_index + i
+            assert obs["collided"] == expected[i]["collided"]
+            for uuid in ["color_sensor", "depth_sensor"]:
+                assert np.array_equal(obs[uuid], expected[i][uuid])
+
+
+def test_agent_states(make_cfg_settings, num_agents=3):
+    hab_cfg = habitat_sim.utils.settings.make_cfg(make_cfg_settings)
+    for _ in range(1, num_agents):
+        hab_cfg.agents.append(copy(hab_cfg.agents[0]))
+
+    with habitat_sim.Simulator(hab_cfg) as sim:
+        for i in range(num_agents):
+            sim.initialize_agent(i)
+        initial_states = sim.get_agent_states()
+        assert len(initial_states) == num_agents
+
+        action_keys = list(hab_cfg.agents[0].action_space.keys())
+        sim.step({i: random.choice(action_keys) for i in range(num_agents)})
+        states = sim.get_agent_states()
+        for i in range(num_agents):
+            assert is_same_state(sim.last_state(i), sim.get_agent(i).state)
+            assert is_same_state(states.get_state(i), sim.get_agent(i).state)
+
+        # Restore the initial states, writing into the same arrays
+        sim.set_agent_states(initial_states)
+        assert sim.get_agent_states(out=states) is states
+        assert np.allclose(states.positions, initial_states.positions)
+        assert np.allclose(states.rotations, initial_states.rotations)
+
+
+def test_vector_simulator(make_cfg_settings, num_envs=2):
+    make_cfg_settings["semantic_sensor"] = False
+    make_config = functools.partial(
+        habitat_sim.utils.settings.make_cfg, make_cfg_settings
+    )
+
+    with habitat_sim.VectorSimulator([make_config] * num_envs) as vector_sim:
+        assert vector_sim.num_envs == num_envs
+        batch_obs = vector_sim.reset()
+        for uuid in ["color_sensor", "depth_sensor"]:
+            assert batch_obs[uuid].shape[0] == num_envs
+
+        batch_obs = vector_sim.step(["move_forward", "turn_left"])
+        assert batch_obs["collided"].shape == (num_envs,)
+        # the stacked observations in shared memory match what each simulator
+        # renders for its current state
+        for index in range(num_envs):
+            obs = vector_sim.call_at(index, "get_sensor_observations")
+            for uuid in ["color_sensor", "depth_sensor"]:
+                assert np.array_equal(batch_obs[uuid][index], obs[uuid])
+
+        with pytest.raises(ValueError):
+            vector_sim.step(["move_forward"])